@@ -14,7 +14,7 @@ migrate = Migrate()
 
 POSTGRESQL_PASSWORD = os.getenv('POSTGRESQL_PASSWORD')
 
-def create_app():
+def create_app(config_overrides=None):
     app = Flask(__name__)
     
     # Set secret key for session management
@@ -22,6 +22,23 @@ def create_app():
     
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    # Live polling: max concurrent ESPN requests and seconds allowed for each cycle's fetches
+    app.config['ESPN_FETCH_CONCURRENCY'] = int(os.getenv('ESPN_FETCH_CONCURRENCY', 8))
+    app.config['POLL_CYCLE_DEADLINE_SECONDS'] = float(os.getenv('POLL_CYCLE_DEADLINE_SECONDS', 15))
+    # Seconds between scheduler leader lock checks
+    app.config['LEADER_CHECK_SECONDS'] = float(os.getenv('LEADER_CHECK_SECONDS', 30))
+
+    # Offline load testing: serve ESPN from a recording or record live responses (app/utils/espnReplay.py)
+    app.config['ESPN_REPLAY_DIR'] = os.getenv('ESPN_REPLAY_DIR')
+    app.config['ESPN_REPLAY_SPEED'] = float(os.getenv('ESPN_REPLAY_SPEED', 1))
+    app.config['ESPN_REPLAY_COPIES'] = int(os.getenv('ESPN_REPLAY_COPIES', 1))
+    app.config['ESPN_REPLAY_STAGGER_SECONDS'] = float(os.getenv('ESPN_REPLAY_STAGGER_SECONDS', 0))
+    app.config['ESPN_RECORD_DIR'] = os.getenv('ESPN_RECORD_DIR')
+
+    # Per-process settings (e.g. the polling worker's DB pool) applied on top of the defaults
+    if config_overrides:
+        app.config.update(config_overrides)
     
     # Initialize OAuth with the app instance
     oauth, google = init_oauth(app)
@@ -40,6 +57,8 @@ def create_app():
     from app.models.props.hashMapAnswers import HashMapAnswers
     from app.models.propAnswers.variableOptionAnswer import VariableOptionAnswer
     from app.models.playerPropSelection import PlayerPropSelection
+    from app.models.pointAward import PointAward
+    from app.models.espnFinalSnapshot import EspnFinalSnapshot
     # Anytime TD Scorer prop models
     from app.models.props.anytimeTdProp import AnytimeTdProp
     from app.models.props.anytimeTdOption import AnytimeTdOption
@@ -50,6 +69,10 @@ def create_app():
     db.init_app(app)
     migrate.init_app(app, db)
 
-    # DON'T initialize scheduler here - it will be done in gunicorn_config.py post_fork hook
+    if app.config['ESPN_REPLAY_DIR'] or app.config['ESPN_RECORD_DIR']:
+        from app.utils.espnReplay import install_from_config
+        install_from_config(app.config)
+
+    # DON'T initialize scheduler here - it is started by worker.py or the gunicorn_config.py post_fork hook
 
     return app
\ No newline at end of file
@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request
 from app.services.game.gameService import GameService
 from app.services.game.gradeGameService import GradeGameService
+from app.services.game.snapshotRegradeService import SnapshotRegradeService
 from app.services.leagueService import LeagueService
 from app.repositories.gameRepository import get_game_by_id
 
@@ -181,6 +182,26 @@ def gradeGame():
 
     return jsonify(result)
 
+@gameController.route('/regrade_game_from_snapshot', methods=['POST'])
+def regradeGameFromSnapshot():
+    """
+    Regrade a completed game from its stored final ESPN snapshot, without calling ESPN.
+
+    Expects JSON body with:
+        - game_id (int): The ID of the game to regrade
+
+    Returns:
+        JSON: {"success": bool, "game_id": int, "error": str (on failure)}
+    """
+    data = request.get_json()
+    game_id = data.get('game_id')
+
+    result = SnapshotRegradeService.regrade_game(game_id)
+
+    if result["success"]:
+        return jsonify(result), 200
+    return jsonify(result), 404
+
 @gameController.route('/delete_game', methods=['POST'])
 def deleteGame():
     """
@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 from app.services.leagueService import LeagueService
 from app.services.playerService import PlayerService
 from app.services.game.gameService import GameService
+from app.services.game.snapshotRegradeService import SnapshotRegradeService
 from app.repositories.leagueRepository import get_league_by_name
 
 """
@@ -231,4 +232,22 @@ def getPlayerByUsernameAndLeaguename():
     if result is None:
         return jsonify({"error": "Player not found"}), 404
 
-    return jsonify(result.to_dict())
\ No newline at end of file
+    return jsonify(result.to_dict())
+
+@leagueController.route('/regrade_league_from_snapshots', methods=['POST'])
+def regradeLeagueFromSnapshots():
+    """
+    Regrade every completed game in a league from stored final ESPN snapshots, without calling ESPN.
+
+    Expects JSON body with:
+        - leaguename (str): The name of the league
+
+    Returns:
+        JSON: {"regraded": [game_id, ...], "skipped": {game_id: reason, ...}}
+    """
+    data = request.get_json()
+    leaguename = data.get('leaguename')
+
+    result = SnapshotRegradeService.regrade_league(leaguename)
+
+    return jsonify(result)
@@ -5,14 +5,22 @@ This controller provides endpoints for:
 - Fetching available players for a game (for prop creation)
 - Getting live stats for a game
 - Manually triggering polling (for testing/debugging)
+- Inspecting ESPN response cache and request statistics
+- Exposing polling metrics for Prometheus-style scrapers
+- Backfilling ESPN team ids on Winner/Loser props
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from app.services.espnClientService import ESPNClientService
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.responseCache import espn_response_cache
 from app.services.game.pollingService import PollingService
+from app.services.game.pollingMetricsService import PollingMetricsService
+from app.services.game.teamBindingService import TeamBindingService
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 from app.models.gameModel import Game
 from app.validators.gameValidator import validate_game_id, validate_game_exists
-from app.repositories.gameRepository import get_game_by_id
+from app.repositories.gameRepository import get_game_by_id, get_game_with_props
 
 liveStatsController = Blueprint('liveStatsController', __name__)
 
@@ -99,7 +107,7 @@ def get_live_stats(game_id):
         404: If game not found
     """
     game_id = validate_game_id(game_id)
-    game = get_game_by_id(game_id)
+    game = get_game_with_props(game_id)
     validate_game_exists(game)
 
     # Build response with live data
@@ -174,6 +182,21 @@ def manual_poll_game(game_id):
         return jsonify(result), 404
 
 
+@liveStatsController.route('/polling/backfill_team_ids', methods=['POST'])
+def backfill_team_ids():
+    """
+    Bind existing Winner/Loser props to their ESPN team ids.
+
+    New props are bound when they are created; this covers props created
+    before that, or while ESPN was unavailable. One cached team lookup is
+    made per ESPN event.
+
+    Returns:
+        JSON: {"events": int, "bound": int, "unresolved": int}
+    """
+    return jsonify(TeamBindingService.backfill_team_ids()), 200
+
+
 @liveStatsController.route('/scoreboard', methods=['GET'])
 def get_scoreboard():
     """
@@ -232,3 +255,49 @@ def get_available_players_by_espn_id(espn_game_id):
         }), 200
     except Exception as e:
         return jsonify({"error": f"Failed to fetch players: {str(e)}"}), 404
+
+
+@liveStatsController.route('/espn/cache_stats', methods=['GET'])
+def get_espn_cache_stats():
+    """
+    Get ESPN response cache hit/miss counts, upstream request latency and circuit breaker state.
+
+    Returns:
+        JSON: {
+            "cache": {"size": int, "maxsize": int, "endpoints": {
+                "summary": {"hits": int, "misses": int, "coalesced": int,
+                            "evictions": int, "hit_rate": float}, ...}},
+            "http": {"summary": {"requests": int, "errors": int, "not_modified": int,
+                                 "short_circuited": int, "avg_ms": float, "max_ms": float, ...}, ...},
+            "breaker": {"state": "closed" | "open" | "half_open", "consecutive_failures": int,
+                        "open_seconds_remaining": float, "trips": int, "rejected": int,
+                        "slow_calls": int, "probes": int}
+        }
+    """
+    return jsonify({
+        "cache": espn_response_cache.get_stats(),
+        "http": ESPNHttpClient.get_latency_stats(),
+        "breaker": ESPNHttpClient.get_breaker_stats()
+    }), 200
+
+
+@liveStatsController.route('/polling/metrics', methods=['GET'])
+def get_polling_metrics():
+    """
+    Get polling metrics in the Prometheus text exposition format.
+
+    Covers ESPN request outcomes, latency and payload size per endpoint,
+    response cache lookups, polling stage latency histograms (fetch, parse,
+    apply, write, grade, cycle), game outcome totals, APScheduler job events
+    (missed and max_instances runs), run start delay and interval, overruns
+    and leadership.
+
+    Metrics are per process; only the polling leader (the poll worker, or
+    the web worker holding the leader lock) has polling data.
+
+    Returns:
+        text/plain: Prometheus exposition, e.g.
+            pickem_polling_stage_duration_seconds_bucket{stage="fetch",le="0.5"} 12
+    """
+    return Response(PollingMetricsService.render_prometheus(),
+                    content_type=METRICS_CONTENT_TYPE)
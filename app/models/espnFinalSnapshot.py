@@ -0,0 +1,40 @@
+# This model stores the final ESPN state of an NFL game, one row per ESPN event (external_game_id), shared by every
+# league's Game row for that event. It is written once when polling first sees the game final, so a stat correction
+# or a grading fix can be regraded from this row instead of refetching ESPN.
+
+from flask_sqlalchemy import SQLAlchemy
+from app import db
+
+class EspnFinalSnapshot(db.Model):
+    # Unique id for this snapshot
+    id = db.Column(db.Integer, primary_key=True)
+
+    # The ESPN event this snapshot is for (matches Game.external_game_id)
+    external_game_id = db.Column(db.String(100), unique=True, nullable=False)
+
+    # ESPN status name when the snapshot was taken (normally STATUS_FINAL)
+    status = db.Column(db.String(50), nullable=True)
+
+    # Whether the snapshot has player stats (False when only the scoreboard was fetched)
+    has_box_score = db.Column(db.Boolean, default=False, nullable=False)
+
+    # Version of the payload layout, so older rows can still be read after the layout changes
+    format_version = db.Column(db.Integer, nullable=False)
+
+    # zlib-compressed JSON: scores, team names and the box score as one column per stat
+    # (see ESPNGameSnapshot.to_compact). A few KB instead of the multi-hundred-KB summary payload.
+    payload = db.Column(db.LargeBinary, nullable=False)
+
+    # When the snapshot was (last) written
+    captured_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'external_game_id': self.external_game_id,
+            'status': self.status,
+            'has_box_score': self.has_box_score,
+            'format_version': self.format_version,
+            'payload_bytes': len(self.payload) if self.payload is not None else 0,
+            'captured_at': self.captured_at,
+        }
@@ -42,6 +42,10 @@ class Game(db.Model):
     # Field intended to check if the game is graded or not. 0 represents not graded, non-zero represents graded.
     graded = db.Column(db.Integer)
 
+    # Whether this game's awarded points are recorded in the PointAward ledger. Set whenever the game is
+    # graded, even if nobody scored (no ledger rows); false only for games graded before the ledger existed.
+    points_ledgered = db.Column(db.Boolean, default=False, nullable=False, server_default='false')
+
     ## Fields for live game polling and tracking
     # External ESPN game ID for API polling
     external_game_id = db.Column(db.String(100), nullable=True)
@@ -56,6 +60,11 @@ class Game(db.Model):
     team_a_score = db.Column(db.Integer, nullable=True)
     team_b_score = db.Column(db.Integer, nullable=True)
 
+    # When this game is next due for a poll (UTC). Set after each poll from the ESPN game state:
+    # sooner during live play and red zone / two-minute situations, later at halftime, and
+    # cleared once the game is final. NULL means poll as soon as the game has started.
+    next_poll_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
     # Number of props each player must select to answer for this game
     prop_limit = db.Column(db.Integer, nullable=False)
 
@@ -65,11 +74,13 @@ class Game(db.Model):
             'game_name': self.game_name,
             'start_time': self.start_time,
             'graded': self.graded,
+            'points_ledgered': self.points_ledgered,
             'external_game_id': self.external_game_id,
             'is_polling': self.is_polling,
             'is_completed': self.is_completed,
             'team_a_score': self.team_a_score,
             'team_b_score': self.team_b_score,
+            'next_poll_at': self.next_poll_at,
             'prop_limit': self.prop_limit,
             'winner_loser_props': [prop.to_dict() for prop in self.winner_loser_props],
             'over_under_props': [prop.to_dict() for prop in self.over_under_props],
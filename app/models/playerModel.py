@@ -38,6 +38,9 @@ class Player(db.Model):
 
     # Tracks which props this player has selected to answer (new feature)
     prop_selections = db.relationship('PlayerPropSelection', back_populates='player', cascade='all, delete-orphan')
+
+    # Grading ledger rows for this player. Player.points is the cached total of these (plus any manual edits).
+    point_awards = db.relationship('PointAward', cascade='all, delete-orphan')
     
     def to_dict(self):
         return {
@@ -0,0 +1,41 @@
+# This model is the grading ledger. Each row records the points one player was awarded for one prop in one game.
+# Player.points is a cached total that grading keeps in sync with this table: regrading a prop replaces that prop's rows
+# and applies only the difference to Player.points, so running grade_game more than once never double-awards.
+
+from flask_sqlalchemy import SQLAlchemy
+from app import db
+
+class PointAward(db.Model):
+    # Unique id for this ledger row
+    id = db.Column(db.Integer, primary_key=True)
+
+    # The player who was awarded the points
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+
+    # The game the prop belongs to
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+
+    # The type of prop: 'winner_loser', 'over_under', 'variable_option', or 'anytime_td'
+    prop_type = db.Column(db.String(50), nullable=False)
+
+    # The ID of the specific prop (references different tables based on prop_type)
+    prop_id = db.Column(db.Integer, nullable=False)
+
+    # Points awarded for this prop
+    points = db.Column(db.Numeric, nullable=False)
+
+    # One row per player per prop. The (game_id, prop_type, prop_id) index makes per-prop regrades cheap.
+    __table_args__ = (
+        db.UniqueConstraint('player_id', 'game_id', 'prop_type', 'prop_id', name='unique_player_prop_award'),
+        db.Index('ix_point_award_game_prop', 'game_id', 'prop_type', 'prop_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'player_id': self.player_id,
+            'game_id': self.game_id,
+            'prop_type': self.prop_type,
+            'prop_id': self.prop_id,
+            'points': float(self.points) if self.points is not None else 0,
+        }
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from app.models.espnFinalSnapshot import EspnFinalSnapshot
+from app import db
+
+# Repository functions for stored final ESPN snapshots. None of these commit; polling commits with the cycle.
+
+def get_final_snapshot(external_game_id):
+    """Get the stored final snapshot for an ESPN event, or None"""
+    return EspnFinalSnapshot.query.filter_by(external_game_id=str(external_game_id)).first()
+
+def get_final_snapshots(external_game_ids):
+    """Get stored final snapshots for many ESPN events in one query, keyed by external_game_id"""
+    ids = {str(external_game_id) for external_game_id in external_game_ids if external_game_id}
+    if not ids:
+        return {}
+    rows = EspnFinalSnapshot.query.filter(EspnFinalSnapshot.external_game_id.in_(ids)).all()
+    return {row.external_game_id: row for row in rows}
+
+def save_final_snapshot(external_game_id, status, has_box_score, format_version, payload):
+    """
+    Insert or replace the final snapshot for an ESPN event.
+
+    A snapshot with player stats is never replaced by a score-only one (from the scoreboard), so
+    a later league's scoreboard-only poll can't throw away the box score.
+    """
+    row = get_final_snapshot(external_game_id)
+    if row is not None and row.has_box_score and not has_box_score:
+        return row
+    if row is None:
+        row = EspnFinalSnapshot(external_game_id=str(external_game_id))
+        db.session.add(row)
+    row.status = status
+    row.has_box_score = has_box_score
+    row.format_version = format_version
+    row.payload = payload
+    row.captured_at = datetime.now(timezone.utc)
+    return row
@@ -1,5 +1,28 @@
+from sqlalchemy.orm import selectinload
 from app.models.gameModel import Game
+from app.models.props.anytimeTdProp import AnytimeTdProp
+from app.models.props.variableOptionProp import VariableOptionProp
 
 # Query method to retrieve an instance of a game by its id.
 def get_game_by_id(id):
-    return Game.query.get(id)
\ No newline at end of file
+    return Game.query.get(id)
+
+# Loader options that fetch a game's full prop graph (every prop type plus variable option and
+# anytime TD options) with one SELECT ... IN per relationship, however many games are loaded.
+def game_prop_graph_options():
+    return (
+        selectinload(Game.winner_loser_props),
+        selectinload(Game.over_under_props),
+        selectinload(Game.variable_option_props).selectinload(VariableOptionProp.options),
+        selectinload(Game.anytime_td_props).selectinload(AnytimeTdProp.options),
+    )
+
+# Query method to retrieve a batch of games by id with their props and options eager-loaded.
+def get_games_with_props(ids):
+    if not ids:
+        return []
+    return Game.query.options(*game_prop_graph_options()).filter(Game.id.in_(ids)).all()
+
+# Query method to retrieve a single game by id with its props and options eager-loaded.
+def get_game_with_props(id):
+    return Game.query.options(*game_prop_graph_options()).filter(Game.id == id).first()
@@ -1,3 +1,6 @@
+from sqlalchemy import case, func, update
+from sqlalchemy.orm.util import identity_key
+from app import db
 from app.models.playerModel import Player
 from app.repositories.usersRepository import get_user_by_username
 from app.repositories.leagueRepository import get_league_by_name
@@ -10,6 +13,30 @@ def get_all_players():
 def get_player_by_id(playerId):
     return Player.query.get(playerId)
 
+# Adds a point delta to many players at once. points_by_player maps player id -> points to add (negative to deduct).
+# This is a single UPDATE ... SET points = COALESCE(points, 0) + CASE id WHEN ... END, so grading a large league does
+# not need to load every Player row. The caller is responsible for committing.
+def add_points_to_players(points_by_player):
+    deltas = {player_id: delta for player_id, delta in points_by_player.items() if delta}
+    if not deltas:
+        return 0
+
+    statement = (
+        update(Player)
+        .where(Player.id.in_(list(deltas.keys())))
+        .values(points=func.coalesce(Player.points, 0) + case(deltas, value=Player.id, else_=0))
+        .execution_options(synchronize_session=False)
+    )
+    result = db.session.execute(statement)
+
+    # Loaded Player objects would otherwise keep their old points until the next commit.
+    for player_id in deltas:
+        player = db.session.identity_map.get(identity_key(Player, player_id))
+        if player is not None:
+            db.session.expire(player, ['points'])
+
+    return result.rowcount
+
 # Query to get a player based on the league it is a part of (leagueName) and the user that the player is associated to (username).
 def get_player_by_username_and_leaguename(username, leagueName):
     # Get the user and league we care about.
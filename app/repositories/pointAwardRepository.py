@@ -0,0 +1,36 @@
+from sqlalchemy import insert
+from app.models.pointAward import PointAward
+from app import db
+
+# Repository functions for the grading ledger (PointAward). None of these commit; grading commits once at the end.
+
+def get_point_awards_for_game(game_id):
+    """Get the (player_id, prop_type, prop_id, points) ledger rows for a game"""
+    return db.session.query(
+        PointAward.player_id, PointAward.prop_type, PointAward.prop_id, PointAward.points
+    ).filter(PointAward.game_id == game_id).all()
+
+def get_point_awards_for_prop(game_id, prop_type, prop_id):
+    """Get the (player_id, points) ledger rows for a single prop"""
+    return db.session.query(
+        PointAward.player_id, PointAward.points
+    ).filter_by(game_id=game_id, prop_type=prop_type, prop_id=prop_id).all()
+
+def insert_point_awards(game_id, prop_type, prop_id, awards):
+    """Insert ledger rows for one prop from a {player_id: points} mapping in a single statement"""
+    rows = [
+        {"player_id": player_id, "game_id": game_id, "prop_type": prop_type, "prop_id": prop_id, "points": points}
+        for player_id, points in awards.items()
+        if points
+    ]
+    if rows:
+        db.session.execute(insert(PointAward), rows)
+    return len(rows)
+
+def delete_point_awards_for_prop(game_id, prop_type, prop_id):
+    """Delete every ledger row for a single prop"""
+    return PointAward.query.filter_by(game_id=game_id, prop_type=prop_type, prop_id=prop_id).delete(synchronize_session=False)
+
+def delete_point_awards_for_game(game_id):
+    """Delete every ledger row for a game"""
+    return PointAward.query.filter_by(game_id=game_id).delete(synchronize_session=False)
@@ -7,6 +7,7 @@ from app.models.propAnswers.winnerLoserAnswer import WinnerLoserAnswer
 from app.models.props.anytimeTdProp import AnytimeTdProp
 from app.models.propAnswers.anytimeTdAnswer import AnytimeTdAnswer
 from app.models.playerPropSelection import PlayerPropSelection
+from app.models.gameModel import Game
 from app import db
 
 def get_winner_loser_prop_by_id(id):
@@ -22,6 +23,15 @@ def get_anytime_td_prop_by_id(id):
     """Get an anytime TD prop by its ID"""
     return AnytimeTdProp.query.get(id)
 
+def get_unbound_winner_loser_props():
+    """Get (prop, external_game_id) for winner/loser props of ESPN-tracked games that lack team IDs"""
+    return db.session.query(WinnerLoserProp, Game.external_game_id).join(
+        Game, WinnerLoserProp.game_id == Game.id
+    ).filter(
+        Game.external_game_id.isnot(None),
+        db.or_(WinnerLoserProp.team_a_id.is_(None), WinnerLoserProp.team_b_id.is_(None))
+    ).all()
+
 def get_winner_loser_answers_for_prop(prop_id):
     return WinnerLoserAnswer.query.filter_by(prop_id=prop_id).all()
 
@@ -35,6 +45,41 @@ def get_anytime_td_answers_for_prop(prop_id):
     """Get all anytime TD answers for a specific prop"""
     return AnytimeTdAnswer.query.filter_by(prop_id=prop_id).all()
 
+# Batch answer loaders used by grading. These only pull the columns grading needs
+# (player_id, prop_id, answer) for every prop of a type in a single query.
+
+def get_winner_loser_answers_for_props(prop_ids):
+    """Get the (player_id, prop_id, answer) rows for a batch of winner/loser props"""
+    if not prop_ids:
+        return []
+    return db.session.query(
+        WinnerLoserAnswer.player_id, WinnerLoserAnswer.prop_id, WinnerLoserAnswer.answer
+    ).filter(WinnerLoserAnswer.prop_id.in_(prop_ids)).all()
+
+def get_over_under_answers_for_props(prop_ids):
+    """Get the (player_id, prop_id, answer) rows for a batch of over/under props"""
+    if not prop_ids:
+        return []
+    return db.session.query(
+        OverUnderAnswer.player_id, OverUnderAnswer.prop_id, OverUnderAnswer.answer
+    ).filter(OverUnderAnswer.prop_id.in_(prop_ids)).all()
+
+def get_variable_option_answers_for_props(prop_ids):
+    """Get the (player_id, prop_id, answer) rows for a batch of variable option props"""
+    if not prop_ids:
+        return []
+    return db.session.query(
+        VariableOptionAnswer.player_id, VariableOptionAnswer.prop_id, VariableOptionAnswer.answer
+    ).filter(VariableOptionAnswer.prop_id.in_(prop_ids)).all()
+
+def get_anytime_td_answers_for_props(prop_ids):
+    """Get the (player_id, prop_id, answer) rows for a batch of anytime TD props"""
+    if not prop_ids:
+        return []
+    return db.session.query(
+        AnytimeTdAnswer.player_id, AnytimeTdAnswer.prop_id, AnytimeTdAnswer.answer
+    ).filter(AnytimeTdAnswer.prop_id.in_(prop_ids)).all()
+
 def get_all_winner_loser_props_for_game(game_id):
     return WinnerLoserProp.query.filter_by(game_id=game_id).all()
     
@@ -54,6 +99,19 @@ def get_player_prop_selections_for_game(player_id, game_id):
     """Get all prop selections a player has made for a specific game"""
     return PlayerPropSelection.query.filter_by(player_id=player_id, game_id=game_id).all()
 
+def get_prop_selections_for_game(game_id):
+    """Get the (player_id, prop_type, prop_id) rows for every player's selections in a game"""
+    return db.session.query(
+        PlayerPropSelection.player_id, PlayerPropSelection.prop_type, PlayerPropSelection.prop_id
+    ).filter(PlayerPropSelection.game_id == game_id).all()
+
+def get_prop_selection_player_ids(game_id, prop_type, prop_id):
+    """Get the ids of players who selected a specific prop"""
+    rows = db.session.query(PlayerPropSelection.player_id).filter_by(
+        game_id=game_id, prop_type=prop_type, prop_id=prop_id
+    ).all()
+    return [row.player_id for row in rows]
+
 def get_player_prop_selection_count(player_id, game_id):
     """Get the count of props a player has selected for a game"""
     return PlayerPropSelection.query.filter_by(player_id=player_id, game_id=game_id).count()
@@ -0,0 +1,292 @@
+"""
+Box Score Index for O(1) player stat lookups.
+
+ESPN nests player stats as boxscore.players -> statistics -> athletes, with
+each stat group carrying its own list of keys. Walking that tree once per prop
+is wasteful when a poll updates dozens of props for the same game, so the
+index flattens a summary payload once into per-athlete stat dicts keyed by
+normalized display name and ESPN athlete id.
+
+Names typed by commissioners rarely match ESPN's display names exactly
+("Ken Walker" for "Kenneth Walker III", "DJ Moore" for "D.J. Moore"), so
+names are normalized (accents, punctuation and generational suffixes
+dropped), also indexed under a nickname-folded alias, and as a last resort
+matched fuzzily against the game's athletes.
+"""
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional
+from app.services.statExtractors import StatExtractor, get_extractor
+
+
+# Generational suffixes dropped from the end of a name ("Marvin Harrison Jr." -> "marvin harrison")
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+# Common first-name nicknames, folded to one form so "Ken Walker" finds "Kenneth Walker III"
+NICKNAMES = {
+    "alex": "alexander", "ben": "benjamin", "cam": "cameron", "chris": "christopher",
+    "dan": "daniel", "danny": "daniel", "dave": "david", "gabe": "gabriel", "greg": "gregory",
+    "jake": "jacob", "jim": "james", "jimmy": "james", "joe": "joseph", "jon": "jonathan",
+    "josh": "joshua", "ken": "kenneth", "kenny": "kenneth", "matt": "matthew", "mike": "michael",
+    "nate": "nathan", "nick": "nicholas", "pat": "patrick", "rob": "robert", "bob": "robert",
+    "bobby": "robert", "sam": "samuel", "steve": "steven", "tim": "timothy", "tom": "thomas",
+    "tommy": "thomas", "tony": "anthony", "will": "william", "bill": "william", "zach": "zachary",
+}
+
+# Minimum similarity (0-1) for a fuzzy name match, and how far ahead of the
+# runner-up the best match must be for the match to be trusted
+FUZZY_CUTOFF = 0.85
+FUZZY_MARGIN = 0.05
+
+_PUNCTUATION = re.compile(r"[.'\u2019`]")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an athlete name for index lookups.
+
+    Lowercases, folds accents ("Nicolás" -> "nicolas"), drops periods and
+    apostrophes ("D.J." -> "dj", "Ja'Marr" -> "jamarr"), turns hyphens and
+    other separators into single spaces and strips a trailing generational
+    suffix ("Kenneth Walker III" -> "kenneth walker").
+    """
+    folded = unicodedata.normalize("NFKD", name or "")
+    folded = "".join(char for char in folded if not unicodedata.combining(char)).lower()
+    tokens = _SEPARATORS.sub(" ", _PUNCTUATION.sub("", folded)).split()
+    if len(tokens) > 2 and tokens[-1] in NAME_SUFFIXES:
+        tokens = tokens[:-1]
+    return " ".join(tokens)
+
+
+def name_alias(key: str) -> str:
+    """Fold the first name of a normalized name to its full form ("ken walker" -> "kenneth walker")."""
+    first, _, rest = key.partition(" ")
+    return f"{NICKNAMES.get(first, first)} {rest}".strip()
+
+
+class BoxScoreIndex:
+    """
+    Flattened view of the player stats in an ESPN summary payload.
+
+    Each athlete is stored once as a record:
+        {"id": "4241457", "name": "Jonathan Taylor", "team": "IND",
+         "stats": {("rushing", "rushingYards"): 78.0, ...}}
+
+    Stat values that are not numeric (e.g. "--" or "22/30") are skipped, so a
+    lookup for them returns None.
+    """
+
+    def __init__(self, game_data: Dict[str, Any]):
+        self._by_name = {}
+        self._by_id = {}
+        # Nickname-folded name -> record, or None when two athletes share the alias
+        self._by_alias = {}
+        # Fuzzy lookups already made against this payload: normalized name -> record or None
+        self._fuzzy_memo = {}
+
+        box_score = (game_data or {}).get("boxscore", {}) or {}
+        for team in box_score.get("players", []) or []:
+            team_abbr = (team.get("team") or {}).get("abbreviation")
+
+            for stat_group in team.get("statistics", []) or []:
+                category = (stat_group.get("name") or "").lower()
+                stat_keys = stat_group.get("keys", []) or []
+
+                for athlete in stat_group.get("athletes", []) or []:
+                    info = athlete.get("athlete") or {}
+                    record = self._get_or_add_record(info, team_abbr)
+                    if record is None:
+                        continue
+
+                    stats = athlete.get("stats", []) or []
+                    for key, value in zip(stat_keys, stats):
+                        # Keep the first value seen, matching the old first-match search
+                        if (category, key) in record["stats"]:
+                            continue
+                        try:
+                            record["stats"][(category, key)] = float(value)
+                        except (TypeError, ValueError):
+                            continue
+
+    def _get_or_add_record(self, info: Dict[str, Any], team_abbr: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the record for an athlete, creating and indexing it on first sight."""
+        athlete_id = str(info["id"]) if info.get("id") is not None else None
+        name = info.get("displayName", "")
+        key = normalize_name(name)
+
+        record = self._by_id.get(athlete_id) if athlete_id else None
+        if record is None and key:
+            record = self._by_name.get(key)
+            # Same display name but a different athlete id is a different player
+            if record is not None and athlete_id and record["id"] and record["id"] != athlete_id:
+                record = None
+        if record is not None:
+            return record
+        if not athlete_id and not key:
+            return None
+
+        record = {"id": athlete_id, "name": name, "team": team_abbr, "stats": {}}
+        if athlete_id:
+            self._by_id[athlete_id] = record
+        if key:
+            # The first athlete seen keeps the name; others are only reachable by id
+            self._by_name.setdefault(key, record)
+            alias = name_alias(key)
+            self._by_alias[alias] = record if self._by_alias.get(alias, record) is record else None
+        return record
+
+    def _records(self) -> List[Dict[str, Any]]:
+        """Every athlete record once, whether it is indexed by id, name or both."""
+        records = {}
+        for record in list(self._by_id.values()) + list(self._by_name.values()):
+            records.setdefault(id(record), record)
+        return list(records.values())
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Serialize the index one column per stat, for compact storage.
+
+        Returns:
+            dict: {"athletes": [[id, name, team], ...],
+                   "stats": {"category/key": [[athlete index, ...], [value, ...]], ...}}
+        """
+        athletes = []
+        positions = {}
+        stats = {}
+        for record in self._records():
+            positions[id(record)] = len(athletes)
+            athletes.append([record["id"], record["name"], record["team"]])
+            for (category, key), value in record["stats"].items():
+                column = stats.setdefault(f"{category}/{key}", [[], []])
+                column[0].append(positions[id(record)])
+                column[1].append(int(value) if value.is_integer() else value)
+        return {"athletes": athletes, "stats": stats}
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> "BoxScoreIndex":
+        """
+        Rebuild an index serialized with to_columns().
+
+        Args:
+            columns (dict): Output of to_columns().
+
+        Returns:
+            BoxScoreIndex: An index answering the same lookups as the original.
+        """
+        index = cls({})
+        records = [
+            index._get_or_add_record({"id": athlete_id, "displayName": name}, team)
+            for athlete_id, name, team in columns.get("athletes", [])
+        ]
+        for column, (positions, values) in columns.get("stats", {}).items():
+            category, _, key = column.partition("/")
+            for position, value in zip(positions, values):
+                if records[position] is not None:
+                    records[position]["stats"][(category, key)] = float(value)
+        return index
+
+    def find_athlete(self, player_name: Optional[str] = None,
+                     athlete_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find an athlete record by ESPN athlete id, falling back to name.
+
+        Args:
+            player_name (str, optional): The player's display name.
+            athlete_id (str, optional): The ESPN athlete id.
+
+        Returns:
+            dict: The athlete record, or None if not found.
+        """
+        if athlete_id:
+            record = self._by_id.get(str(athlete_id))
+            if record is not None:
+                return record
+        if player_name:
+            key = normalize_name(player_name)
+            return self._by_name.get(key) or self._by_alias.get(name_alias(key))
+        return None
+
+    def fuzzy_find(self, player_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the athlete whose name is closest to player_name.
+
+        Only used after find_athlete() misses. The match must reach
+        FUZZY_CUTOFF similarity and beat every other athlete by FUZZY_MARGIN,
+        so near-ties (e.g. two Watsons) resolve to nothing rather than the
+        wrong player. Results are memoized for this payload.
+
+        Args:
+            player_name (str): The player's name as entered on the prop.
+
+        Returns:
+            dict: The athlete record, or None if no single name is close enough.
+        """
+        key = normalize_name(player_name)
+        if not key:
+            return None
+        if key in self._fuzzy_memo:
+            return self._fuzzy_memo[key]
+
+        # Names below this can't be the match or close enough to it to make it ambiguous
+        floor = FUZZY_CUTOFF - FUZZY_MARGIN
+        matcher = SequenceMatcher(None, b=key)
+        best, best_ratio, runner_up = None, 0.0, 0.0
+        for candidate, record in self._by_name.items():
+            matcher.set_seq1(candidate)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best, best_ratio, runner_up = record, ratio, best_ratio
+            elif ratio > runner_up:
+                runner_up = ratio
+
+        match = best if best_ratio >= FUZZY_CUTOFF and best_ratio - runner_up >= FUZZY_MARGIN else None
+        self._fuzzy_memo[key] = match
+        return match
+
+    def get_player_stat(self, player_name: Optional[str], stat_type: str,
+                        athlete_id: Optional[str] = None) -> Optional[float]:
+        """
+        Look up a single stat for a player.
+
+        Args:
+            player_name (str): The player's display name (e.g., "Zay Flowers").
+            stat_type (str): A player stat type from STAT_EXTRACTORS, base
+                (e.g. "rushing_yards") or derived (e.g. "scrimmage_yards").
+            athlete_id (str, optional): ESPN athlete id, preferred over the name.
+
+        Returns:
+            float: The stat value for the player.
+            None: If the player or stat is not found, or stat_type isn't a player stat.
+        """
+        extractor = get_extractor(stat_type)
+        if extractor is None or extractor.scope != StatExtractor.PLAYER:
+            return None
+        record = self.find_athlete(player_name, athlete_id)
+        if record is None:
+            return None
+        return extractor.from_record(record)
+
+    def tally(self, stat_type: str) -> Dict[str, float]:
+        """
+        Evaluate one player stat for every athlete in a single pass.
+
+        Args:
+            stat_type (str): A player stat type from STAT_EXTRACTORS (e.g. "touchdowns").
+
+        Returns:
+            dict: normalized athlete name -> value, for athletes with a value.
+        """
+        extractor = get_extractor(stat_type)
+        if extractor is None or extractor.scope != StatExtractor.PLAYER:
+            return {}
+        values = {}
+        for key, record in self._by_name.items():
+            value = extractor.from_record(record)
+            if value is not None:
+                values[key] = value
+        return values
@@ -0,0 +1,146 @@
+"""
+Circuit Breaker for calls to a flaky upstream.
+
+When ESPN degrades, every request would otherwise wait out its full timeout
+(plus retries) and the polling thread piles up behind them. The breaker
+counts consecutive failures, and calls slower than a latency budget, and
+after too many in a row opens: callers skip the upstream entirely (and fall
+back to something cached) until a cool-down passes. It then lets a single
+probe through (half-open); a healthy probe closes the breaker, a failed one
+opens it again for another cool-down.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    Usage:
+        if not breaker.allow_request():
+            ...serve a fallback...
+        try:
+            ...call the upstream...
+        except UpstreamError:
+            breaker.record_failure()
+            raise
+        breaker.record_success(elapsed_ms)
+
+    Every allowed request must end in record_success() or record_failure(),
+    otherwise a half-open breaker keeps waiting for its probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, slow_call_ms: float = 4000.0,
+                 open_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_ms = slow_call_ms
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the breaker and clear its counters."""
+        with self._lock:
+            self._state = CircuitBreaker.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+            self._stats = {"trips": 0, "rejected": 0, "slow_calls": 0, "probes": 0}
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a request may go to the upstream.
+
+        An open breaker turns half-open once open_seconds have passed and
+        lets exactly one probe through; every other caller is rejected until
+        the probe reports back.
+
+        Returns:
+            bool: True if the caller should make the request.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.OPEN and self._clock() - self._opened_at >= self.open_seconds:
+                self._state = CircuitBreaker.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == CircuitBreaker.CLOSED:
+                return True
+            if self._state == CircuitBreaker.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._stats["probes"] += 1
+                return True
+
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self, elapsed_ms: float = 0.0) -> None:
+        """
+        Report a request that got an answer from the upstream.
+
+        An answer slower than slow_call_ms still counts as a failure: a
+        degraded upstream that answers in 9 seconds hurts the cycle as much
+        as one that times out.
+
+        Args:
+            elapsed_ms (float): How long the request took.
+        """
+        if elapsed_ms > self.slow_call_ms:
+            with self._lock:
+                self._stats["slow_calls"] += 1
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state == CircuitBreaker.HALF_OPEN:
+                self._state = CircuitBreaker.CLOSED
+                self._probe_in_flight = False
+                self._opened_at = None
+                print(f"[CIRCUIT] {self.name} recovered, breaker closed")
+
+    def record_failure(self) -> None:
+        """Report a failed (or too slow) request; may trip the breaker."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitBreaker.HALF_OPEN:
+                self._trip("probe failed")
+            elif self._state == CircuitBreaker.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._trip(f"{self._consecutive_failures} consecutive failures")
+
+    def _trip(self, reason: str) -> None:
+        """Open the breaker; caller must hold the lock."""
+        self._state = CircuitBreaker.OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._stats["trips"] += 1
+        print(f"[CIRCUIT] {self.name} breaker open for {self.open_seconds:g}s ({reason})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the breaker's state and counters.
+
+        Returns:
+            dict: {"state", "consecutive_failures", "open_seconds_remaining",
+                   "trips", "rejected", "slow_calls", "probes"}
+        """
+        with self._lock:
+            remaining = 0.0
+            if self._state == CircuitBreaker.OPEN:
+                remaining = max(self.open_seconds - (self._clock() - self._opened_at), 0.0)
+            return dict(self._stats, state=self._state, consecutive_failures=self._consecutive_failures,
+                        open_seconds_remaining=remaining)
@@ -5,8 +5,12 @@ This service provides methods to interact with ESPN's public JSON API
 for retrieving live game data, scores, and player statistics.
 """
 
+import os
 import requests
 from typing import Dict, List, Optional, Any
+from app.services.boxScoreIndex import BoxScoreIndex
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.responseCache import espn_response_cache
 
 
 class ESPNClientService:
@@ -14,10 +18,22 @@ class ESPNClientService:
     Service class for interacting with ESPN's public NFL API.
 
     This service fetches live game data including scores, game status,
-    and player statistics without requiring authentication.
+    and player statistics without requiring authentication. Requests go
+    through the shared, pooled ESPNHttpClient session and are cached in
+    espn_response_cache for CACHE_TTLS seconds per endpoint.
     """
 
-    BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+    # ESPN_BASE_URL points polling at a stand-in server (see app/utils/espnStubServer.py)
+    BASE_URL = os.getenv("ESPN_BASE_URL", "https://site.api.espn.com/apis/site/v2/sports/football/nfl").rstrip("/")
+
+    # Seconds each endpoint's responses stay in espn_response_cache
+    CACHE_TTLS = {
+        "summary": 5,
+        "scoreboard": 30,
+        "roster": 6 * 60 * 60,
+        # An event's competitors never change, so its team list is kept for a day
+        "teams": 24 * 60 * 60,
+    }
 
     @staticmethod
     def get_game_data(external_game_id: str) -> Optional[Dict[str, Any]]:
@@ -37,9 +53,11 @@ class ESPNClientService:
         try:
             url = f"{ESPNClientService.BASE_URL}/summary"
             params = {"event": external_game_id}
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return espn_response_cache.get_or_load(
+                ("summary", str(external_game_id)),
+                lambda: ESPNHttpClient.get_json(url, params=params, endpoint="summary"),
+                ttl=ESPNClientService.CACHE_TTLS["summary"]
+            )
         except requests.RequestException as e:
             print(f"Error fetching game data for {external_game_id}: {e}")
             return None
@@ -138,6 +156,35 @@ class ESPNClientService:
         except (IndexError, KeyError, TypeError):
             return {}
 
+    @staticmethod
+    def get_event_teams(external_game_id: str) -> Dict[str, str]:
+        """
+        Get the team abbreviation -> full name mapping for an ESPN event, cached.
+
+        Used to bind props to ESPN team ids once, at creation or backfill,
+        rather than matching names on every poll.
+
+        Args:
+            external_game_id (str): The ESPN game ID.
+
+        Returns:
+            dict: e.g. {"BAL": "Baltimore Ravens", "KC": "Kansas City Chiefs"};
+                  {} if ESPN has no data for the event (not cached).
+        """
+        def load_teams():
+            team_names = ESPNClientService.get_team_names(ESPNClientService.get_game_data(external_game_id) or {})
+            if not team_names:
+                raise LookupError(f"No teams found for ESPN event {external_game_id}")
+            return team_names
+
+        try:
+            return espn_response_cache.get_or_load(
+                ("teams", str(external_game_id)), load_teams, ttl=ESPNClientService.CACHE_TTLS["teams"]
+            )
+        except LookupError as e:
+            print(e)
+            return {}
+
     @staticmethod
     def get_winning_team_id(game_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -166,87 +213,36 @@ class ESPNClientService:
         """
         Extract a specific player's stat from ESPN game data.
 
+        For many lookups against the same payload, build a BoxScoreIndex once
+        and query it directly instead.
+
         Args:
             game_data (dict): The game data returned from get_game_data().
             player_name (str): The player's name to search for (e.g., "Zay Flowers").
-            stat_type (str): The type of stat to retrieve. Supported values:
+            stat_type (str): The type of stat to retrieve; any player stat in
+                statExtractors.STAT_EXTRACTORS, e.g.:
                 - "passing_yards", "passing_tds", "passing_interceptions", "passing_completions"
                 - "rushing_yards", "rushing_tds"
                 - "receiving_yards", "receiving_tds", "receiving_receptions"
                 - "scrimmage_yards" (rushing_yards + receiving_yards)
+                - "touchdowns" (rushing, receiving and return touchdowns)
 
         Returns:
             float: The stat value for the player.
             None: If player or stat is not found.
         """
-        try:
-            # Handle scrimmage_yards as a special case (rush + rec)
-            if stat_type == "scrimmage_yards":
-                rushing = ESPNClientService.get_player_stats(game_data, player_name, "rushing_yards")
-                receiving = ESPNClientService.get_player_stats(game_data, player_name, "receiving_yards")
-
-                # If both are None, return None (player not found)
-                if rushing is None and receiving is None:
-                    return None
-                # Otherwise add them (treating None as 0)
-                return (rushing or 0) + (receiving or 0)
-
-            # Map our stat types to ESPN's stat category names
-            stat_category_map = {
-                "passing_yards": ("passing", "passingYards"),
-                "passing_tds": ("passing", "passingTouchdowns"),
-                "passing_interceptions": ("passing", "interceptions"),
-                "passing_completions": ("passing", "completions"),
-                "rushing_yards": ("rushing", "rushingYards"),
-                "rushing_tds": ("rushing", "rushingTouchdowns"),
-                "receiving_yards": ("receiving", "receivingYards"),
-                "receiving_tds": ("receiving", "receivingTouchdowns"),
-                "receiving_receptions": ("receiving", "receptions"),
-            }
-
-            if stat_type not in stat_category_map:
-                return None
-
-            category, stat_key = stat_category_map[stat_type]
-
-            # Navigate through ESPN's JSON structure to find player stats
-            box_score = game_data.get("boxscore", {})
-            players = box_score.get("players", [])
-
-            # Search through both teams' player lists
-            for team in players:
-                statistics = team.get("statistics", [])
-
-                # Find the correct stat category (passing, rushing, or receiving)
-                for stat_group in statistics:
-                    if stat_group.get("name", "").lower() == category:
-                        athletes = stat_group.get("athletes", [])
-
-                        # Search for the player by name
-                        for athlete in athletes:
-                            athlete_name = athlete.get("athlete", {}).get("displayName", "")
-                            if athlete_name.lower() == player_name.lower():
-                                # Find the specific stat in the athlete's stats
-                                stats = athlete.get("stats", [])
-                                stat_keys = stat_group.get("keys", [])
-
-                                # Map stat keys to values
-                                for idx, key in enumerate(stat_keys):
-                                    if key == stat_key and idx < len(stats):
-                                        return float(stats[idx])
-
-            return None
-        except (IndexError, KeyError, TypeError, ValueError):
-            return None
+        return BoxScoreIndex(game_data).get_player_stat(player_name, stat_type)
 
     @staticmethod
-    def get_scoreboard(date: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def get_scoreboard(date: Optional[str] = None, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Fetch NFL scoreboard data for a specific date.
 
         Args:
             date (str, optional): Date in YYYYMMDD format (e.g., "20250115").
                                  If None, fetches current day's games.
+            use_cache (bool): If False, skip any cached scoreboard and fetch a fresh one
+                              (the fresh response still refreshes the cache).
 
         Returns:
             dict: Scoreboard data containing all games for the specified date.
@@ -255,9 +251,13 @@ class ESPNClientService:
         try:
             url = f"{ESPNClientService.BASE_URL}/scoreboard"
             params = {"dates": date} if date else {}
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            if not use_cache:
+                espn_response_cache.invalidate(("scoreboard", date))
+            return espn_response_cache.get_or_load(
+                ("scoreboard", date),
+                lambda: ESPNHttpClient.get_json(url, params=params, endpoint="scoreboard"),
+                ttl=ESPNClientService.CACHE_TTLS["scoreboard"]
+            )
         except requests.RequestException as e:
             print(f"Error fetching scoreboard: {e}")
             return None
@@ -298,9 +298,11 @@ class ESPNClientService:
                 # Fetch team roster from ESPN's roster endpoint
                 roster_url = f"{ESPNClientService.BASE_URL.replace('/summary', '')}/teams/{team_id}/roster"
                 try:
-                    roster_response = requests.get(roster_url, timeout=10)
-                    roster_response.raise_for_status()
-                    roster_data = roster_response.json()
+                    roster_data = espn_response_cache.get_or_load(
+                        ("roster", str(team_id)),
+                        lambda: ESPNHttpClient.get_json(roster_url, endpoint="roster"),
+                        ttl=ESPNClientService.CACHE_TTLS["roster"]
+                    )
 
                     # Parse roster data
                     athletes = roster_data.get("athletes", [])
@@ -0,0 +1,320 @@
+"""
+ESPN Game Snapshot for sharing one parsed ESPN payload across many games.
+
+Every league creates its own Game row for the same NFL game, so one ESPN
+event is usually referenced by many Game rows. A snapshot parses an ESPN
+summary payload once so the polling cycle can fan the result out to every
+Game (and prop) that shares the external_game_id.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, Iterable, Optional
+from app.services.boxScoreIndex import BoxScoreIndex, normalize_name
+from app.services.espnClientService import ESPNClientService
+from app.services.statExtractors import StatExtractor, get_extractor
+
+
+class ESPNGameSnapshot:
+    """
+    Parsed view of a single ESPN summary payload.
+
+    Attributes:
+        external_game_id (str): The ESPN event ID this snapshot was built from.
+        game_data (dict): The raw ESPN summary payload.
+        status (str): ESPN status name (e.g., "STATUS_IN_PROGRESS", "STATUS_FINAL").
+        is_completed (bool): True if the game is final.
+        scores (dict): Team abbreviation -> score (e.g., {"BAL": 28, "KC": 24}).
+        team_names (dict): Team abbreviation -> full name.
+        winning_team_id (str): Abbreviation of the winning team, None until final.
+        period (int): Current quarter (5+ is overtime), None if unknown.
+        clock (float): Seconds left in the current period, None if unknown.
+        is_red_zone (bool): True if the offense is inside the opponent's 20.
+        has_box_score (bool): False for snapshots built from a scoreboard event,
+            which carry scores and status but no player stats.
+    """
+
+    # Layout of to_compact() payloads; bump when it changes and keep reading older versions
+    COMPACT_FORMAT_VERSION = 1
+
+    def __init__(self, external_game_id: str, game_data: Dict[str, Any], has_box_score: bool = True):
+        self.external_game_id = external_game_id
+        self.game_data = game_data
+        self.has_box_score = has_box_score
+        self.status = ESPNClientService.get_game_status(game_data)
+        self.is_completed = self.status == "STATUS_FINAL"
+        self.scores = ESPNClientService.get_team_scores(game_data)
+        self.team_names = ESPNClientService.get_team_names(game_data)
+        self.winning_team_id = ESPNClientService.get_winning_team_id(game_data) if self.is_completed else None
+        self._box_score = None
+        self._touchdown_tally = None
+
+        status = ESPNGameSnapshot._get_competition(game_data).get("status", {}) or {}
+        self.period = ESPNGameSnapshot._to_number(status.get("period"), int)
+        self.clock = ESPNGameSnapshot._to_number(status.get("clock"), float)
+        situation = game_data.get("situation") or ESPNGameSnapshot._get_competition(game_data).get("situation") or {}
+        self.is_red_zone = bool(situation.get("isRedZone"))
+        self._last_play_id = (situation.get("lastPlay") or {}).get("id")
+
+    @property
+    def state_fingerprint(self) -> int:
+        """
+        Hash of the game state a scoreboard exposes: status, clock, scores and last play.
+
+        Player stats can only have moved if this changed since the last poll.
+        """
+        return hash((
+            self.status, self.period, self.clock, self._last_play_id,
+            tuple(sorted(self.scores.items()))
+        ))
+
+    @staticmethod
+    def _get_competition(game_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the first competition from the summary header, or {} if missing."""
+        try:
+            return game_data.get("header", {}).get("competitions", [{}])[0] or {}
+        except (IndexError, AttributeError, TypeError):
+            return {}
+
+    @staticmethod
+    def _to_number(value: Any, number_type: type) -> Optional[float]:
+        """Convert an ESPN status value to a number, or None if it isn't one."""
+        try:
+            return number_type(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def box_score(self) -> BoxScoreIndex:
+        """Player stat index, built on first use so score-only games never parse the box score."""
+        if self._box_score is None:
+            self._box_score = BoxScoreIndex(self.game_data)
+        return self._box_score
+
+    def get_touchdowns(self, player_name: str) -> Optional[int]:
+        """
+        Look up how many touchdowns a player has scored (rushing, receiving and returns).
+
+        The per-player tally is built from the box score once per snapshot, so
+        every Anytime TD option of every game sharing this event is a dict lookup.
+
+        Args:
+            player_name (str): The player's display name.
+
+        Returns:
+            int: Touchdowns scored, or None if the player isn't in the box score.
+        """
+        if not self.has_box_score:
+            return None
+        if self._touchdown_tally is None:
+            self._touchdown_tally = self.box_score.tally("touchdowns")
+        value = self._touchdown_tally.get(normalize_name(player_name))
+        if value is None:
+            # Not an exact name; try the nickname alias and, once the game is final, a fuzzy match
+            record = self.find_athlete(player_name)
+            value = get_extractor("touchdowns").from_record(record) if record is not None else None
+        return int(value) if value is not None else None
+
+    def find_athlete(self, player_name: Optional[str], athlete_id: Optional[str] = None,
+                     fuzzy: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Find an athlete in the box score by id, normalized name, nickname alias or, last, fuzzy name match.
+
+        Fuzzy matching only runs once the game is final. Before that a name can
+        be missing simply because the player hasn't recorded a stat yet (or is
+        inactive), and a similar name ("Derek Carr" / "Derek Carrier") would
+        hand them someone else's stats. Fuzzy results are never cached across
+        snapshots.
+
+        Args:
+            player_name (str): The player's name as entered on the prop.
+            athlete_id (str, optional): ESPN athlete id; if given, only the id is used.
+            fuzzy (bool): False to accept only exact and nickname alias matches.
+
+        Returns:
+            dict: The BoxScoreIndex athlete record, or None if not found.
+        """
+        if athlete_id:
+            return self.box_score.find_athlete(athlete_id=athlete_id)
+        record = self.box_score.find_athlete(player_name)
+        if record is not None or not player_name:
+            return record
+
+        if not fuzzy or not self.is_completed:
+            return None
+        record = self.box_score.fuzzy_find(player_name)
+        if record is not None:
+            print(f"Matched player name '{player_name}' to ESPN athlete {record['name']} ({record['id']})")
+        return record
+
+    @staticmethod
+    def from_scoreboard(scoreboard: Dict[str, Any]) -> Dict[str, "ESPNGameSnapshot"]:
+        """
+        Build score-only snapshots for every event on an ESPN scoreboard.
+
+        Scoreboard competitions share the summary header's shape (competitors,
+        scores, status), so they are wrapped as a header and parsed the same way.
+
+        Args:
+            scoreboard (dict): Payload from ESPNClientService.get_scoreboard().
+
+        Returns:
+            dict: ESPN event id -> snapshot without a box score.
+        """
+        snapshots = {}
+        for event in (scoreboard or {}).get("events", []) or []:
+            competitions = event.get("competitions") or []
+            if not event.get("id") or not competitions:
+                continue
+            game_data = {
+                "header": {"competitions": competitions[:1]},
+                "situation": competitions[0].get("situation")
+            }
+            snapshots[str(event["id"])] = ESPNGameSnapshot(str(event["id"]), game_data, has_box_score=False)
+        return snapshots
+
+    @staticmethod
+    def fetch(external_game_id: str) -> Optional["ESPNGameSnapshot"]:
+        """
+        Fetch an ESPN summary and parse it into a snapshot.
+
+        Args:
+            external_game_id (str): The ESPN game ID to fetch.
+
+        Returns:
+            ESPNGameSnapshot: The parsed snapshot.
+            None: If the ESPN request failed.
+        """
+        game_data = ESPNClientService.get_game_data(external_game_id)
+        if not game_data:
+            return None
+        return ESPNGameSnapshot(external_game_id, game_data)
+
+    def to_compact(self) -> bytes:
+        """
+        Serialize the parsed state (status, scores, team names, box score) for storage.
+
+        Only what polling and grading read is kept, with the box score stored
+        one column per stat, then zlib-compressed: a final summary of several
+        hundred KB becomes a few KB.
+
+        Returns:
+            bytes: Compressed payload for from_compact().
+        """
+        data = {
+            "v": ESPNGameSnapshot.COMPACT_FORMAT_VERSION,
+            "status": self.status,
+            "period": self.period,
+            "clock": self.clock,
+            "scores": self.scores,
+            "team_names": self.team_names,
+            "box_score": self.box_score.to_columns() if self.has_box_score else None,
+        }
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 9)
+
+    @staticmethod
+    def from_compact(external_game_id: str, payload: bytes) -> "ESPNGameSnapshot":
+        """
+        Rebuild a snapshot saved with to_compact(), without calling ESPN.
+
+        Args:
+            external_game_id (str): The ESPN event id the payload belongs to.
+            payload (bytes): Output of to_compact().
+
+        Returns:
+            ESPNGameSnapshot: A snapshot with the same status, scores and player stats.
+
+        Raises:
+            ValueError: If the payload is corrupt or from an unknown format version.
+        """
+        try:
+            data = json.loads(zlib.decompress(payload).decode("utf-8"))
+        except (zlib.error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Unreadable snapshot payload for ESPN event {external_game_id}: {e}") from e
+        if data.get("v") != ESPNGameSnapshot.COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unknown snapshot format version {data.get('v')} for ESPN event {external_game_id}")
+
+        team_names = data.get("team_names") or {}
+        competitors = [
+            {"team": {"abbreviation": team_id, "displayName": team_names.get(team_id)}, "score": str(score)}
+            for team_id, score in (data.get("scores") or {}).items()
+        ]
+        game_data = {"header": {"competitions": [{
+            "status": {"type": {"name": data.get("status")}, "period": data.get("period"), "clock": data.get("clock")},
+            "competitors": competitors,
+        }]}}
+
+        box_score = data.get("box_score")
+        snapshot = ESPNGameSnapshot(str(external_game_id), game_data, has_box_score=box_score is not None)
+        if box_score is not None:
+            snapshot._box_score = BoxScoreIndex.from_columns(box_score)
+        return snapshot
+
+    def get_player_stat(self, player_name: str, stat_type: str, athlete_id: Optional[str] = None) -> Optional[float]:
+        """
+        Look up a player's stat in this snapshot.
+
+        Args:
+            player_name (str): The player's display name (ignored for game stats).
+            stat_type (str): Stat type as used by OverUnderProp.stat_type, or "touchdowns".
+            athlete_id (str, optional): ESPN athlete id; if given, the name isn't used.
+
+        Returns:
+            float: The stat value, or None if the player/stat is not found.
+        """
+        request = (player_name, stat_type, athlete_id)
+        return self.get_stats([request]).get(request)
+
+    def get_stats(self, requests: Iterable[tuple]) -> Dict[tuple, float]:
+        """
+        Evaluate every stat a game's props need in one pass.
+
+        Each athlete is looked up once however many of their stats are asked
+        for, and each game stat (e.g. total_points) is computed once however
+        many props track it. The box score is only built if a player stat is
+        requested.
+
+        Args:
+            requests: (player_name, stat_type) or (player_name, stat_type,
+                athlete_id) tuples. Players are found by athlete id when one is
+                given, otherwise by name (see find_athlete); player_name is
+                ignored for game stats such as total_points.
+
+        Returns:
+            dict: request tuple -> value, for every request that has a value;
+                  unsupported stat types and unknown players are left out.
+        """
+        requests = list(requests)
+        stat_types_by_player = {}
+        game_values = {}
+        for request in requests:
+            player_name, stat_type = request[0], request[1]
+            athlete_id = request[2] if len(request) > 2 else None
+            extractor = get_extractor(stat_type)
+            if extractor is None:
+                continue
+            if extractor.scope == StatExtractor.GAME:
+                if stat_type not in game_values:
+                    game_values[stat_type] = extractor.from_scores(self.scores)
+            elif (player_name or athlete_id) and self.has_box_score:
+                stat_types_by_player.setdefault((player_name, athlete_id), set()).add(stat_type)
+
+        player_values = {}
+        for (player_name, athlete_id), stat_types in stat_types_by_player.items():
+            record = self.find_athlete(player_name, athlete_id=athlete_id)
+            if record is None:
+                continue
+            for stat_type in stat_types:
+                player_values[(player_name, athlete_id, stat_type)] = get_extractor(stat_type).from_record(record)
+
+        values = {}
+        for request in requests:
+            player_name, stat_type = request[0], request[1]
+            athlete_id = request[2] if len(request) > 2 else None
+            if stat_type in game_values:
+                value = game_values[stat_type]
+            else:
+                value = player_values.get((player_name, athlete_id, stat_type))
+            if value is not None:
+                values[request] = value
+        return values
@@ -0,0 +1,436 @@
+"""
+ESPN HTTP Client with a shared, pooled session.
+
+Every ESPN request goes through one module-level requests.Session so
+connections are kept alive across polls instead of paying a TCP+TLS
+handshake per call. The session retries transient failures with
+exponential backoff and jitter, revalidates payloads with ETag /
+Last-Modified so unchanged responses come back as 304s, and keeps
+per-endpoint latency counters and latency / response size histograms.
+
+A circuit breaker stops calling ESPN after repeated failures or slow
+responses and serves the last good payload per URL while it is open, and a
+per-thread deadline (see deadline()) caps every request, and its retries, at
+the time left in the caller's budget, so a degraded ESPN can't stall a polling cycle. For offline load testing, responses can be
+recorded to disk or served from a recording (see app/utils/espnReplay.py).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from app.services.circuitBreaker import CircuitBreaker
+from app.utils.metrics import Histogram, LATENCY_BUCKETS_MS, SIZE_BUCKETS_BYTES
+
+
+class CircuitOpenError(requests.RequestException):
+    """ESPN was skipped because the circuit breaker is open and no earlier payload is known."""
+
+
+class DeadlineExceededError(requests.Timeout):
+    """The caller's deadline passed before the request could be sent."""
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry policy that never starts another attempt after the calling thread's deadline.
+
+    urllib3 retries inside session.get(), so the per-request timeout cap alone
+    doesn't stop it from sleeping and trying again once the budget is spent.
+    Before each retry the wait (backoff, or Retry-After) is checked against the
+    time left; if the retry couldn't start before the deadline, retrying stops
+    and the last error or response is returned as if retries were exhausted.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response=response, error=error,
+                                      _pool=_pool, _stacktrace=_stacktrace)
+        at = ESPNHttpClient.get_deadline()
+        if at is None:
+            return new_retry
+
+        wait = new_retry.get_backoff_time()
+        if response is not None and self.respect_retry_after_header:
+            wait = self.get_retry_after(response) or wait
+        if time.monotonic() + wait >= at:
+            reason = error or ResponseError(f"deadline reached after a {response.status} error response")
+            raise MaxRetryError(_pool, url, reason) from reason
+        return new_retry
+
+
+class ESPNHttpClient:
+    """
+    Shared HTTP client for ESPN's public API.
+
+    All state is class-level so every caller (polling threads, request
+    handlers) shares the same connection pool, validator store and counters.
+    """
+
+    # Seconds to wait for ESPN before giving up on a single attempt
+    TIMEOUT = 10
+    # Max kept-alive connections per host; should cover ESPN_FETCH_CONCURRENCY
+    POOL_MAXSIZE = 16
+    # Retries for connection errors and 429/5xx responses
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.3
+    BACKOFF_JITTER = 0.2
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    # Max number of URLs whose ETag/Last-Modified and payload are remembered
+    MAX_VALIDATORS = 512
+    # Circuit breaker: consecutive failures (or responses slower than BREAKER_SLOW_CALL_MS)
+    # that open it, and seconds it stays open before a half-open probe
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_SLOW_CALL_MS = 4000
+    BREAKER_OPEN_SECONDS = 30
+    # Max number of URLs whose last good payload is kept to serve while the breaker is open
+    MAX_LAST_GOOD = 128
+
+    _session = None
+    _lock = threading.Lock()
+    _validators = OrderedDict()
+    _stats = {}
+    # endpoint -> {"latency_ms": Histogram, "response_bytes": Histogram}
+    _histograms = {}
+    _breaker = CircuitBreaker("ESPN", failure_threshold=BREAKER_FAILURE_THRESHOLD,
+                              slow_call_ms=BREAKER_SLOW_CALL_MS, open_seconds=BREAKER_OPEN_SECONDS)
+    # URL key -> last successful payload, served while the breaker is open
+    _last_good = OrderedDict()
+    # Per-thread deadline (time.monotonic()) set by deadline()
+    _local = threading.local()
+    # Optional ESPNRecorder / ESPNReplay (app/utils/espnReplay.py)
+    _recorder = None
+    _replay = None
+
+    @staticmethod
+    def _build_retry() -> Retry:
+        """Build the retry policy for the shared session; retries stop at the caller's deadline."""
+        return DeadlineRetry(
+            total=ESPNHttpClient.MAX_RETRIES,
+            connect=ESPNHttpClient.MAX_RETRIES,
+            read=ESPNHttpClient.MAX_RETRIES,
+            status=ESPNHttpClient.MAX_RETRIES,
+            backoff_factor=ESPNHttpClient.BACKOFF_FACTOR,
+            backoff_jitter=ESPNHttpClient.BACKOFF_JITTER,
+            status_forcelist=ESPNHttpClient.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Get the shared session, creating it on first use.
+
+        Returns:
+            requests.Session: Session with a pooled, retrying HTTPS/HTTP adapter.
+        """
+        if ESPNHttpClient._session is None:
+            with ESPNHttpClient._lock:
+                if ESPNHttpClient._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=ESPNHttpClient.POOL_MAXSIZE,
+                        max_retries=ESPNHttpClient._build_retry(),
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({"Accept": "application/json"})
+                    ESPNHttpClient._session = session
+        return ESPNHttpClient._session
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build a stable key for a URL and its query params."""
+        if not params:
+            return url
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return f"{url}?{query}"
+
+    @staticmethod
+    @contextmanager
+    def deadline(at: Optional[float]) -> Iterator[None]:
+        """
+        Cap every request made on this thread at a point in time.
+
+        Each request's timeout becomes the smaller of its own and the time
+        left, and requests made after the deadline fail at once with
+        DeadlineExceededError. Nested deadlines keep the earlier one.
+
+        Args:
+            at (float): Deadline as a time.monotonic() value, or None for no deadline.
+        """
+        previous = getattr(ESPNHttpClient._local, "deadline", None)
+        if at is not None and previous is not None:
+            at = min(at, previous)
+        ESPNHttpClient._local.deadline = at if at is not None else previous
+        try:
+            yield
+        finally:
+            ESPNHttpClient._local.deadline = previous
+
+    @staticmethod
+    def get_deadline() -> Optional[float]:
+        """The current thread's deadline (time.monotonic()), or None."""
+        return getattr(ESPNHttpClient._local, "deadline", None)
+
+    @staticmethod
+    def _budget_timeout(timeout: Optional[float], url: str) -> float:
+        """Per-attempt timeout for a request, capped at the time left before the thread's deadline."""
+        timeout = timeout or ESPNHttpClient.TIMEOUT
+        at = ESPNHttpClient.get_deadline()
+        if at is None:
+            return timeout
+        remaining = at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Deadline passed before requesting {url}")
+        return min(timeout, remaining)
+
+    @staticmethod
+    def _serve_last_good(key: str, endpoint: str, url: str) -> Dict[str, Any]:
+        """Payload to return instead of calling ESPN while the breaker is open."""
+        with ESPNHttpClient._lock:
+            stats = ESPNHttpClient._stats.setdefault(endpoint, {
+                "requests": 0,
+                "errors": 0,
+                "not_modified": 0,
+                "short_circuited": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            })
+            stats["short_circuited"] += 1
+            payload = ESPNHttpClient._last_good.get(key)
+        if payload is None:
+            raise CircuitOpenError(f"ESPN circuit breaker is open and no earlier response is known for {url}")
+        return payload
+
+    @staticmethod
+    def _is_upstream_failure(error: Exception) -> bool:
+        """Whether an error means ESPN is unhealthy (not e.g. a 404 for an unknown event)."""
+        if isinstance(error, DeadlineExceededError):
+            return False
+        response = getattr(error, "response", None)
+        if isinstance(error, requests.HTTPError) and response is not None:
+            return response.status_code >= 500 or response.status_code == 429
+        return True
+
+    @staticmethod
+    def _record(endpoint: str, elapsed_ms: float, outcome: str, size_bytes: Optional[int] = None) -> None:
+        """Add one request to the endpoint's latency counters and histograms."""
+        with ESPNHttpClient._lock:
+            stats = ESPNHttpClient._stats.setdefault(endpoint, {
+                "requests": 0,
+                "errors": 0,
+                "not_modified": 0,
+                "short_circuited": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            })
+            stats["requests"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            if outcome == "error":
+                stats["errors"] += 1
+            elif outcome == "not_modified":
+                stats["not_modified"] += 1
+
+            histograms = ESPNHttpClient._histograms.setdefault(endpoint, {
+                "latency_ms": Histogram(LATENCY_BUCKETS_MS),
+                "response_bytes": Histogram(SIZE_BUCKETS_BYTES),
+            })
+            histograms["latency_ms"].observe(elapsed_ms)
+            if size_bytes is not None:
+                histograms["response_bytes"].observe(size_bytes)
+
+    @staticmethod
+    def get_json(url: str, params: Optional[Dict[str, Any]] = None, endpoint: str = "other",
+                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        GET a JSON payload through the shared session.
+
+        If an earlier response for the same URL carried an ETag or
+        Last-Modified header, the request is sent as a conditional GET and a
+        304 returns the payload remembered from that earlier response.
+
+        Args:
+            url (str): Full URL to fetch.
+            params (dict, optional): Query string parameters.
+            endpoint (str): Name used for the latency counters (e.g., "summary").
+            timeout (float, optional): Per-attempt timeout in seconds.
+
+        Returns:
+            dict: The decoded JSON payload.
+
+        Raises:
+            requests.RequestException: If the request fails after retries.
+        """
+        replay = ESPNHttpClient._replay
+        if replay is not None:
+            started = time.perf_counter()
+            try:
+                payload = replay.get_json(url, params=params, endpoint=endpoint)
+            except requests.RequestException:
+                ESPNHttpClient._record(endpoint, (time.perf_counter() - started) * 1000, "error")
+                raise
+            ESPNHttpClient._record(endpoint, (time.perf_counter() - started) * 1000, "ok")
+            return payload
+
+        session = ESPNHttpClient.get_session()
+        key = ESPNHttpClient._cache_key(url, params)
+        request_timeout = ESPNHttpClient._budget_timeout(timeout, url)
+
+        breaker = ESPNHttpClient._breaker
+        if not breaker.allow_request():
+            return ESPNHttpClient._serve_last_good(key, endpoint, url)
+
+        headers = {}
+        with ESPNHttpClient._lock:
+            cached = ESPNHttpClient._validators.get(key)
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=request_timeout)
+            if response.status_code == 304 and cached is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                ESPNHttpClient._record(endpoint, elapsed_ms, "not_modified")
+                breaker.record_success(elapsed_ms)
+                return cached["payload"]
+
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            ESPNHttpClient._record(endpoint, elapsed_ms, "error")
+            if ESPNHttpClient._is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success(elapsed_ms)
+            if isinstance(e, requests.RequestException):
+                raise
+            raise requests.RequestException(f"Invalid JSON from {url}: {e}") from e
+        except BaseException:
+            # Never leave a half-open probe unreported
+            breaker.record_failure()
+            raise
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        ESPNHttpClient._record(endpoint, elapsed_ms, "ok", len(response.content))
+        breaker.record_success(elapsed_ms)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with ESPNHttpClient._lock:
+            if etag or last_modified:
+                ESPNHttpClient._validators[key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "payload": payload,
+                }
+                ESPNHttpClient._validators.move_to_end(key)
+                while len(ESPNHttpClient._validators) > ESPNHttpClient.MAX_VALIDATORS:
+                    ESPNHttpClient._validators.popitem(last=False)
+            else:
+                ESPNHttpClient._validators.pop(key, None)
+            ESPNHttpClient._last_good[key] = payload
+            ESPNHttpClient._last_good.move_to_end(key)
+            while len(ESPNHttpClient._last_good) > ESPNHttpClient.MAX_LAST_GOOD:
+                ESPNHttpClient._last_good.popitem(last=False)
+
+        recorder = ESPNHttpClient._recorder
+        if recorder is not None:
+            try:
+                recorder.record(endpoint, url, params, payload)
+            except Exception as e:
+                print(f"[ESPN] Failed to record {endpoint} response: {e}")
+
+        return payload
+
+    @staticmethod
+    def set_recorder(recorder) -> None:
+        """
+        Save every successful response with recorder.record(endpoint, url, params, payload).
+
+        Args:
+            recorder: An ESPNRecorder, or None to stop recording.
+        """
+        ESPNHttpClient._recorder = recorder
+
+    @staticmethod
+    def set_replay(replay) -> None:
+        """
+        Serve every request from replay.get_json(url, params, endpoint) instead of ESPN.
+
+        Args:
+            replay: An ESPNReplay, or None to go back to the network.
+        """
+        ESPNHttpClient._replay = replay
+
+    @staticmethod
+    def get_latency_stats() -> Dict[str, Dict[str, float]]:
+        """
+        Get per-endpoint request counters.
+
+        Returns:
+            dict: endpoint -> {"requests", "errors", "not_modified", "short_circuited",
+                  "total_ms", "max_ms", "avg_ms"}; short-circuited calls (breaker
+                  open) are not counted as requests
+        """
+        with ESPNHttpClient._lock:
+            result = {}
+            for endpoint, stats in ESPNHttpClient._stats.items():
+                entry = dict(stats)
+                entry["avg_ms"] = stats["total_ms"] / stats["requests"] if stats["requests"] else 0.0
+                result[endpoint] = entry
+            return result
+
+    @staticmethod
+    def get_breaker_stats() -> Dict[str, Any]:
+        """
+        Get the ESPN circuit breaker's state and counters.
+
+        Returns:
+            dict: See CircuitBreaker.get_stats().
+        """
+        return ESPNHttpClient._breaker.get_stats()
+
+    @staticmethod
+    def get_histograms() -> Dict[str, Dict[str, Histogram]]:
+        """
+        Get per-endpoint latency and response size histograms.
+
+        Response sizes only cover full (200) responses from ESPN; 304s, errors
+        and replayed responses have no body to measure.
+
+        Returns:
+            dict: endpoint -> {"latency_ms": Histogram, "response_bytes": Histogram},
+                  copies that later requests don't change
+        """
+        with ESPNHttpClient._lock:
+            return {
+                endpoint: {name: histogram.copy() for name, histogram in histograms.items()}
+                for endpoint, histograms in ESPNHttpClient._histograms.items()
+            }
+
+    @staticmethod
+    def reset() -> None:
+        """Close the shared session, close the breaker and clear remembered payloads and counters."""
+        with ESPNHttpClient._lock:
+            if ESPNHttpClient._session is not None:
+                ESPNHttpClient._session.close()
+            ESPNHttpClient._session = None
+            ESPNHttpClient._validators.clear()
+            ESPNHttpClient._stats.clear()
+            ESPNHttpClient._histograms.clear()
+            ESPNHttpClient._last_good.clear()
+        ESPNHttpClient._breaker.reset()
@@ -12,6 +12,8 @@ from app.models.props.anytimeTdProp import AnytimeTdProp
 from app.models.props.anytimeTdOption import AnytimeTdOption
 from app.models.propAnswers.anytimeTdAnswer import AnytimeTdAnswer
 from app.repositories.leagueRepository import get_league_by_name
+from app.services.game.schedulerService import SchedulerService
+from app.services.game.teamBindingService import TeamBindingService
 from app.repositories.gameRepository import get_game_by_id
 from app.repositories.playerRepository import get_player_by_username_and_leaguename, get_player_by_id
 from app.repositories.propRepository import get_variable_option_answers_for_prop, get_variable_option_prop_by_id, get_winner_loser_prop_by_id, get_over_under_prop_by_id, get_over_under_answers_for_prop, get_winner_loser_answers_for_prop, get_anytime_td_prop_by_id, get_anytime_td_answers_for_prop
@@ -349,6 +351,10 @@ class GameService:
 
         db.session.commit()
 
+        # A new tracked game may kick off before the scheduler's next wake-up
+        if new_game.external_game_id:
+            SchedulerService.schedule_next_poll()
+
         return {"message": "Created game successfully."}
 
     @staticmethod
@@ -438,6 +444,9 @@ class GameService:
             is_mandatory = is_mandatory
         )
 
+        # Store the ESPN team ids now so polling never has to match team names
+        TeamBindingService.bind_game_props(game, [new_prop])
+
         game.winner_loser_props.append(new_prop)
 
         db.session.add(new_prop)
@@ -711,6 +720,9 @@ class GameService:
             team_b_name=data.get('underdog_team')
         )
 
+        # Store the ESPN team ids now so polling never has to match team names
+        TeamBindingService.bind_game_props(game, [new_prop])
+
         game.winner_loser_props.append(new_prop)
         db.session.add(new_prop)
         db.session.commit()
@@ -980,14 +992,28 @@ class GameService:
         if 'game_name' in data and data['game_name']:
             game.game_name = data['game_name']
 
+        polling_changed = False
+
         # Update start time if provided
         if 'start_time' in data and data['start_time']:
             # Parse ISO format datetime string
             game.start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
+            polling_changed = True
 
         # Update external game ID if provided
         if 'external_game_id' in data:
-            game.external_game_id = data['external_game_id'] if data['external_game_id'] else None
+            external_game_id = data['external_game_id'] if data['external_game_id'] else None
+            if external_game_id != game.external_game_id:
+                # Team ids bound to the old ESPN event don't apply to the new one
+                for prop in game.winner_loser_props:
+                    prop.team_a_id = prop.team_b_id = None
+            game.external_game_id = external_game_id
+            TeamBindingService.bind_game_props(game)
+            polling_changed = True
+
+        # Poll from the (new) kickoff instead of a next_poll_at computed for the old schedule
+        if polling_changed:
+            game.next_poll_at = None
 
         # Update prop_limit if provided
         if 'prop_limit' in data and data['prop_limit']:
@@ -995,4 +1021,8 @@ class GameService:
 
         db.session.commit()
 
+        # Re-arm the scheduler so it wakes for the new kickoff
+        if polling_changed:
+            SchedulerService.schedule_next_poll()
+
         return {"message": "Game updated successfully."}
@@ -1,19 +1,29 @@
+from collections import defaultdict
+from decimal import Decimal
 from flask import abort
 from app import db
 from app.models.gameModel import Game
-from app.repositories.gameRepository import get_game_by_id
+from app.repositories.gameRepository import get_game_with_props
 from app.repositories.propRepository import (
-    get_winner_loser_answers_for_prop,
-    get_over_under_answers_for_prop,
-    get_variable_option_answers_for_prop,
     get_winner_loser_prop_by_id,
     get_over_under_prop_by_id,
     get_variable_option_prop_by_id,
     get_anytime_td_prop_by_id,
-    get_anytime_td_answers_for_prop,
-    get_player_prop_selections_for_game
+    get_winner_loser_answers_for_props,
+    get_over_under_answers_for_props,
+    get_variable_option_answers_for_props,
+    get_anytime_td_answers_for_props,
+    get_prop_selections_for_game,
+    get_prop_selection_player_ids
+)
+from app.repositories.playerRepository import add_points_to_players
+from app.repositories.pointAwardRepository import (
+    get_point_awards_for_game,
+    get_point_awards_for_prop,
+    insert_point_awards,
+    delete_point_awards_for_prop,
+    delete_point_awards_for_game
 )
-from app.repositories.playerRepository import get_player_by_id
 from app.validators.gameValidator import validate_game_exists, validate_game_id
 from app.validators.propValidator import validate_prop_exists, validate_prop_id, validate_answer
 from app.validators.leagueValidator import validate_league_name
@@ -24,30 +34,10 @@ class GradeGameService:
     Service class for handling game grading and regrading logic.
 
     This class manages grading games by calculating and awarding points to players
-    based on their answers, and handles regrading by deducting old points when
-    correct answers are changed after a game has been graded.
+    based on their answers. Every award is recorded in the PointAward ledger, so
+    regrading a prop after its correct answer changes only applies the difference.
     """
 
-    @staticmethod
-    def _has_player_selected_prop(player_id, game_id, prop_type, prop_id):
-        """
-        Check if a player has selected a specific prop for a game.
-
-        Args:
-            player_id (int): The player's ID
-            game_id (int): The game's ID
-            prop_type (str): Type of prop ("winner_loser", "over_under", "variable_option", or "anytime_td")
-            prop_id (int): The prop's ID
-
-        Returns:
-            bool: True if the player has selected this prop, False otherwise
-        """
-        selections = get_player_prop_selections_for_game(player_id, game_id)
-        for selection in selections:
-            if selection.prop_type == prop_type and selection.prop_id == prop_id:
-                return True
-        return False
-
     @staticmethod
     def auto_grade_props_from_live_data(game):
         """
@@ -105,121 +95,379 @@ class GradeGameService:
         db.session.commit()
 
     @staticmethod
-    def grade_game(game_id):
+    def _to_points(value):
         """
-        Grade a game by awarding points to players for correct answers.
+        Normalize a point value to Decimal.
 
-        Iterates through all winner/loser, over/under, and variable option props
-        in the game and awards points to players whose answers match the correct answers.
+        Prop point columns are a mix of Numeric (Decimal) and Float, so everything is
+        converted before it is summed. Missing values count as 0.
 
         Args:
-            game_id (int): The unique identifier of the game to grade.
+            value: The point value (Decimal, float, int, or None).
 
         Returns:
-            None
+            Decimal: The point value as a Decimal.
+        """
+        if value is None:
+            return Decimal(0)
+        if isinstance(value, Decimal):
+            return value
+        return Decimal(str(value))
 
-        Raises:
-            400: If game_id validation fails.
-            404: If the game doesn't exist.
+    @staticmethod
+    def _is_eligible(prop, player_id, selected_player_ids):
         """
-        game_id = validate_game_id(game_id)
-        game = get_game_by_id(game_id)
-        validate_game_exists(game)
+        Check whether an answer counts toward a player's score.
 
-        # Iterate through the winner_loser_props of the game
-        for prop in game.winner_loser_props:
-            # Get all the answers for the current prop (for all players)
-            answers = get_winner_loser_answers_for_prop(prop.id)
-
-            # Iterate through each answer to grade it
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)  # Get the player who submitted the answer
-
-                # For optional props, check if player selected this prop
-                if not prop.is_mandatory:
-                    if not GradeGameService._has_player_selected_prop(player.id, game.id, "winner_loser", prop.id):
-                        continue  # Skip grading if player didn't select this optional prop
-
-                # Check if the player's answer matches the correct answer
-                if player is not None and answer.answer == prop.correct_answer:
-                    print("HERE")
-                    # If the answer is correct, assign the appropriate points
-                    if answer.answer == prop.favorite_team:
-                        print("Before: ", player.points)
-                        player.points += prop.favorite_points  # Add favorite points
-                        print("After: ", player.points)
-                    elif answer.answer == prop.underdog_team:
-                        print("Before: ", player.points)
-                        player.points += prop.underdog_points  # Add underdog points
-                        print("After: ", player.points)
+        Mandatory props always count. Optional props only count if the player selected them.
 
-        for prop in game.over_under_props:
-            answers = get_over_under_answers_for_prop(prop.id)
+        Args:
+            prop: The prop being graded.
+            player_id (int): The player who submitted the answer.
+            selected_player_ids (set): IDs of players who selected this prop.
 
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
-                print(answer.answer)
+        Returns:
+            bool: True if the answer should be graded.
+        """
+        return prop.is_mandatory or player_id in selected_player_ids
 
-                # For optional props, check if player selected this prop
-                if not prop.is_mandatory:
-                    if not GradeGameService._has_player_selected_prop(player.id, game.id, "over_under", prop.id):
-                        continue  # Skip grading if player didn't select this optional prop
+    @staticmethod
+    def _score_winner_loser_prop(prop, answers, selected_player_ids):
+        """
+        Score every answer for a winner/loser prop in memory.
 
-                # Case-insensitive comparison for safety
-                if player is not None and answer.answer.lower() == prop.correct_answer.lower():
-                    if answer.answer.lower() == "over":
-                        player.points += prop.over_points
-                    elif answer.answer.lower() == "under":
-                        player.points += prop.under_points
+        Args:
+            prop (WinnerLoserProp): The prop being graded.
+            answers (list): Answer rows (player_id, prop_id, answer) for this prop.
+            selected_player_ids (set): IDs of players who selected this prop.
 
-        for prop in game.variable_option_props:
-            answers = get_variable_option_answers_for_prop(prop.id)
+        Returns:
+            dict: Mapping of player_id to points awarded for this prop.
+        """
+        awards = {}
+        if prop.correct_answer is None:
+            return awards
+
+        for answer in answers:
+            if not GradeGameService._is_eligible(prop, answer.player_id, selected_player_ids):
+                continue
+            if answer.answer != prop.correct_answer:
+                continue
+
+            # Points depend on which team they picked
+            if answer.answer == prop.favorite_team:
+                points = GradeGameService._to_points(prop.favorite_points)
+            elif answer.answer == prop.underdog_team:
+                points = GradeGameService._to_points(prop.underdog_points)
+            else:
+                continue
+
+            awards[answer.player_id] = awards.get(answer.player_id, Decimal(0)) + points
+        return awards
 
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
+    @staticmethod
+    def _score_over_under_prop(prop, answers, selected_player_ids):
+        """
+        Score every answer for an over/under prop in memory (case-insensitive).
 
-                # For optional props, check if player selected this prop
-                if not prop.is_mandatory:
-                    if not GradeGameService._has_player_selected_prop(player.id, game.id, "variable_option", prop.id):
-                        continue  # Skip grading if player didn't select this optional prop
+        Args:
+            prop (OverUnderProp): The prop being graded.
+            answers (list): Answer rows (player_id, prop_id, answer) for this prop.
+            selected_player_ids (set): IDs of players who selected this prop.
 
-                for correct in prop.correct_answer:
-                    if player is not None and answer.answer == correct:
-                        points_to_add = 0
+        Returns:
+            dict: Mapping of player_id to points awarded for this prop.
+        """
+        awards = {}
+        if prop.correct_answer is None:
+            return awards
+
+        correct = prop.correct_answer.lower()
+        for answer in answers:
+            if not GradeGameService._is_eligible(prop, answer.player_id, selected_player_ids):
+                continue
+            if answer.answer is None or answer.answer.lower() != correct:
+                continue
+
+            if correct == "over":
+                points = GradeGameService._to_points(prop.over_points)
+            elif correct == "under":
+                points = GradeGameService._to_points(prop.under_points)
+            else:
+                continue
+
+            awards[answer.player_id] = awards.get(answer.player_id, Decimal(0)) + points
+        return awards
 
-                        for option in prop.options:
-                            if answer.answer == option.answer_choice:
-                                points_to_add = option.answer_points
+    @staticmethod
+    def _score_variable_option_prop(prop, answers, selected_player_ids):
+        """
+        Score every answer for a variable option prop in memory.
 
-                        print(points_to_add)
-                        player.points += points_to_add
+        Args:
+            prop (VariableOptionProp): The prop being graded.
+            answers (list): Answer rows (player_id, prop_id, answer) for this prop.
+            selected_player_ids (set): IDs of players who selected this prop.
 
-        # Grade Anytime TD props
-        for prop in game.anytime_td_props:
-            answers = get_anytime_td_answers_for_prop(prop.id)
+        Returns:
+            dict: Mapping of player_id to points awarded for this prop.
+        """
+        awards = {}
+        if not prop.correct_answer:
+            return awards
+
+        # When two options share a choice text, the last one wins (matches the old option walk)
+        option_points = {option.answer_choice: option.answer_points for option in prop.options}
+
+        for answer in answers:
+            if not GradeGameService._is_eligible(prop, answer.player_id, selected_player_ids):
+                continue
+
+            # Each matching entry in correct_answer awards the option's points
+            matches = sum(1 for correct in prop.correct_answer if answer.answer == correct)
+            if matches == 0:
+                continue
+
+            points = GradeGameService._to_points(option_points.get(answer.answer)) * matches
+            awards[answer.player_id] = awards.get(answer.player_id, Decimal(0)) + points
+        return awards
+
+    @staticmethod
+    def _score_anytime_td_prop(prop, answers, selected_player_ids):
+        """
+        Score every answer for an anytime TD prop in memory.
+
+        correct_answer is a JSON array of player names who hit their TD lines, and each
+        option carries its own point value.
+
+        Args:
+            prop (AnytimeTdProp): The prop being graded.
+            answers (list): Answer rows (player_id, prop_id, answer) for this prop.
+            selected_player_ids (set): IDs of players who selected this prop.
+
+        Returns:
+            dict: Mapping of player_id to points awarded for this prop.
+        """
+        awards = {}
+        if not prop.correct_answer:
+            return awards
+
+        # First option with a given player name wins (matches the old option walk)
+        option_points = {}
+        for option in prop.options:
+            option_points.setdefault(option.player_name, option.points)
+
+        for answer in answers:
+            if not GradeGameService._is_eligible(prop, answer.player_id, selected_player_ids):
+                continue
+            if answer.answer not in prop.correct_answer:
+                continue
+
+            points = GradeGameService._to_points(option_points.get(answer.answer))
+            awards[answer.player_id] = awards.get(answer.player_id, Decimal(0)) + points
+        return awards
+
+    @staticmethod
+    def _prop_graders():
+        """
+        Map each prop type to its batch answer loader and in-memory scorer.
+
+        Returns:
+            dict: prop_type -> (load_answers(prop_ids), score_prop(prop, answers, selected_player_ids))
+        """
+        return {
+            "winner_loser": (get_winner_loser_answers_for_props, GradeGameService._score_winner_loser_prop),
+            "over_under": (get_over_under_answers_for_props, GradeGameService._score_over_under_prop),
+            "variable_option": (get_variable_option_answers_for_props, GradeGameService._score_variable_option_prop),
+            "anytime_td": (get_anytime_td_answers_for_props, GradeGameService._score_anytime_td_prop),
+        }
+
+    @staticmethod
+    def _score_game_props(game):
+        """
+        Load everything needed to grade a game in a few queries and score it in memory.
+
+        Runs one query per prop type for answers and one query for all prop selections
+        (skipped when the game has no optional props), instead of querying per answer.
+
+        Args:
+            game (Game): The game to score.
+
+        Returns:
+            list: (prop_type, prop, awards) tuples, where awards maps player_id to the
+                  points that prop awards.
+        """
+        prop_groups = [
+            ("winner_loser", game.winner_loser_props),
+            ("over_under", game.over_under_props),
+            ("variable_option", game.variable_option_props),
+            ("anytime_td", game.anytime_td_props),
+        ]
+        graders = GradeGameService._prop_graders()
+
+        # Which players selected which optional props: {(prop_type, prop_id): {player_id, ...}}
+        selected = defaultdict(set)
+        if any(not prop.is_mandatory for _, props in prop_groups for prop in props):
+            for selection in get_prop_selections_for_game(game.id):
+                selected[(selection.prop_type, selection.prop_id)].add(selection.player_id)
+
+        scored = []
+        for prop_type, props in prop_groups:
+            load_answers, score_prop = graders[prop_type]
+
+            answers_by_prop = defaultdict(list)
+            for answer in load_answers([prop.id for prop in props]):
+                answers_by_prop[answer.prop_id].append(answer)
+
+            for prop in props:
+                awards = score_prop(prop, answers_by_prop[prop.id], selected[(prop_type, prop.id)])
+                scored.append((prop_type, prop, awards))
+
+        return scored
+
+    @staticmethod
+    def _score_prop(game, prop_type, prop):
+        """
+        Score a single prop, loading only that prop's answers and selections.
+
+        Args:
+            game (Game): The game the prop belongs to.
+            prop_type (str): "winner_loser", "over_under", "variable_option", or "anytime_td".
+            prop: The prop to score.
 
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
+        Returns:
+            dict: Mapping of player_id to points awarded for this prop.
+        """
+        load_answers, score_prop = GradeGameService._prop_graders()[prop_type]
+
+        selected = set()
+        if not prop.is_mandatory:
+            selected = set(get_prop_selection_player_ids(game.id, prop_type, prop.id))
+
+        return score_prop(prop, load_answers([prop.id]), selected)
+
+    @staticmethod
+    def _apply_award_deltas(previous, current):
+        """
+        Apply the difference between two sets of awards to Player.points.
+
+        Args:
+            previous (dict): player_id -> points previously recorded in the ledger.
+            current (dict): player_id -> points the ledger now records.
+
+        Returns:
+            dict: player_id -> point change that was applied (zero changes are left out).
+        """
+        deltas = {}
+        for player_id in set(previous) | set(current):
+            delta = current.get(player_id, Decimal(0)) - previous.get(player_id, Decimal(0))
+            if delta:
+                deltas[player_id] = delta
+
+        add_points_to_players(deltas)
+        return deltas
+
+    @staticmethod
+    def _ensure_point_awards_recorded(game):
+        """
+        Backfill ledger rows for a game that was graded before the ledger existed.
+
+        The points are already in Player.points, so this only records them. Must be
+        called before a correct answer changes so the old awards are captured.
+        Whether a game is in the ledger is read from Game.points_ledgered, not from
+        the presence of rows: a game where nobody scored has none.
 
-                # For optional props, check if player selected this prop
-                if not prop.is_mandatory:
-                    if not GradeGameService._has_player_selected_prop(player.id, game.id, "anytime_td", prop.id):
-                        continue  # Skip grading if player didn't select this optional prop
+        Args:
+            game (Game): A game that has already been graded.
 
-                # Check if the player's selected player is in the correct_answer array
-                # correct_answer is a JSON array of player names who hit their TD lines
-                if player is not None and prop.correct_answer and answer.answer in prop.correct_answer:
-                    # Find the corresponding option to get the points
-                    points_to_add = 0
-                    for option in prop.options:
-                        if option.player_name == answer.answer:
-                            points_to_add = option.points
-                            break
+        Returns:
+            bool: True if ledger rows were backfilled, False if the game was already in the ledger.
+        """
+        if game.points_ledgered:
+            return False
 
-                    print(f"Anytime TD: Awarding {points_to_add} points to {player.name} for selecting {answer.answer}")
-                    player.points += points_to_add
+        for prop_type, prop, awards in GradeGameService._score_game_props(game):
+            insert_point_awards(game.id, prop_type, prop.id, awards)
+        game.points_ledgered = True
+        print(f"Backfilled point ledger for previously graded game {game.id}")
+        return True
+
+    @staticmethod
+    def _regrade_prop(game, prop_type, prop):
+        """
+        Regrade one prop against its current correct answer using the ledger.
+
+        Replaces the prop's ledger rows and applies only the point difference, so the
+        cost is proportional to the answers for this prop, not the whole game.
+
+        Args:
+            game (Game): The game the prop belongs to.
+            prop_type (str): "winner_loser", "over_under", "variable_option", or "anytime_td".
+            prop: The prop whose correct answer was set.
+
+        Returns:
+            dict: player_id -> point change that was applied.
+        """
+        previous = {
+            row.player_id: GradeGameService._to_points(row.points)
+            for row in get_point_awards_for_prop(game.id, prop_type, prop.id)
+        }
+        current = GradeGameService._score_prop(game, prop_type, prop)
+
+        delete_point_awards_for_prop(game.id, prop_type, prop.id)
+        insert_point_awards(game.id, prop_type, prop.id, current)
+
+        deltas = GradeGameService._apply_award_deltas(previous, current)
+        print(f"Regraded {prop_type} prop {prop.id}: adjusted points for {len(deltas)} player(s)")
+        return deltas
+
+    @staticmethod
+    def grade_game(game_id):
+        """
+        Grade a game by awarding points to players for correct answers.
+
+        Loads all answers and prop selections for the game in bulk and scores every
+        winner/loser, over/under, variable option, and anytime TD prop in memory. The
+        awards replace the game's rows in the PointAward ledger, and only the difference
+        from what was previously recorded is applied to Player.points (one UPDATE).
+        Running this more than once (e.g. from polling and then from /grade_game) is safe.
+
+        Args:
+            game_id (int): The unique identifier of the game to grade.
+
+        Returns:
+            None
+
+        Raises:
+            400: If game_id validation fails.
+            404: If the game doesn't exist.
+        """
+        game_id = validate_game_id(game_id)
+        game = get_game_with_props(game_id)
+        validate_game_exists(game)
+
+        if game.graded and GradeGameService._ensure_point_awards_recorded(game):
+            # Graded before the ledger existed - points were already awarded, nothing to apply
+            db.session.commit()
+            return
+
+        previous = defaultdict(Decimal)
+        for row in get_point_awards_for_game(game.id):
+            previous[row.player_id] += GradeGameService._to_points(row.points)
+
+        delete_point_awards_for_game(game.id)
+
+        current = defaultdict(Decimal)
+        for prop_type, prop, awards in GradeGameService._score_game_props(game):
+            insert_point_awards(game.id, prop_type, prop.id, awards)
+            for player_id, points in awards.items():
+                current[player_id] += points
+
+        deltas = GradeGameService._apply_award_deltas(previous, current)
+        print(f"Graded game {game.id}: adjusted points for {len(deltas)} player(s)")
 
         game.graded = 1
+        game.points_ledgered = True
 
         db.session.commit()
 
@@ -228,8 +476,8 @@ class GradeGameService:
         """
         Set the correct answer for a variable option prop and handle regrading.
 
-        If the game has already been graded, deducts points from players who got
-        the old correct answer before updating to the new correct answer.
+        If the game has already been graded, the prop is regraded through the point
+        ledger: its old awards are replaced and only the difference is applied.
 
         Args:
             leaguename (str): The name of the league (for validation context).
@@ -249,44 +497,19 @@ class GradeGameService:
 
         p = get_variable_option_prop_by_id(prop_id)
         validate_prop_exists(p)
-        print(prop_id)
 
         game = Game.query.filter_by(id=p.game_id).first()
         validate_game_exists(game)
 
-        # If game already graded, deduct points for OLD correct answer before updating
-        if game.graded != 0:
-            # Only get answers for THIS specific prop
-            answers = get_variable_option_answers_for_prop(prop_id)
-            old_correct_answers = p.correct_answer  # Get OLD correct answer before updating
-
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
-
-                # If player's answer matched the OLD correct answer, deduct those points
-                if player is not None and answer.answer in old_correct_answers:
-                    points_to_reduce = 0
-
-                    for opt in p.options:
-                        if opt.answer_choice == answer.answer:
-                            points_to_reduce = opt.answer_points
-                            break
-
-                    player.points -= points_to_reduce
-                    print(f"Deducted {points_to_reduce} points from player {player.name}")
-
-        # Update to NEW correct answer
-        print(ans)
-        p.correct_answer = ans
-        db.session.commit()
+        GradeGameService._set_correct_answer(game, "variable_option", p, ans)
 
     @staticmethod
     def set_correct_winner_loser_prop(leaguename, prop_id, ans):
         """
         Set the correct answer for a winner/loser prop and handle regrading.
 
-        If the game has already been graded, deducts points from players who got
-        the old correct answer before updating to the new correct answer.
+        If the game has already been graded, the prop is regraded through the point
+        ledger: its old awards are replaced and only the difference is applied.
 
         Args:
             leaguename (str): The name of the league (for validation context).
@@ -310,40 +533,15 @@ class GradeGameService:
         game = Game.query.filter_by(id=p.game_id).first()
         validate_game_exists(game)
 
-        # If game already graded, deduct points for OLD correct answer before updating
-        if game.graded != 0:
-            # Only get answers for THIS specific prop
-            answers = get_winner_loser_answers_for_prop(prop_id)
-            old_correct_answer = p.correct_answer  # Get OLD correct answer before updating
-
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
-
-                # If player's answer matched the OLD correct answer, deduct those points
-                if player is not None and answer.answer == old_correct_answer:
-                    print(f"Old correct answer: {old_correct_answer}")
-                    # Deduct points based on which team they picked
-                    if answer.answer == p.favorite_team:
-                        player.points -= p.favorite_points
-                        print(f"Deducted {p.favorite_points} points from player {player.name}")
-                    elif answer.answer == p.underdog_team:
-                        player.points -= p.underdog_points
-                        print(f"Deducted {p.underdog_points} points from player {player.name}")
-
-        # Update to NEW correct answer
-        print("Correct winner/loser answer: ", ans)
-        p.correct_answer = ans
-        db.session.commit()
-
-        print("Checking winner/loser prop answer saved or not: ", p.correct_answer)
+        GradeGameService._set_correct_answer(game, "winner_loser", p, ans)
 
     @staticmethod
     def set_correct_over_under_prop(leaguename, prop_id, ans):
         """
         Set the correct answer for an over/under prop and handle regrading.
 
-        If the game has already been graded, deducts points from players who got
-        the old correct answer before updating to the new correct answer. Uses
+        If the game has already been graded, the prop is regraded through the point
+        ledger: its old awards are replaced and only the difference is applied. Uses
         case-insensitive comparison for "over" and "under" answers.
 
         Args:
@@ -368,31 +566,7 @@ class GradeGameService:
         game = Game.query.filter_by(id=p.game_id).first()
         validate_game_exists(game)
 
-        print(f"Game graded status: {game.graded}")
-
-        # If game already graded, deduct points for OLD correct answer before updating
-        if game.graded != 0:
-            # Only get answers for THIS specific prop
-            answers = get_over_under_answers_for_prop(prop_id)
-            old_correct_answer = p.correct_answer  # Get OLD correct answer before updating
-
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
-
-                # If player's answer matched the OLD correct answer, deduct those points (case-insensitive)
-                if player is not None and answer.answer.lower() == old_correct_answer.lower():
-                    if answer.answer.lower() == "over":
-                        player.points -= p.over_points
-                        print(f"Deducted {p.over_points} points from player {player.name}")
-                    elif answer.answer.lower() == "under":
-                        player.points -= p.under_points
-                        print(f"Deducted {p.under_points} points from player {player.name}")
-
-        # Update to NEW correct answer
-        print("ANSWER: ", ans)
-        p.correct_answer = ans
-        db.session.commit()
-        print("prop answer: ", p.correct_answer)
+        GradeGameService._set_correct_answer(game, "over_under", p, ans)
 
     @staticmethod
     def set_correct_anytime_td_prop(leaguename, prop_id, ans):
@@ -400,8 +574,8 @@ class GradeGameService:
         Set the correct answer for an anytime TD prop and handle regrading.
 
         The correct answer should be an array of player names who hit their TD lines.
-        If the game has already been graded, deducts points from players who got
-        the old correct answer before updating to the new correct answer.
+        If the game has already been graded, the prop is regraded through the point
+        ledger: its old awards are replaced and only the difference is applied.
 
         Args:
             leaguename (str): The name of the league (for validation context).
@@ -422,33 +596,36 @@ class GradeGameService:
 
         p = get_anytime_td_prop_by_id(prop_id)
         validate_prop_exists(p)
-        print(prop_id)
 
         game = Game.query.filter_by(id=p.game_id).first()
         validate_game_exists(game)
 
-        # If game already graded, deduct points for OLD correct answer before updating
-        if game.graded != 0:
-            # Only get answers for THIS specific prop
-            answers = get_anytime_td_answers_for_prop(prop_id)
-            old_correct_answers = p.correct_answer if p.correct_answer else []  # Get OLD correct answers before updating
-
-            for answer in answers:
-                player = get_player_by_id(answer.player_id)
-
-                # If player's answer matched the OLD correct answer, deduct those points
-                if player is not None and answer.answer in old_correct_answers:
-                    # Find the corresponding option to get the points to deduct
-                    points_to_reduce = 0
-                    for opt in p.options:
-                        if opt.player_name == answer.answer:
-                            points_to_reduce = opt.points
-                            break
-
-                    player.points -= points_to_reduce
-                    print(f"Deducted {points_to_reduce} points from player {player.name}")
-
-        # Update to NEW correct answer
-        print(ans)
-        p.correct_answer = ans
+        GradeGameService._set_correct_answer(game, "anytime_td", p, ans)
+
+    @staticmethod
+    def _set_correct_answer(game, prop_type, prop, ans):
+        """
+        Update a prop's correct answer and regrade it if the game was already graded.
+
+        Args:
+            game (Game): The game the prop belongs to.
+            prop_type (str): "winner_loser", "over_under", "variable_option", or "anytime_td".
+            prop: The prop being updated.
+            ans: The new correct answer (string or list depending on prop type).
+
+        Returns:
+            None
+        """
+        already_graded = game.graded != 0
+
+        # Capture the awards for the OLD correct answer if this game predates the ledger
+        if already_graded:
+            GradeGameService._ensure_point_awards_recorded(game)
+
+        print(f"Correct {prop_type} answer for prop {prop.id}: {ans}")
+        prop.correct_answer = ans
+
+        if already_graded:
+            GradeGameService._regrade_prop(game, prop_type, prop)
+
         db.session.commit()
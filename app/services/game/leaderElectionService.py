@@ -0,0 +1,204 @@
+"""
+Leader Election Service for running the polling scheduler in one process.
+
+Every gunicorn worker (on every host) starts a scheduler, but only the
+worker holding a Postgres session-level advisory lock polls ESPN. The lock
+is taken with pg_try_advisory_lock on a dedicated connection that is kept
+open for as long as the worker leads, so it is released by Postgres itself
+when the leader exits, crashes or loses its connection. Followers keep
+their own connection open, retry the lock on it periodically, and the
+first one to get the lock takes over.
+"""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from app import db
+import threading
+
+
+class LeaderElectionService:
+    """
+    Service class for holding the scheduler leader lock.
+
+    All state is class-level: a worker process is either the leader or not,
+    and it keeps one lock connection open whether it leads or follows.
+    """
+
+    # Advisory lock key shared by every process polling the same database
+    LOCK_KEY = 7301920466
+    # Server-side TCP keepalive settings for the lock connection, so Postgres drops
+    # the lock of a leader whose host vanished within ~idle + interval * count seconds
+    KEEPALIVE_IDLE_SECONDS = 10
+    KEEPALIVE_INTERVAL_SECONDS = 5
+    KEEPALIVE_COUNT = 3
+    # LISTEN/NOTIFY channel other processes use to tell the leader the schedule changed
+    SCHEDULE_CHANNEL = "pickem_schedule_changed"
+
+    _engine = None
+    _connection = None
+    _is_leader = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_leader() -> bool:
+        """
+        Check whether this process currently holds the leader lock.
+
+        Returns:
+            bool: True if this process should run the polling job.
+        """
+        return LeaderElectionService._is_leader
+
+    @staticmethod
+    def try_acquire() -> bool:
+        """
+        Take the leader lock if it is free, or confirm it is still held.
+
+        Leaders and followers both keep one long-lived lock connection: a
+        leader checks that it is still alive (if not, Postgres has already
+        released the lock and this process competes for it again), and a
+        follower retries pg_try_advisory_lock on it instead of reconnecting
+        every check. Databases without advisory locks (SQLite in local
+        development) run a single process, which always leads.
+
+        Must be called inside a Flask app context.
+
+        Returns:
+            bool: True if this process is the leader after the call.
+        """
+        with LeaderElectionService._lock:
+            if db.engine.dialect.name != "postgresql":
+                LeaderElectionService._is_leader = True
+                return True
+
+            if LeaderElectionService._is_leader:
+                try:
+                    LeaderElectionService._connection.execute(text("SELECT 1"))
+                    return True
+                except Exception as e:
+                    print(f"[LEADER] Lost leader lock connection: {e}")
+                    LeaderElectionService._close_connection()
+
+            if LeaderElectionService._connection is None and not LeaderElectionService._open_connection():
+                return False
+
+            connection = LeaderElectionService._connection
+            try:
+                acquired = connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": LeaderElectionService.LOCK_KEY}
+                ).scalar()
+                if acquired:
+                    # Hear about schedule changes made by other processes (see notify_schedule_changed)
+                    connection.execute(text(f"LISTEN {LeaderElectionService.SCHEDULE_CHANNEL}"))
+            except Exception as e:
+                print(f"[LEADER] Error taking leader lock: {e}")
+                LeaderElectionService._close_connection()
+                return False
+
+            LeaderElectionService._is_leader = bool(acquired)
+            return LeaderElectionService._is_leader
+
+    @staticmethod
+    def notify_schedule_changed() -> None:
+        """
+        Tell the leader that a game's kickoff or polling state changed.
+
+        Called by processes that are not the leader after committing such a
+        change, so the leader re-arms its polling job on its next check
+        instead of recomputing the wake time every check. Best effort: a
+        missed notification only delays polling until the job's next run.
+
+        Must be called inside a Flask app context.
+        """
+        try:
+            if db.engine.dialect.name != "postgresql":
+                return
+            with db.engine.connect() as connection:
+                connection.execute(text("SELECT pg_notify(:channel, '')"),
+                                   {"channel": LeaderElectionService.SCHEDULE_CHANNEL})
+                connection.commit()
+        except Exception as e:
+            print(f"[LEADER] Could not notify the leader of a schedule change: {e}")
+
+    @staticmethod
+    def pop_schedule_changed() -> bool:
+        """
+        Check for, and clear, schedule change notifications sent to the leader.
+
+        Reads notifications already delivered to the lock connection without
+        running a query.
+
+        Returns:
+            bool: True if another process changed the schedule since the last call.
+        """
+        with LeaderElectionService._lock:
+            if not LeaderElectionService._is_leader or LeaderElectionService._connection is None:
+                return False
+            try:
+                raw_connection = LeaderElectionService._connection.connection.driver_connection
+                raw_connection.poll()
+                changed = bool(raw_connection.notifies)
+                raw_connection.notifies.clear()
+                return changed
+            except Exception as e:
+                print(f"[LEADER] Could not read schedule change notifications: {e}")
+                # Re-arm to be safe; try_acquire will notice a dead connection
+                return True
+
+    @staticmethod
+    def release() -> None:
+        """Release the leader lock, if held, so another process can take over immediately."""
+        with LeaderElectionService._lock:
+            if LeaderElectionService._connection is not None:
+                try:
+                    LeaderElectionService._connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": LeaderElectionService.LOCK_KEY}
+                    )
+                except Exception as e:
+                    print(f"[LEADER] Error releasing leader lock: {e}")
+            LeaderElectionService._close_connection()
+
+    @staticmethod
+    def _open_connection() -> bool:
+        """
+        Open the long-lived lock connection with server-side keepalives; caller must hold _lock.
+
+        Returns:
+            bool: True if the connection is open.
+        """
+        try:
+            if LeaderElectionService._engine is None:
+                LeaderElectionService._engine = create_engine(db.engine.url, poolclass=NullPool)
+            connection = LeaderElectionService._engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        except Exception as e:
+            print(f"[LEADER] Could not open leader lock connection: {e}")
+            return False
+
+        try:
+            connection.execute(text(
+                f"SET tcp_keepalives_idle = {LeaderElectionService.KEEPALIVE_IDLE_SECONDS}; "
+                f"SET tcp_keepalives_interval = {LeaderElectionService.KEEPALIVE_INTERVAL_SECONDS}; "
+                f"SET tcp_keepalives_count = {LeaderElectionService.KEEPALIVE_COUNT}"
+            ))
+        except Exception as e:
+            print(f"[LEADER] Could not configure leader lock connection: {e}")
+            connection.close()
+            return False
+
+        LeaderElectionService._connection = connection
+        return True
+
+    @staticmethod
+    def _close_connection() -> None:
+        """Close the lock connection and step down; caller must hold _lock."""
+        if LeaderElectionService._connection is not None:
+            try:
+                LeaderElectionService._connection.close()
+            except Exception:
+                pass
+        LeaderElectionService._connection = None
+        LeaderElectionService._is_leader = False
@@ -0,0 +1,92 @@
+"""
+Poll Worker Service for running live-stats polling as its own process.
+
+The web process can host the scheduler (see gunicorn_config.py), but then an
+ESPN stall or a grading burst competes with HTTP requests for the same
+worker. The poll worker runs only the scheduler, with a database pool sized
+for polling, and shuts down cleanly on SIGTERM/SIGINT: the cycle in progress
+finishes, the scheduler stops and the leader lock is released.
+"""
+
+from app.services.game.schedulerService import SchedulerService
+from typing import Any, Dict
+import os
+import signal
+import sys
+import threading
+
+
+class PollWorkerService:
+    """
+    Service class for the standalone polling and grading process.
+    """
+
+    # DB connections for the worker: the poll job and the leader check each hold at most one
+    DEFAULT_DB_POOL_SIZE = 4
+    DEFAULT_DB_MAX_OVERFLOW = 2
+    # Seconds between checks that the scheduler is still running
+    HEALTH_CHECK_SECONDS = 30
+
+    _stop_event = threading.Event()
+
+    @staticmethod
+    def get_config_overrides() -> Dict[str, Any]:
+        """
+        Build the app config for a poll worker.
+
+        Pool size comes from POLL_WORKER_DB_POOL_SIZE and
+        POLL_WORKER_DB_MAX_OVERFLOW. SQLite (local development) keeps
+        Flask-SQLAlchemy's own pool settings.
+
+        Returns:
+            dict: Config values to pass to create_app().
+        """
+        database_url = os.getenv('DATABASE_URL') or ''
+        if database_url.startswith('sqlite'):
+            return {}
+        return {
+            'SQLALCHEMY_ENGINE_OPTIONS': {
+                'pool_size': int(os.getenv('POLL_WORKER_DB_POOL_SIZE', PollWorkerService.DEFAULT_DB_POOL_SIZE)),
+                'max_overflow': int(os.getenv('POLL_WORKER_DB_MAX_OVERFLOW', PollWorkerService.DEFAULT_DB_MAX_OVERFLOW)),
+                'pool_pre_ping': True,
+            }
+        }
+
+    @staticmethod
+    def request_stop(signum=None, frame=None) -> None:
+        """Signal handler that asks the worker loop to shut down."""
+        sys.stderr.write(f"[POLL WORKER] Received signal {signum}, shutting down after the current cycle\n")
+        sys.stderr.flush()
+        PollWorkerService._stop_event.set()
+
+    @staticmethod
+    def run(app) -> None:
+        """
+        Run the polling scheduler until the process is told to stop.
+
+        Blocks the calling thread. Polling and grading run on the scheduler's
+        threads; this thread only waits for SIGTERM/SIGINT and then shuts the
+        scheduler down, waiting for a running cycle to finish.
+
+        Args:
+            app: Flask application instance created with get_config_overrides().
+        """
+        PollWorkerService._stop_event.clear()
+        signal.signal(signal.SIGTERM, PollWorkerService.request_stop)
+        signal.signal(signal.SIGINT, PollWorkerService.request_stop)
+
+        SchedulerService.initialize_scheduler(app)
+        sys.stderr.write("[POLL WORKER] Started\n")
+        sys.stderr.flush()
+
+        try:
+            while not PollWorkerService._stop_event.wait(PollWorkerService.HEALTH_CHECK_SECONDS):
+                scheduler = SchedulerService.get_scheduler()
+                if scheduler is None or not scheduler.running:
+                    sys.stderr.write("[POLL WORKER] Scheduler stopped unexpectedly, exiting\n")
+                    sys.stderr.flush()
+                    break
+        finally:
+            SchedulerService.shutdown_scheduler()
+            sys.stderr.write("[POLL WORKER] Stopped\n")
+            sys.stderr.flush()
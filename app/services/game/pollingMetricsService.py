@@ -0,0 +1,132 @@
+"""
+Polling Metrics Service for exposing live-stats polling instrumentation.
+
+Collects the counters and histograms the polling path already keeps
+(ESPNHttpClient, the ESPN response cache, PollingService stages and
+SchedulerService runs) and renders them in the Prometheus text format, so
+any scraper can chart fetch latency, payload size, stage timings, cycle
+duration against its interval, skipped runs and ESPN error rates.
+"""
+
+from app.services.circuitBreaker import CircuitBreaker
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.game.leaderElectionService import LeaderElectionService
+from app.services.game.pollingService import PollingService
+from app.services.game.schedulerService import SchedulerService
+from app.services.responseCache import espn_response_cache
+from app.utils.metrics import PrometheusWriter
+
+# Histograms are kept in milliseconds and exposed in seconds
+MS_TO_SECONDS = 0.001
+
+
+class PollingMetricsService:
+    """
+    Service class for rendering polling metrics.
+    """
+
+    PREFIX = "pickem_"
+
+    @staticmethod
+    def render_prometheus() -> str:
+        """
+        Render all polling metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text (see app.utils.metrics.CONTENT_TYPE).
+        """
+        writer = PrometheusWriter(prefix=PollingMetricsService.PREFIX)
+        PollingMetricsService._write_espn_metrics(writer)
+        PollingMetricsService._write_polling_metrics(writer)
+        PollingMetricsService._write_scheduler_metrics(writer)
+        return writer.render()
+
+    @staticmethod
+    def _write_espn_metrics(writer: PrometheusWriter) -> None:
+        """ESPN request outcomes, latency, payload size and response cache lookups."""
+        latency_stats = ESPNHttpClient.get_latency_stats()
+        histograms = ESPNHttpClient.get_histograms()
+
+        samples = []
+        for endpoint, stats in sorted(latency_stats.items()):
+            ok = stats["requests"] - stats["errors"] - stats["not_modified"]
+            samples.append(({"endpoint": endpoint, "outcome": "ok"}, ok))
+            samples.append(({"endpoint": endpoint, "outcome": "not_modified"}, stats["not_modified"]))
+            samples.append(({"endpoint": endpoint, "outcome": "error"}, stats["errors"]))
+            samples.append(({"endpoint": endpoint, "outcome": "short_circuited"}, stats["short_circuited"]))
+        writer.counter("espn_requests_total", "ESPN requests by endpoint and outcome (errors are after retries; "
+                       "short_circuited calls were skipped by the open circuit breaker).", samples)
+
+        breaker = ESPNHttpClient.get_breaker_stats()
+        writer.gauge("espn_circuit_state", "ESPN circuit breaker state (1 for the current state).",
+                     [({"state": state}, 1 if breaker["state"] == state else 0)
+                      for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)])
+        writer.counter("espn_circuit_trips_total", "Times the ESPN circuit breaker opened.", [(None, breaker["trips"])])
+        writer.counter("espn_circuit_slow_calls_total", "ESPN responses slower than the breaker's latency budget.",
+                       [(None, breaker["slow_calls"])])
+
+        writer.histogram(
+            "espn_request_duration_seconds", "ESPN request latency, including retries.",
+            [({"endpoint": endpoint}, entry["latency_ms"]) for endpoint, entry in sorted(histograms.items())],
+            scale=MS_TO_SECONDS)
+        writer.histogram(
+            "espn_response_size_bytes", "Size of full (200) ESPN response bodies.",
+            [({"endpoint": endpoint}, entry["response_bytes"]) for endpoint, entry in sorted(histograms.items())])
+
+        cache_stats = espn_response_cache.get_stats()
+        samples = []
+        for endpoint, stats in sorted(cache_stats["endpoints"].items()):
+            for result in ("hits", "misses", "coalesced", "evictions"):
+                samples.append(({"endpoint": endpoint, "result": result}, stats[result]))
+        writer.counter("espn_cache_lookups_total", "ESPN response cache lookups by endpoint and result.", samples)
+        writer.gauge("espn_cache_entries", "Entries in the ESPN response cache.", [(None, cache_stats["size"])])
+
+    @staticmethod
+    def _write_polling_metrics(writer: PrometheusWriter) -> None:
+        """Pipeline stage latency, per-cycle outcome totals and grading backlog."""
+        writer.histogram(
+            "polling_stage_duration_seconds",
+            "Polling pipeline stage latency: fetch/write/cycle per cycle, parse per payload, "
+            "apply per event, grade per game.",
+            [({"stage": stage}, histogram) for stage, histogram in sorted(PollingService.get_stage_histograms().items())],
+            scale=MS_TO_SECONDS)
+
+        totals = PollingService.get_outcome_totals()
+        writer.counter("polling_cycles_total", "Polling cycles run.", [(None, totals["cycles"])])
+        writer.counter("polling_espn_requests_total", "ESPN requests made by polling cycles.",
+                       [(None, totals["espn_requests"])])
+        writer.counter("polling_games_total", "Games handled by polling cycles, by outcome.",
+                       [({"outcome": outcome}, totals[outcome])
+                        for outcome in ("polled", "failed", "completed", "changed")])
+        writer.gauge("polling_grading_queue_depth", "Completed games waiting for the grading thread.",
+                     [(None, PollingService.get_grading_backlog())])
+
+    @staticmethod
+    def _write_scheduler_metrics(writer: PrometheusWriter) -> None:
+        """Polling job events, run delays and intervals, overruns and leadership."""
+        stats = SchedulerService.get_run_stats()
+
+        samples = []
+        for job_id, events in sorted(stats["job_events"].items()):
+            for name in SchedulerService.JOB_EVENT_NAMES.values():
+                samples.append(({"job": job_id, "event": name}, events.get(name, 0)))
+        writer.counter("scheduler_job_events_total",
+                       "APScheduler job events: executed, error, missed (past misfire grace) and "
+                       "max_instances (skipped while the previous run was still going).", samples)
+
+        histograms = stats["histograms"]
+        writer.histogram("polling_run_start_delay_seconds", "How late polling runs started after their scheduled time.",
+                         [(None, histograms["start_delay_ms"])] if "start_delay_ms" in histograms else [],
+                         scale=MS_TO_SECONDS)
+        writer.histogram("polling_run_interval_seconds", "Time between the starts of consecutive polling runs.",
+                         [(None, histograms["interval_ms"])] if "interval_ms" in histograms else [],
+                         scale=MS_TO_SECONDS)
+        writer.gauge("polling_run_last_duration_seconds", "Duration of the last polling run.",
+                     [(None, round(stats["last_run_ms"] * MS_TO_SECONDS, 6))])
+        if stats["scheduled_sleep_seconds"] is not None:
+            writer.gauge("polling_run_scheduled_interval_seconds", "Sleep scheduled before the next polling run.",
+                         [(None, round(stats["scheduled_sleep_seconds"], 3))])
+        writer.counter("polling_run_overruns_total", "Polling runs that took longer than the sleep scheduled before them.",
+                       [(None, stats["overruns"])])
+        writer.gauge("polling_leader", "1 if this process holds the polling leader lock.",
+                     [(None, 1 if LeaderElectionService.is_leader() else 0)])
@@ -4,17 +4,42 @@ Polling Service for live NFL game updates.
 This service manages the periodic polling of ESPN API for live game data,
 updating prop values and game scores in real-time, and triggering auto-grading
 when games complete.
+
+A polling cycle runs as a pipeline of stages joined by bounded queues:
+fetch (ESPN requests on a thread pool), parse (payload -> snapshot and box
+score index), apply (stage changes on the scheduler thread, which owns the
+database session) and grade (a separate grading thread, so a big league's
+grading never holds up live updates for other games).
 """
 
-from datetime import datetime, timezone
-from typing import List, Optional
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+from flask import current_app, has_app_context
+from sqlalchemy import func, or_, update
+from sqlalchemy.orm.attributes import set_committed_value
 from app import db
 from app.models.gameModel import Game
 from app.models.props.overUnderProp import OverUnderProp
 from app.models.props.winnerLoserProp import WinnerLoserProp
 from app.models.props.anytimeTdProp import AnytimeTdProp
+from app.models.props.anytimeTdOption import AnytimeTdOption
+from app.repositories.espnFinalSnapshotRepository import save_final_snapshot
+from app.repositories.gameRepository import game_prop_graph_options, get_game_with_props, get_games_with_props
 from app.services.espnClientService import ESPNClientService
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.espnHttpClient import ESPNHttpClient
 from app.services.game.gradeGameService import GradeGameService
+from app.services.game.teamBindingService import TeamBindingService
+from app.services.statExtractors import get_extractor
+from app.utils.metrics import Histogram, LATENCY_BUCKETS_MS
 
 
 class PollingService:
@@ -26,6 +51,56 @@ class PollingService:
     auto-grading when games complete.
     """
 
+    # Defaults used when the app config does not set ESPN_FETCH_CONCURRENCY /
+    # POLL_CYCLE_DEADLINE_SECONDS (or when polling runs outside an app context).
+    # The deadline covers a cycle's scoreboard and summary requests and stays under
+    # CRITICAL_POLL_SECONDS, so a slow ESPN can't push a cycle past the next trigger.
+    DEFAULT_FETCH_CONCURRENCY = 8
+    DEFAULT_CYCLE_DEADLINE_SECONDS = 15
+
+    # Seconds until a game's next poll, chosen from its ESPN state
+    CRITICAL_POLL_SECONDS = 20     # red zone, last two minutes of a half, overtime
+    LIVE_POLL_SECONDS = 60         # normal live play
+    HALFTIME_POLL_SECONDS = 300    # halftime
+    PREGAME_POLL_SECONDS = 120     # past start_time but ESPN hasn't kicked off (or delayed)
+    RETRY_POLL_SECONDS = 60        # ESPN fetch failed
+
+    # Columns polling writes, per model. Every batched UPDATE for a table sets the
+    # same columns so the whole table is written with one executemany.
+    TRACKED_COLUMNS = {
+        Game: ("team_a_score", "team_b_score", "is_polling", "is_completed", "next_poll_at"),
+        OverUnderProp: ("current_value",),
+        WinnerLoserProp: ("team_a_score", "team_b_score", "winning_team_id", "team_a_id", "team_b_id"),
+        AnytimeTdOption: ("current_tds",),
+    }
+
+    # Max parsed events waiting for the apply stage, and completed games waiting to be graded.
+    # A full grading queue makes the polling thread grade the game itself (backpressure).
+    PIPELINE_QUEUE_SIZE = 32
+    GRADING_QUEUE_SIZE = 64
+
+    # Fingerprint of the live values last written for each game id
+    _fingerprints = {}
+    # Scoreboard state fingerprint at the last successful summary fetch, per ESPN event id
+    _scoreboard_states = {}
+
+    # Per-stage timing counters: stage -> {"count", "total_ms", "max_ms", "last_ms"}
+    _stage_stats = {}
+    # Per-stage latency histograms (milliseconds): stage -> Histogram
+    _stage_histograms = {}
+    # Running totals of games per cycle outcome ("polled", "failed", "completed", "changed")
+    # plus "cycles" and "espn_requests"
+    _outcome_totals = defaultdict(int)
+    _stats_lock = threading.Lock()
+
+    # Completed games waiting for the grading thread: (app, game_id)
+    _grading_queue = queue.Queue(maxsize=GRADING_QUEUE_SIZE)
+    _grading_thread = None
+    _grading_lock = threading.Lock()
+
+    # Marks the end of a cycle's fetch stage on the apply queue
+    _FETCH_DONE = object()
+
     @staticmethod
     def get_games_to_poll() -> List[Game]:
         """
@@ -35,33 +110,109 @@ class PollingService:
         - start_time has passed (game has started)
         - is_completed is False (game is not finished)
         - external_game_id is set (we have an ESPN game ID to poll)
+        - next_poll_at is unset or has passed (the game is due)
+
+        Props and their options are eager-loaded so polling never lazy-loads
+        relationships game by game.
 
         Returns:
             list: List of Game objects that need to be polled.
         """
         now = datetime.now(timezone.utc)
-        games = Game.query.filter(
+        games = Game.query.options(*game_prop_graph_options()).filter(
             Game.start_time <= now,
             Game.is_completed == False,  # noqa: E712
-            Game.external_game_id.isnot(None)
+            Game.external_game_id.isnot(None),
+            or_(Game.next_poll_at.is_(None), Game.next_poll_at <= now)
         ).all()
         return games
 
     @staticmethod
-    def poll_game(game: Game) -> bool:
+    def get_next_poll_time() -> Optional[datetime]:
+        """
+        Get the earliest time any started, unfinished game is due for a poll.
+
+        Games that have started but were never polled count as due now.
+
+        Returns:
+            datetime: Earliest next_poll_at (UTC), or None if no game is being polled.
+        """
+        now = datetime.now(timezone.utc)
+        next_poll_at = db.session.query(func.min(func.coalesce(Game.next_poll_at, now))).filter(
+            Game.start_time <= now,
+            Game.is_completed == False,  # noqa: E712
+            Game.external_game_id.isnot(None)
+        ).scalar()
+        return PollingService._as_utc(next_poll_at)
+
+    @staticmethod
+    def get_next_kickoff_time() -> Optional[datetime]:
+        """
+        Get the start_time of the next game that still needs polling.
+
+        Only unfinished games with an external_game_id whose start_time is in
+        the future are considered.
+
+        Returns:
+            datetime: The next kickoff (UTC), or None if no upcoming game is tracked.
+        """
+        now = datetime.now(timezone.utc)
+        next_kickoff = db.session.query(func.min(Game.start_time)).filter(
+            Game.start_time > now,
+            Game.is_completed == False,  # noqa: E712
+            Game.external_game_id.isnot(None)
+        ).scalar()
+        return PollingService._as_utc(next_kickoff)
+
+    @staticmethod
+    def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Treat naive datetimes from the database as UTC."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    @staticmethod
+    def get_poll_interval(snapshot: ESPNGameSnapshot) -> Optional[int]:
+        """
+        Choose how long to wait before polling a game again.
+
+        Args:
+            snapshot (ESPNGameSnapshot): The game's latest ESPN state.
+
+        Returns:
+            int: Seconds until the next poll.
+            None: If the game is final and polling should stop.
+        """
+        if snapshot.is_completed:
+            return None
+        if snapshot.status == "STATUS_HALFTIME":
+            return PollingService.HALFTIME_POLL_SECONDS
+        if snapshot.status in ("STATUS_SCHEDULED", "STATUS_DELAYED", "STATUS_RAIN_DELAY"):
+            return PollingService.PREGAME_POLL_SECONDS
+
+        # Red zone, overtime, or the last two minutes of the 2nd or 4th quarter
+        two_minute = snapshot.period in (2, 4) and snapshot.clock is not None and snapshot.clock <= 120
+        overtime = snapshot.period is not None and snapshot.period > 4
+        if snapshot.is_red_zone or two_minute or overtime:
+            return PollingService.CRITICAL_POLL_SECONDS
+        return PollingService.LIVE_POLL_SECONDS
+
+    @staticmethod
+    def poll_game(game: Game, snapshot: Optional[ESPNGameSnapshot] = None) -> bool:
         """
         Poll ESPN API for a single game and update database with live data.
 
         This method:
-        1. Fetches live game data from ESPN
-        2. Updates game scores
-        3. Updates all Over/Under prop current values
-        4. Updates all Winner/Loser prop scores
-        5. Checks if game is completed
-        6. Triggers auto-grading if game has ended
+        1. Fetches live game data from ESPN (unless a snapshot is passed in)
+        2. Works out the game's scores and every prop's live value
+        3. Writes only the values that changed
+        4. Checks if game is completed
+        5. Triggers auto-grading if game has ended
 
         Args:
             game (Game): The game object to poll.
+            snapshot (ESPNGameSnapshot, optional): Already-parsed ESPN data for this
+                game's external_game_id.
 
         Returns:
             bool: True if polling succeeded, False if ESPN request failed.
@@ -70,219 +221,989 @@ class PollingService:
             return False
 
         # Fetch live data from ESPN
-        game_data = ESPNClientService.get_game_data(game.external_game_id)
-        if not game_data:
+        if snapshot is None:
+            snapshot = ESPNGameSnapshot.fetch(game.external_game_id)
+        if snapshot is None:
             print(f"Failed to fetch data for game {game.id} ({game.game_name})")
             return False
 
-        # Mark game as actively polling if not already
-        if not game.is_polling:
-            game.is_polling = True
-
-        # Update game-level scores
-        scores = ESPNClientService.get_team_scores(game_data)
-        if scores:
-            # Get full team names from ESPN to match with our team_a_name/team_b_name
-            team_names_map = ESPNClientService.get_team_names(game_data)
-
-            # Try to match scores to team_a and team_b based on winner/loser prop team names
-            if game.winner_loser_props:
-                prop = game.winner_loser_props[0]  # Use first winner/loser prop as reference
-                if prop.team_a_name and prop.team_b_name:
-                    # Match team names to ESPN team IDs
-                    for team_id, score in scores.items():
-                        team_full_name = team_names_map.get(team_id, "")
-                        if prop.team_a_name in team_full_name or team_full_name in prop.team_a_name:
-                            game.team_a_score = score
-                        elif prop.team_b_name in team_full_name or team_full_name in prop.team_b_name:
-                            game.team_b_score = score
-                else:
-                    # Fallback: just assign in order
-                    team_ids = list(scores.keys())
-                    if len(team_ids) >= 2:
-                        game.team_a_score = scores.get(team_ids[0], 0)
-                        game.team_b_score = scores.get(team_ids[1], 0)
-            else:
-                # No winner/loser props, just assign in order
-                team_ids = list(scores.keys())
-                if len(team_ids) >= 2:
-                    game.team_a_score = scores.get(team_ids[0], 0)
-                    game.team_b_score = scores.get(team_ids[1], 0)
-
-        # Update Over/Under props
-        PollingService._update_over_under_props(game, game_data)
-
-        # Update Winner/Loser props
-        PollingService._update_winner_loser_props(game, game_data, scores)
-
-        # Update Anytime TD props
-        PollingService._update_anytime_td_props(game, game_data)
-
-        # Check if game is completed
-        if ESPNClientService.is_game_completed(game_data):
-            print(f"Game {game.id} ({game.game_name}) has completed. Triggering auto-grading...")
-            game.is_completed = True
-            game.is_polling = False
-
-            # Trigger auto-grading
-            try:
-                # First, auto-set correct answers based on live data
-                GradeGameService.auto_grade_props_from_live_data(game)
-                # Then grade the game
-                GradeGameService.grade_game(game.id)
-                print(f"Auto-grading completed for game {game.id}")
-            except Exception as e:
-                print(f"Error during auto-grading for game {game.id}: {e}")
+        if snapshot.is_completed:
+            PollingService._stage_final_snapshot(snapshot)
+        PollingService.apply_snapshot(game, snapshot)
+
+        # Check if game is completed (reloading its prop graph, which the commit expired)
+        if snapshot.is_completed:
+            PollingService._grade_completed_game(get_game_with_props(game.id) or game)
+        return True
+
+    @staticmethod
+    def apply_snapshot(game: Game, snapshot: ESPNGameSnapshot, force: bool = False) -> bool:
+        """
+        Write a game's live values from parsed ESPN data and commit them.
+
+        Values are derived exactly as a poll derives them and only the ones
+        that differ are written. Grading is left to the caller.
+
+        Args:
+            game (Game): The game to update, with its prop graph loaded.
+            snapshot (ESPNGameSnapshot): Parsed ESPN data for the game's external_game_id.
+            force (bool): Ignore the last poll's fingerprint and compare every value,
+                e.g. when applying a corrected stored snapshot.
 
-        # Commit all changes
+        Returns:
+            bool: True if any live value changed.
+        """
+        if force:
+            PollingService._fingerprints.pop(game.id, None)
+        changes = defaultdict(dict)
+        fingerprints = {}
+        changed = PollingService._collect_game_changes(game, snapshot, changes, fingerprints)
+        PollingService._write_changes(changes)
         db.session.commit()
+        PollingService._fingerprints.update(fingerprints)
+        return changed
+
+    @staticmethod
+    def _collect_game_changes(game: Game, snapshot: ESPNGameSnapshot, changes: Dict[type, dict],
+                              fingerprints: Dict[int, int]) -> bool:
+        """
+        Work out which of a game's live values differ from what is stored.
+
+        The live values (scores, completion, every tracked stat) are
+        fingerprinted; if the fingerprint matches the last committed poll, the
+        props are not compared at all. Only the game's own row is always staged,
+        since its next_poll_at moves forward on every poll.
+
+        A new fingerprint is only staged in fingerprints: the caller records it
+        in _fingerprints after the changes are committed, so a failed write
+        can't make the next poll skip values that were never saved.
+
+        Args:
+            game (Game): The game being polled.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
+            changes (dict): Model -> {id: (object, values)}, filled in place.
+            fingerprints (dict): Game id -> fingerprint to record once committed, filled in place.
+
+        Returns:
+            bool: True if any live value changed since the last poll.
+        """
+        PollingService._bind_team_ids(game, snapshot, changes)
+        PollingService._bind_player_ids(game, snapshot, changes)
+        team_a_score, team_b_score = PollingService._match_game_scores(game, snapshot)
+        stat_values = snapshot.get_stats(PollingService._get_stat_requests(game))
+        over_under_values = PollingService._get_over_under_values(game, stat_values)
+        winner_loser_values = PollingService._get_winner_loser_values(game, snapshot, team_a_score, team_b_score)
+        anytime_td_values = PollingService._get_anytime_td_values(game, snapshot)
+
+        # Schedule this game's next poll from its current state
+        interval = PollingService.get_poll_interval(snapshot)
+        PollingService._stage_row(changes, game, {
+            "team_a_score": team_a_score,
+            "team_b_score": team_b_score,
+            "is_polling": not snapshot.is_completed,
+            "is_completed": bool(game.is_completed) or snapshot.is_completed,
+            "next_poll_at": datetime.now(timezone.utc) + timedelta(seconds=interval) if interval else None,
+        })
+
+        fingerprint = hash((
+            snapshot.status, team_a_score, team_b_score,
+            tuple((prop.id, value) for prop, value in over_under_values),
+            tuple((prop.id, tuple(sorted(values.items(), key=str))) for prop, values in winner_loser_values),
+            tuple((option.id, value) for option, value in anytime_td_values),
+        ))
+        if PollingService._fingerprints.get(game.id) == fingerprint:
+            return False
+        fingerprints[game.id] = fingerprint
+
+        for prop, value in over_under_values:
+            if PollingService._differs(prop.current_value, value):
+                PollingService._stage_row(changes, prop, {"current_value": value})
+                print(f"Updated {prop.player_name or 'game'} {prop.stat_type}: {value}")
+
+        for prop, values in winner_loser_values:
+            if any(PollingService._differs(getattr(prop, key), value) for key, value in values.items()):
+                PollingService._stage_row(changes, prop, values)
+
+        for option, value in anytime_td_values:
+            if PollingService._differs(option.current_tds, value):
+                PollingService._stage_row(changes, option, {"current_tds": value})
+                print(f"Updated {option.player_name} touchdowns: {value}")
+
         return True
 
     @staticmethod
-    def _update_over_under_props(game: Game, game_data: dict) -> None:
+    def _bind_team_ids(game: Game, snapshot: ESPNGameSnapshot, changes: Dict[type, dict]) -> None:
         """
-        Update current_value for all Over/Under props associated with a game.
+        Bind any of the game's Winner/Loser props that still lack ESPN team ids.
 
-        Handles both player-specific stats and game-wide stats like total points.
+        Props are normally bound when they are created (see TeamBindingService);
+        this catches the rest from the team names already in the snapshot, so
+        it costs no ESPN request and each prop is matched by name at most once.
 
         Args:
-            game (Game): The game object.
-            game_data (dict): Live game data from ESPN.
+            game (Game): The game being polled.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
+            changes (dict): Model -> {id: (object, values)}, filled in place.
         """
+        for prop in game.winner_loser_props:
+            if prop.team_a_id and prop.team_b_id:
+                continue
+            team_a_id, team_b_id = TeamBindingService.match_team_ids(
+                snapshot.team_names, prop.team_a_name, prop.team_b_name)
+            if team_a_id is None:
+                continue
+            values = {"team_a_id": team_a_id, "team_b_id": team_b_id}
+            # Visible to the rest of this poll now; written with the cycle's batched UPDATE
+            for key, value in values.items():
+                set_committed_value(prop, key, value)
+            PollingService._stage_row(changes, prop, values)
+            print(f"Bound W/L prop {prop.id} to ESPN teams {team_a_id} / {team_b_id}")
+
+    @staticmethod
+    def _bind_player_ids(game: Game, snapshot: ESPNGameSnapshot, changes: Dict[type, dict]) -> None:
+        """
+        Store the ESPN athlete id of Over/Under props that only have a player name.
+
+        Stats are looked up by athlete id whenever a prop has one; a name is
+        matched only until the player shows up in the box score, then their id
+        is written with the cycle's batched UPDATE and used from then on. Only
+        exact and nickname alias matches are bound: a fuzzy match can be wrong,
+        and a stored id would make it permanent.
+
+        Args:
+            game (Game): The game being polled.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
+            changes (dict): Model -> {id: (object, values)}, filled in place.
+        """
+        if not snapshot.has_box_score:
+            return
         for prop in game.over_under_props:
-            # Handle total points prop (game-wide stat)
-            if prop.stat_type == "total_points":
-                # Calculate total points from both teams
-                scores = ESPNClientService.get_team_scores(game_data)
-                if scores:
-                    total_points = sum(scores.values())
-                    prop.current_value = total_points
-                    print(f"Updated total points: {total_points}")
+            if prop.player_id or not prop.player_name or PollingService._is_game_stat(prop.stat_type):
+                continue
+            record = snapshot.find_athlete(prop.player_name, fuzzy=False)
+            if record is None or not record["id"]:
                 continue
+            # Visible to the rest of this poll now; written once, with the cycle's batched UPDATE
+            # (rows carrying the extra column go out as their own executemany group)
+            set_committed_value(prop, "player_id", record["id"])
+            PollingService._stage_row(changes, prop, {"player_id": record["id"]})
+            print(f"Bound O/U prop {prop.id} ({prop.player_name}) to ESPN athlete {record['id']}")
+
+    @staticmethod
+    def _match_game_scores(game: Game, snapshot: ESPNGameSnapshot) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Map ESPN's per-team scores onto the game's team A and team B.
+
+        Uses the ESPN team ids bound to the game's first Winner/Loser prop.
+
+        Args:
+            game (Game): The game object.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
 
-            # Handle player-specific stats
-            if not prop.player_name or not prop.stat_type:
-                continue  # Skip props without player/stat info
+        Returns:
+            tuple: (team_a_score, team_b_score), the stored scores if ESPN has none.
+        """
+        team_a_score, team_b_score = game.team_a_score, game.team_b_score
+        scores = snapshot.scores
+        if not scores:
+            return team_a_score, team_b_score
 
-            current_value = ESPNClientService.get_player_stats(
-                game_data,
-                prop.player_name,
-                prop.stat_type
-            )
+        if game.winner_loser_props:
+            prop = game.winner_loser_props[0]  # Use first winner/loser prop as reference
+            if prop.team_a_id and prop.team_b_id:
+                return scores.get(prop.team_a_id, team_a_score), scores.get(prop.team_b_id, team_b_score)
+            if prop.team_a_name and prop.team_b_name:
+                # Named teams that couldn't be bound to this event; keep the stored scores
+                return team_a_score, team_b_score
 
-            if current_value is not None:
-                prop.current_value = current_value
-                print(f"Updated {prop.player_name} {prop.stat_type}: {current_value}")
+        # Fallback: just assign in order
+        team_ids = list(scores.keys())
+        if len(team_ids) >= 2:
+            team_a_score = scores.get(team_ids[0], 0)
+            team_b_score = scores.get(team_ids[1], 0)
+        return team_a_score, team_b_score
 
     @staticmethod
-    def _update_winner_loser_props(game: Game, game_data: dict, scores: dict) -> None:
+    def _get_stat_requests(game: Game) -> List[tuple]:
         """
-        Update scores and winning_team_id for all Winner/Loser props.
+        List every stat the game's Over/Under props track.
 
         Args:
             game (Game): The game object.
-            game_data (dict): Live game data from ESPN.
-            scores (dict): Dictionary of team scores from ESPN.
+
+        Returns:
+            list: Requests for ESPNGameSnapshot.get_stats(), one per prop with stat info.
         """
+        return [
+            PollingService._stat_request(prop) for prop in game.over_under_props
+            if prop.stat_type and (prop.player_name or prop.player_id or PollingService._is_game_stat(prop.stat_type))
+        ]
+
+    @staticmethod
+    def _stat_request(prop: OverUnderProp) -> tuple:
+        """
+        The get_stats() request for an Over/Under prop.
+
+        Props with an ESPN athlete id are looked up by id only, so two players
+        with the same display name can't be confused; the rest by name.
+        """
+        if prop.player_id:
+            return None, prop.stat_type, str(prop.player_id)
+        return prop.player_name, prop.stat_type
+
+    @staticmethod
+    def _is_game_stat(stat_type: Optional[str]) -> bool:
+        """True for stat types computed from the game's scores rather than a player's box score line."""
+        extractor = get_extractor(stat_type)
+        return extractor is not None and not extractor.needs_box_score
+
+    @staticmethod
+    def _get_over_under_values(game: Game, stat_values: Dict[tuple, float]) -> List[tuple]:
+        """
+        Get the live current_value for every Over/Under prop ESPN has data for.
+
+        Handles both player-specific stats and game-wide stats like total points.
+
+        Args:
+            game (Game): The game object.
+            stat_values (dict): Output of ESPNGameSnapshot.get_stats() for the game's stat requests.
+
+        Returns:
+            list: (prop, value) pairs; props without live data are left out.
+        """
+        values = []
+        for prop in game.over_under_props:
+            value = stat_values.get(PollingService._stat_request(prop))
+            if value is not None:
+                values.append((prop, value))
+        return values
+
+    @staticmethod
+    def _get_winner_loser_values(game: Game, snapshot: ESPNGameSnapshot,
+                                 team_a_score: Optional[int], team_b_score: Optional[int]) -> List[tuple]:
+        """
+        Get the live scores and winning_team_id for every Winner/Loser prop.
+
+        Args:
+            game (Game): The game object.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
+            team_a_score (int): The game's team A score, used when a prop has no team IDs.
+            team_b_score (int): The game's team B score, used when a prop has no team IDs.
+
+        Returns:
+            list: (prop, {"team_a_score", "team_b_score", "winning_team_id"}) pairs.
+        """
+        scores = snapshot.scores
+        values = []
         for prop in game.winner_loser_props:
-            # Try to update using team IDs first
+            # Try to update using team IDs first, falling back to the game-level scores
+            prop_a_score = prop.team_a_score
             if prop.team_a_id and prop.team_a_id in scores:
-                prop.team_a_score = scores[prop.team_a_id]
-            elif game.team_a_score is not None:
-                # Fallback: use game-level scores if team IDs not set
-                prop.team_a_score = game.team_a_score
+                prop_a_score = scores[prop.team_a_id]
+            elif team_a_score is not None:
+                prop_a_score = team_a_score
 
+            prop_b_score = prop.team_b_score
             if prop.team_b_id and prop.team_b_id in scores:
-                prop.team_b_score = scores[prop.team_b_id]
-            elif game.team_b_score is not None:
-                # Fallback: use game-level scores if team IDs not set
-                prop.team_b_score = game.team_b_score
+                prop_b_score = scores[prop.team_b_id]
+            elif team_b_score is not None:
+                prop_b_score = team_b_score
 
-            # If game is completed, set the winning team
-            if ESPNClientService.is_game_completed(game_data):
-                winning_team_id = ESPNClientService.get_winning_team_id(game_data)
-                if winning_team_id:
-                    prop.winning_team_id = winning_team_id
-                    print(f"Set winning team for prop {prop.id}: {winning_team_id}")
+            values.append((prop, {
+                "team_a_score": prop_a_score,
+                "team_b_score": prop_b_score,
+                # If game is completed, set the winning team
+                "winning_team_id": snapshot.winning_team_id or prop.winning_team_id,
+            }))
+        return values
 
     @staticmethod
-    def _update_anytime_td_props(game: Game, game_data: dict) -> None:
+    def _get_anytime_td_values(game: Game, snapshot: ESPNGameSnapshot) -> List[tuple]:
         """
-        Update current_tds for all player options in Anytime TD props.
+        Get the live current_tds for every player option in the game's Anytime TD props.
 
-        This method fetches TD stats for each player option in all anytime TD props
-        for the game, and updates the current_tds field accordingly.
+        Reads the snapshot's per-player touchdown tally, which is built once
+        and shared by every game polled from the same ESPN event.
 
         Args:
             game (Game): The game object.
-            game_data (dict): Live game data from ESPN.
+            snapshot (ESPNGameSnapshot): Parsed live game data from ESPN.
+
+        Returns:
+            list: (option, touchdowns) pairs; options without live data are left out.
         """
+        values = []
         for prop in game.anytime_td_props:
             for option in prop.options:
-                if not option.player_name:
-                    continue  # Skip options without player name
-
-                # Fetch TD stats for this player
-                # stat_type for touchdowns is "touchdowns"
-                current_tds = ESPNClientService.get_player_stats(
-                    game_data,
-                    option.player_name,
-                    "touchdowns"
+                current_tds = snapshot.get_touchdowns(option.player_name) if option.player_name else None
+                if current_tds is not None:
+                    values.append((option, current_tds))
+        return values
+
+    @staticmethod
+    def _differs(old, new) -> bool:
+        """Compare a stored value with a live one, treating Decimal/float/int alike."""
+        if old is None or new is None:
+            return old is not new
+        if isinstance(old, (int, float, Decimal)) and isinstance(new, (int, float, Decimal)):
+            return float(old) != float(new)
+        return old != new
+
+    @staticmethod
+    def _stage_row(changes: Dict[type, dict], obj, values: Dict[str, object]) -> None:
+        """
+        Stage new values for a row in its table's batched UPDATE.
+
+        Every row staged for a table carries all of that table's tracked
+        columns, so the table can be written with a single executemany.
+        """
+        model = obj.__class__
+        if obj.id in changes[model]:
+            changes[model][obj.id][1].update(values)
+            return
+        row = {column: getattr(obj, column) for column in PollingService.TRACKED_COLUMNS.get(model, ())}
+        row.update(values)
+        changes[model][obj.id] = (obj, row)
+
+    @staticmethod
+    def _write_changes(changes: Dict[type, dict]) -> None:
+        """
+        Write staged changes with one batched UPDATE per table.
+
+        Loaded objects are updated in place without being marked dirty, so the
+        session doesn't flush the same values again.
+
+        Args:
+            changes (dict): Model -> {id: (object, values)} from _collect_game_changes.
+        """
+        for model, rows in changes.items():
+            if not rows:
+                continue
+            db.session.execute(update(model), [dict(values, id=row_id) for row_id, (obj, values) in rows.items()])
+            for obj, values in rows.values():
+                for key, value in values.items():
+                    set_committed_value(obj, key, value)
+
+    @staticmethod
+    def _grade_completed_game(game: Game) -> None:
+        """
+        Auto-grade and grade a game that ESPN reports as final.
+
+        Args:
+            game (Game): The completed game object with its final live values.
+        """
+        print(f"Game {game.id} ({game.game_name}) has completed. Triggering auto-grading...")
+        PollingService._fingerprints.pop(game.id, None)
+        try:
+            # First, auto-set correct answers based on live data
+            GradeGameService.auto_grade_props_from_live_data(game)
+            # Then grade the game
+            GradeGameService.grade_game(game.id)
+            print(f"Auto-grading completed for game {game.id}")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error during auto-grading for game {game.id}: {e}")
+
+    @staticmethod
+    def group_games_by_event(games: List[Game]) -> Dict[str, List[Game]]:
+        """
+        Group games by the ESPN event they track.
+
+        Every league has its own Game row for the same NFL game, so many rows
+        can share one external_game_id.
+
+        Args:
+            games (list): Game objects with an external_game_id.
+
+        Returns:
+            dict: external_game_id -> list of Game objects, in first-seen order.
+        """
+        games_by_event = defaultdict(list)
+        for game in games:
+            if game.external_game_id:
+                games_by_event[game.external_game_id].append(game)
+        return games_by_event
+
+    @staticmethod
+    def _fetch_settings() -> Tuple[int, float]:
+        """
+        Read the fetch concurrency limit and cycle deadline from the app config.
+
+        Returns:
+            tuple: (max concurrent ESPN requests, seconds allowed for the fetch stage)
+        """
+        concurrency = PollingService.DEFAULT_FETCH_CONCURRENCY
+        deadline = PollingService.DEFAULT_CYCLE_DEADLINE_SECONDS
+        if has_app_context():
+            concurrency = current_app.config.get('ESPN_FETCH_CONCURRENCY', concurrency)
+            deadline = current_app.config.get('POLL_CYCLE_DEADLINE_SECONDS', deadline)
+        return max(1, int(concurrency)), float(deadline)
+
+    @staticmethod
+    def stream_snapshots(external_game_ids: List[str],
+                         on_result: Callable[[str, Optional[ESPNGameSnapshot]], None]) -> None:
+        """
+        Fetch ESPN summaries concurrently and parse each one as it arrives.
+
+        The fetch stage runs ESPN requests on a bounded thread pool so one slow
+        response cannot hold up the rest of the cycle; the calling thread is
+        the parse stage and hands each snapshot to on_result in completion
+        order. Fetches still running when the cycle deadline passes are
+        abandoned and reported as failed. Neither stage touches the database.
+
+        The deadline is the calling thread's ESPNHttpClient deadline if one is
+        set (the cycle's, see _run_fetch_stage), otherwise the configured
+        cycle deadline from now. Every request is capped at the time left, so
+        abandoned fetches don't keep running long after the cycle.
+
+        Args:
+            external_game_ids (list): Distinct ESPN game IDs to fetch.
+            on_result (callable): Called once per ID with its ESPNGameSnapshot,
+                or None if the fetch failed or missed the deadline.
+        """
+        if not external_game_ids:
+            return
+
+        concurrency, deadline = PollingService._fetch_settings()
+        deadline_at = ESPNHttpClient.get_deadline() or time.monotonic() + deadline
+
+        def fetch(external_game_id: str):
+            with ESPNHttpClient.deadline(deadline_at):
+                return ESPNClientService.get_game_data(external_game_id)
+
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(external_game_ids)),
+                                      thread_name_prefix='espn-fetch')
+        futures = {
+            executor.submit(fetch, external_game_id): external_game_id
+            for external_game_id in external_game_ids
+        }
+        pending = set(external_game_ids)
+
+        try:
+            for future in as_completed(futures, timeout=max(deadline_at - time.monotonic(), 0)):
+                external_game_id = futures[future]
+                pending.discard(external_game_id)
+                snapshot = None
+                try:
+                    game_data = future.result()
+                    if game_data:
+                        started = time.perf_counter()
+                        snapshot = ESPNGameSnapshot(external_game_id, game_data)
+                        PollingService._record_stage("parse", (time.perf_counter() - started) * 1000)
+                except Exception as e:
+                    print(f"[POLLING] Error fetching ESPN event {external_game_id}: {e}")
+                on_result(external_game_id, snapshot)
+        except FuturesTimeoutError:
+            for future, external_game_id in futures.items():
+                if external_game_id in pending:
+                    future.cancel()
+                    print(f"[POLLING] ESPN event {external_game_id} missed the {deadline:g}s cycle deadline")
+        finally:
+            # Don't block on requests that overran the deadline; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for external_game_id in external_game_ids:
+            if external_game_id in pending:
+                on_result(external_game_id, None)
+
+    @staticmethod
+    def fetch_snapshots(external_game_ids: List[str]) -> Dict[str, Optional[ESPNGameSnapshot]]:
+        """
+        Fetch and parse ESPN summaries for many events concurrently.
+
+        Args:
+            external_game_ids (list): Distinct ESPN game IDs to fetch.
+
+        Returns:
+            dict: external_game_id -> ESPNGameSnapshot, or None if the fetch failed
+                  or did not finish before the deadline.
+        """
+        snapshots = {external_game_id: None for external_game_id in external_game_ids}
+        PollingService.stream_snapshots(external_game_ids, snapshots.__setitem__)
+        return snapshots
+
+    @staticmethod
+    def needs_box_score(games: List[Game]) -> bool:
+        """
+        Check whether any of the games has props that need player stats.
+
+        Winner/loser props and total_points over/unders only need scores,
+        which the scoreboard already has.
+
+        Args:
+            games (list): Game objects sharing one ESPN event.
+
+        Returns:
+            bool: True if a summary (box score) is needed to update the games' props.
+        """
+        for game in games:
+            if any((prop.player_name or prop.player_id) and not PollingService._is_game_stat(prop.stat_type)
+                   for prop in game.over_under_props):
+                return True
+            if any(prop.options for prop in game.anytime_td_props):
+                return True
+        return False
+
+    @staticmethod
+    def fetch_cycle_snapshots(games_by_event: Dict[str, List[Game]],
+                              on_snapshot: Optional[Callable[[str, Optional[ESPNGameSnapshot]], None]] = None
+                              ) -> Tuple[Dict[str, Optional[ESPNGameSnapshot]], int]:
+        """
+        Fetch ESPN data for a polling cycle, scoreboard first.
+
+        One scoreboard request gives status and scores for every event on the
+        slate. A per-game summary is only fetched for events that:
+        - are missing from the scoreboard, or
+        - have props that need player stats and whose scoreboard state
+          (status, clock, scores, last play) changed since the last summary.
+
+        Winner/loser-only games therefore need no per-game requests.
+
+        Args:
+            games_by_event (dict): external_game_id -> Game objects, from group_games_by_event.
+            on_snapshot (callable, optional): Called with each event's final snapshot
+                (or None) as soon as it is known: scoreboard-only events right after
+                the scoreboard, summary events as their fetches complete.
+
+        Returns:
+            tuple: (external_game_id -> snapshot or None if it could not be fetched,
+                    number of ESPN requests made)
+        """
+        scoreboard = ESPNClientService.get_scoreboard(use_cache=False)
+        board = ESPNGameSnapshot.from_scoreboard(scoreboard) if scoreboard else {}
+        if scoreboard is None:
+            print("[POLLING] Scoreboard unavailable, fetching a summary for every event")
+
+        snapshots = {}
+        summary_ids = []
+        needs_stats = {}
+        for external_game_id, event_games in games_by_event.items():
+            board_snapshot = board.get(external_game_id)
+            snapshots[external_game_id] = board_snapshot
+            needs_stats[external_game_id] = PollingService.needs_box_score(event_games)
+
+            if board_snapshot is None:
+                summary_ids.append(external_game_id)
+            elif needs_stats[external_game_id] and \
+                    PollingService._scoreboard_states.get(external_game_id) != board_snapshot.state_fingerprint:
+                summary_ids.append(external_game_id)
+            elif on_snapshot is not None:
+                on_snapshot(external_game_id, board_snapshot)
+
+        def resolve_summary(external_game_id: str, summary: Optional[ESPNGameSnapshot]) -> None:
+            board_snapshot = board.get(external_game_id)
+            if summary is not None:
+                snapshots[external_game_id] = summary
+                if board_snapshot is not None and not summary.is_completed:
+                    PollingService._scoreboard_states[external_game_id] = board_snapshot.state_fingerprint
+                else:
+                    PollingService._scoreboard_states.pop(external_game_id, None)
+                if needs_stats[external_game_id]:
+                    # Build the box score index here (parse stage), not on the apply thread
+                    started = time.perf_counter()
+                    summary.box_score
+                    PollingService._record_stage("parse", (time.perf_counter() - started) * 1000)
+            elif board_snapshot is not None and board_snapshot.is_completed and needs_stats[external_game_id]:
+                # Never complete (and grade) a game on scores alone when its props need final stats
+                snapshots[external_game_id] = None
+            if on_snapshot is not None:
+                on_snapshot(external_game_id, snapshots[external_game_id])
+
+        if on_snapshot is None:
+            summaries = PollingService.fetch_snapshots(summary_ids)
+            for external_game_id in summary_ids:
+                resolve_summary(external_game_id, summaries[external_game_id])
+        else:
+            PollingService.stream_snapshots(summary_ids, resolve_summary)
+
+        print(f"[POLLING] Scoreboard triage: {len(summary_ids)} of {len(games_by_event)} event(s) need a summary")
+        requests_made = len(summary_ids) + 1
+        return snapshots, requests_made
+
+    @staticmethod
+    def _record_stage(stage: str, elapsed_ms: float) -> None:
+        """Add one run of a pipeline stage to its timing counters."""
+        with PollingService._stats_lock:
+            stats = PollingService._stage_stats.setdefault(stage, {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_ms": 0.0,
+            })
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["last_ms"] = elapsed_ms
+            PollingService._stage_histograms.setdefault(stage, Histogram(LATENCY_BUCKETS_MS)).observe(elapsed_ms)
+
+    @staticmethod
+    def _record_cycle(counts: Dict[str, int], espn_requests: int) -> None:
+        """Add one polling cycle's game counts to the running totals."""
+        with PollingService._stats_lock:
+            PollingService._outcome_totals["cycles"] += 1
+            PollingService._outcome_totals["espn_requests"] += espn_requests
+            for outcome, count in counts.items():
+                PollingService._outcome_totals[outcome] += count
+
+    @staticmethod
+    def get_stage_timings() -> Dict[str, Dict[str, float]]:
+        """
+        Get per-stage timing counters for the polling pipeline.
+
+        Stages are "fetch" (scoreboard and summaries, per cycle), "parse" (per
+        payload), "apply" (per event), "write" (batched UPDATEs and commit, per
+        cycle), "grade" (per completed game) and "cycle" (a whole
+        poll_all_active_games run, including cycles with nothing due).
+
+        Returns:
+            dict: stage -> {"count", "total_ms", "max_ms", "last_ms", "avg_ms"}
+        """
+        with PollingService._stats_lock:
+            result = {}
+            for stage, stats in PollingService._stage_stats.items():
+                entry = dict(stats)
+                entry["avg_ms"] = stats["total_ms"] / stats["count"] if stats["count"] else 0.0
+                result[stage] = entry
+            return result
+
+    @staticmethod
+    def get_stage_histograms() -> Dict[str, Histogram]:
+        """
+        Get per-stage latency histograms for the polling pipeline.
+
+        Returns:
+            dict: stage -> Histogram of milliseconds per run (see get_stage_timings
+                  for the stages), copies that later cycles don't change
+        """
+        with PollingService._stats_lock:
+            return {stage: histogram.copy() for stage, histogram in PollingService._stage_histograms.items()}
+
+    @staticmethod
+    def get_outcome_totals() -> Dict[str, int]:
+        """
+        Get running totals across all polling cycles.
+
+        Returns:
+            dict: {"cycles", "espn_requests", "polled", "failed", "completed", "changed"}
+        """
+        with PollingService._stats_lock:
+            totals = {key: 0 for key in ("cycles", "espn_requests", "polled", "failed", "completed", "changed")}
+            totals.update(PollingService._outcome_totals)
+            return totals
+
+    @staticmethod
+    def reset_stats() -> None:
+        """Clear stage timings, histograms and outcome totals."""
+        with PollingService._stats_lock:
+            PollingService._stage_stats.clear()
+            PollingService._stage_histograms.clear()
+            PollingService._outcome_totals.clear()
+
+    @staticmethod
+    def _run_fetch_stage(app, games_by_event: Dict[str, List[Game]], results: queue.Queue) -> None:
+        """
+        Fetch and parse stages of a polling cycle, run on their own thread.
+
+        Puts (external_game_id, snapshot) on the results queue as each event is
+        resolved, then (_FETCH_DONE, (snapshots, requests_made)). The done marker
+        is always sent, so the apply stage never waits forever.
+
+        The cycle deadline starts here and covers the scoreboard request as
+        well as the summaries.
+        """
+        _, deadline = PollingService._fetch_settings()
+        deadline_at = time.monotonic() + deadline
+
+        def emit(external_game_id: str, snapshot: Optional[ESPNGameSnapshot]) -> None:
+            try:
+                results.put((external_game_id, snapshot), timeout=deadline)
+            except queue.Full:
+                print(f"[POLLING] Apply stage stalled, dropping ESPN event {external_game_id} until next cycle")
+
+        outcome = ({}, 0)
+        started = time.perf_counter()
+        try:
+            with app.app_context() if app is not None else nullcontext(), ESPNHttpClient.deadline(deadline_at):
+                outcome = PollingService.fetch_cycle_snapshots(games_by_event, on_snapshot=emit)
+        except Exception as e:
+            print(f"[POLLING] Error in fetch stage: {e}")
+        finally:
+            PollingService._record_stage("fetch", (time.perf_counter() - started) * 1000)
+            results.put((PollingService._FETCH_DONE, outcome))
+
+    @staticmethod
+    def _apply_event(event_games: List[Game], snapshot: Optional[ESPNGameSnapshot], changes: Dict[type, dict],
+                     fingerprints: Dict[int, int], counts: Dict[str, int], completed_games: List[Game]) -> None:
+        """
+        Apply stage for one ESPN event: stage changes for every Game that tracks it.
+
+        Args:
+            event_games (list): Game objects sharing the event.
+            snapshot (ESPNGameSnapshot): The event's parsed data, or None if it could not be fetched.
+            changes (dict): Model -> {id: (object, values)}, filled in place.
+            fingerprints (dict): Game id -> fingerprint to record once committed, filled in place.
+            counts (dict): Cycle counters ("polled", "failed", "completed", "changed"), updated in place.
+            completed_games (list): Games that are final, appended in place.
+        """
+        if snapshot is None:
+            print(f"[POLLING] Failed to fetch ESPN event {event_games[0].external_game_id} "
+                  f"({len(event_games)} game(s))")
+            counts["failed"] += len(event_games)
+            retry_at = datetime.now(timezone.utc) + timedelta(seconds=PollingService.RETRY_POLL_SECONDS)
+            for game in event_games:
+                PollingService._stage_row(changes, game, {"next_poll_at": retry_at})
+            return
+
+        for game in event_games:
+            print(f"[POLLING] Polling game {game.id}: {game.game_name}")
+            was_completed = game.is_completed
+            if PollingService._collect_game_changes(game, snapshot, changes, fingerprints):
+                counts["changed"] += 1
+            counts["polled"] += 1
+
+            if snapshot.is_completed:
+                completed_games.append(game)
+                # Check if game just completed
+                if not was_completed:
+                    counts["completed"] += 1
+
+        if snapshot.is_completed:
+            PollingService._stage_final_snapshot(snapshot)
+
+    @staticmethod
+    def _stage_final_snapshot(snapshot: ESPNGameSnapshot) -> None:
+        """
+        Add a final ESPN snapshot to the session, committed with the game's final values.
+
+        The stored snapshot lets the game (in every league) be regraded later
+        without calling ESPN (see SnapshotRegradeService). Failing to store it
+        never blocks polling or grading: the row is flushed in a savepoint, so
+        e.g. another process inserting the same event first (a unique violation)
+        rolls back only the snapshot, not the cycle's other changes.
+
+        Args:
+            snapshot (ESPNGameSnapshot): The event's final snapshot.
+        """
+        try:
+            with db.session.begin_nested():
+                save_final_snapshot(snapshot.external_game_id, snapshot.status, snapshot.has_box_score,
+                                    ESPNGameSnapshot.COMPACT_FORMAT_VERSION, snapshot.to_compact())
+        except Exception as e:
+            print(f"[POLLING] Could not store final snapshot for ESPN event {snapshot.external_game_id}: {e}")
+
+    @staticmethod
+    def submit_grading(game_ids: List[int]) -> None:
+        """
+        Grade stage: hand completed games to the grading thread.
+
+        Grading runs in its own app context and database session, so the
+        polling thread moves on to the next cycle right away. Outside an app
+        context, or when the grading queue is full, games are graded on the
+        calling thread instead.
+
+        Args:
+            game_ids (list): IDs of games that are final, with their final values committed.
+        """
+        app = current_app._get_current_object() if has_app_context() else None
+        inline_ids = []
+        if app is None:
+            inline_ids = list(game_ids)
+        else:
+            PollingService._start_grading_thread()
+            for game_id in game_ids:
+                try:
+                    PollingService._grading_queue.put_nowait((app, game_id))
+                except queue.Full:
+                    print(f"[POLLING] Grading queue full, grading game {game_id} on the polling thread")
+                    inline_ids.append(game_id)
+
+        # The commit expired every loaded object, so reload the prop graphs in one batch
+        for game in get_games_with_props(inline_ids) if inline_ids else []:
+            started = time.perf_counter()
+            PollingService._grade_completed_game(game)
+            PollingService._record_stage("grade", (time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def requeue_ungraded_games() -> List[int]:
+        """
+        Hand completed games that were never graded back to the grading stage.
+
+        The grading queue lives in memory, so games queued when a leader
+        crashed or restarted are left final but ungraded. The new leader calls
+        this when it takes over; grading an already graded game is harmless.
+
+        Returns:
+            list: IDs of the games submitted for grading.
+        """
+        game_ids = [game_id for (game_id,) in db.session.query(Game.id).filter(
+            Game.is_completed == True,  # noqa: E712
+            or_(Game.graded.is_(None), Game.graded == 0),
+            Game.external_game_id.isnot(None)
+        ).order_by(Game.id).all()]
+        if game_ids:
+            print(f"[POLLING] Re-queueing {len(game_ids)} completed but ungraded game(s) for grading: {game_ids}")
+            PollingService.submit_grading(game_ids)
+        return game_ids
+
+    @staticmethod
+    def _start_grading_thread() -> None:
+        """Start the grading thread on first use."""
+        with PollingService._grading_lock:
+            if PollingService._grading_thread is None or not PollingService._grading_thread.is_alive():
+                PollingService._grading_thread = threading.Thread(
+                    target=PollingService._run_grading_worker, name='grading', daemon=True
                 )
+                PollingService._grading_thread.start()
 
-                if current_tds is not None:
-                    option.current_tds = int(current_tds)
-                    print(f"Updated {option.player_name} touchdowns: {current_tds}")
+    @staticmethod
+    def _run_grading_worker() -> None:
+        """Grading thread: grade completed games one at a time, each in its own app context."""
+        while True:
+            app, game_id = PollingService._grading_queue.get()
+            started = time.perf_counter()
+            try:
+                with app.app_context():
+                    game = get_game_with_props(game_id)
+                    if game is not None:
+                        PollingService._grade_completed_game(game)
+            except Exception as e:
+                print(f"[POLLING] Error in grading thread for game {game_id}: {e}")
+            finally:
+                PollingService._record_stage("grade", (time.perf_counter() - started) * 1000)
+                PollingService._grading_queue.task_done()
+
+    @staticmethod
+    def get_grading_backlog() -> int:
+        """Number of completed games waiting for the grading thread."""
+        return PollingService._grading_queue.qsize()
+
+    @staticmethod
+    def wait_for_grading(timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued grading to finish (e.g. before the process exits).
+
+        Args:
+            timeout (float, optional): Max seconds to wait; None waits indefinitely.
+
+        Returns:
+            bool: True if the grading queue drained, False on timeout.
+        """
+        grading_queue = PollingService._grading_queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with grading_queue.all_tasks_done:
+            while grading_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                grading_queue.all_tasks_done.wait(remaining)
+        return True
 
     @staticmethod
     def poll_all_active_games() -> dict:
         """
         Poll all games that should be actively monitored.
 
-        This is the main method called by the scheduler every 1-3 minutes.
-        It queries for active games and polls each one.
+        This is the main method called by the scheduler whenever a game is due
+        (see Game.next_poll_at). It queries for due games and runs them through
+        the pipeline:
+        - fetch/parse (own thread): one scoreboard request, then summaries only
+          where player stats may have moved, fetched concurrently within the
+          cycle deadline and parsed as they arrive
+        - apply (this thread): each event's snapshot is applied to every Game
+          that references it as soon as it is parsed, via a bounded queue
+        - write: each table is updated in one batch, then one commit
+        - grade: games that went final are handed to the grading thread
 
         Returns:
             dict: Summary of polling results with counts of:
                   - games_polled: Number of games successfully polled
                   - games_failed: Number of games that failed to poll
                   - games_completed: Number of games that finished this poll
+                  - games_changed: Number of polled games whose live values changed
+                  - espn_fetches: Number of ESPN requests made (scoreboard + summaries)
+                  - stage_ms: Milliseconds spent in the fetch, apply and write stages
         """
         print(f"[POLLING] Checking for active games at {datetime.now(timezone.utc)}")
+        cycle_started = time.perf_counter()
         games = PollingService.get_games_to_poll()
 
         if not games:
             print("[POLLING] No active games to poll at this time")
+            PollingService._record_cycle({}, 0)
+            PollingService._record_stage("cycle", (time.perf_counter() - cycle_started) * 1000)
             return {
                 "games_polled": 0,
                 "games_failed": 0,
-                "games_completed": 0
+                "games_completed": 0,
+                "games_changed": 0,
+                "espn_fetches": 0,
+                "stage_ms": {}
             }
 
-        print(f"[POLLING] Found {len(games)} game(s) to poll")
-        polled_count = 0
-        failed_count = 0
-        completed_count = 0
+        games_by_event = PollingService.group_games_by_event(games)
+        print(f"[POLLING] Found {len(games)} game(s) across {len(games_by_event)} ESPN event(s) to poll")
+        counts = {"polled": 0, "failed": 0, "completed": 0, "changed": 0}
+        changes = defaultdict(dict)
+        fingerprints = {}
+        completed_games = []
+        stage_ms = {"fetch": 0.0, "apply": 0.0, "write": 0.0}
 
-        for game in games:
-            print(f"[POLLING] Polling game {game.id}: {game.game_name}")
-            was_completed = game.is_completed
-            success = PollingService.poll_game(game)
+        # Fetch and parse on their own thread; each response is parsed once and shared by
+        # every league's Game row
+        app = current_app._get_current_object() if has_app_context() else None
+        results = queue.Queue(maxsize=PollingService.PIPELINE_QUEUE_SIZE)
+        started = time.perf_counter()
+        fetch_thread = threading.Thread(target=PollingService._run_fetch_stage,
+                                        args=(app, games_by_event, results), name='poll-fetch', daemon=True)
+        fetch_thread.start()
 
-            if success:
-                polled_count += 1
-                # Check if game just completed
-                if not was_completed and game.is_completed:
-                    completed_count += 1
-            else:
-                failed_count += 1
+        # Apply events as they arrive
+        applied = set()
+        while True:
+            external_game_id, payload = results.get()
+            if external_game_id is PollingService._FETCH_DONE:
+                snapshots, espn_requests = payload
+                break
+            apply_started = time.perf_counter()
+            PollingService._apply_event(games_by_event[external_game_id], payload, changes, fingerprints,
+                                        counts, completed_games)
+            applied.add(external_game_id)
+            elapsed_ms = (time.perf_counter() - apply_started) * 1000
+            stage_ms["apply"] += elapsed_ms
+            PollingService._record_stage("apply", elapsed_ms)
+        stage_ms["fetch"] = (time.perf_counter() - started) * 1000
+
+        # Events the fetch stage resolved without handing over (dropped, or a fetch stage error)
+        for external_game_id, event_games in games_by_event.items():
+            if external_game_id not in applied:
+                PollingService._apply_event(event_games, snapshots.get(external_game_id),
+                                            changes, fingerprints, counts, completed_games)
+
+        # Write each table once and commit once; fingerprints are only recorded once the values are saved
+        write_started = time.perf_counter()
+        PollingService._write_changes(changes)
+        db.session.commit()
+        PollingService._fingerprints.update(fingerprints)
+        stage_ms["write"] = (time.perf_counter() - write_started) * 1000
+        PollingService._record_stage("write", stage_ms["write"])
+
+        # Grade games that finished this cycle, after their final values are saved
+        if completed_games:
+            PollingService.submit_grading([game.id for game in completed_games])
+        PollingService._record_cycle(counts, espn_requests)
+        PollingService._record_stage("cycle", (time.perf_counter() - cycle_started) * 1000)
 
-        print(f"[POLLING] Polling complete: {polled_count} polled, {failed_count} failed, {completed_count} completed")
+        print(f"[POLLING] Polling complete: {counts['polled']} polled ({counts['changed']} changed), "
+              f"{counts['failed']} failed, {counts['completed']} completed ({espn_requests} ESPN request(s)); "
+              f"fetch {stage_ms['fetch']:.0f}ms, apply {stage_ms['apply']:.0f}ms, write {stage_ms['write']:.0f}ms")
 
         return {
-            "games_polled": polled_count,
-            "games_failed": failed_count,
-            "games_completed": completed_count
+            "games_polled": counts["polled"],
+            "games_failed": counts["failed"],
+            "games_completed": counts["completed"],
+            "games_changed": counts["changed"],
+            "espn_fetches": espn_requests,
+            "stage_ms": stage_ms
         }
 
     @staticmethod
@@ -299,7 +1220,7 @@ class PollingService:
         Raises:
             404: If game is not found.
         """
-        game = Game.query.get(game_id)
+        game = get_game_with_props(game_id)
         if not game:
             return {"success": False, "error": "Game not found"}
 
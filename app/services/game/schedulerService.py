@@ -3,16 +3,27 @@ Scheduler Service for managing periodic polling tasks.
 
 This service initializes and manages APScheduler for periodic polling
 of live NFL game data. The scheduler runs independently of HTTP requests
-and persists across server restarts.
+and persists across server restarts. Every worker process starts a
+scheduler, but only the one holding the leader lock (see
+LeaderElectionService) runs the polling job.
 """
 
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from app.services.game.leaderElectionService import LeaderElectionService
 from app.services.game.pollingService import PollingService
+from app.utils.metrics import Histogram, LATENCY_BUCKETS_MS
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from flask import current_app
+from typing import Dict, Optional
 import atexit
 import logging
 import sys
+import threading
+import time
 
 # Force output to stderr to ensure logs appear
 sys.stdout.flush()
@@ -24,19 +35,64 @@ class SchedulerService:
     Service class for managing APScheduler background tasks.
 
     This service creates a background scheduler that polls active games
-    every 2 minutes and handles graceful shutdown.
+    whenever the earliest one is due and handles graceful shutdown. The
+    polling job is a one-shot job that is re-armed after every run for the
+    earliest Game.next_poll_at.
+
+    A second, interval job runs leader election: followers try to take the
+    leader lock every LEADER_CHECK_SECONDS, and the leader confirms it still
+    holds it and re-arms polling when another process notified it of a
+    changed kickoff.
     """
 
     scheduler = None
     app = None
 
+    POLL_JOB_ID = 'poll_active_games'
+    LEADER_JOB_ID = 'scheduler_leader_check'
+    GRADING_RECOVERY_JOB_ID = 'recover_ungraded_games'
+    # Default seconds between leader lock attempts (app config LEADER_CHECK_SECONDS);
+    # bounds how long polling stops when a leader dies
+    LEADER_CHECK_SECONDS = 30
+    # Never wake sooner than this after a run, so a game that stays due can't spin the scheduler
+    MIN_SLEEP_SECONDS = 5
+    # Upper bound on a sleep between slates. Kickoffs created or moved in the leader re-arm the
+    # job immediately and other workers' changes are picked up by the next leader check via
+    # LeaderElectionService.notify_schedule_changed; this is only a backstop.
+    MAX_IDLE_SLEEP_SECONDS = 6 * 60 * 60
+    # Max seconds shutdown waits for queued grading to finish
+    GRADING_SHUTDOWN_SECONDS = 60
+
+    # APScheduler event codes counted per job
+    JOB_EVENT_NAMES = {
+        EVENT_JOB_EXECUTED: "executed",
+        EVENT_JOB_ERROR: "error",
+        EVENT_JOB_MISSED: "missed",
+        EVENT_JOB_MAX_INSTANCES: "max_instances",
+    }
+
+    _stats_lock = threading.Lock()
+    # (job_id, event name) -> count
+    _job_events = defaultdict(int)
+    # When the polling job was last armed for, and how long it was going to sleep
+    _scheduled_run_at = None
+    _scheduled_sleep_seconds = None
+    # perf_counter() at the start of the last polling run, for the interval between runs
+    _last_run_started = None
+    # Polling runs that took longer than the sleep scheduled before them
+    _overruns = 0
+    _last_run_ms = 0.0
+    # "start_delay_ms": how late runs started; "interval_ms": time between run starts
+    _run_histograms = {}
+
     @staticmethod
     def initialize_scheduler(app=None) -> BackgroundScheduler:
         """
         Initialize and start the background scheduler for game polling.
 
-        Sets up a recurring job that runs every 2 minutes to poll
-        all active NFL games for live updates.
+        Sets up the leader election job and, if this process becomes the
+        leader, a polling job that runs when the earliest active game is due
+        and re-arms itself after every run.
 
         Args:
             app: Flask application instance (required for app context)
@@ -65,71 +121,290 @@ class SchedulerService:
             },
             'apscheduler.executors.default': {
                 'class': 'apscheduler.executors.pool:ThreadPoolExecutor',
-                'max_workers': '1'
+                'max_workers': '2'
             },
             'apscheduler.job_defaults.coalesce': 'false',
             'apscheduler.job_defaults.max_instances': '1'
         })
 
-        # Create wrapper function that runs polling with app context
-        def poll_with_context():
-            sys.stderr.write("[SCHEDULER JOB] Polling job triggered\n")
-            sys.stderr.flush()
-            with SchedulerService.app.app_context():
-                PollingService.poll_all_active_games()
-
-        # Add polling job - runs every 2 minutes
-        scheduler.add_job(
-            func=poll_with_context,
-            trigger=IntervalTrigger(minutes=2),
-            id='poll_active_games',
-            name='Poll active NFL games for live updates',
-            replace_existing=True
+        # Re-arm the one-shot polling job after every run, failure or skip
+        scheduler.add_listener(
+            SchedulerService._on_poll_job_event,
+            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
         )
 
         # Start the scheduler
         scheduler.start()
-        sys.stderr.write("APScheduler initialized and started polling every 2 minutes\n")
+        SchedulerService.scheduler = scheduler
+        sys.stderr.write("APScheduler initialized and started adaptive game polling\n")
         sys.stderr.flush()
 
-        # Log next run time
-        jobs = scheduler.get_jobs()
-        if jobs:
-            next_run = jobs[0].next_run_time
-            sys.stderr.write(f"[SCHEDULER] Next poll scheduled for: {next_run}\n")
+        # Try to become the leader now, then keep retrying (or confirming) in the background
+        with app.app_context():
+            is_leader = LeaderElectionService.try_acquire()
+        scheduler.add_job(
+            func=SchedulerService._check_leadership,
+            trigger=IntervalTrigger(
+                seconds=app.config.get('LEADER_CHECK_SECONDS', SchedulerService.LEADER_CHECK_SECONDS)),
+            id=SchedulerService.LEADER_JOB_ID,
+            name='Scheduler leader election',
+            replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=None
+        )
+
+        if is_leader:
+            sys.stderr.write("[SCHEDULER] This process is the polling leader\n")
+            sys.stderr.flush()
+
+            # Arm the polling job for the earliest due game; the first poll runs on the
+            # scheduler thread within MIN_SLEEP_SECONDS instead of blocking startup
+            SchedulerService.schedule_next_poll()
+            SchedulerService.schedule_grading_recovery()
+        else:
+            sys.stderr.write("[SCHEDULER] Another process is the polling leader; standing by\n")
             sys.stderr.flush()
 
-        # Run one poll immediately on startup to test
-        sys.stderr.write("[SCHEDULER] Running initial poll on startup...\n")
+        # Register shutdown hook to gracefully stop scheduler
+        atexit.register(lambda: SchedulerService.shutdown_scheduler())
+
+        return scheduler
+
+    @staticmethod
+    def _run_poll_job() -> None:
+        """Run one polling cycle inside the Flask app context."""
+        if not LeaderElectionService.is_leader():
+            return
+        sys.stderr.write("[SCHEDULER JOB] Polling job triggered\n")
         sys.stderr.flush()
+        started = time.perf_counter()
+        SchedulerService._record_run_start(datetime.now(timezone.utc), started)
         try:
-            with app.app_context():
+            with SchedulerService.app.app_context():
                 PollingService.poll_all_active_games()
+        finally:
+            SchedulerService._record_run_end((time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def schedule_grading_recovery() -> None:
+        """Run a one-off job now that re-queues completed games left ungraded by a previous leader."""
+        SchedulerService.scheduler.add_job(
+            func=SchedulerService._run_grading_recovery_job,
+            id=SchedulerService.GRADING_RECOVERY_JOB_ID,
+            name='Re-queue completed games left ungraded',
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+
+    @staticmethod
+    def _run_grading_recovery_job() -> None:
+        """Re-queue ungraded completed games inside the Flask app context."""
+        if not LeaderElectionService.is_leader():
+            return
+        try:
+            with SchedulerService.app.app_context():
+                PollingService.requeue_ungraded_games()
         except Exception as e:
-            sys.stderr.write(f"[SCHEDULER] Error during initial poll: {e}\n")
-            import traceback
-            sys.stderr.write(f"[SCHEDULER] Traceback: {traceback.format_exc()}\n")
+            sys.stderr.write(f"[SCHEDULER] Could not re-queue ungraded games: {e}\n")
             sys.stderr.flush()
 
-        # Store scheduler instance
-        SchedulerService.scheduler = scheduler
+    @staticmethod
+    def _record_run_start(now: datetime, started: float) -> None:
+        """Record how late a polling run started and how long since the previous one."""
+        with SchedulerService._stats_lock:
+            histograms = SchedulerService._run_histograms
+            if SchedulerService._scheduled_run_at is not None:
+                delay_ms = max((now - SchedulerService._scheduled_run_at).total_seconds() * 1000, 0.0)
+                histograms.setdefault("start_delay_ms", Histogram(LATENCY_BUCKETS_MS)).observe(delay_ms)
+            if SchedulerService._last_run_started is not None:
+                interval_ms = (started - SchedulerService._last_run_started) * 1000
+                histograms.setdefault("interval_ms", Histogram(LATENCY_BUCKETS_MS)).observe(interval_ms)
+            SchedulerService._last_run_started = started
 
-        # Register shutdown hook to gracefully stop scheduler
-        atexit.register(lambda: SchedulerService.shutdown_scheduler())
+    @staticmethod
+    def _record_run_end(elapsed_ms: float) -> None:
+        """Record a polling run's duration and whether it outlasted the sleep before it."""
+        with SchedulerService._stats_lock:
+            SchedulerService._last_run_ms = elapsed_ms
+            sleep_seconds = SchedulerService._scheduled_sleep_seconds
+            if sleep_seconds is not None and elapsed_ms > sleep_seconds * 1000:
+                SchedulerService._overruns += 1
+                sys.stderr.write(f"[SCHEDULER] Polling run took {elapsed_ms / 1000:.1f}s, longer than "
+                                 f"its {sleep_seconds:.0f}s interval\n")
+                sys.stderr.flush()
 
-        return scheduler
+    @staticmethod
+    def _on_poll_job_event(event) -> None:
+        """Scheduler listener that counts job events and re-arms the polling job once a run has finished."""
+        name = SchedulerService.JOB_EVENT_NAMES.get(event.code)
+        if name is not None:
+            with SchedulerService._stats_lock:
+                SchedulerService._job_events[(event.job_id, name)] += 1
+        if event.job_id == SchedulerService.POLL_JOB_ID:
+            SchedulerService.schedule_next_poll()
+
+    @staticmethod
+    def _check_leadership() -> None:
+        """
+        Leader election job: take over polling if the leader lock is free.
+
+        A new leader arms the polling job and re-queues games the previous
+        leader left ungraded; a leader that lost its lock
+        removes it. A continuing leader only re-arms the job if it has none
+        or another worker notified it that a game was created or moved;
+        changes made in this process re-arm it directly.
+        """
+        scheduler = SchedulerService.scheduler
+        if scheduler is None:
+            return
+
+        was_leader = LeaderElectionService.is_leader()
+        with SchedulerService.app.app_context():
+            is_leader = LeaderElectionService.try_acquire()
+
+        if not is_leader:
+            if was_leader:
+                sys.stderr.write("[SCHEDULER] Lost the polling leader lock; standing by\n")
+                sys.stderr.flush()
+                if scheduler.get_job(SchedulerService.POLL_JOB_ID) is not None:
+                    scheduler.remove_job(SchedulerService.POLL_JOB_ID)
+            return
+
+        if not was_leader:
+            sys.stderr.write("[SCHEDULER] Took over as the polling leader\n")
+            sys.stderr.flush()
+            SchedulerService.schedule_next_poll()
+            SchedulerService.schedule_grading_recovery()
+            return
+
+        schedule_changed = LeaderElectionService.pop_schedule_changed()
+        if schedule_changed or scheduler.get_job(SchedulerService.POLL_JOB_ID) is None:
+            SchedulerService.schedule_next_poll()
+
+    @staticmethod
+    def get_next_wake_time() -> datetime:
+        """
+        Work out when the polling job should run next.
+
+        The job wakes for whichever comes first: the earliest Game.next_poll_at
+        among games in progress, or the next kickoff of a tracked game. Between
+        slates this means sleeping until the next game instead of waking to
+        find nothing to poll.
+
+        Returns:
+            datetime: The next wake time, clamped between MIN_SLEEP_SECONDS
+                      and MAX_IDLE_SLEEP_SECONDS from now.
+        """
+        now = datetime.now(timezone.utc)
+        earliest = now + timedelta(seconds=SchedulerService.MIN_SLEEP_SECONDS)
+        latest = now + timedelta(seconds=SchedulerService.MAX_IDLE_SLEEP_SECONDS)
+
+        try:
+            with SchedulerService.app.app_context():
+                candidates = [
+                    PollingService.get_next_poll_time(),
+                    PollingService.get_next_kickoff_time()
+                ]
+        except Exception as e:
+            sys.stderr.write(f"[SCHEDULER] Could not compute next poll time: {e}\n")
+            sys.stderr.flush()
+            return earliest + timedelta(seconds=PollingService.RETRY_POLL_SECONDS)
+
+        candidates = [candidate for candidate in candidates if candidate is not None]
+        if not candidates:
+            return latest
+        return min(max(min(candidates), earliest), latest)
+
+    @staticmethod
+    def schedule_next_poll() -> Optional[datetime]:
+        """
+        (Re)arm the polling job for the next wake time.
+
+        Safe to call at any time; replaces any pending run of the polling job.
+        Processes that are not the leader notify the leader instead, which
+        re-arms its own job on its next leader check.
+
+        Returns:
+            datetime: When the polling job will next run, or None if the
+                      scheduler is not running or this process is not the leader.
+        """
+        scheduler = SchedulerService.scheduler
+        if scheduler is None or not scheduler.running or not LeaderElectionService.is_leader():
+            LeaderElectionService.notify_schedule_changed()
+            return None
+
+        run_at = SchedulerService.get_next_wake_time()
+        with SchedulerService._stats_lock:
+            SchedulerService._scheduled_run_at = run_at
+            SchedulerService._scheduled_sleep_seconds = (run_at - datetime.now(timezone.utc)).total_seconds()
+        scheduler.add_job(
+            func=SchedulerService._run_poll_job,
+            trigger=DateTrigger(run_date=run_at),
+            id=SchedulerService.POLL_JOB_ID,
+            name='Poll active NFL games for live updates',
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+        sys.stderr.write(f"[SCHEDULER] Next poll scheduled for: {run_at}\n")
+        sys.stderr.flush()
+        return run_at
 
     @staticmethod
     def shutdown_scheduler() -> None:
         """
         Gracefully shutdown the scheduler when the application stops.
 
-        This is automatically called when the application exits via atexit.
+        This is automatically called when the application exits via atexit,
+        and releases the leader lock so a follower can take over right away.
         """
         if SchedulerService.scheduler is not None:
             SchedulerService.scheduler.shutdown()
             print("APScheduler shut down successfully")
             SchedulerService.scheduler = None
+        # Let games already handed to the grading thread finish grading
+        if not PollingService.wait_for_grading(timeout=SchedulerService.GRADING_SHUTDOWN_SECONDS):
+            print("Grading still in progress at shutdown")
+        # Hand the leader lock over now instead of waiting for the connection to drop
+        LeaderElectionService.release()
+
+    @staticmethod
+    def get_run_stats() -> Dict[str, object]:
+        """
+        Get polling job run statistics.
+
+        Returns:
+            dict: {
+                "job_events": {job_id: {"executed", "error", "missed", "max_instances"}},
+                "overruns": runs that took longer than the sleep scheduled before them,
+                "last_run_ms": duration of the last polling run,
+                "scheduled_sleep_seconds": sleep before the next (or current) run, or None,
+                "histograms": {"start_delay_ms": Histogram, "interval_ms": Histogram}
+            }
+        """
+        with SchedulerService._stats_lock:
+            job_events = {}
+            for (job_id, name), count in SchedulerService._job_events.items():
+                job_events.setdefault(job_id, {})[name] = count
+            return {
+                "job_events": job_events,
+                "overruns": SchedulerService._overruns,
+                "last_run_ms": SchedulerService._last_run_ms,
+                "scheduled_sleep_seconds": SchedulerService._scheduled_sleep_seconds,
+                "histograms": {name: histogram.copy()
+                               for name, histogram in SchedulerService._run_histograms.items()},
+            }
+
+    @staticmethod
+    def reset_run_stats() -> None:
+        """Clear polling job run statistics."""
+        with SchedulerService._stats_lock:
+            SchedulerService._job_events.clear()
+            SchedulerService._scheduled_run_at = None
+            SchedulerService._scheduled_sleep_seconds = None
+            SchedulerService._last_run_started = None
+            SchedulerService._overruns = 0
+            SchedulerService._last_run_ms = 0.0
+            SchedulerService._run_histograms.clear()
 
     @staticmethod
     def get_scheduler() -> BackgroundScheduler:
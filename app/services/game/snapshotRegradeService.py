@@ -0,0 +1,141 @@
+"""
+Snapshot Regrade Service for regrading completed games without calling ESPN.
+
+When polling first sees a game final it stores the parsed final state (see
+EspnFinalSnapshot). After a stat correction is applied to that data, or a
+grading bug is fixed, games can be regraded from the stored snapshot: the
+props' final values are recomputed exactly as polling computes them, the
+correct answers are re-derived and the game is regraded through the point
+ledger, so only point differences are applied.
+"""
+
+from typing import Any, Dict, List
+from app import db
+from app.models.gameModel import Game
+from app.repositories.espnFinalSnapshotRepository import get_final_snapshots
+from app.repositories.gameRepository import get_game_with_props, get_games_with_props
+from app.repositories.leagueRepository import get_league_by_name
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.gradeGameService import GradeGameService
+from app.services.game.pollingService import PollingService
+from app.validators.gameValidator import validate_game_exists, validate_game_id
+from app.validators.leagueValidator import validate_league_exists, validate_league_name
+
+
+class SnapshotRegradeService:
+    """
+    Service class for regrading completed games from stored final ESPN snapshots.
+    """
+
+    @staticmethod
+    def regrade_game(game_id) -> Dict[str, Any]:
+        """
+        Regrade one completed game from its stored final snapshot.
+
+        Args:
+            game_id (int): The ID of the game to regrade.
+
+        Returns:
+            dict: {"success": True, "game_id": int} or {"success": False, "game_id": int, "error": str}
+
+        Raises:
+            400: If game_id is invalid.
+            404: If the game doesn't exist.
+        """
+        game_id = validate_game_id(game_id)
+        game = get_game_with_props(game_id)
+        validate_game_exists(game)
+
+        snapshots = SnapshotRegradeService._load_snapshots([game])
+        return SnapshotRegradeService._regrade_loaded_game(game, snapshots)
+
+    @staticmethod
+    def regrade_league(leaguename) -> Dict[str, Any]:
+        """
+        Regrade every completed game in a league from stored final snapshots.
+
+        Each ESPN event's snapshot is loaded and parsed once. Games without a
+        stored snapshot are skipped and reported.
+
+        Args:
+            leaguename (str): The name of the league.
+
+        Returns:
+            dict: {"regraded": [game_id, ...], "skipped": {game_id: reason, ...}}
+
+        Raises:
+            400: If leaguename is empty.
+            404: If the league doesn't exist.
+        """
+        leaguename = validate_league_name(leaguename)
+        league = validate_league_exists(get_league_by_name(leaguename))
+
+        game_ids = [game.id for game in league.league_games if game.is_completed and game.external_game_id]
+        games = get_games_with_props(game_ids)
+        snapshots = SnapshotRegradeService._load_snapshots(games)
+
+        result = {"regraded": [], "skipped": {}}
+        for game in sorted(games, key=lambda game: game.id):
+            outcome = SnapshotRegradeService._regrade_loaded_game(game, snapshots)
+            if outcome["success"]:
+                result["regraded"].append(game.id)
+            else:
+                result["skipped"][game.id] = outcome["error"]
+        print(f"Regraded {len(result['regraded'])} game(s) in league {leaguename} from stored snapshots "
+              f"({len(result['skipped'])} skipped)")
+        return result
+
+    @staticmethod
+    def _load_snapshots(games: List[Game]) -> Dict[str, Any]:
+        """
+        Load and parse the stored final snapshots for a set of games.
+
+        Returns:
+            dict: external_game_id -> ESPNGameSnapshot, or the error message if it couldn't be read.
+        """
+        rows = get_final_snapshots(game.external_game_id for game in games)
+        snapshots = {}
+        for external_game_id, row in rows.items():
+            try:
+                snapshots[external_game_id] = ESPNGameSnapshot.from_compact(external_game_id, row.payload)
+            except ValueError as e:
+                snapshots[external_game_id] = str(e)
+        return snapshots
+
+    @staticmethod
+    def _regrade_loaded_game(game: Game, snapshots: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recompute a game's final values from its snapshot, then auto-grade and grade it.
+
+        Args:
+            game (Game): The game, with its prop graph loaded.
+            snapshots (dict): Output of _load_snapshots().
+
+        Returns:
+            dict: {"success": bool, "game_id": int, "error": str (on failure)}
+        """
+        if not game.external_game_id:
+            return {"success": False, "game_id": game.id, "error": "Game does not have an external_game_id"}
+        snapshot = snapshots.get(str(game.external_game_id))
+        if snapshot is None:
+            return {"success": False, "game_id": game.id, "error": "No stored final snapshot for this game"}
+        if isinstance(snapshot, str):
+            return {"success": False, "game_id": game.id, "error": snapshot}
+        if not snapshot.is_completed:
+            return {"success": False, "game_id": game.id, "error": "Stored snapshot is not final"}
+
+        try:
+            # Same value derivation as a live poll, comparing every value against what is stored
+            PollingService.apply_snapshot(game, snapshot, force=True)
+
+            # Reload the prop graph the commit expired, then re-derive answers and regrade via the ledger
+            game = get_game_with_props(game.id) or game
+            GradeGameService.auto_grade_props_from_live_data(game)
+            GradeGameService.grade_game(game.id)
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error regrading game {game.id} from stored snapshot: {e}")
+            return {"success": False, "game_id": game.id, "error": str(e)}
+
+        print(f"Regraded game {game.id} from stored snapshot of ESPN event {game.external_game_id}")
+        return {"success": True, "game_id": game.id}
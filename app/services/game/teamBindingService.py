@@ -0,0 +1,160 @@
+"""
+Team Binding Service for tying Winner/Loser props to ESPN team ids.
+
+ESPN reports scores and the winner by team abbreviation ("BAL", "KC"), while
+commissioners enter team names ("Baltimore Ravens", "Ravens"). Props are
+bound once, when they are created or by a backfill, by storing the matching
+ESPN ids in team_a_id/team_b_id; polling then reads scores by id with a dict
+lookup instead of comparing names on every cycle.
+"""
+
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+import requests
+from app import db
+from app.models.gameModel import Game
+from app.models.props.winnerLoserProp import WinnerLoserProp
+from app.repositories.propRepository import get_unbound_winner_loser_props
+from app.services.espnClientService import ESPNClientService
+from app.services.espnHttpClient import ESPNHttpClient
+
+
+class TeamBindingService:
+    """
+    Service class for resolving and storing ESPN team ids on Winner/Loser props.
+    """
+
+    # Longest a web request waits on ESPN (retries included) to bind props it creates
+    BIND_DEADLINE_SECONDS = 2
+
+    @staticmethod
+    def _match_team(team_names: Dict[str, str], name: Optional[str]) -> Optional[str]:
+        """
+        Find the ESPN team id a commissioner-entered team name refers to.
+
+        Tries, in order: the abbreviation itself ("BAL"), the full name
+        ("Baltimore Ravens"), then a name contained in the other either way
+        ("Ravens"). A fallback that matches more than one team is rejected.
+
+        Args:
+            team_names (dict): ESPN team abbreviation -> full name for the event.
+            name (str): The prop's team name.
+
+        Returns:
+            str: The matching team abbreviation, or None if there's no unambiguous match.
+        """
+        name = (name or "").strip().lower()
+        if not name:
+            return None
+
+        for team_id in team_names:
+            if team_id.lower() == name:
+                return team_id
+        for team_id, full_name in team_names.items():
+            if full_name.lower() == name:
+                return team_id
+
+        matches = [team_id for team_id, full_name in team_names.items()
+                   if name in full_name.lower() or full_name.lower() in name]
+        return matches[0] if len(matches) == 1 else None
+
+    @staticmethod
+    def match_team_ids(team_names: Dict[str, str], team_a_name: Optional[str],
+                       team_b_name: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve both of a prop's team names against an event's teams.
+
+        Args:
+            team_names (dict): ESPN team abbreviation -> full name for the event.
+            team_a_name (str): The prop's team A (favorite) name.
+            team_b_name (str): The prop's team B (underdog) name.
+
+        Returns:
+            tuple: (team_a_id, team_b_id), or (None, None) unless both resolve to different teams.
+        """
+        team_a_id = TeamBindingService._match_team(team_names, team_a_name)
+        team_b_id = TeamBindingService._match_team(team_names, team_b_name)
+        if team_a_id is None or team_b_id is None or team_a_id == team_b_id:
+            return None, None
+        return team_a_id, team_b_id
+
+    @staticmethod
+    def bind_prop(prop: WinnerLoserProp, team_names: Dict[str, str]) -> bool:
+        """
+        Store ESPN team ids on a prop that doesn't have them yet.
+
+        Args:
+            prop (WinnerLoserProp): The prop to bind (modified in place, not committed).
+            team_names (dict): ESPN team abbreviation -> full name for the prop's event.
+
+        Returns:
+            bool: True if the prop has both team ids afterwards.
+        """
+        if prop.team_a_id and prop.team_b_id:
+            return True
+        team_a_id, team_b_id = TeamBindingService.match_team_ids(team_names, prop.team_a_name, prop.team_b_name)
+        if team_a_id is None:
+            return False
+        prop.team_a_id, prop.team_b_id = team_a_id, team_b_id
+        return True
+
+    @staticmethod
+    def bind_game_props(game: Game, props: Optional[Iterable[WinnerLoserProp]] = None) -> int:
+        """
+        Bind a game's Winner/Loser props using the cached team list of its ESPN event.
+
+        Best effort: a game without an external_game_id, or an ESPN outage,
+        leaves the props unbound for the backfill or polling to pick up. Called
+        from web requests, so the ESPN lookup is capped at BIND_DEADLINE_SECONDS.
+
+        Args:
+            game (Game): The game the props belong to.
+            props (list, optional): The props to bind; defaults to all of the game's props.
+
+        Returns:
+            int: Number of props that are bound afterwards.
+        """
+        props = list(game.winner_loser_props if props is None else props)
+        if not game.external_game_id or all(prop.team_a_id and prop.team_b_id for prop in props):
+            return sum(1 for prop in props if prop.team_a_id and prop.team_b_id)
+
+        try:
+            with ESPNHttpClient.deadline(time.monotonic() + TeamBindingService.BIND_DEADLINE_SECONDS):
+                team_names = ESPNClientService.get_event_teams(game.external_game_id)
+        except requests.RequestException as e:
+            print(f"Could not look up ESPN teams for event {game.external_game_id}; leaving props unbound: {e}")
+            team_names = {}
+        return sum(1 for prop in props if TeamBindingService.bind_prop(prop, team_names))
+
+    @staticmethod
+    def backfill_team_ids() -> Dict[str, int]:
+        """
+        Bind every existing Winner/Loser prop that is missing ESPN team ids.
+
+        Props are grouped by ESPN event so each event's team list is looked up
+        once, however many leagues created a game for it.
+
+        Returns:
+            dict: {"events": int, "bound": int, "unresolved": int}
+        """
+        props_by_event = defaultdict(list)
+        for prop, external_game_id in get_unbound_winner_loser_props():
+            props_by_event[external_game_id].append(prop)
+
+        bound = 0
+        unresolved = 0
+        for external_game_id, props in props_by_event.items():
+            team_names = ESPNClientService.get_event_teams(external_game_id)
+            for prop in props:
+                if TeamBindingService.bind_prop(prop, team_names):
+                    bound += 1
+                else:
+                    unresolved += 1
+                    print(f"Could not bind W/L prop {prop.id} ({prop.team_a_name} vs {prop.team_b_name}) "
+                          f"to ESPN event {external_game_id}")
+        db.session.commit()
+
+        print(f"Bound {bound} W/L prop(s) to ESPN team ids across {len(props_by_event)} event(s); "
+              f"{unresolved} unresolved")
+        return {"events": len(props_by_event), "bound": bound, "unresolved": unresolved}
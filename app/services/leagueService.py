@@ -5,6 +5,7 @@ from app.models.propAnswers.overUnderAnswer import OverUnderAnswer
 from app.models.propAnswers.winnerLoserAnswer import WinnerLoserAnswer
 from app.models.propAnswers.variableOptionAnswer import VariableOptionAnswer
 from app.models.playerPropSelection import PlayerPropSelection
+from app.repositories.pointAwardRepository import delete_point_awards_for_game
 from app.repositories.leagueRepository import get_all_leagues, get_league_by_name, get_leagues_by_username, get_league_by_join_code
 from app.repositories.playerRepository import get_player_by_username_and_leaguename, get_player_by_playername_and_leaguename
 from app.repositories.gameRepository import get_game_by_id
@@ -281,6 +282,10 @@ class LeagueService:
             db.session.delete(selection)
             db.session.commit()
 
+        # Delete the grading ledger rows for this game
+        delete_point_awards_for_game(game_id)
+        db.session.commit()
+
         # Finally, delete the game
         db.session.delete(game)
         db.session.commit()
@@ -0,0 +1,151 @@
+"""
+Response Cache for ESPN payloads.
+
+An in-process TTL cache with LRU eviction and single-flight loading: when
+several threads ask for the same missing key at once, one of them calls the
+loader and the rest wait for its result instead of each hitting ESPN.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    """A load in progress that other callers can wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Keys are usually tuples whose first element names the endpoint
+    (e.g. ("summary", "401772915")); stats are broken down by that name.
+    None results and loader exceptions are never cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    @staticmethod
+    def _namespace(key: Hashable) -> str:
+        """Name used to group stats for a key."""
+        if isinstance(key, tuple) and key:
+            return str(key[0])
+        return "default"
+
+    def _count(self, key: Hashable, counter: str) -> None:
+        """Increment a stat counter; caller must hold the lock."""
+        stats = self._stats.setdefault(self._namespace(key), {
+            "hits": 0, "misses": 0, "coalesced": 0, "evictions": 0,
+        })
+        stats[counter] += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for a key, loading it on a miss.
+
+        Concurrent misses for the same key share one loader call.
+
+        Args:
+            key: Cache key.
+            loader (callable): Zero-argument function that fetches the value.
+            ttl (float, optional): Seconds the loaded value stays fresh.
+
+        Returns:
+            The cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever the loader raised, for the loading caller and
+                every caller that was waiting on it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._count(key, "hits")
+                    return entry[1]
+                del self._entries[key]
+
+            flight = self._in_flight.get(key)
+            is_loader = flight is None
+            if is_loader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+                self._count(key, "misses")
+            else:
+                self._count(key, "coalesced")
+
+        if not is_loader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+            flight.value = value
+            if value is not None:
+                self._store(key, value, self.default_ttl if ttl is None else ttl)
+            return value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Insert a value and evict least recently used entries over maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._count(evicted_key, "evictions")
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the stats."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics.
+
+        Returns:
+            dict: {"size": int, "maxsize": int, "endpoints": {name: {"hits",
+                  "misses", "coalesced", "evictions", "hit_rate"}}}
+        """
+        with self._lock:
+            endpoints = {}
+            for name, stats in self._stats.items():
+                entry = dict(stats)
+                lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+                entry["hit_rate"] = (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+                endpoints[name] = entry
+            return {"size": len(self._entries), "maxsize": self.maxsize, "endpoints": endpoints}
+
+
+# Shared cache for ESPNClientService responses
+espn_response_cache = TTLCache(maxsize=1024)
@@ -0,0 +1,141 @@
+"""
+Stat Extractors for every stat type a prop can track.
+
+Each stat type (OverUnderProp.stat_type, or "touchdowns" for Anytime TD
+options) has one entry in STAT_EXTRACTORS describing how to compute it:
+
+- Base player stats read one ESPN box score stat, e.g. rushing_yards is
+  ("rushing", "rushingYards").
+- Derived player stats combine several base stats, e.g. scrimmage_yards is
+  rushing + receiving yards and touchdowns is every way a player scores one.
+- Game stats are computed from the team scores, e.g. total_points.
+
+Adding a stat type is a new registry entry; ESPNGameSnapshot.get_stats()
+evaluates any mix of them for a game in one pass.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+
+class StatExtractor:
+    """
+    How to compute one stat type.
+
+    Attributes:
+        scope (str): PLAYER stats are read from an athlete's box score record,
+            GAME stats from the snapshot's team scores.
+        columns (tuple): (category, key) box score stats a player stat sums.
+        compute (callable): For GAME stats, team abbreviation -> score dict to value;
+            for PLAYER stats combined from other stats (e.g. player_max), athlete record to value.
+    """
+
+    PLAYER = "player"
+    GAME = "game"
+
+    def __init__(self, scope: str, columns: Tuple[Tuple[str, str], ...] = (),
+                 compute: Optional[Callable[[Dict], Optional[float]]] = None):
+        self.scope = scope
+        self.columns = columns
+        self.compute = compute
+
+    @property
+    def needs_box_score(self) -> bool:
+        """True if this stat can only be read from a summary's box score."""
+        return self.scope == StatExtractor.PLAYER
+
+    def from_record(self, record: Dict) -> Optional[float]:
+        """
+        Evaluate a player stat against an athlete record from BoxScoreIndex.
+
+        Returns:
+            float: The sum of the columns the athlete has (or the combined value for a
+                   computed stat), or None if they have none of them.
+        """
+        if self.compute is not None:
+            return self.compute(record)
+        values = [record["stats"][column] for column in self.columns if column in record["stats"]]
+        return sum(values) if values else None
+
+    def from_scores(self, scores: Dict[str, int]) -> Optional[float]:
+        """Evaluate a game stat against the team scores."""
+        return self.compute(scores) if scores else None
+
+
+def player_stat(category: str, key: str) -> StatExtractor:
+    """A base stat read straight from one ESPN box score column."""
+    return StatExtractor(StatExtractor.PLAYER, columns=((category, key),))
+
+
+def player_sum(*extractors: StatExtractor) -> StatExtractor:
+    """A derived stat summing other player stats; None only if the player has none of them."""
+    if all(extractor.compute is None for extractor in extractors):
+        return StatExtractor(StatExtractor.PLAYER, columns=tuple(
+            column for extractor in extractors for column in extractor.columns))
+
+    def compute(record: Dict) -> Optional[float]:
+        values = [value for value in (extractor.from_record(record) for extractor in extractors) if value is not None]
+        return sum(values) if values else None
+    return StatExtractor(StatExtractor.PLAYER, compute=compute)
+
+
+def player_max(*extractors: StatExtractor) -> StatExtractor:
+    """A derived stat taking the largest of other player stats that count the same events differently."""
+    def compute(record: Dict) -> Optional[float]:
+        values = [value for value in (extractor.from_record(record) for extractor in extractors) if value is not None]
+        return max(values) if values else None
+    return StatExtractor(StatExtractor.PLAYER, compute=compute)
+
+
+def game_stat(compute: Callable[[Dict[str, int]], Optional[float]]) -> StatExtractor:
+    """A game-wide stat computed from the team scores."""
+    return StatExtractor(StatExtractor.GAME, compute=compute)
+
+
+# Base stats, keyed by our stat type, mapped to ESPN's stat category and key
+BASE_STATS = {
+    "passing_yards": player_stat("passing", "passingYards"),
+    "passing_tds": player_stat("passing", "passingTouchdowns"),
+    "passing_interceptions": player_stat("passing", "interceptions"),
+    "passing_completions": player_stat("passing", "completions"),
+    "rushing_yards": player_stat("rushing", "rushingYards"),
+    "rushing_tds": player_stat("rushing", "rushingTouchdowns"),
+    "receiving_yards": player_stat("receiving", "receivingYards"),
+    "receiving_tds": player_stat("receiving", "receivingTouchdowns"),
+    "receiving_receptions": player_stat("receiving", "receptions"),
+    "interception_return_tds": player_stat("interceptions", "interceptionTouchdowns"),
+    "kick_return_tds": player_stat("kickreturns", "kickReturnTouchdowns"),
+    "punt_return_tds": player_stat("puntreturns", "puntReturnTouchdowns"),
+    "fumble_return_tds": player_stat("fumbles", "fumblesTouchdowns"),
+    "defensive_tds": player_stat("defensive", "defensiveTouchdowns"),
+}
+
+# Return TDs scored on defense. ESPN's defensive "TD" column already counts interception and
+# fumble returns, while the interceptions (and, when present, fumbles) columns break them out,
+# so take whichever is larger instead of adding the two and counting a pick-six twice.
+DEFENSIVE_RETURN_TDS = player_max(
+    BASE_STATS["defensive_tds"],
+    player_sum(BASE_STATS["interception_return_tds"], BASE_STATS["fumble_return_tds"]),
+)
+
+STAT_EXTRACTORS = dict(
+    BASE_STATS,
+    scrimmage_yards=player_sum(BASE_STATS["rushing_yards"], BASE_STATS["receiving_yards"]),
+    # Anytime TD: every touchdown the player scores, not the ones they throw
+    touchdowns=player_sum(
+        BASE_STATS["rushing_tds"], BASE_STATS["receiving_tds"], DEFENSIVE_RETURN_TDS,
+        BASE_STATS["kick_return_tds"], BASE_STATS["punt_return_tds"]),
+    total_points=game_stat(lambda scores: sum(scores.values())),
+)
+
+
+def get_extractor(stat_type: Optional[str]) -> Optional[StatExtractor]:
+    """
+    Look up the extractor for a stat type.
+
+    Args:
+        stat_type (str): e.g. "rushing_yards", "scrimmage_yards", "total_points".
+
+    Returns:
+        StatExtractor: The registry entry, or None if the stat type isn't supported.
+    """
+    return STAT_EXTRACTORS.get(stat_type)
@@ -0,0 +1,260 @@
+"""
+Record and replay ESPN payloads for offline load testing.
+
+ESPNRecorder saves every ESPN response that goes through ESPNHttpClient to
+disk as a timestamped sequence per resource (one summary event, one
+scoreboard date, one team roster). ESPNReplay serves those sequences back
+through ESPNHttpClient instead of the network, at real or accelerated speed,
+optionally cloned into many synthetic events so a full Sunday of polling,
+apply and grading can be benchmarked on a laptop.
+
+Layout on disk:
+    <directory>/<endpoint>/<resource>.jsonl.gz
+Each line is {"t": unix time the response arrived, "payload": {...}}, so a
+recorder restarted mid-slate keeps appending to the same timeline.
+Consecutive identical payloads are only stored once. On replay, time 0 is
+the earliest frame in the directory.
+"""
+
+import copy
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import requests
+
+
+def resource_key(endpoint: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Name the ESPN resource a request is for, used as its recording file name.
+
+    Args:
+        endpoint (str): ESPNHttpClient endpoint name ("summary", "scoreboard", "roster").
+        url (str): Requested URL.
+        params (dict, optional): Query string parameters.
+
+    Returns:
+        str: The event id for summaries, the date (or "current") for
+             scoreboards, the team id for rosters; otherwise a sanitized URL.
+    """
+    params = params or {}
+    if endpoint == "summary" and params.get("event"):
+        return str(params["event"])
+    if endpoint == "scoreboard":
+        return str(params.get("dates") or "current")
+    match = re.search(r"/teams/([^/]+)/roster", url)
+    if endpoint == "roster" and match:
+        return match.group(1)
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", f"{url}?{query}" if query else url)
+
+
+def synthetic_event_id(event_id: str, copy_index: int) -> str:
+    """ESPN event id of the given copy of a recorded event; copy 0 keeps the real id."""
+    return str(event_id) if copy_index == 0 else f"{event_id}-{copy_index}"
+
+
+class ESPNRecorder:
+    """
+    Writes ESPN responses to disk as timestamped sequences.
+
+    Install with ESPNHttpClient.set_recorder(recorder); every successful
+    (non-304) response is then passed to record().
+    """
+
+    def __init__(self, directory: str, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self._clock = clock
+        self._last_digest = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, url: str, params: Optional[Dict[str, Any]], payload: Dict[str, Any]) -> None:
+        """
+        Append one response to its resource's sequence.
+
+        Args:
+            endpoint (str): ESPNHttpClient endpoint name.
+            url (str): Requested URL.
+            params (dict, optional): Query string parameters.
+            payload (dict): Decoded JSON response.
+        """
+        key = (endpoint, resource_key(endpoint, url, params))
+        line = json.dumps({"t": round(self._clock(), 3), "payload": payload},
+                          separators=(",", ":"))
+        digest = hashlib.sha1(line[line.index('"payload"'):].encode()).hexdigest()
+
+        with self._lock:
+            if self._last_digest.get(key) == digest:
+                return
+            self._last_digest[key] = digest
+            path = os.path.join(self.directory, endpoint, f"{key[1]}.jsonl.gz")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class ESPNReplay:
+    """
+    Serves recorded ESPN payloads in place of the network.
+
+    Install with ESPNHttpClient.set_replay(replay). Each request gets the
+    latest frame of its resource recorded at or before the replay clock
+    (elapsed wall time * speed + start_offset); before the first frame, the
+    first frame is served.
+
+    With copies > 1 every recorded event also exists as copies - 1 synthetic
+    events ("<event_id>-1", "<event_id>-2", ...), each running stagger_seconds
+    behind the previous one, and scoreboards list every copy.
+    """
+
+    def __init__(self, directory: str, speed: float = 1.0, copies: int = 1, stagger_seconds: float = 0.0,
+                 start_offset: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.directory = directory
+        self.speed = speed
+        self.copies = max(1, int(copies))
+        self.stagger_seconds = stagger_seconds
+        self.start_offset = start_offset
+        self._clock = clock
+        self._started = clock()
+        self._sequences = ESPNReplay.load(directory)
+
+    @staticmethod
+    def load(directory: str) -> Dict[Tuple[str, str], Tuple[List[float], List[Dict[str, Any]]]]:
+        """
+        Read every recorded sequence under a directory.
+
+        Args:
+            directory (str): Directory written by ESPNRecorder.
+
+        Returns:
+            dict: (endpoint, resource) -> (sorted frame times in seconds since the
+                  earliest frame, payloads)
+        """
+        sequences = {}
+        if not os.path.isdir(directory):
+            return sequences
+        for endpoint in sorted(os.listdir(directory)):
+            endpoint_dir = os.path.join(directory, endpoint)
+            if not os.path.isdir(endpoint_dir):
+                continue
+            for filename in sorted(os.listdir(endpoint_dir)):
+                if not filename.endswith(".jsonl.gz"):
+                    continue
+                frames = []
+                with gzip.open(os.path.join(endpoint_dir, filename), "rt", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            frame = json.loads(line)
+                            frames.append((float(frame["t"]), frame["payload"]))
+                frames.sort(key=lambda frame: frame[0])
+                resource = filename[:-len(".jsonl.gz")]
+                sequences[(endpoint, resource)] = ([t for t, _ in frames], [payload for _, payload in frames])
+
+        origin = min((times[0] for times, _ in sequences.values() if times), default=0.0)
+        return {key: ([t - origin for t in times], payloads) for key, (times, payloads) in sequences.items()}
+
+    def elapsed(self) -> float:
+        """Seconds into the recording the replay has reached."""
+        return (self._clock() - self._started) * self.speed + self.start_offset
+
+    def duration(self) -> float:
+        """Seconds from the start of the recording to its last frame, including stagger."""
+        last = max((times[-1] for times, _ in self._sequences.values() if times), default=0.0)
+        return last + self.stagger_seconds * (self.copies - 1)
+
+    def event_ids(self) -> List[str]:
+        """ESPN event ids served by this replay, synthetic copies included."""
+        recorded = [resource for endpoint, resource in self._sequences if endpoint == "summary"]
+        return [synthetic_event_id(event_id, copy_index)
+                for copy_index in range(self.copies) for event_id in recorded]
+
+    def _frame(self, endpoint: str, resource: str, at: float) -> Optional[Dict[str, Any]]:
+        """Latest payload of a resource recorded at or before a point in the recording."""
+        sequence = self._sequences.get((endpoint, resource))
+        if sequence is None or not sequence[0]:
+            return None
+        times, payloads = sequence
+        return payloads[max(bisect_right(times, at) - 1, 0)]
+
+    def _split_event_id(self, event_id: str) -> Tuple[str, int]:
+        """Map a (possibly synthetic) event id to its recorded event id and copy index."""
+        base, _, suffix = str(event_id).rpartition("-")
+        if base and suffix.isdigit() and 0 < int(suffix) < self.copies:
+            return base, int(suffix)
+        return str(event_id), 0
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, endpoint: str = "other") -> Dict[str, Any]:
+        """
+        Serve a request from the recording.
+
+        Args:
+            url (str): Requested URL.
+            params (dict, optional): Query string parameters.
+            endpoint (str): ESPNHttpClient endpoint name.
+
+        Returns:
+            dict: The recorded payload for the replay clock.
+
+        Raises:
+            requests.RequestException: If nothing was recorded for the resource.
+        """
+        elapsed = self.elapsed()
+        if endpoint == "summary":
+            event_id, copy_index = self._split_event_id((params or {}).get("event"))
+            payload = self._frame("summary", event_id, elapsed - copy_index * self.stagger_seconds)
+        elif endpoint == "scoreboard":
+            payload = self._scoreboard(resource_key(endpoint, url, params), elapsed)
+        else:
+            payload = self._frame(endpoint, resource_key(endpoint, url, params), elapsed)
+
+        if payload is None:
+            raise requests.RequestException(f"No recorded {endpoint} response for {url} {params or ''}")
+        return payload
+
+    def _scoreboard(self, resource: str, elapsed: float) -> Optional[Dict[str, Any]]:
+        """Recorded scoreboard, with every synthetic copy's events at its own point in time."""
+        base = self._frame("scoreboard", resource, elapsed)
+        if base is None or self.copies == 1:
+            return base
+
+        scoreboard = dict(base)
+        scoreboard["events"] = list(base.get("events", []) or [])
+        for copy_index in range(1, self.copies):
+            frame = self._frame("scoreboard", resource, elapsed - copy_index * self.stagger_seconds) or {}
+            for event in frame.get("events", []) or []:
+                event = copy.copy(event)
+                event["id"] = synthetic_event_id(event.get("id"), copy_index)
+                scoreboard["events"].append(event)
+        return scoreboard
+
+
+def install_from_config(config: Dict[str, Any]) -> None:
+    """
+    Install a replay or recorder on ESPNHttpClient from the app config.
+
+    ESPN_REPLAY_DIR serves ESPN from a recording (ESPN_REPLAY_SPEED,
+    ESPN_REPLAY_COPIES, ESPN_REPLAY_STAGGER_SECONDS); otherwise
+    ESPN_RECORD_DIR records live responses.
+
+    Args:
+        config (dict): The Flask app config.
+    """
+    from app.services.espnHttpClient import ESPNHttpClient
+
+    if config.get('ESPN_REPLAY_DIR'):
+        replay = ESPNReplay(
+            config['ESPN_REPLAY_DIR'],
+            speed=float(config.get('ESPN_REPLAY_SPEED') or 1.0),
+            copies=int(config.get('ESPN_REPLAY_COPIES') or 1),
+            stagger_seconds=float(config.get('ESPN_REPLAY_STAGGER_SECONDS') or 0.0),
+        )
+        ESPNHttpClient.set_replay(replay)
+        print(f"[ESPN] Replaying {len(replay.event_ids())} event(s) from {replay.directory} at {replay.speed:g}x")
+    elif config.get('ESPN_RECORD_DIR'):
+        ESPNHttpClient.set_recorder(ESPNRecorder(config['ESPN_RECORD_DIR']))
+        print(f"[ESPN] Recording responses to {config['ESPN_RECORD_DIR']}")
@@ -0,0 +1,422 @@
+"""
+Local stand-in for ESPN's NFL site API, for benchmarks and integration tests.
+
+Serves the /summary, /scoreboard and /teams/{id}/roster shapes that
+ESPNClientService consumes, from scripted synthetic games or from an
+ESPNReplay recording, with configurable latency and error injection. Point
+the app at it with ESPN_BASE_URL:
+
+    python -m app.utils.espnStubServer --games 16 --speed 10 --latency-ms 80 --error-rate 0.02
+    ESPN_BASE_URL=http://127.0.0.1:8765 python worker.py
+
+Event ids are "9000001", "9000002", ... for scripted games.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+# (abbreviation, display name, ESPN team id) for scripted games
+TEAMS = [
+    ("BAL", "Baltimore Ravens", "33"), ("KC", "Kansas City Chiefs", "12"),
+    ("BUF", "Buffalo Bills", "2"), ("PHI", "Philadelphia Eagles", "21"),
+    ("DET", "Detroit Lions", "8"), ("SF", "San Francisco 49ers", "25"),
+    ("HOU", "Houston Texans", "34"), ("LAR", "Los Angeles Rams", "14"),
+    ("GB", "Green Bay Packers", "9"), ("PIT", "Pittsburgh Steelers", "23"),
+    ("MIN", "Minnesota Vikings", "16"), ("DEN", "Denver Broncos", "7"),
+    ("WSH", "Washington Commanders", "28"), ("TB", "Tampa Bay Buccaneers", "27"),
+    ("LAC", "Los Angeles Chargers", "24"), ("CIN", "Cincinnati Bengals", "4"),
+]
+
+# (fraction of game clock elapsed, scoring side, points, scorer position) for scripted games
+DEFAULT_SCORING = [
+    (0.08, 0, 7, "WR"), (0.21, 1, 3, None), (0.37, 1, 7, "RB"), (0.46, 0, 7, "RB"),
+    (0.58, 0, 3, None), (0.71, 1, 7, "WR"), (0.84, 0, 7, "WR"), (0.97, 1, 3, None),
+]
+
+# Final stat lines per position, accrued linearly over the game: (category, key, final value)
+STAT_LINES = {
+    "QB": [("passing", "passingYards", 265), ("passing", "completions", 22), ("passing", "interceptions", 1)],
+    "RB": [("rushing", "rushingYards", 92), ("receiving", "receivingYards", 24), ("receiving", "receptions", 3)],
+    "WR": [("receiving", "receivingYards", 108), ("receiving", "receptions", 7)],
+}
+STAT_KEYS = {
+    "passing": ["completions", "passingYards", "passingTouchdowns", "interceptions"],
+    "rushing": ["rushingYards", "rushingTouchdowns"],
+    "receiving": ["receptions", "receivingYards", "receivingTouchdowns"],
+}
+TOUCHDOWN_KEYS = {"RB": ("rushing", "rushingTouchdowns"), "WR": ("receiving", "receivingTouchdowns")}
+
+
+class ScriptedGame:
+    """
+    A deterministic synthetic game that progresses with elapsed time.
+
+    The timeline is: scheduled for start_delay seconds, four quarters of
+    duration_seconds / 4 each with a halftime_seconds break after the
+    second, then final. Scores follow the scoring script and player stats
+    grow linearly with the game clock.
+    """
+
+    def __init__(self, event_id: str, home: Tuple[str, str, str], away: Tuple[str, str, str],
+                 duration_seconds: float = 3600.0, halftime_seconds: float = 0.0, start_delay: float = 0.0,
+                 scoring: Optional[List[tuple]] = None):
+        self.event_id = str(event_id)
+        self.teams = [home, away]
+        self.duration_seconds = duration_seconds
+        self.halftime_seconds = halftime_seconds
+        self.start_delay = start_delay
+        self.scoring = DEFAULT_SCORING if scoring is None else scoring
+
+    def player(self, side: int, position: str) -> Dict[str, str]:
+        """Synthetic athlete for a team and position."""
+        abbreviation, _, team_id = self.teams[side]
+        return {"id": f"{team_id}{position}{self.event_id}", "displayName": f"{abbreviation} {position}",
+                "position": position}
+
+    def state(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Game state at a point in the timeline.
+
+        Returns:
+            dict: {"status", "period", "clock", "progress" (0-1 of game clock), "scores", "plays"}
+        """
+        quarter = self.duration_seconds / 4
+        t = elapsed - self.start_delay
+        if t < 0:
+            status, progress = "STATUS_SCHEDULED", 0.0
+        elif t < 2 * quarter:
+            status, progress = "STATUS_IN_PROGRESS", t / self.duration_seconds
+        elif t < 2 * quarter + self.halftime_seconds:
+            status, progress = "STATUS_HALFTIME", 0.5
+        elif t < self.duration_seconds + self.halftime_seconds:
+            status, progress = "STATUS_IN_PROGRESS", (t - self.halftime_seconds) / self.duration_seconds
+        else:
+            status, progress = "STATUS_FINAL", 1.0
+
+        period = min(4, int(progress * 4) + 1) if status != "STATUS_SCHEDULED" else 0
+        clock = 900.0 - (progress * 4 - (period - 1)) * 900.0 if status == "STATUS_IN_PROGRESS" else 0.0
+        plays = [play for play in self.scoring if play[0] <= progress]
+        scores = [sum(points for _, side, points, _ in plays if side == team) for team in (0, 1)]
+        return {"status": status, "period": period, "clock": round(clock, 1), "progress": progress,
+                "scores": scores, "plays": plays}
+
+    def _competition(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Header/scoreboard competition for a state."""
+        final = state["status"] == "STATUS_FINAL"
+        competitors = []
+        for side, (abbreviation, name, team_id) in enumerate(self.teams):
+            score = state["scores"][side]
+            competitors.append({
+                "homeAway": "home" if side == 0 else "away",
+                "team": {"id": team_id, "abbreviation": abbreviation, "displayName": name},
+                "score": str(score),
+                "winner": final and score > state["scores"][1 - side],
+            })
+        progress = state["progress"]
+        return {
+            "id": self.event_id,
+            "competitors": competitors,
+            "status": {
+                "clock": state["clock"],
+                "period": state["period"],
+                "type": {"name": state["status"], "completed": final},
+            },
+            "situation": {
+                "isRedZone": state["status"] == "STATUS_IN_PROGRESS" and any(
+                    0 < play[0] - progress < 0.02 for play in self.scoring),
+                "lastPlay": {"id": f"{self.event_id}-{int(progress * 1000)}"},
+            },
+        }
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """ESPN /summary payload at a point in the timeline."""
+        state = self.state(elapsed)
+        competition = self._competition(state)
+        players = []
+        for side in (0, 1):
+            touchdowns = {}
+            for _, scoring_side, points, position in state["plays"]:
+                if scoring_side == side and position:
+                    touchdowns[position] = touchdowns.get(position, 0) + 1
+
+            stats = {}
+            for position, lines in STAT_LINES.items():
+                athlete = self.player(side, position)
+                for category, key, final_value in lines:
+                    stats.setdefault(category, {}).setdefault(athlete["id"], (athlete, {}))[1][key] = \
+                        int(final_value * state["progress"])
+                if position in TOUCHDOWN_KEYS:
+                    category, key = TOUCHDOWN_KEYS[position]
+                    stats.setdefault(category, {}).setdefault(athlete["id"], (athlete, {}))[1][key] = \
+                        touchdowns.get(position, 0)
+            # The QB threw every receiving touchdown
+            qb = self.player(side, "QB")
+            stats["passing"][qb["id"]][1]["passingTouchdowns"] = touchdowns.get("WR", 0)
+
+            abbreviation, name, team_id = self.teams[side]
+            players.append({
+                "team": {"id": team_id, "abbreviation": abbreviation, "displayName": name},
+                "statistics": [{
+                    "name": category,
+                    "keys": STAT_KEYS[category],
+                    "athletes": [{
+                        "athlete": {"id": athlete["id"], "displayName": athlete["displayName"]},
+                        "stats": [str(values.get(key, 0)) for key in STAT_KEYS[category]],
+                    } for athlete, values in athletes.values()],
+                } for category, athletes in stats.items()],
+            })
+
+        return {
+            "header": {"id": self.event_id, "competitions": [competition]},
+            "situation": competition["situation"],
+            "boxscore": {"players": players},
+        }
+
+    def scoreboard_event(self, elapsed: float) -> Dict[str, Any]:
+        """One event of the ESPN /scoreboard payload."""
+        return {"id": self.event_id, "competitions": [self._competition(self.state(elapsed))]}
+
+    def roster(self, team_id: str) -> Optional[Dict[str, Any]]:
+        """ESPN /teams/{id}/roster payload, or None if the team isn't in this game."""
+        for side, (_, _, game_team_id) in enumerate(self.teams):
+            if game_team_id == str(team_id):
+                items = [{"id": athlete["id"], "displayName": athlete["displayName"],
+                          "position": {"abbreviation": athlete["position"]}}
+                         for athlete in (self.player(side, position) for position in STAT_LINES)]
+                return {"athletes": [{"position": "offense", "items": items}]}
+        return None
+
+
+def make_scripted_games(count: int, duration_seconds: float = 3600.0, halftime_seconds: float = 0.0,
+                        stagger_seconds: float = 0.0) -> List[ScriptedGame]:
+    """
+    Build scripted games with event ids 9000001, 9000002, ...
+
+    Args:
+        count (int): Number of games.
+        duration_seconds (float): Seconds of game clock per game (four quarters).
+        halftime_seconds (float): Length of the halftime break.
+        stagger_seconds (float): Each game kicks off this long after the previous one.
+
+    Returns:
+        list: ScriptedGame objects.
+    """
+    games = []
+    for index in range(count):
+        home = TEAMS[(2 * index) % len(TEAMS)]
+        away = TEAMS[(2 * index + 1) % len(TEAMS)]
+        games.append(ScriptedGame(str(9000001 + index), home, away, duration_seconds=duration_seconds,
+                                  halftime_seconds=halftime_seconds, start_delay=index * stagger_seconds))
+    return games
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Routes ESPN-shaped requests to the owning ESPNStubServer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        try:
+            self.server.stub.handle(self)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on a hung or slow response
+            self.close_connection = True
+
+    def send_json(self, status: int, payload: Optional[Dict[str, Any]]) -> None:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ESPNStubServer:
+    """
+    Threaded HTTP server that stands in for ESPN.
+
+    Games come from scripted games, an ESPNReplay, or both (scripted first).
+    Time runs at `speed` times wall-clock time from start(). Every response
+    waits latency_ms (+/- jitter_ms); error_rate of responses fail with
+    error_status, and fail_next()/hang_next() script specific failures.
+    """
+
+    def __init__(self, games: Optional[List[ScriptedGame]] = None, replay=None, speed: float = 1.0,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, host: str = "127.0.0.1", port: int = 0, seed: Optional[int] = None):
+        self.games = {game.event_id: game for game in (games or [])}
+        self.replay = replay
+        self.speed = speed
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.request_counts = {}
+        self._random = random.Random(seed)
+        self._scripted_failures = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._started = time.monotonic()
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ESPN_BASE_URL / ESPNClientService.BASE_URL."""
+        return f"http://{self.host}:{self.port}"
+
+    def elapsed(self) -> float:
+        """Seconds of game time since the server started."""
+        return (time.monotonic() - self._started) * self.speed
+
+    def start(self) -> str:
+        """
+        Start serving on a background thread.
+
+        Returns:
+            str: The server's base URL.
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self.port = self._server.server_address[1]
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._server.serve_forever, name='espn-stub', daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def fail_next(self, count: int = 1, status: int = 503) -> None:
+        """Make the next `count` requests fail with an HTTP status."""
+        with self._lock:
+            self._scripted_failures.extend([("status", status)] * count)
+
+    def hang_next(self, count: int = 1, seconds: float = 30.0) -> None:
+        """Make the next `count` requests stall for `seconds` before answering (for timeout tests)."""
+        with self._lock:
+            self._scripted_failures.extend([("hang", seconds)] * count)
+
+    def handle(self, request: _StubHandler) -> None:
+        """Serve one request: count it, apply latency and failures, then route it."""
+        parsed = urlparse(request.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        endpoint, payload = self._route(parsed.path, params)
+
+        with self._lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+            failure = self._scripted_failures.pop(0) if self._scripted_failures else None
+            if failure is None and self.error_rate and self._random.random() < self.error_rate:
+                failure = ("status", self.error_status)
+            delay = max(0.0, self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+        if failure is not None and failure[0] == "hang":
+            delay += failure[1]
+        if delay:
+            time.sleep(delay)
+
+        if failure is not None and failure[0] == "status":
+            request.send_json(failure[1], {"error": "injected"})
+        elif payload is None:
+            request.send_json(404, {"error": "not found"})
+        else:
+            request.send_json(200, payload)
+
+    def _route(self, path: str, params: Dict[str, str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Build the payload for a path, matching on its last segments so any base path works."""
+        elapsed = self.elapsed()
+        roster = re.search(r"/teams/([^/]+)/roster$", path)
+
+        if path.endswith("/summary"):
+            event_id = params.get("event", "")
+            game = self.games.get(event_id)
+            if game is not None:
+                return "summary", game.summary(elapsed)
+            return "summary", self._from_replay(path, params, "summary")
+
+        if path.endswith("/scoreboard"):
+            events = [game.scoreboard_event(elapsed) for game in self.games.values()]
+            recorded = self._from_replay(path, params, "scoreboard") or {}
+            return "scoreboard", dict(recorded, events=events + list(recorded.get("events", []) or []))
+
+        if roster:
+            for game in self.games.values():
+                payload = game.roster(roster.group(1))
+                if payload is not None:
+                    return "roster", payload
+            return "roster", self._from_replay(path, params, "roster")
+
+        return "other", None
+
+    def _from_replay(self, path: str, params: Dict[str, str], endpoint: str) -> Optional[Dict[str, Any]]:
+        """Payload from the replay, if one is attached and has the resource."""
+        if self.replay is None:
+            return None
+        try:
+            return self.replay.get_json(path, params=params, endpoint=endpoint)
+        except Exception:
+            return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the stub server from the command line until interrupted."""
+    parser = argparse.ArgumentParser(description="Local ESPN stand-in for polling benchmarks")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--games", type=int, default=16, help="number of scripted games")
+    parser.add_argument("--duration", type=float, default=3600.0, help="seconds of game clock per game")
+    parser.add_argument("--halftime", type=float, default=0.0, help="halftime length in seconds")
+    parser.add_argument("--stagger", type=float, default=0.0, help="seconds between kickoffs")
+    parser.add_argument("--speed", type=float, default=1.0, help="game seconds per wall-clock second")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--replay-dir", help="also serve an ESPNRecorder recording")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    replay = None
+    if args.replay_dir:
+        from app.utils.espnReplay import ESPNReplay
+        replay = ESPNReplay(args.replay_dir, speed=args.speed)
+
+    server = ESPNStubServer(
+        games=make_scripted_games(args.games, args.duration, args.halftime, args.stagger),
+        replay=replay, speed=args.speed, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, error_status=args.error_status, port=args.port, seed=args.seed,
+    )
+    print(f"ESPN stub serving {args.games} scripted game(s) at {server.start()}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Histograms and Prometheus text exposition for in-process metrics.
+
+Services keep their own counters under their own locks (see
+ESPNHttpClient.get_latency_stats and PollingService.get_stage_timings);
+Histogram adds a latency or size distribution next to those counters, and
+PrometheusWriter renders everything in the text format Prometheus and most
+scrapers read (version 0.0.4), so no client library is needed.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Upper bounds of latency buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+# Upper bounds of payload size buckets, in bytes
+SIZE_BUCKETS_BYTES = (1024, 4096, 16384, 65536, 131072, 262144, 524288, 1048576, 4194304)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """
+    Cumulative distribution of observed values over fixed buckets.
+
+    Not thread-safe on its own: observe() is called under the owning
+    service's lock, and readers take a copy() under the same lock.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket; not cumulative
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def copy(self) -> "Histogram":
+        """Snapshot of the histogram that later observations don't change."""
+        snapshot = Histogram(self.buckets)
+        snapshot.counts = list(self.counts)
+        snapshot.count = self.count
+        snapshot.sum = self.sum
+        return snapshot
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations <= bound) per bucket, ending with +Inf."""
+        result = []
+        running = 0
+        for bound, count in zip(list(self.buckets) + [float("inf")], self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile from the buckets (upper bound of the bucket it falls in).
+
+        Args:
+            q (float): Quantile between 0 and 1, e.g. 0.95.
+
+        Returns:
+            float: Bucket upper bound, the largest finite bound if it falls in
+                   +Inf, or 0.0 with no observations.
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for bound, running in self.cumulative():
+            if running >= target:
+                return bound if bound != float("inf") else float(self.buckets[-1])
+        return float(self.buckets[-1])
+
+
+def _format_value(value: float) -> str:
+    """Prometheus sample value: integers without a decimal point, +Inf spelled out."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Optional[Dict[str, str]]) -> str:
+    """Render a label set as {name="value",...}, escaping values."""
+    if not labels:
+        return ""
+    escaped = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class PrometheusWriter:
+    """
+    Builds a Prometheus text-format exposition, one metric family at a time.
+    """
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._lines = []
+
+    def _header(self, name: str, metric_type: str, help_text: str) -> str:
+        name = self.prefix + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+        return name
+
+    def counter(self, name: str, help_text: str, samples: Iterable[Tuple[Optional[Dict[str, str]], float]]) -> None:
+        """
+        Add a counter family.
+
+        Args:
+            name (str): Metric name, conventionally ending in _total.
+            help_text (str): One-line description.
+            samples: (labels, value) pairs.
+        """
+        name = self._header(name, "counter", help_text)
+        for labels, value in samples:
+            self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[Tuple[Optional[Dict[str, str]], float]]) -> None:
+        """
+        Add a gauge family.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): One-line description.
+            samples: (labels, value) pairs.
+        """
+        name = self._header(name, "gauge", help_text)
+        for labels, value in samples:
+            self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def histogram(self, name: str, help_text: str, samples: Iterable[Tuple[Optional[Dict[str, str]], Histogram]],
+                  scale: float = 1.0) -> None:
+        """
+        Add a histogram family.
+
+        Args:
+            name (str): Metric name, with its unit (e.g. _seconds, _bytes).
+            help_text (str): One-line description.
+            samples: (labels, Histogram) pairs.
+            scale (float): Multiplier from the histogram's unit to the metric's,
+                           e.g. 0.001 to expose millisecond histograms in seconds.
+        """
+        name = self._header(name, "histogram", help_text)
+        for labels, histogram in samples:
+            labels = dict(labels or {})
+            for bound, running in histogram.cumulative():
+                le = bound if bound == float("inf") else round(bound * scale, 6)
+                bucket_labels = dict(labels, le=_format_value(le))
+                self._lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {running}")
+            self._lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(round(histogram.sum * scale, 6))}")
+            self._lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        """The exposition text, newline-terminated."""
+        return "\n".join(self._lines) + "\n"
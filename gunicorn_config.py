@@ -1,17 +1,22 @@
 """
 Gunicorn configuration file for production deployment.
 
-This ensures the APScheduler only runs in ONE worker process to avoid duplicates.
+Every worker starts the APScheduler, but only the worker holding the
+Postgres leader lock polls ESPN (see LeaderElectionService), so the number
+of web workers can be scaled independently of polling. When polling runs as
+its own process (worker.py), set SCHEDULER_IN_WEB=false so web workers
+never poll.
 """
 
 import multiprocessing
 import os
 
-# Number of worker processes
-workers = 1  # Use only 1 worker to ensure scheduler runs once
+# Number of worker processes (Render and Heroku set WEB_CONCURRENCY)
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 4)))
 
-# Worker class
-worker_class = "sync"
+# Worker class and threads per worker
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+threads = int(os.getenv("GUNICORN_THREADS", 1))
 
 # Bind address - use PORT from environment (Render sets this) or default to 8000
 port = os.getenv("PORT", "8000")
@@ -25,32 +30,39 @@ accesslog = "-"
 errorlog = "-"
 loglevel = "info"
 
-# Track if scheduler has been initialized
-scheduler_initialized = False
+# Whether web workers run the scheduler; turn off when worker.py runs polling
+scheduler_in_web = os.getenv("SCHEDULER_IN_WEB", "true").lower() in ("1", "true", "yes")
 
 
 def post_fork(server, worker):
     """
     Called just after a worker has been forked.
 
-    Initialize the scheduler in the first worker only.
+    Start the scheduler in every worker; leader election decides which one polls.
     """
-    global scheduler_initialized
-
-    # Only initialize scheduler once across all workers
-    if not scheduler_initialized:
-        server.log.info("Attempting to initialize APScheduler in worker %s", worker.pid)
-        from app.services.game.schedulerService import SchedulerService
-        from app import create_app
-        try:
-            # Create app instance for the scheduler to use
-            app = create_app()
-            SchedulerService.initialize_scheduler(app)
-            scheduler_initialized = True
-            server.log.info("APScheduler successfully initialized in worker %s", worker.pid)
-        except Exception as e:
-            server.log.error("Failed to initialize scheduler in worker %s: %s", worker.pid, e)
-            import traceback
-            server.log.error("Traceback: %s", traceback.format_exc())
-    else:
-        server.log.info("Scheduler already initialized, skipping for worker %s", worker.pid)
+    if not scheduler_in_web:
+        server.log.info("SCHEDULER_IN_WEB is off, not starting APScheduler in worker %s", worker.pid)
+        return
+
+    server.log.info("Attempting to initialize APScheduler in worker %s", worker.pid)
+    from app.services.game.schedulerService import SchedulerService
+    from app import create_app
+    try:
+        # Create app instance for the scheduler to use
+        app = create_app()
+        SchedulerService.initialize_scheduler(app)
+        server.log.info("APScheduler successfully initialized in worker %s", worker.pid)
+    except Exception as e:
+        server.log.error("Failed to initialize scheduler in worker %s: %s", worker.pid, e)
+        import traceback
+        server.log.error("Traceback: %s", traceback.format_exc())
+
+
+def worker_exit(server, worker):
+    """
+    Called just after a worker has exited.
+
+    Stop the scheduler and release the leader lock so another worker takes over immediately.
+    """
+    from app.services.game.schedulerService import SchedulerService
+    SchedulerService.shutdown_scheduler()
@@ -0,0 +1,38 @@
+"""
+Shared harness for tests that run the app against an in-memory SQLite database.
+
+Importing this module registers a compiler for Postgres ARRAY columns on
+SQLite, so the full schema can be created there.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from app import db, create_app
+
+
+@compiles(ARRAY, "sqlite")
+def compile_array_for_sqlite(type_, compiler, **kw):
+    """Store Postgres ARRAY columns as JSON text so the tables can be created in SQLite."""
+    return "JSON"
+
+
+def create_sqlite_app():
+    """Create the app on a fresh in-memory SQLite database."""
+    with patch.dict(os.environ, {"DATABASE_URL": "sqlite://"}):
+        return create_app()
+
+
+class SQLiteAppTestCase(unittest.TestCase):
+    """Base test case that runs each test in an app context with every table created in SQLite."""
+
+    def setUp(self):
+        self.app = create_sqlite_app()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.addCleanup(self.app_context.pop)
+        self.addCleanup(db.drop_all)
+        self.addCleanup(db.session.remove)
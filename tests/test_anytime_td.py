@@ -9,6 +9,8 @@ Tests cover:
 """
 
 import unittest
+from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 from app.services.game.gradeGameService import GradeGameService
 
@@ -251,18 +253,22 @@ class TestAnytimeTdGrading(unittest.TestCase):
         self.mock_game.variable_option_props = []
         self.mock_game.anytime_td_props = []
 
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
-    @patch('app.services.game.gradeGameService.get_game_by_id')
+        # Start from an empty point ledger
+        ledger = patch.multiple(
+            'app.services.game.gradeGameService',
+            get_point_awards_for_game=Mock(return_value=[]),
+            delete_point_awards_for_game=Mock(),
+            insert_point_awards=Mock(),
+        )
+        ledger.start()
+        self.addCleanup(ledger.stop)
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
     @patch('app.services.game.gradeGameService.db')
-    def test_anytime_td_correct_answer_awards_points(self, mock_db, mock_get_game, mock_get_answers, mock_get_player):
+    def test_anytime_td_correct_answer_awards_points(self, mock_db, mock_get_game, mock_get_answers, mock_add_points):
         """Test that correct anytime TD answer awards points."""
-        # Setup player
-        player = Mock()
-        player.id = 1
-        player.points = 10
-        mock_get_player.return_value = player
-
         # Setup option
         option = Mock()
         option.player_name = "Travis Kelce"
@@ -278,6 +284,7 @@ class TestAnytimeTdGrading(unittest.TestCase):
         # Setup answer
         answer = Mock()
         answer.player_id = 1
+        answer.prop_id = 1
         answer.answer = "Travis Kelce"
         mock_get_answers.return_value = [answer]
 
@@ -286,21 +293,15 @@ class TestAnytimeTdGrading(unittest.TestCase):
 
         GradeGameService.grade_game(1)
 
-        # Player should receive 5 points
-        self.assertEqual(player.points, 15)
+        # Player should receive 5 points in a single bulk update
+        mock_add_points.assert_called_once_with({1: Decimal("5")})
 
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
-    @patch('app.services.game.gradeGameService.get_game_by_id')
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
     @patch('app.services.game.gradeGameService.db')
-    def test_anytime_td_incorrect_answer_no_points(self, mock_db, mock_get_game, mock_get_answers, mock_get_player):
+    def test_anytime_td_incorrect_answer_no_points(self, mock_db, mock_get_game, mock_get_answers, mock_add_points):
         """Test that incorrect anytime TD answer awards no points."""
-        # Setup player
-        player = Mock()
-        player.id = 1
-        player.points = 10
-        mock_get_player.return_value = player
-
         # Setup option
         option = Mock()
         option.player_name = "Patrick Mahomes"
@@ -316,6 +317,7 @@ class TestAnytimeTdGrading(unittest.TestCase):
         # Setup answer
         answer = Mock()
         answer.player_id = 1
+        answer.prop_id = 1
         answer.answer = "Patrick Mahomes"
         mock_get_answers.return_value = [answer]
 
@@ -325,20 +327,14 @@ class TestAnytimeTdGrading(unittest.TestCase):
         GradeGameService.grade_game(1)
 
         # Player should receive no points
-        self.assertEqual(player.points, 10)
+        mock_add_points.assert_called_once_with({})
 
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
-    @patch('app.services.game.gradeGameService.get_game_by_id')
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
     @patch('app.services.game.gradeGameService.db')
-    def test_anytime_td_different_point_values(self, mock_db, mock_get_game, mock_get_answers, mock_get_player):
+    def test_anytime_td_different_point_values(self, mock_db, mock_get_game, mock_get_answers, mock_add_points):
         """Test that different options award different point values."""
-        # Setup player
-        player = Mock()
-        player.id = 1
-        player.points = 0
-        mock_get_player.return_value = player
-
         # Setup options with different point values
         option1 = Mock()
         option1.player_name = "Travis Kelce"
@@ -358,6 +354,7 @@ class TestAnytimeTdGrading(unittest.TestCase):
         # Setup answer
         answer = Mock()
         answer.player_id = 1
+        answer.prop_id = 1
         answer.answer = "Patrick Mahomes"
         mock_get_answers.return_value = [answer]
 
@@ -367,20 +364,14 @@ class TestAnytimeTdGrading(unittest.TestCase):
         GradeGameService.grade_game(1)
 
         # Player should receive 12 points (Mahomes' value, not Kelce's)
-        self.assertEqual(player.points, 12)
+        mock_add_points.assert_called_once_with({1: Decimal("12")})
 
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
-    @patch('app.services.game.gradeGameService.get_game_by_id')
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
     @patch('app.services.game.gradeGameService.db')
-    def test_anytime_td_multiple_correct_answers(self, mock_db, mock_get_game, mock_get_answers, mock_get_player):
+    def test_anytime_td_multiple_correct_answers(self, mock_db, mock_get_game, mock_get_answers, mock_add_points):
         """Test when multiple players hit their lines (multiple correct answers)."""
-        # Setup player
-        player = Mock()
-        player.id = 1
-        player.points = 0
-        mock_get_player.return_value = player
-
         # Setup options
         option1 = Mock()
         option1.player_name = "Travis Kelce"
@@ -400,6 +391,7 @@ class TestAnytimeTdGrading(unittest.TestCase):
         # Setup answer - player selected Kelce
         answer = Mock()
         answer.player_id = 1
+        answer.prop_id = 1
         answer.answer = "Travis Kelce"
         mock_get_answers.return_value = [answer]
 
@@ -409,18 +401,18 @@ class TestAnytimeTdGrading(unittest.TestCase):
         GradeGameService.grade_game(1)
 
         # Player should receive Kelce's 5 points
-        self.assertEqual(player.points, 5)
+        mock_add_points.assert_called_once_with({1: Decimal("5")})
 
 
 class TestAnytimeTdManualGrading(unittest.TestCase):
     """Test cases for manual grading and regrading of Anytime TD props."""
 
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_point_awards_for_prop')
     @patch('app.services.game.gradeGameService.get_anytime_td_prop_by_id')
     @patch('app.services.game.gradeGameService.Game')
     @patch('app.services.game.gradeGameService.db')
-    def test_set_correct_anytime_td_prop_not_graded(self, mock_db, mock_game_class, mock_get_prop, mock_get_answers, mock_get_player):
+    def test_set_correct_anytime_td_prop_not_graded(self, mock_db, mock_game_class, mock_get_prop, mock_get_awards, mock_add_points):
         """Test setting correct answer when game hasn't been graded yet."""
         # Setup prop
         prop = Mock()
@@ -437,23 +429,23 @@ class TestAnytimeTdManualGrading(unittest.TestCase):
 
         GradeGameService.set_correct_anytime_td_prop("TestLeague", 1, ["Travis Kelce"])
 
-        # Should update correct_answer without deducting points
+        # Should update correct_answer without touching the ledger or points
         self.assertEqual(prop.correct_answer, ["Travis Kelce"])
-
-    @patch('app.services.game.gradeGameService.get_player_by_id')
-    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_prop')
+        mock_get_awards.assert_not_called()
+        mock_add_points.assert_not_called()
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.insert_point_awards')
+    @patch('app.services.game.gradeGameService.delete_point_awards_for_prop')
+    @patch('app.services.game.gradeGameService.get_point_awards_for_prop')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
     @patch('app.services.game.gradeGameService.get_anytime_td_prop_by_id')
     @patch('app.services.game.gradeGameService.Game')
     @patch('app.services.game.gradeGameService.db')
-    def test_set_correct_anytime_td_prop_regrade(self, mock_db, mock_game_class, mock_get_prop, mock_get_answers, mock_get_player):
+    def test_set_correct_anytime_td_prop_regrade(self, mock_db, mock_game_class, mock_get_prop, mock_get_answers,
+                                                 mock_get_awards, mock_delete_awards,
+                                                 mock_insert_awards, mock_add_points):
         """Test regrading when correct answer changes after grading."""
-        # Setup player
-        player = Mock()
-        player.id = 1
-        player.name = "TestPlayer"
-        player.points = 15  # Has 15 points
-        mock_get_player.return_value = player
-
         # Setup option
         option = Mock()
         option.player_name = "Travis Kelce"
@@ -463,6 +455,7 @@ class TestAnytimeTdManualGrading(unittest.TestCase):
         prop = Mock()
         prop.id = 1
         prop.game_id = 1
+        prop.is_mandatory = True
         prop.correct_answer = ["Travis Kelce"]  # OLD correct answer
         prop.options = [option]
         mock_get_prop.return_value = prop
@@ -471,11 +464,16 @@ class TestAnytimeTdManualGrading(unittest.TestCase):
         game = Mock()
         game.id = 1
         game.graded = 1
+        game.points_ledgered = True
         mock_game_class.query.filter_by.return_value.first.return_value = game
 
+        # The ledger has the 5 points player 1 earned for Kelce
+        mock_get_awards.return_value = [SimpleNamespace(player_id=1, points=Decimal("5"))]
+
         # Setup answer
         answer = Mock()
         answer.player_id = 1
+        answer.prop_id = 1
         answer.answer = "Travis Kelce"
         mock_get_answers.return_value = [answer]
 
@@ -483,7 +481,10 @@ class TestAnytimeTdManualGrading(unittest.TestCase):
         GradeGameService.set_correct_anytime_td_prop("TestLeague", 1, ["Patrick Mahomes"])
 
         # Should deduct old points
-        self.assertEqual(player.points, 10)  # 15 - 5 = 10
+        mock_add_points.assert_called_once_with({1: Decimal("-5")})
+        # Should replace the prop's ledger rows with the new (empty) awards
+        mock_delete_awards.assert_called_once_with(1, "anytime_td", 1)
+        mock_insert_awards.assert_called_once_with(1, "anytime_td", 1, {})
         # Should update correct_answer
         self.assertEqual(prop.correct_answer, ["Patrick Mahomes"])
 
@@ -0,0 +1,220 @@
+"""
+Unit tests for BoxScoreIndex.
+
+Tests cover:
+- Name and ESPN athlete id lookups
+- Stats from several stat groups on one athlete
+- scrimmage_yards combining rushing and receiving yards
+- Non-numeric and missing stats returning None
+- Name normalization (accents, punctuation, suffixes), nickname aliases and fuzzy matches
+"""
+
+import unittest
+from unittest.mock import patch
+from app.services.boxScoreIndex import BoxScoreIndex, normalize_name
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+
+
+def make_game_data():
+    """Build a small ESPN summary payload with two teams."""
+    return {
+        "boxscore": {
+            "players": [
+                {
+                    "team": {"abbreviation": "BAL"},
+                    "statistics": [
+                        {
+                            "name": "passing",
+                            "keys": ["completions/passingAttempts", "passingYards", "passingTouchdowns"],
+                            "athletes": [
+                                {"athlete": {"id": "3916387", "displayName": "Lamar Jackson"},
+                                 "stats": ["22/30", "250", "2"]}
+                            ]
+                        },
+                        {
+                            "name": "rushing",
+                            "keys": ["rushingAttempts", "rushingYards", "rushingTouchdowns"],
+                            "athletes": [
+                                {"athlete": {"id": "3916387", "displayName": "Lamar Jackson"},
+                                 "stats": ["9", "61", "0"]},
+                                {"athlete": {"id": "3043078", "displayName": "Derrick Henry"},
+                                 "stats": ["20", "102", "1"]}
+                            ]
+                        },
+                        {
+                            "name": "receiving",
+                            "keys": ["receptions", "receivingYards", "receivingTouchdowns"],
+                            "athletes": [
+                                {"athlete": {"id": "3043078", "displayName": "Derrick Henry"},
+                                 "stats": ["2", "--", "0"]},
+                                {"athlete": {"id": "4429615", "displayName": "Zay Flowers"},
+                                 "stats": ["6", "84", "1"]}
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "team": {"abbreviation": "KC"},
+                    "statistics": [
+                        {
+                            "name": "Receiving",
+                            "keys": ["receptions", "receivingYards", "receivingTouchdowns"],
+                            "athletes": [
+                                {"athlete": {"id": "15847", "displayName": "Travis Kelce"},
+                                 "stats": ["7", "71", "1"]}
+                            ]
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class TestBoxScoreIndex(unittest.TestCase):
+    """Test cases for looking up player stats in a BoxScoreIndex."""
+
+    def setUp(self):
+        """Index the sample payload."""
+        self.index = BoxScoreIndex(make_game_data())
+
+    def test_lookup_by_name_is_case_insensitive(self):
+        """Test that names match regardless of case and surrounding whitespace."""
+        self.assertEqual(self.index.get_player_stat(" lamar JACKSON ", "passing_yards"), 250.0)
+        self.assertEqual(self.index.get_player_stat("Travis Kelce", "receiving_tds"), 1.0)
+
+    def test_lookup_by_athlete_id(self):
+        """Test that an ESPN athlete id finds the player even with a different name."""
+        self.assertEqual(self.index.get_player_stat("Zay", "receiving_yards", athlete_id="4429615"), 84.0)
+
+    def test_unknown_athlete_id_falls_back_to_name(self):
+        """Test that an id missing from the box score falls back to the name."""
+        self.assertEqual(self.index.get_player_stat("Derrick Henry", "rushing_tds", athlete_id="999"), 1.0)
+
+    def test_scrimmage_yards_combines_groups(self):
+        """Test that scrimmage yards add rushing and receiving yards."""
+        self.assertEqual(self.index.get_player_stat("Zay Flowers", "scrimmage_yards"), 84.0)
+        self.assertEqual(self.index.get_player_stat("Lamar Jackson", "scrimmage_yards"), 61.0)
+
+    def test_non_numeric_and_missing_stats_return_none(self):
+        """Test that unparseable values, unknown stat types and unknown players return None."""
+        self.assertIsNone(self.index.get_player_stat("Lamar Jackson", "passing_completions"))
+        self.assertIsNone(self.index.get_player_stat("Derrick Henry", "receiving_yards"))
+        self.assertIsNone(self.index.get_player_stat("Lamar Jackson", "field_goals"))
+        self.assertIsNone(self.index.get_player_stat("Patrick Mahomes", "passing_yards"))
+
+    def test_empty_payload(self):
+        """Test that a payload without a box score indexes nothing."""
+        self.assertIsNone(BoxScoreIndex({}).get_player_stat("Lamar Jackson", "passing_yards"))
+
+
+class TestSnapshotBoxScore(unittest.TestCase):
+    """Test cases for the box score index on ESPNGameSnapshot."""
+
+    @patch('app.services.espnGameSnapshot.BoxScoreIndex')
+    def test_index_built_once_per_snapshot(self, mock_index):
+        """Test that many stat lookups share one index build."""
+        snapshot = ESPNGameSnapshot("401772915", make_game_data())
+
+        for _ in range(5):
+            snapshot.get_player_stat("Zay Flowers", "receiving_yards")
+
+        mock_index.assert_called_once()
+
+    @patch('app.services.espnGameSnapshot.BoxScoreIndex')
+    def test_total_points_does_not_build_index(self, mock_index):
+        """Test that game-level stats skip the box score entirely."""
+        snapshot = ESPNGameSnapshot("401772915", make_game_data())
+
+        snapshot.get_player_stat(None, "total_points")
+
+        mock_index.assert_not_called()
+
+
+def make_named_game_data(*names, status="STATUS_IN_PROGRESS"):
+    """Build a payload with one rushing line per name; athlete ids are "1", "2", ... and yards 10, 20, ..."""
+    return {
+        "header": {"competitions": [{"status": {"type": {"name": status}}}]},
+        "boxscore": {"players": [{
+            "team": {"abbreviation": "SEA"},
+            "statistics": [{
+                "name": "rushing",
+                "keys": ["rushingYards", "rushingTouchdowns"],
+                "athletes": [
+                    {"athlete": {"id": str(position), "displayName": name}, "stats": [str(position * 10), "1"]}
+                    for position, name in enumerate(names, start=1)
+                ]
+            }]
+        }]}
+    }
+
+
+class TestNameMatching(unittest.TestCase):
+    """Test cases for finding athletes whose names don't match ESPN's exactly."""
+
+    def test_normalize_name(self):
+        """Test accent, punctuation, separator and suffix folding."""
+        self.assertEqual(normalize_name("Kenneth Walker III"), "kenneth walker")
+        self.assertEqual(normalize_name("D.J. Moore"), normalize_name("DJ Moore"))
+        self.assertEqual(normalize_name("Ja\u2019Marr Chase"), "jamarr chase")
+        self.assertEqual(normalize_name("Amon-Ra St. Brown"), "amon ra st brown")
+        self.assertEqual(normalize_name(" Nicol\u00e1s  Cort\u00e9s "), "nicolas cortes")
+        self.assertEqual(normalize_name("Marvin Harrison Jr."), "marvin harrison")
+        self.assertEqual(normalize_name("Will V"), "will v")
+
+    def test_suffix_punctuation_and_nickname_variants(self):
+        """Test that common ways of writing a name all find the athlete without fuzzy matching."""
+        index = BoxScoreIndex(make_named_game_data("Kenneth Walker III", "D.J. Moore", "Jos\u00e9 Ram\u00edrez"))
+
+        with patch.object(BoxScoreIndex, "fuzzy_find") as mock_fuzzy:
+            snapshot = ESPNGameSnapshot("401", {})
+            snapshot._box_score = index
+            self.assertEqual(snapshot.get_player_stat("Ken Walker", "rushing_yards"), 10.0)
+            self.assertEqual(snapshot.get_player_stat("kenneth walker", "rushing_yards"), 10.0)
+            self.assertEqual(snapshot.get_player_stat("DJ Moore", "rushing_yards"), 20.0)
+            self.assertEqual(snapshot.get_player_stat("Jose Ramirez", "rushing_yards"), 30.0)
+            mock_fuzzy.assert_not_called()
+
+    def test_fuzzy_match_for_misspellings(self):
+        """Test that a misspelled name resolves to the closest athlete."""
+        index = BoxScoreIndex(make_named_game_data("Christian McCaffrey", "Jordan Mason", "Kyle Juszczyk"))
+
+        self.assertEqual(index.fuzzy_find("Christian McCaffery")["id"], "1")
+        self.assertEqual(index.fuzzy_find("Kyle Juszcyzk")["id"], "3")
+        self.assertIsNone(index.fuzzy_find("Brock Purdy"))
+
+    def test_fuzzy_near_tie_matches_nothing(self):
+        """Test that a name equally close to two athletes resolves to neither."""
+        index = BoxScoreIndex(make_named_game_data("Jon Smithe", "Jon Smitho"))
+
+        self.assertIsNone(index.fuzzy_find("Jon Smith"))
+
+    def test_shared_alias_matches_nothing(self):
+        """Test that a nickname shared by two athletes isn't resolved to either."""
+        index = BoxScoreIndex(make_named_game_data("Mike Williams", "Michael Williams"))
+
+        self.assertEqual(index.find_athlete("Mike Williams")["id"], "1")
+        self.assertIsNone(index.find_athlete("Mikey Williams"))
+        self.assertIsNone(index.find_athlete("Michel Williams"))
+
+    def test_absent_player_not_matched_to_similar_name_while_live(self):
+        """Test that a player missing from a live box score isn't given a similarly named athlete's stats."""
+        snapshot = ESPNGameSnapshot("401", make_named_game_data("Derek Carrier", "Kenan Allen"))
+
+        self.assertIsNone(snapshot.find_athlete("Derek Carr"))
+        self.assertIsNone(snapshot.get_touchdowns("Derek Carr"))
+        self.assertIsNone(snapshot.get_player_stat("Keenan Allen", "rushing_yards"))
+
+    def test_fuzzy_match_only_once_final(self):
+        """Test that a misspelled name resolves in a final snapshot, and that nothing carries over to live ones."""
+        final = ESPNGameSnapshot("401", make_named_game_data("Christian McCaffrey", "Jordan Mason",
+                                                             status="STATUS_FINAL"))
+        self.assertEqual(final.get_player_stat("Christian McCaffery", "rushing_yards"), 10.0)
+        self.assertEqual(final.get_touchdowns("Christian McCaffery"), 1)
+
+        live = ESPNGameSnapshot("401", make_named_game_data("Christian McCaffrey", "Jordan Mason"))
+        self.assertIsNone(live.get_player_stat("Christian McCaffery", "rushing_yards"))
+
+
+if __name__ == '__main__':
+    unittest.main()
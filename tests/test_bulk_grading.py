@@ -0,0 +1,237 @@
+"""
+Unit tests for the set-based grading engine in GradeGameService.
+
+Tests cover:
+- In-memory scoring for all four prop types
+- Optional props only counting for players who selected them
+- grade_game loading answers once per prop type and applying one bulk update
+- The point ledger making regrades apply only the difference
+"""
+
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from app.services.game.gradeGameService import GradeGameService
+
+
+def make_answer(player_id, prop_id, answer):
+    """Build an answer row shaped like the bulk loader results."""
+    return SimpleNamespace(player_id=player_id, prop_id=prop_id, answer=answer)
+
+
+def make_selection(player_id, prop_type, prop_id):
+    """Build a selection row shaped like get_prop_selections_for_game results."""
+    return SimpleNamespace(player_id=player_id, prop_type=prop_type, prop_id=prop_id)
+
+
+class TestPropScoring(unittest.TestCase):
+    """Test cases for scoring a single prop in memory."""
+
+    def test_winner_loser_awards_favorite_and_underdog_points(self):
+        """Test that correct picks earn the points of the team they picked."""
+        prop = Mock(is_mandatory=True, correct_answer="Chiefs", favorite_team="Chiefs",
+                    underdog_team="Ravens", favorite_points=Decimal("1"), underdog_points=Decimal("3"))
+        answers = [make_answer(1, 1, "Chiefs"), make_answer(2, 1, "Ravens")]
+
+        awards = GradeGameService._score_winner_loser_prop(prop, answers, set())
+
+        self.assertEqual(awards, {1: Decimal("1")})
+
+    def test_winner_loser_ungraded_prop_awards_nothing(self):
+        """Test that a prop without a correct answer awards no points."""
+        prop = Mock(is_mandatory=True, correct_answer=None, favorite_team="Chiefs",
+                    underdog_team="Ravens", favorite_points=Decimal("1"), underdog_points=Decimal("3"))
+
+        awards = GradeGameService._score_winner_loser_prop(prop, [make_answer(1, 1, "Chiefs")], set())
+
+        self.assertEqual(awards, {})
+
+    def test_over_under_is_case_insensitive(self):
+        """Test that over/under answers match regardless of case."""
+        prop = Mock(is_mandatory=True, correct_answer="Over",
+                    over_points=Decimal("2"), under_points=Decimal("1.5"))
+        answers = [make_answer(1, 1, "over"), make_answer(2, 1, "UNDER")]
+
+        awards = GradeGameService._score_over_under_prop(prop, answers, set())
+
+        self.assertEqual(awards, {1: Decimal("2")})
+
+    def test_variable_option_uses_option_points(self):
+        """Test that variable option answers earn their option's points."""
+        prop = Mock(is_mandatory=True, correct_answer=["A", "C"])
+        prop.options = [
+            Mock(answer_choice="A", answer_points=Decimal("2")),
+            Mock(answer_choice="B", answer_points=Decimal("4")),
+            Mock(answer_choice="C", answer_points=Decimal("6")),
+        ]
+        answers = [make_answer(1, 1, "A"), make_answer(2, 1, "B"), make_answer(3, 1, "C")]
+
+        awards = GradeGameService._score_variable_option_prop(prop, answers, set())
+
+        self.assertEqual(awards, {1: Decimal("2"), 3: Decimal("6")})
+
+    def test_anytime_td_mixes_float_option_points(self):
+        """Test that float option points are converted without precision noise."""
+        prop = Mock(is_mandatory=True, correct_answer=["Travis Kelce"])
+        prop.options = [Mock(player_name="Travis Kelce", points=2.5)]
+
+        awards = GradeGameService._score_anytime_td_prop(prop, [make_answer(1, 1, "Travis Kelce")], set())
+
+        self.assertEqual(awards, {1: Decimal("2.5")})
+
+    def test_optional_prop_requires_selection(self):
+        """Test that optional props only score for players who selected them."""
+        prop = Mock(is_mandatory=False, correct_answer="over",
+                    over_points=Decimal("2"), under_points=Decimal("1"))
+        answers = [make_answer(1, 1, "over"), make_answer(2, 1, "over")]
+
+        awards = GradeGameService._score_over_under_prop(prop, answers, {2})
+
+        self.assertEqual(awards, {2: Decimal("2")})
+
+
+class TestBulkGradeGame(unittest.TestCase):
+    """Test cases for grade_game using bulk loaders and a single points update."""
+
+    def setUp(self):
+        """Set up a game with one prop of each type."""
+        self.wl_prop = Mock(id=10, is_mandatory=True, correct_answer="Chiefs", favorite_team="Chiefs",
+                            underdog_team="Ravens", favorite_points=Decimal("1"), underdog_points=Decimal("3"))
+        self.ou_prop = Mock(id=20, is_mandatory=False, correct_answer="under",
+                            over_points=Decimal("2"), under_points=Decimal("2"))
+        self.vo_prop = Mock(id=30, is_mandatory=False, correct_answer=["Yes"])
+        self.vo_prop.options = [Mock(answer_choice="Yes", answer_points=Decimal("5"))]
+        self.td_prop = Mock(id=40, is_mandatory=True, correct_answer=["Travis Kelce"])
+        self.td_prop.options = [Mock(player_name="Travis Kelce", points=4.0)]
+
+        self.game = Mock(id=1, graded=0, points_ledgered=False)
+        self.game.winner_loser_props = [self.wl_prop]
+        self.game.over_under_props = [self.ou_prop]
+        self.game.variable_option_props = [self.vo_prop]
+        self.game.anytime_td_props = [self.td_prop]
+
+        # Start from an empty point ledger unless a test says otherwise
+        self.ledger_rows = []
+        self.ledger = {
+            "get_point_awards_for_game": Mock(side_effect=lambda game_id: self.ledger_rows),
+            "delete_point_awards_for_game": Mock(),
+            "insert_point_awards": Mock(),
+        }
+        ledger = patch.multiple('app.services.game.gradeGameService', **self.ledger)
+        ledger.start()
+        self.addCleanup(ledger.stop)
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_prop_selections_for_game')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_variable_option_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_over_under_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_winner_loser_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
+    @patch('app.services.game.gradeGameService.db')
+    def test_grade_game_sums_all_prop_types(self, mock_db, mock_get_game, mock_wl, mock_ou, mock_vo,
+                                            mock_td, mock_selections, mock_add_points):
+        """Test that every prop type is scored and totals are applied once."""
+        mock_get_game.return_value = self.game
+        mock_wl.return_value = [make_answer(1, 10, "Chiefs"), make_answer(2, 10, "Ravens")]
+        mock_ou.return_value = [make_answer(1, 20, "under"), make_answer(2, 20, "under")]
+        mock_vo.return_value = [make_answer(1, 30, "Yes"), make_answer(2, 30, "Yes")]
+        mock_td.return_value = [make_answer(2, 40, "Travis Kelce")]
+        # Player 1 picked the O/U prop, player 2 picked the variable option prop
+        mock_selections.return_value = [
+            make_selection(1, "over_under", 20),
+            make_selection(2, "variable_option", 30),
+        ]
+
+        GradeGameService.grade_game(1)
+
+        mock_wl.assert_called_once_with([10])
+        mock_selections.assert_called_once_with(1)
+        mock_add_points.assert_called_once_with({1: Decimal("3"), 2: Decimal("9")})
+        self.assertEqual(self.game.graded, 1)
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_prop_selections_for_game')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
+    @patch('app.services.game.gradeGameService.db')
+    def test_selections_not_loaded_when_all_props_mandatory(self, mock_db, mock_get_game, mock_td,
+                                                            mock_selections, mock_add_points):
+        """Test that the selection query is skipped when no prop is optional."""
+        self.game.winner_loser_props = []
+        self.game.over_under_props = []
+        self.game.variable_option_props = []
+        mock_get_game.return_value = self.game
+        mock_td.return_value = [make_answer(1, 40, "Travis Kelce")]
+
+        GradeGameService.grade_game(1)
+
+        mock_selections.assert_not_called()
+        mock_add_points.assert_called_once_with({1: Decimal("4.0")})
+
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
+    @patch('app.services.game.gradeGameService.db')
+    def test_regrading_same_results_awards_nothing(self, mock_db, mock_get_game, mock_td, mock_add_points):
+        """Test that grading a game again only applies the difference from the ledger."""
+        self.game.winner_loser_props = []
+        self.game.over_under_props = []
+        self.game.variable_option_props = []
+        self.game.graded = 1
+        self.game.points_ledgered = True
+        mock_get_game.return_value = self.game
+        mock_td.return_value = [make_answer(1, 40, "Travis Kelce"), make_answer(2, 40, "Travis Kelce")]
+        # Player 1 was already awarded for this prop, player 2 answered after the first grade
+        self.ledger_rows = [SimpleNamespace(player_id=1, prop_type="anytime_td", prop_id=40, points=Decimal("4.0"))]
+
+        GradeGameService.grade_game(1)
+
+        mock_add_points.assert_called_once_with({2: Decimal("4.0")})
+        self.ledger["delete_point_awards_for_game"].assert_called_once_with(1)
+        self.ledger["insert_point_awards"].assert_called_once_with(
+            1, "anytime_td", 40, {1: Decimal("4.0"), 2: Decimal("4.0")})
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
+    @patch('app.services.game.gradeGameService.db')
+    def test_graded_game_without_ledger_is_backfilled(self, mock_db, mock_get_game, mock_td, mock_add_points):
+        """Test that a game graded before the ledger existed is recorded, not awarded again."""
+        self.game.winner_loser_props = []
+        self.game.over_under_props = []
+        self.game.variable_option_props = []
+        self.game.graded = 1
+        mock_get_game.return_value = self.game
+        mock_td.return_value = [make_answer(1, 40, "Travis Kelce")]
+
+        GradeGameService.grade_game(1)
+
+        mock_add_points.assert_not_called()
+        self.ledger["insert_point_awards"].assert_called_once_with(1, "anytime_td", 40, {1: Decimal("4.0")})
+        self.assertTrue(self.game.points_ledgered)
+
+    @patch('app.services.game.gradeGameService.add_points_to_players')
+    @patch('app.services.game.gradeGameService.get_anytime_td_answers_for_props')
+    @patch('app.services.game.gradeGameService.get_game_with_props')
+    @patch('app.services.game.gradeGameService.db')
+    def test_regrading_game_without_awards_applies_new_points(self, mock_db, mock_get_game, mock_td,
+                                                              mock_add_points):
+        """Test that a ledgered game nobody scored in (no ledger rows) is regraded, not backfilled."""
+        self.game.winner_loser_props = []
+        self.game.over_under_props = []
+        self.game.variable_option_props = []
+        self.game.graded = 1
+        self.game.points_ledgered = True
+        mock_get_game.return_value = self.game
+        mock_td.return_value = [make_answer(1, 40, "Travis Kelce")]
+
+        GradeGameService.grade_game(1)
+
+        mock_add_points.assert_called_once_with({1: Decimal("4.0")})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Tests for the ESPN circuit breaker and request deadlines.
+
+Tests cover:
+- Tripping on consecutive failures and on slow responses
+- Half-open probes closing or re-opening the breaker
+- ESPNHttpClient serving the last good payload while the breaker is open
+- 404s not counting as ESPN failures
+- Per-thread deadlines capping request timeouts
+"""
+
+import time
+import unittest
+from unittest.mock import patch
+import requests
+from app.services.circuitBreaker import CircuitBreaker
+from app.services.espnHttpClient import CircuitOpenError, DeadlineExceededError, ESPNHttpClient
+from app.services.game.pollingService import PollingService
+from app.utils.espnStubServer import ESPNStubServer, make_scripted_games
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for CircuitBreaker state changes."""
+
+    def setUp(self):
+        """A breaker that trips after 3 failures and stays open for 30 seconds."""
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker("test", failure_threshold=3, slow_call_ms=1000, open_seconds=30,
+                                      clock=self.clock)
+
+    def trip(self):
+        for _ in range(3):
+            self.assertTrue(self.breaker.allow_request())
+            self.breaker.record_failure()
+
+    def test_trips_after_consecutive_failures(self):
+        """Test that only consecutive failures count toward tripping."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success(10)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.breaker.record_success(10)
+
+        self.trip()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.get_stats()["rejected"], 1)
+        self.assertEqual(self.breaker.get_stats()["open_seconds_remaining"], 30)
+
+    def test_slow_successes_trip(self):
+        """Test that answers over the latency budget count as failures."""
+        for _ in range(3):
+            self.breaker.record_success(5000)
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.get_stats()["slow_calls"], 3)
+
+    def test_half_open_probe_closes_on_success(self):
+        """Test that one probe goes through after the cool-down and a good one closes the breaker."""
+        self.trip()
+        self.clock.now += 30
+
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request(), "Only one probe at a time")
+
+        self.breaker.record_success(50)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the breaker for another cool-down."""
+        self.trip()
+        self.clock.now += 30
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.get_stats()["trips"], 2)
+        self.clock.now += 29
+        self.assertFalse(self.breaker.allow_request())
+
+
+class TestESPNHttpClientBreaker(unittest.TestCase):
+    """Test cases for the breaker and deadlines in ESPNHttpClient."""
+
+    def setUp(self):
+        """Start a stub ESPN and a fresh breaker on a fake clock, without retries."""
+        self.stub = ESPNStubServer(make_scripted_games(1, duration_seconds=100), seed=1)
+        self.stub.start()
+        self.addCleanup(self.stub.stop)
+        self.url = f"{self.stub.base_url}/summary"
+
+        self.clock = FakeClock()
+        breaker = patch.object(ESPNHttpClient, '_breaker', CircuitBreaker(
+            "ESPN", failure_threshold=2, slow_call_ms=1000, open_seconds=30, clock=self.clock))
+        retries = patch.object(ESPNHttpClient, 'MAX_RETRIES', 0)
+        for patcher in (breaker, retries):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ESPNHttpClient.reset()
+        self.addCleanup(ESPNHttpClient.reset)
+
+    def get(self, event_id="9000001", **kwargs):
+        return ESPNHttpClient.get_json(self.url, params={"event": event_id}, endpoint="summary", **kwargs)
+
+    def test_open_breaker_serves_last_good_payload(self):
+        """Test that an open breaker answers from the last good payload without calling ESPN."""
+        good = self.get()
+        self.stub.fail_next(2, status=503)
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                self.get()
+        calls = self.stub.request_counts["summary"]
+
+        self.assertEqual(self.get(), good)
+        self.assertEqual(self.stub.request_counts["summary"], calls)
+        self.assertEqual(ESPNHttpClient.get_latency_stats()["summary"]["short_circuited"], 1)
+        with self.assertRaises(CircuitOpenError):
+            self.get("9999999")
+
+    def test_probe_after_cool_down_closes_breaker(self):
+        """Test that the first request after the cool-down reaches ESPN and closes the breaker."""
+        self.stub.fail_next(2, status=503)
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                self.get()
+        self.clock.now += 30
+
+        self.assertIn("header", self.get())
+        self.assertEqual(ESPNHttpClient.get_breaker_stats()["state"], CircuitBreaker.CLOSED)
+
+    def test_not_found_does_not_trip(self):
+        """Test that unknown events (404) are not treated as ESPN failures."""
+        for _ in range(3):
+            with self.assertRaises(requests.HTTPError):
+                self.get("123")
+
+        self.assertEqual(ESPNHttpClient.get_breaker_stats()["state"], CircuitBreaker.CLOSED)
+
+    def test_deadline_caps_request_timeout(self):
+        """Test that a stalled request fails when the deadline passes, not at the full timeout."""
+        self.stub.hang_next(1, seconds=2.0)
+        started = time.monotonic()
+
+        with ESPNHttpClient.deadline(time.monotonic() + 0.3):
+            with self.assertRaises(requests.RequestException):
+                self.get()
+
+        self.assertLess(time.monotonic() - started, 1.5)
+
+    def test_expired_deadline_fails_without_a_request(self):
+        """Test that requests after the deadline fail at once and don't count against ESPN."""
+        with ESPNHttpClient.deadline(time.monotonic() - 1):
+            with self.assertRaises(DeadlineExceededError):
+                self.get()
+
+        self.assertEqual(self.stub.request_counts.get("summary", 0), 0)
+        self.assertEqual(ESPNHttpClient.get_breaker_stats()["consecutive_failures"], 0)
+
+    def test_nested_deadline_keeps_the_earlier_one(self):
+        """Test that an inner, later deadline can't extend the outer one."""
+        with ESPNHttpClient.deadline(100.0):
+            with ESPNHttpClient.deadline(200.0):
+                self.assertEqual(ESPNHttpClient.get_deadline(), 100.0)
+            self.assertEqual(ESPNHttpClient.get_deadline(), 100.0)
+        self.assertIsNone(ESPNHttpClient.get_deadline())
+
+    @patch.object(PollingService, '_fetch_settings', return_value=(4, 30.0))
+    def test_fetch_workers_share_the_cycle_deadline(self, mock_settings):
+        """Test that summary fetches on the pool inherit the calling thread's deadline."""
+        self.stub.hang_next(1, seconds=2.0)
+        started = time.monotonic()
+
+        with ESPNHttpClient.deadline(time.monotonic() + 0.3):
+            snapshots = PollingService.fetch_snapshots(["9000001"])
+
+        self.assertIsNone(snapshots["9000001"])
+        self.assertLess(time.monotonic() - started, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
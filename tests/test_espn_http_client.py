@@ -0,0 +1,157 @@
+"""
+Tests for ESPNHttpClient against a local stub HTTP server.
+
+Tests cover:
+- Connection reuse through the shared session
+- ETag revalidation returning the remembered payload on 304
+- Retrying 5xx responses before succeeding
+- Retries stopping at the caller's deadline
+- Per-endpoint latency and error counters
+"""
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from app.services.espnHttpClient import ESPNHttpClient
+
+
+class StubESPNHandler(BaseHTTPRequestHandler):
+    """Serves canned JSON with an ETag and fails on demand."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        server.client_ports.add(self.client_address[1])
+
+        if self.path.startswith("/flaky") and server.failures_left > 0:
+            server.failures_left -= 1
+            self._send(503, b"{}")
+            return
+        if self.path.startswith("/broken"):
+            self._send(500, b"{}")
+            return
+
+        etag = '"v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag=etag)
+            return
+        self._send(200, json.dumps({"path": self.path}).encode(), etag=etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestESPNHttpClient(unittest.TestCase):
+    """Test cases for the shared ESPN HTTP client."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stub server on a free local port."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubESPNHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stub server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Start every test with a fresh session and empty counters."""
+        ESPNHttpClient.reset()
+        self.server.requests_seen = []
+        self.server.client_ports = set()
+        self.server.failures_left = 0
+        self.original_backoff = ESPNHttpClient.BACKOFF_FACTOR
+        self.original_jitter = ESPNHttpClient.BACKOFF_JITTER
+        ESPNHttpClient.BACKOFF_FACTOR = 0.01
+        ESPNHttpClient.BACKOFF_JITTER = 0.0
+
+    def tearDown(self):
+        """Restore retry timing and close the session."""
+        ESPNHttpClient.BACKOFF_FACTOR = self.original_backoff
+        ESPNHttpClient.BACKOFF_JITTER = self.original_jitter
+        ESPNHttpClient.reset()
+
+    def test_connections_are_kept_alive(self):
+        """Test that sequential requests reuse one pooled connection."""
+        for event_id in ("1", "2", "3"):
+            ESPNHttpClient.get_json(f"{self.base_url}/summary", params={"event": event_id}, endpoint="summary")
+
+        self.assertEqual(len(self.server.requests_seen), 3)
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_etag_revalidation_returns_remembered_payload(self):
+        """Test that a 304 response returns the payload from the first response."""
+        first = ESPNHttpClient.get_json(f"{self.base_url}/summary", params={"event": "1"}, endpoint="summary")
+        second = ESPNHttpClient.get_json(f"{self.base_url}/summary", params={"event": "1"}, endpoint="summary")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.requests_seen[1][1], '"v1"')
+        stats = ESPNHttpClient.get_latency_stats()["summary"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["not_modified"], 1)
+
+    def test_retries_transient_errors(self):
+        """Test that 5xx responses are retried before succeeding."""
+        self.server.failures_left = 2
+
+        payload = ESPNHttpClient.get_json(f"{self.base_url}/flaky", endpoint="scoreboard")
+
+        self.assertEqual(payload, {"path": "/flaky"})
+        self.assertEqual(len(self.server.requests_seen), 3)
+        self.assertEqual(ESPNHttpClient.get_latency_stats()["scoreboard"]["errors"], 0)
+
+    def test_exhausted_retries_raise_and_count_error(self):
+        """Test that a persistent failure raises after retries and is counted."""
+        with self.assertRaises(requests.RequestException):
+            ESPNHttpClient.get_json(f"{self.base_url}/broken", endpoint="roster")
+
+        self.assertEqual(len(self.server.requests_seen), ESPNHttpClient.MAX_RETRIES + 1)
+        stats = ESPNHttpClient.get_latency_stats()["roster"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["errors"], 1)
+
+    def test_retries_stop_at_deadline(self):
+        """Test that no retry is started when its backoff would end after the deadline."""
+        self.server.failures_left = 3
+        ESPNHttpClient.BACKOFF_FACTOR = 1.0
+        started = time.monotonic()
+
+        with ESPNHttpClient.deadline(time.monotonic() + 0.5):
+            with self.assertRaises(requests.HTTPError):
+                ESPNHttpClient.get_json(f"{self.base_url}/flaky", endpoint="scoreboard")
+
+        # The first retry has no backoff; the second would sleep 2s, past the deadline
+        self.assertEqual(len(self.server.requests_seen), 2)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_retries_without_deadline_are_unchanged(self):
+        """Test that retries outside a deadline still run to MAX_RETRIES."""
+        self.server.failures_left = 3
+
+        payload = ESPNHttpClient.get_json(f"{self.base_url}/flaky", endpoint="scoreboard")
+
+        self.assertEqual(payload, {"path": "/flaky"})
+        self.assertEqual(len(self.server.requests_seen), ESPNHttpClient.MAX_RETRIES + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
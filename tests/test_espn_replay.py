@@ -0,0 +1,153 @@
+"""
+Unit tests for recording and replaying ESPN payloads.
+
+Tests cover:
+- Recording responses per resource, skipping unchanged payloads
+- Replaying the frame current for the replay clock, at accelerated speed
+- Synthetic copies of recorded events, staggered in time
+- ESPNHttpClient serving requests from a replay and feeding a recorder
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from app.services.espnClientService import ESPNClientService
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.responseCache import espn_response_cache
+from app.utils.espnReplay import ESPNRecorder, ESPNReplay, resource_key
+
+SUMMARY_URL = f"{ESPNClientService.BASE_URL}/summary"
+SCOREBOARD_URL = f"{ESPNClientService.BASE_URL}/scoreboard"
+
+
+class FakeClock:
+    """Manually advanced clock for recorder and replay timing."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_summary(score):
+    """Build a minimal summary payload with the home team's score."""
+    return {"header": {"competitions": [{"competitors": [{"team": {"abbreviation": "BAL"}, "score": str(score)}]}]}}
+
+
+def make_scoreboard(score):
+    """Build a scoreboard payload with one event."""
+    return {"events": [{"id": "401", "competitions": [{"competitors": [{"score": str(score)}]}]}]}
+
+
+class TestESPNReplay(unittest.TestCase):
+    """Test cases for the recorder and replay."""
+
+    def setUp(self):
+        """Record a summary and a scoreboard at t=0, 60, 90 (unchanged) and 120 seconds."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        started = 1_700_000_000.0
+        clock = FakeClock()
+        recorder = ESPNRecorder(self.directory, clock=clock)
+        for seconds, score in ((0, 0), (60, 7), (90, 7), (120, 14)):
+            clock.now = started + seconds
+            recorder.record("summary", SUMMARY_URL, {"event": "401"}, make_summary(score))
+            recorder.record("scoreboard", SCOREBOARD_URL, {}, make_scoreboard(score))
+
+    def test_resource_keys(self):
+        """Test that recordings are named after the event, date or team."""
+        self.assertEqual(resource_key("summary", SUMMARY_URL, {"event": "401"}), "401")
+        self.assertEqual(resource_key("scoreboard", SCOREBOARD_URL, {}), "current")
+        self.assertEqual(resource_key("scoreboard", SCOREBOARD_URL, {"dates": "20260111"}), "20260111")
+        self.assertEqual(resource_key("roster", f"{ESPNClientService.BASE_URL}/teams/33/roster"), "33")
+
+    def test_unchanged_payloads_stored_once(self):
+        """Test that a repeated payload doesn't add a frame."""
+        times, payloads = ESPNReplay.load(self.directory)[("summary", "401")]
+
+        self.assertEqual(times, [0.0, 60.0, 120.0])
+        self.assertEqual([p["header"]["competitions"][0]["competitors"][0]["score"] for p in payloads],
+                         ["0", "7", "14"])
+
+    def test_replay_serves_frame_for_accelerated_clock(self):
+        """Test that replay at 10x reaches the 60 second frame after 6 seconds."""
+        clock = FakeClock()
+        replay = ESPNReplay(self.directory, speed=10, clock=clock)
+
+        def score():
+            payload = replay.get_json(SUMMARY_URL, {"event": "401"}, endpoint="summary")
+            return payload["header"]["competitions"][0]["competitors"][0]["score"]
+
+        self.assertEqual(score(), "0")
+        clock.now = 6.5
+        self.assertEqual(score(), "7")
+        clock.now = 100
+        self.assertEqual(score(), "14")
+        self.assertEqual(replay.duration(), 120.0)
+
+    def test_synthetic_copies_are_staggered(self):
+        """Test that copies serve the recording shifted by the stagger and appear on the scoreboard."""
+        clock = FakeClock()
+        replay = ESPNReplay(self.directory, copies=3, stagger_seconds=60, clock=clock)
+        clock.now = 125
+
+        self.assertEqual(replay.event_ids(), ["401", "401-1", "401-2"])
+        scores = [replay.get_json(SUMMARY_URL, {"event": event_id}, endpoint="summary")
+                  ["header"]["competitions"][0]["competitors"][0]["score"] for event_id in replay.event_ids()]
+        self.assertEqual(scores, ["14", "7", "0"])
+
+        scoreboard = replay.get_json(SCOREBOARD_URL, {}, endpoint="scoreboard")
+        self.assertEqual([event["id"] for event in scoreboard["events"]], ["401", "401-1", "401-2"])
+        self.assertEqual(scoreboard["events"][1]["competitions"][0]["competitors"][0]["score"], "7")
+
+    def test_unrecorded_resource_fails_like_a_request(self):
+        """Test that asking for an event that wasn't recorded raises a RequestException."""
+        replay = ESPNReplay(self.directory)
+
+        with self.assertRaises(requests.RequestException):
+            replay.get_json(SUMMARY_URL, {"event": "999"}, endpoint="summary")
+
+
+class TestESPNHttpClientHooks(unittest.TestCase):
+    """Test cases for installing a recorder or replay on the HTTP client."""
+
+    def setUp(self):
+        """Start with no hooks and an empty cache."""
+        ESPNHttpClient.reset()
+        espn_response_cache.clear()
+        self.addCleanup(ESPNHttpClient.set_replay, None)
+        self.addCleanup(ESPNHttpClient.set_recorder, None)
+        self.addCleanup(espn_response_cache.clear)
+
+    def test_replay_replaces_network(self):
+        """Test that ESPNClientService is served from the replay without a request."""
+        replay = MagicMock()
+        replay.get_json.return_value = make_summary(21)
+        ESPNHttpClient.set_replay(replay)
+
+        with patch.object(ESPNHttpClient, 'get_session') as mock_session:
+            game_data = ESPNClientService.get_game_data("401")
+
+        mock_session.assert_not_called()
+        self.assertEqual(ESPNClientService.get_team_scores(game_data), {"BAL": 21})
+        replay.get_json.assert_called_once_with(SUMMARY_URL, params={"event": "401"}, endpoint="summary")
+
+    def test_recorder_sees_successful_responses(self):
+        """Test that live responses are passed to the recorder."""
+        recorder = MagicMock()
+        ESPNHttpClient.set_recorder(recorder)
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = make_summary(3)
+
+        with patch.object(ESPNHttpClient, 'get_session') as mock_session:
+            mock_session.return_value.get.return_value = response
+            ESPNClientService.get_game_data("401")
+
+        recorder.record.assert_called_once_with("summary", SUMMARY_URL, {"event": "401"}, make_summary(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for the local ESPN stand-in server.
+
+Tests cover:
+- Scripted game progression (scheduled, live, halftime, final)
+- ESPNClientService and ESPNGameSnapshot parsing stub payloads over HTTP
+- Injected errors being retried and injected stalls hitting the client timeout
+- A polling cycle's scoreboard triage running against the stub
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from app.services.espnClientService import ESPNClientService
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.game.pollingService import PollingService
+from app.services.responseCache import espn_response_cache
+from app.utils.espnStubServer import ESPNStubServer, ScriptedGame, TEAMS, make_scripted_games
+
+
+class TestScriptedGame(unittest.TestCase):
+    """Test cases for scripted game timelines."""
+
+    def setUp(self):
+        """A 400 second game with a 100 second halftime, kicking off after 50 seconds."""
+        self.game = ScriptedGame("1", TEAMS[0], TEAMS[1], duration_seconds=400,
+                                 halftime_seconds=100, start_delay=50)
+
+    def test_status_progression(self):
+        """Test that the game moves from scheduled through halftime to final."""
+        self.assertEqual(self.game.state(0)["status"], "STATUS_SCHEDULED")
+        self.assertEqual(self.game.state(100)["status"], "STATUS_IN_PROGRESS")
+        self.assertEqual(self.game.state(100)["period"], 1)
+        self.assertEqual(self.game.state(300)["status"], "STATUS_HALFTIME")
+        self.assertEqual(self.game.state(400)["period"], 3)
+        self.assertEqual(self.game.state(600)["status"], "STATUS_FINAL")
+
+    def test_scores_and_stats_only_grow(self):
+        """Test that scores and player stats never go backwards."""
+        previous = None
+        for elapsed in range(0, 601, 25):
+            snapshot = ESPNGameSnapshot("1", self.game.summary(elapsed))
+            current = (sum(snapshot.scores.values()), snapshot.get_player_stat("BAL QB", "passing_yards"))
+            if previous is not None:
+                self.assertGreaterEqual(current, previous)
+            previous = current
+
+        self.assertEqual(snapshot.winning_team_id, "BAL")
+        self.assertEqual(snapshot.get_player_stat("BAL QB", "passing_yards"), 265)
+        self.assertEqual(snapshot.get_player_stat("BAL WR", "receiving_tds"), 2)
+        self.assertEqual(snapshot.get_player_stat("BAL QB", "passing_tds"), 2)
+
+
+class TestESPNStubServer(unittest.TestCase):
+    """Test cases for serving stub payloads over HTTP."""
+
+    def setUp(self):
+        """Start a stub with two games and point ESPNClientService at it."""
+        self.stub = ESPNStubServer(make_scripted_games(2, duration_seconds=100), seed=1)
+        self.stub.start()
+        self.addCleanup(self.stub.stop)
+
+        base_url = patch.object(ESPNClientService, 'BASE_URL', self.stub.base_url)
+        base_url.start()
+        self.addCleanup(base_url.stop)
+
+        self.original_backoff = ESPNHttpClient.BACKOFF_FACTOR
+        ESPNHttpClient.BACKOFF_FACTOR = 0.0
+        self.addCleanup(setattr, ESPNHttpClient, 'BACKOFF_FACTOR', self.original_backoff)
+        ESPNHttpClient.reset()
+        self.addCleanup(ESPNHttpClient.reset)
+        espn_response_cache.clear()
+        self.addCleanup(espn_response_cache.clear)
+
+    def test_client_endpoints(self):
+        """Test that summary, scoreboard and roster payloads parse like ESPN's."""
+        self.stub._started -= 60  # jump to the third quarter
+
+        snapshot = ESPNGameSnapshot.fetch("9000001")
+        self.assertEqual(snapshot.status, "STATUS_IN_PROGRESS")
+        self.assertEqual(snapshot.period, 3)
+        self.assertEqual(snapshot.scores, {"BAL": 17, "KC": 10})
+
+        board = ESPNGameSnapshot.from_scoreboard(ESPNClientService.get_scoreboard())
+        self.assertEqual(sorted(board), ["9000001", "9000002"])
+        self.assertEqual((board["9000001"].status, board["9000001"].period, board["9000001"].scores),
+                         (snapshot.status, snapshot.period, snapshot.scores))
+
+        players = ESPNClientService.get_available_players("9000002", positions=["QB"])
+        self.assertEqual([player["name"] for player in players], ["BUF QB", "PHI QB"])
+        self.assertEqual(self.stub.request_counts, {"summary": 2, "scoreboard": 1, "roster": 2})
+
+    def test_unknown_event_is_not_found(self):
+        """Test that an unknown event id fails like a missing ESPN event."""
+        self.assertIsNone(ESPNClientService.get_game_data("123"))
+
+    def test_injected_errors_are_retried(self):
+        """Test that injected 503s are retried by the HTTP client."""
+        self.stub.fail_next(2, status=503)
+
+        self.assertIsNotNone(ESPNClientService.get_game_data("9000001"))
+        self.assertEqual(self.stub.request_counts["summary"], 3)
+
+    def test_injected_stall_hits_client_timeout(self):
+        """Test that a stalled response fails at the client timeout."""
+        self.stub.hang_next(ESPNHttpClient.MAX_RETRIES + 1, seconds=1.0)
+
+        with patch.object(ESPNHttpClient, 'MAX_RETRIES', 0):
+            ESPNHttpClient.reset()
+            with self.assertRaises(requests.RequestException):
+                ESPNHttpClient.get_json(f"{self.stub.base_url}/summary", params={"event": "9000001"},
+                                        endpoint="summary", timeout=0.2)
+
+    def test_error_rate_fails_a_fraction_of_requests(self):
+        """Test that error_rate makes roughly that share of responses fail."""
+        self.stub.error_rate = 0.5
+        session = requests.Session()
+        statuses = [session.get(f"{self.stub.base_url}/scoreboard").status_code for _ in range(40)]
+
+        self.assertTrue(5 < statuses.count(503) < 35)
+
+    def test_polling_cycle_against_stub(self):
+        """Test that scoreboard triage only fetches summaries for stat games."""
+        PollingService._scoreboard_states.clear()
+        self.addCleanup(PollingService._scoreboard_states.clear)
+        score_game = MagicMock(over_under_props=[], anytime_td_props=[])
+        stat_game = MagicMock(over_under_props=[MagicMock(player_name="BUF RB", stat_type="rushing_yards")],
+                              anytime_td_props=[])
+        self.stub._started -= 30
+
+        snapshots, requests_made = PollingService.fetch_cycle_snapshots(
+            {"9000001": [score_game], "9000002": [stat_game]})
+
+        self.assertEqual(requests_made, 2)
+        self.assertFalse(snapshots["9000001"].has_box_score)
+        self.assertGreater(snapshots["9000002"].get_player_stat("BUF RB", "rushing_yards"), 0)
+        self.assertEqual(self.stub.request_counts, {"scoreboard": 1, "summary": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+Tests for stored final ESPN snapshots and regrading from them.
+
+Tests cover:
+- Compact snapshot round trip (status, scores, winner, every player stat)
+- Polling storing the final snapshot once a game goes final
+- A snapshot that fails to insert not rolling back the game's final values
+- Regrading a game and a league from the stored snapshot without calling ESPN,
+  with only point differences applied after a stat correction
+"""
+
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from app import db
+from app.models.espnFinalSnapshot import EspnFinalSnapshot
+from app.models.gameModel import Game
+from app.models.leagueModel import League
+from app.models.playerModel import Player
+from app.models.pointAward import PointAward
+from app.models.propAnswers.overUnderAnswer import OverUnderAnswer
+from app.models.propAnswers.winnerLoserAnswer import WinnerLoserAnswer
+from app.models.props.overUnderProp import OverUnderProp
+from app.models.props.winnerLoserProp import WinnerLoserProp
+from app.repositories.espnFinalSnapshotRepository import get_final_snapshot, save_final_snapshot
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+from app.services.game.snapshotRegradeService import SnapshotRegradeService
+from app.utils.espnStubServer import ScriptedGame, TEAMS
+from tests.sqlite_app import SQLiteAppTestCase
+
+
+def final_summary(event_id="401"):
+    """A final ESPN summary payload: BAL beats KC, BAL RB finishes with 92 rushing yards."""
+    game = ScriptedGame(event_id, TEAMS[0], TEAMS[1], duration_seconds=100, halftime_seconds=0, start_delay=0)
+    return game.summary(1000)
+
+
+class TestCompactSnapshot(unittest.TestCase):
+    """Test cases for ESPNGameSnapshot.to_compact / from_compact."""
+
+    def test_round_trip(self):
+        """Test that a restored snapshot answers every lookup like the original."""
+        original = ESPNGameSnapshot("401", final_summary())
+
+        restored = ESPNGameSnapshot.from_compact("401", original.to_compact())
+
+        self.assertEqual(restored.status, "STATUS_FINAL")
+        self.assertTrue(restored.is_completed)
+        self.assertEqual(restored.scores, original.scores)
+        self.assertEqual(restored.team_names, original.team_names)
+        self.assertEqual(restored.winning_team_id, "BAL")
+        for name in ("BAL QB", "BAL RB", "KC WR"):
+            for stat_type in ("passing_yards", "rushing_yards", "receiving_yards", "receiving_tds",
+                              "scrimmage_yards", "total_points"):
+                self.assertEqual(restored.get_player_stat(name, stat_type),
+                                 original.get_player_stat(name, stat_type), (name, stat_type))
+        self.assertEqual(restored.box_score.find_athlete(athlete_id="33RB401")["name"], "BAL RB")
+
+    def test_payload_is_smaller_than_summary(self):
+        """Test that the compressed payload is a fraction of the raw JSON."""
+        game_data = final_summary()
+        payload = ESPNGameSnapshot("401", game_data).to_compact()
+
+        self.assertLess(len(payload), len(json.dumps(game_data)) / 3)
+
+    def test_score_only_snapshot(self):
+        """Test that scoreboard snapshots round-trip without a box score."""
+        board = ESPNGameSnapshot("401", {"header": final_summary()["header"]}, has_box_score=False)
+
+        restored = ESPNGameSnapshot.from_compact("401", board.to_compact())
+
+        self.assertFalse(restored.has_box_score)
+        self.assertIsNone(restored.get_player_stat("BAL RB", "rushing_yards"))
+        self.assertEqual(restored.get_player_stat(None, "total_points"), sum(board.scores.values()))
+
+    def test_corrupt_payload(self):
+        """Test that unreadable payloads raise ValueError."""
+        with self.assertRaises(ValueError):
+            ESPNGameSnapshot.from_compact("401", b"not zlib")
+
+
+class TestSnapshotRegrade(SQLiteAppTestCase):
+    """Test cases for storing final snapshots and regrading from them, on SQLite."""
+
+    def setUp(self):
+        """Create a league with one final game, two players and their answers."""
+        super().setUp()
+        PollingService._fingerprints.clear()
+
+        league = League(league_name="Sunday", join_code="abc")
+        db.session.add(league)
+        db.session.flush()
+        self.over, self.under = Player(name="Over", league_id=league.id, points=0), \
+            Player(name="Under", league_id=league.id, points=0)
+        game = Game(league_id=league.id, game_name="BAL vs KC", start_time=datetime(2026, 1, 11),
+                    prop_limit=2, graded=0, external_game_id="401")
+        db.session.add_all([self.over, self.under, game])
+        db.session.flush()
+        self.prop = OverUnderProp(game_id=game.id, question="BAL RB rushing yards?", player_name="BAL RB",
+                                  stat_type="rushing_yards", line_value=90.5, over_points=2, under_points=3,
+                                  is_mandatory=True)
+        winner = WinnerLoserProp(game_id=game.id, question="Who wins?", favorite_team="Baltimore Ravens",
+                                 underdog_team="Kansas City Chiefs", favorite_points=1, underdog_points=1,
+                                 team_a_name="Baltimore Ravens", team_b_name="Kansas City Chiefs")
+        db.session.add_all([self.prop, winner])
+        db.session.flush()
+        db.session.add_all([
+            OverUnderAnswer(prop_id=self.prop.id, player_id=self.over.id, answer="over"),
+            OverUnderAnswer(prop_id=self.prop.id, player_id=self.under.id, answer="under"),
+            WinnerLoserAnswer(prop_id=winner.id, player_id=self.over.id, answer="Baltimore Ravens"),
+        ])
+        db.session.commit()
+        self.game_id = game.id
+
+    def points(self):
+        db.session.expire_all()
+        return float(db.session.get(Player, self.over.id).points), float(db.session.get(Player, self.under.id).points)
+
+    def correct_stored_stat(self, value):
+        """Simulate a stat correction by rewriting BAL RB's rushing yards in the stored snapshot."""
+        row = get_final_snapshot("401")
+        snapshot = ESPNGameSnapshot.from_compact("401", row.payload)
+        snapshot.box_score.find_athlete("BAL RB")["stats"][("rushing", "rushingYards")] = float(value)
+        save_final_snapshot("401", snapshot.status, True, ESPNGameSnapshot.COMPACT_FORMAT_VERSION,
+                            snapshot.to_compact())
+        db.session.commit()
+
+    def test_poll_stores_snapshot_and_regrade_applies_correction(self):
+        """Test the full path: final poll, stored snapshot, corrected stat, refetch-free regrade."""
+        game = db.session.get(Game, self.game_id)
+        PollingService.poll_game(game, ESPNGameSnapshot("401", final_summary()))
+
+        row = get_final_snapshot("401")
+        self.assertTrue(row.has_box_score)
+        self.assertEqual(row.status, "STATUS_FINAL")
+        self.assertEqual(db.session.get(OverUnderProp, self.prop.id).correct_answer, "over")
+        self.assertEqual(self.points(), (3.0, 0.0))
+
+        self.correct_stored_stat(88)
+        with patch('app.services.espnClientService.ESPNClientService.get_game_data') as mock_get_game_data:
+            result = SnapshotRegradeService.regrade_game(self.game_id)
+            mock_get_game_data.assert_not_called()
+
+        self.assertEqual(result, {"success": True, "game_id": self.game_id})
+        prop = db.session.get(OverUnderProp, self.prop.id)
+        self.assertEqual(float(prop.current_value), 88)
+        self.assertEqual(prop.correct_answer, "under")
+        self.assertEqual(self.points(), (1.0, 3.0))
+
+        # Regrading again with no change applies nothing
+        SnapshotRegradeService.regrade_game(self.game_id)
+        self.assertEqual(self.points(), (1.0, 3.0))
+
+    def test_regrade_of_game_nobody_scored_in_applies_points(self):
+        """Test that a graded game with no awards is still regraded through the ledger, not backfilled."""
+        OverUnderAnswer.query.filter_by(player_id=self.over.id).delete()
+        WinnerLoserAnswer.query.delete()
+        db.session.commit()
+        game = db.session.get(Game, self.game_id)
+        PollingService.poll_game(game, ESPNGameSnapshot("401", final_summary()))
+
+        game = db.session.get(Game, self.game_id)
+        self.assertTrue(game.graded)
+        self.assertTrue(game.points_ledgered)
+        self.assertEqual(PointAward.query.count(), 0)
+        self.assertEqual(self.points(), (0.0, 0.0))
+
+        self.correct_stored_stat(88)
+        SnapshotRegradeService.regrade_game(self.game_id)
+
+        self.assertEqual(self.points(), (0.0, 3.0))
+
+    def test_score_only_final_does_not_replace_box_score(self):
+        """Test that a scoreboard-only final snapshot can't overwrite stored player stats."""
+        PollingService._stage_final_snapshot(ESPNGameSnapshot("401", final_summary()))
+        db.session.commit()
+        board = ESPNGameSnapshot("401", {"header": final_summary()["header"]}, has_box_score=False)
+        PollingService._stage_final_snapshot(board)
+        db.session.commit()
+
+        self.assertTrue(get_final_snapshot("401").has_box_score)
+        self.assertEqual(EspnFinalSnapshot.query.count(), 1)
+
+    def test_snapshot_conflict_keeps_game_changes(self):
+        """Test that a duplicate snapshot row (another process stored it first) doesn't undo the poll."""
+        PollingService._stage_final_snapshot(ESPNGameSnapshot("401", final_summary()))
+        db.session.commit()
+        game = db.session.get(Game, self.game_id)
+
+        # Not seeing the committed row makes the save insert a second one for the event
+        with patch('app.repositories.espnFinalSnapshotRepository.get_final_snapshot', return_value=None):
+            PollingService.poll_game(game, ESPNGameSnapshot("401", final_summary()))
+
+        db.session.expire_all()
+        self.assertEqual(EspnFinalSnapshot.query.count(), 1)
+        self.assertEqual(float(db.session.get(OverUnderProp, self.prop.id).current_value), 92)
+        self.assertTrue(db.session.get(Game, self.game_id).is_completed)
+        self.assertEqual(self.points(), (3.0, 0.0))
+
+    def test_regrade_league_reports_games_without_snapshot(self):
+        """Test that league regrades cover completed games and skip those without a snapshot."""
+        game = db.session.get(Game, self.game_id)
+        game.is_completed = True
+        db.session.commit()
+
+        skipped = SnapshotRegradeService.regrade_league("Sunday")
+        self.assertEqual(skipped, {"regraded": [], "skipped": {self.game_id: "No stored final snapshot for this game"}})
+
+        PollingService._stage_final_snapshot(ESPNGameSnapshot("401", final_summary()))
+        db.session.commit()
+        result = SnapshotRegradeService.regrade_league("Sunday")
+
+        self.assertEqual(result, {"regraded": [self.game_id], "skipped": {}})
+        self.assertEqual(self.points(), (3.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the eager-loaded game graph loader in gameRepository.
+
+Runs against an in-memory SQLite database and counts the SELECT statements
+needed to load games and walk every prop and option.
+"""
+
+import unittest
+from datetime import datetime
+from sqlalchemy import event
+from app import db
+from app.models.gameModel import Game
+from app.models.props.winnerLoserProp import WinnerLoserProp
+from app.models.props.overUnderProp import OverUnderProp
+from app.models.props.variableOptionProp import VariableOptionProp
+from app.models.props.hashMapAnswers import HashMapAnswers
+from app.models.props.anytimeTdProp import AnytimeTdProp
+from app.models.props.anytimeTdOption import AnytimeTdOption
+from app.repositories.gameRepository import get_games_with_props, get_game_with_props
+from tests.sqlite_app import create_sqlite_app
+
+
+class TestGamePropGraphLoader(unittest.TestCase):
+    """Test cases for loading games with their full prop graph."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create an app on an in-memory SQLite database with the game tables."""
+        cls.app = create_sqlite_app()
+        cls.app_context = cls.app.app_context()
+        cls.app_context.push()
+        cls.tables = [model.__table__ for model in (
+            Game, WinnerLoserProp, OverUnderProp, VariableOptionProp,
+            HashMapAnswers, AnytimeTdProp, AnytimeTdOption)]
+        db.metadata.create_all(db.engine, tables=cls.tables)
+
+        cls.game_ids = []
+        for index in range(4):
+            game = Game(game_name=f"Game {index}", start_time=datetime(2026, 1, 11), prop_limit=2, graded=0)
+            db.session.add(game)
+            db.session.flush()
+            db.session.add(WinnerLoserProp(game_id=game.id, question="Who wins?"))
+            db.session.add(OverUnderProp(game_id=game.id, question="Yards?", player_name="Derrick Henry"))
+            variable_prop = VariableOptionProp(game_id=game.id, question="Pick one")
+            td_prop = AnytimeTdProp(game_id=game.id, question="Who scores?")
+            db.session.add_all([variable_prop, td_prop])
+            db.session.flush()
+            db.session.add(HashMapAnswers(prop_id=variable_prop.id, answer_choice="A", answer_points=1))
+            db.session.add(AnytimeTdOption(anytime_td_prop_id=td_prop.id, player_name="Travis Kelce", td_line=0.5, points=1))
+            cls.game_ids.append(game.id)
+        db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Drop the tables and leave the app context."""
+        db.session.remove()
+        db.metadata.drop_all(db.engine, tables=cls.tables)
+        cls.app_context.pop()
+
+    def count_selects(self, load):
+        """Load and walk a game graph, returning the games and the number of SELECTs issued."""
+        db.session.expunge_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            games = load()
+            for game in games:
+                for prop in game.winner_loser_props + game.over_under_props:
+                    prop.question
+                for prop in game.variable_option_props + game.anytime_td_props:
+                    [option.id for option in prop.options]
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        return games, len(statements)
+
+    def test_query_count_does_not_grow_with_games(self):
+        """Test that one game and many games take the same number of queries."""
+        one, one_count = self.count_selects(lambda: get_games_with_props(self.game_ids[:1]))
+        many, many_count = self.count_selects(lambda: get_games_with_props(self.game_ids))
+
+        self.assertEqual(len(one), 1)
+        self.assertEqual(len(many), 4)
+        self.assertEqual(one_count, many_count)
+        self.assertEqual(many_count, 7)  # games + 4 prop types + 2 option tables
+
+    def test_lazy_loading_grows_with_games(self):
+        """Test the baseline: plain queries lazy-load per game and per prop."""
+        _, lazy_count = self.count_selects(lambda: Game.query.filter(Game.id.in_(self.game_ids)).all())
+
+        self.assertGreater(lazy_count, 7)
+
+    def test_single_game_loader(self):
+        """Test that the single-game loader returns the game with props loaded."""
+        game = get_game_with_props(self.game_ids[0])
+
+        self.assertEqual(game.id, self.game_ids[0])
+        self.assertIn("options", game.anytime_td_props[0].__dict__)
+        self.assertIsNone(get_game_with_props(-1))
+        self.assertEqual(get_games_with_props([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
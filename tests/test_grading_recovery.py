@@ -0,0 +1,109 @@
+"""
+Tests for recovering grading lost with the in-memory grading queue.
+
+Tests cover:
+- Finding completed games that were never graded, on SQLite
+- A new leader re-queueing them when it takes over
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from app import db
+from app.models.gameModel import Game
+from app.models.leagueModel import League
+from app.services.game.pollingService import PollingService
+from app.services.game.schedulerService import SchedulerService
+from tests.sqlite_app import SQLiteAppTestCase
+
+
+class TestRequeueUngradedGames(SQLiteAppTestCase):
+    """Test cases for re-queueing completed, ungraded games."""
+
+    def setUp(self):
+        super().setUp()
+
+        league = League(league_name="Sunday", join_code="abc")
+        db.session.add(league)
+        db.session.flush()
+        self.league_id = league.id
+
+    def add_game(self, is_completed, graded, external_game_id="401"):
+        game = Game(league_id=self.league_id, game_name="BAL vs KC", start_time=datetime(2026, 1, 11),
+                    prop_limit=2, graded=graded, is_completed=is_completed, external_game_id=external_game_id)
+        db.session.add(game)
+        db.session.commit()
+        return game.id
+
+    @patch('app.services.game.pollingService.PollingService.submit_grading')
+    def test_completed_ungraded_games_are_requeued(self, mock_submit):
+        """Test that only final games the lost queue never graded are submitted again."""
+        lost = self.add_game(is_completed=True, graded=0)
+        lost_unset = self.add_game(is_completed=True, graded=None)
+        self.add_game(is_completed=True, graded=1)
+        self.add_game(is_completed=False, graded=0)
+        self.add_game(is_completed=True, graded=0, external_game_id=None)
+
+        self.assertEqual(PollingService.requeue_ungraded_games(), [lost, lost_unset])
+        mock_submit.assert_called_once_with([lost, lost_unset])
+
+    @patch('app.services.game.pollingService.PollingService.submit_grading')
+    def test_nothing_to_recover(self, mock_submit):
+        """Test that no grading is submitted when every final game is graded."""
+        self.add_game(is_completed=True, graded=1)
+
+        self.assertEqual(PollingService.requeue_ungraded_games(), [])
+        mock_submit.assert_not_called()
+
+
+class TestLeaderGradingRecovery(unittest.TestCase):
+    """Test cases for the scheduler re-queueing grading on leader takeover."""
+
+    def setUp(self):
+        self.scheduler = MagicMock()
+        patches = [
+            patch.object(SchedulerService, 'scheduler', self.scheduler),
+            patch.object(SchedulerService, 'app', MagicMock()),
+            patch('app.services.game.schedulerService.SchedulerService.schedule_next_poll'),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_new_leader_schedules_recovery(self, mock_leader):
+        """Test that taking over the lock runs the grading recovery job."""
+        mock_leader.is_leader.return_value = False
+        mock_leader.try_acquire.return_value = True
+
+        SchedulerService._check_leadership()
+
+        job_ids = [call.kwargs["id"] for call in self.scheduler.add_job.call_args_list]
+        self.assertEqual(job_ids, [SchedulerService.GRADING_RECOVERY_JOB_ID])
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_continuing_leader_does_not_recover(self, mock_leader):
+        """Test that a leader confirming its lock doesn't re-queue grading every check."""
+        mock_leader.is_leader.return_value = True
+        mock_leader.try_acquire.return_value = True
+        mock_leader.pop_schedule_changed.return_value = False
+
+        SchedulerService._check_leadership()
+
+        self.scheduler.add_job.assert_not_called()
+
+    @patch('app.services.game.schedulerService.PollingService.requeue_ungraded_games')
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_recovery_job_requeues_as_leader(self, mock_leader, mock_requeue):
+        """Test that the recovery job re-queues games only while this process leads."""
+        mock_leader.is_leader.return_value = False
+        SchedulerService._run_grading_recovery_job()
+        mock_requeue.assert_not_called()
+
+        mock_leader.is_leader.return_value = True
+        SchedulerService._run_grading_recovery_job()
+        mock_requeue.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for looking up Over/Under player stats by ESPN athlete id.
+
+Tests cover:
+- Props with a player_id read that athlete's stats, even when display names collide
+- Props with only a name having their athlete id backfilled by polling
+- A fuzzy name match being read but never stored as the prop's athlete id
+- A stored id that isn't in the box score not falling back to the name
+"""
+
+import unittest
+from collections import defaultdict
+from unittest.mock import MagicMock
+from app.models.gameModel import Game
+from app.models.props.overUnderProp import OverUnderProp
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+
+
+def make_game_data():
+    """Two athletes named Josh Allen: Buffalo's QB (rushing 40) and Jacksonville's LB (no rushing line)."""
+    return {
+        "header": {"competitions": [{
+            "competitors": [{"team": {"abbreviation": "BUF"}, "score": "10"},
+                            {"team": {"abbreviation": "JAX"}, "score": "7"}],
+            "status": {"period": 2, "clock": 100.0, "type": {"name": "STATUS_IN_PROGRESS"}}
+        }]},
+        "boxscore": {"players": [
+            {"team": {"abbreviation": "BUF"}, "statistics": [
+                {"name": "rushing", "keys": ["rushingYards", "rushingTouchdowns"],
+                 "athletes": [{"athlete": {"id": "3918298", "displayName": "Josh Allen"}, "stats": ["40", "1"]}]}
+            ]},
+            {"team": {"abbreviation": "JAX"}, "statistics": [
+                {"name": "defensive", "keys": ["totalTackles", "sacks"],
+                 "athletes": [{"athlete": {"id": "4036414", "displayName": "Josh Allen"}, "stats": ["5", "2"]}]},
+                {"name": "rushing", "keys": ["rushingYards", "rushingTouchdowns"],
+                 "athletes": [{"athlete": {"id": "4036414", "displayName": "Josh Allen"}, "stats": ["3", "0"]}]}
+            ]}
+        ]}
+    }
+
+
+class TestPlayerIdLookup(unittest.TestCase):
+    """Test cases for athlete id keyed stat lookups in polling."""
+
+    def setUp(self):
+        PollingService._fingerprints.clear()
+        self.addCleanup(PollingService._fingerprints.clear)
+        self.snapshot = ESPNGameSnapshot("401", make_game_data())
+
+    def make_game(self, *props):
+        game = MagicMock(id=1, external_game_id="401", is_completed=False, team_a_score=None, team_b_score=None)
+        game.__class__ = Game
+        game.over_under_props = list(props)
+        game.winner_loser_props = []
+        game.anytime_td_props = []
+        return game
+
+    def make_prop(self, prop_id, player_id):
+        return OverUnderProp(id=prop_id, player_name="Josh Allen", player_id=player_id,
+                             stat_type="rushing_yards", current_value=None)
+
+    def collect(self, game):
+        changes = defaultdict(dict)
+        PollingService._collect_game_changes(game, self.snapshot, changes, {})
+        return {row_id: values for row_id, (_, values) in changes[OverUnderProp].items()}
+
+    def test_same_name_players_kept_apart_by_id(self):
+        """Test that each prop reads its own athlete's stat when display names collide."""
+        quarterback = self.make_prop(1, "3918298")
+        linebacker = self.make_prop(2, "4036414")
+
+        staged = self.collect(self.make_game(quarterback, linebacker))
+
+        self.assertEqual(staged, {1: {"current_value": 40.0}, 2: {"current_value": 3.0}})
+        self.assertEqual(self.snapshot.get_player_stat("Josh Allen", "rushing_yards", athlete_id="4036414"), 3.0)
+
+    def test_name_only_prop_gets_id_backfilled(self):
+        """Test that a prop matched by name stores the athlete id and is looked up by id after that."""
+        prop = self.make_prop(1, None)
+
+        staged = self.collect(self.make_game(prop))
+
+        self.assertEqual(prop.player_id, "3918298")
+        self.assertEqual(staged, {1: {"current_value": 40.0, "player_id": "3918298"}})
+        self.assertEqual(PollingService._stat_request(prop), (None, "rushing_yards", "3918298"))
+
+    def test_unknown_id_does_not_fall_back_to_name(self):
+        """Test that an athlete id missing from the box score gives no value, not a same-named player's."""
+        prop = self.make_prop(1, "999")
+
+        staged = self.collect(self.make_game(prop))
+
+        self.assertEqual(staged, {})
+        self.assertEqual(prop.player_id, "999")
+
+    def test_score_only_snapshot_binds_nothing(self):
+        """Test that scoreboard snapshots leave unbound props alone."""
+        prop = self.make_prop(1, None)
+        board = ESPNGameSnapshot("401", {"header": make_game_data()["header"]}, has_box_score=False)
+
+        PollingService._collect_game_changes(self.make_game(prop), board, defaultdict(dict), {})
+
+        self.assertIsNone(prop.player_id)
+
+    def test_fuzzy_match_is_not_bound(self):
+        """Test that a misspelled name matched fuzzily in a final game gets its value but not an athlete id."""
+        game_data = make_game_data()
+        game_data["header"]["competitions"][0]["status"]["type"]["name"] = "STATUS_FINAL"
+        del game_data["boxscore"]["players"][1]
+        self.snapshot = ESPNGameSnapshot("401", game_data)
+        prop = OverUnderProp(id=1, player_name="Josh Alen", player_id=None,
+                             stat_type="rushing_yards", current_value=None)
+
+        staged = self.collect(self.make_game(prop))
+
+        self.assertEqual(staged, {1: {"current_value": 40.0}})
+        self.assertIsNone(prop.player_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+Unit tests for adaptive poll cadence.
+
+Tests cover:
+- Poll intervals chosen from ESPN game state
+- Game.next_poll_at being set after a poll and on fetch failure
+- Scheduler wake time clamped between the min and max sleep
+- Sleeping until the next kickoff and re-arming when games change
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from app.models.gameModel import Game
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+from app.services.game.schedulerService import SchedulerService
+
+
+def make_game_data(status="STATUS_IN_PROGRESS", period=1, clock=900.0, red_zone=False):
+    """Build a minimal ESPN summary payload in the given state."""
+    return {
+        "header": {
+            "competitions": [{
+                "competitors": [
+                    {"team": {"abbreviation": "BAL"}, "score": "7"},
+                    {"team": {"abbreviation": "KC"}, "score": "3"}
+                ],
+                "status": {
+                    "clock": clock,
+                    "period": period,
+                    "type": {"name": status, "completed": status == "STATUS_FINAL"}
+                }
+            }]
+        },
+        "situation": {"isRedZone": red_zone}
+    }
+
+
+def make_snapshot(**kwargs):
+    """Build a snapshot from make_game_data."""
+    return ESPNGameSnapshot("401772915", make_game_data(**kwargs))
+
+
+class TestPollInterval(unittest.TestCase):
+    """Test cases for choosing a game's poll interval."""
+
+    def test_live_play(self):
+        """Test that normal live play uses the live interval."""
+        self.assertEqual(PollingService.get_poll_interval(make_snapshot()), PollingService.LIVE_POLL_SECONDS)
+
+    def test_red_zone_two_minute_and_overtime_poll_fastest(self):
+        """Test that critical situations use the shortest interval."""
+        for snapshot in (make_snapshot(red_zone=True),
+                         make_snapshot(period=4, clock=95.0),
+                         make_snapshot(period=2, clock=120.0),
+                         make_snapshot(period=5, clock=600.0)):
+            self.assertEqual(PollingService.get_poll_interval(snapshot), PollingService.CRITICAL_POLL_SECONDS)
+
+    def test_two_minutes_left_in_first_quarter_is_not_critical(self):
+        """Test that only the 2nd and 4th quarters count as two-minute situations."""
+        snapshot = make_snapshot(period=1, clock=60.0)
+        self.assertEqual(PollingService.get_poll_interval(snapshot), PollingService.LIVE_POLL_SECONDS)
+
+    def test_halftime_and_pregame_poll_slowly(self):
+        """Test that halftime and not-yet-started games back off."""
+        self.assertEqual(PollingService.get_poll_interval(make_snapshot(status="STATUS_HALFTIME", period=2, clock=0)),
+                         PollingService.HALFTIME_POLL_SECONDS)
+        self.assertEqual(PollingService.get_poll_interval(make_snapshot(status="STATUS_SCHEDULED", period=0)),
+                         PollingService.PREGAME_POLL_SECONDS)
+
+    def test_final_suspends_polling(self):
+        """Test that final games get no next poll."""
+        self.assertIsNone(PollingService.get_poll_interval(make_snapshot(status="STATUS_FINAL", period=4, clock=0)))
+
+
+class TestNextPollAt(unittest.TestCase):
+    """Test cases for setting Game.next_poll_at during polling."""
+
+    def make_game(self):
+        game = MagicMock()
+        game.__class__ = Game
+        game.external_game_id = "401772915"
+        game.is_completed = False
+        game.winner_loser_props = []
+        game.over_under_props = []
+        game.anytime_td_props = []
+        return game
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.db')
+    def test_poll_sets_next_poll_at_from_state(self, mock_db, mock_set_value):
+        """Test that a red zone poll schedules the next poll soon."""
+        game = self.make_game()
+        before = datetime.now(timezone.utc)
+
+        PollingService.poll_game(game, make_snapshot(red_zone=True))
+
+        delay = (game.next_poll_at - before).total_seconds()
+        self.assertAlmostEqual(delay, PollingService.CRITICAL_POLL_SECONDS, delta=2)
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.get_game_with_props')
+    @patch('app.services.game.pollingService.GradeGameService')
+    @patch('app.services.game.pollingService.db')
+    def test_final_game_clears_next_poll_at(self, mock_db, mock_grade, mock_get_game, mock_set_value):
+        """Test that a final game has no next poll."""
+        game = self.make_game()
+        mock_get_game.return_value = game
+
+        PollingService.poll_game(game, make_snapshot(status="STATUS_FINAL", period=4, clock=0))
+
+        self.assertIsNone(game.next_poll_at)
+        self.assertTrue(game.is_completed)
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.db')
+    @patch('app.services.game.pollingService.PollingService.fetch_cycle_snapshots')
+    @patch('app.services.game.pollingService.PollingService.get_games_to_poll')
+    def test_failed_fetch_schedules_retry(self, mock_get_games, mock_fetch, mock_db, mock_set_value):
+        """Test that games whose event failed to fetch are retried later, not immediately."""
+        game = self.make_game()
+        mock_get_games.return_value = [game]
+        mock_fetch.return_value = ({"401772915": None}, 2)
+        before = datetime.now(timezone.utc)
+
+        result = PollingService.poll_all_active_games()
+
+        self.assertEqual(result["games_failed"], 1)
+        delay = (game.next_poll_at - before).total_seconds()
+        self.assertAlmostEqual(delay, PollingService.RETRY_POLL_SECONDS, delta=2)
+        mock_db.session.commit.assert_called()
+
+
+class TestSchedulerWakeTime(unittest.TestCase):
+    """Test cases for choosing when the polling job runs next."""
+
+    def setUp(self):
+        self.original_app = SchedulerService.app
+        SchedulerService.app = MagicMock()
+        self.addCleanup(setattr, SchedulerService, 'app', self.original_app)
+
+    @patch('app.services.game.schedulerService.PollingService.get_next_kickoff_time', return_value=None)
+    @patch('app.services.game.schedulerService.PollingService.get_next_poll_time')
+    def test_wakes_for_earliest_due_game(self, mock_next, mock_kickoff):
+        """Test that the scheduler sleeps until the earliest next_poll_at."""
+        due = datetime.now(timezone.utc) + timedelta(seconds=45)
+        mock_next.return_value = due
+
+        self.assertEqual(SchedulerService.get_next_wake_time(), due)
+
+    @patch('app.services.game.schedulerService.PollingService.get_next_kickoff_time', return_value=None)
+    @patch('app.services.game.schedulerService.PollingService.get_next_poll_time')
+    def test_wake_time_is_clamped(self, mock_next, mock_kickoff):
+        """Test that overdue games wait the minimum and idle periods the maximum sleep."""
+        now = datetime.now(timezone.utc)
+
+        mock_next.return_value = now - timedelta(minutes=5)
+        soonest = (SchedulerService.get_next_wake_time() - now).total_seconds()
+        self.assertAlmostEqual(soonest, SchedulerService.MIN_SLEEP_SECONDS, delta=1)
+
+        mock_next.return_value = None
+        idle = (SchedulerService.get_next_wake_time() - now).total_seconds()
+        self.assertAlmostEqual(idle, SchedulerService.MAX_IDLE_SLEEP_SECONDS, delta=1)
+
+    @patch('app.services.game.schedulerService.PollingService.get_next_kickoff_time')
+    @patch('app.services.game.schedulerService.PollingService.get_next_poll_time')
+    def test_sleeps_until_next_kickoff(self, mock_next, mock_kickoff):
+        """Test that with no game in progress the scheduler sleeps until the next kickoff."""
+        kickoff = datetime.now(timezone.utc) + timedelta(hours=3)
+        mock_next.return_value = None
+        mock_kickoff.return_value = kickoff
+
+        self.assertEqual(SchedulerService.get_next_wake_time(), kickoff)
+
+        # A game already in progress still wins over a later kickoff
+        due = datetime.now(timezone.utc) + timedelta(seconds=30)
+        mock_next.return_value = due
+        self.assertEqual(SchedulerService.get_next_wake_time(), due)
+
+
+class TestSchedulerRearm(unittest.TestCase):
+    """Test cases for re-arming the scheduler when games change."""
+
+    @patch('app.services.game.gameService.SchedulerService.schedule_next_poll')
+    @patch('app.services.game.gameService.db')
+    @patch('app.services.game.gameService.get_game_by_id')
+    def test_update_start_time_rearms_scheduler(self, mock_get_game, mock_db, mock_schedule):
+        """Test that moving a kickoff resets next_poll_at and re-arms the scheduler."""
+        from app.services.game.gameService import GameService
+        game = MagicMock(next_poll_at=datetime.now(timezone.utc))
+        mock_get_game.return_value = game
+
+        GameService.update_game({"game_id": 1, "start_time": "2026-01-11T18:00:00Z"})
+
+        self.assertIsNone(game.next_poll_at)
+        mock_schedule.assert_called_once()
+
+    @patch('app.services.game.gameService.SchedulerService.schedule_next_poll')
+    @patch('app.services.game.gameService.db')
+    @patch('app.services.game.gameService.get_game_by_id')
+    def test_rename_does_not_rearm_scheduler(self, mock_get_game, mock_db, mock_schedule):
+        """Test that edits unrelated to polling leave the scheduler alone."""
+        from app.services.game.gameService import GameService
+        mock_get_game.return_value = MagicMock()
+
+        GameService.update_game({"game_id": 1, "game_name": "Ravens vs Chiefs"})
+
+        mock_schedule.assert_not_called()
+
+    @patch('app.services.game.schedulerService.LeaderElectionService.notify_schedule_changed')
+    def test_schedule_next_poll_without_scheduler(self, mock_notify):
+        """Test that processes that don't run the scheduler notify the leader instead of re-arming."""
+        with patch.object(SchedulerService, 'scheduler', None):
+            self.assertIsNone(SchedulerService.schedule_next_poll())
+        mock_notify.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
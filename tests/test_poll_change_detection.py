@@ -0,0 +1,170 @@
+"""
+Unit tests for change detection in PollingService.
+
+Tests cover:
+- Unchanged games only staging their next_poll_at
+- Only props whose live values differ being written
+- Fingerprints only being recorded once a poll's changes are committed
+- One batched UPDATE per table for a polling cycle
+"""
+
+import unittest
+from collections import defaultdict
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from app.models.gameModel import Game
+from app.models.props.overUnderProp import OverUnderProp
+from app.models.props.winnerLoserProp import WinnerLoserProp
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+
+
+def make_game_data(bal_score=7, kc_score=3, rushing_yards="45"):
+    """Build a minimal in-progress ESPN summary payload."""
+    return {
+        "header": {
+            "competitions": [{
+                "competitors": [
+                    {"team": {"abbreviation": "BAL"}, "score": str(bal_score)},
+                    {"team": {"abbreviation": "KC"}, "score": str(kc_score)}
+                ],
+                "status": {"clock": 600.0, "period": 1, "type": {"name": "STATUS_IN_PROGRESS"}}
+            }]
+        },
+        "boxscore": {
+            "players": [{
+                "team": {"abbreviation": "BAL"},
+                "statistics": [{
+                    "name": "rushing",
+                    "keys": ["rushingYards"],
+                    "athletes": [{"athlete": {"id": "3043078", "displayName": "Derrick Henry"},
+                                  "stats": [rushing_yards]}]
+                }]
+            }]
+        }
+    }
+
+
+def make_model_mock(model, **attrs):
+    """Build a mock that PollingService treats as an instance of model."""
+    obj = MagicMock(**attrs)
+    obj.__class__ = model
+    return obj
+
+
+class TestChangeDetection(unittest.TestCase):
+    """Test cases for skipping unchanged live values."""
+
+    def setUp(self):
+        """Build a game with one O/U prop and one W/L prop, already at the live values."""
+        PollingService._fingerprints.clear()
+        self.addCleanup(PollingService._fingerprints.clear)
+
+        self.ou_prop = make_model_mock(OverUnderProp, id=20, player_name="Derrick Henry", player_id="3043078",
+                                       stat_type="rushing_yards", current_value=Decimal("45"))
+        self.wl_prop = make_model_mock(WinnerLoserProp, id=10, team_a_id="BAL", team_b_id="KC",
+                                       team_a_name=None, team_b_name=None,
+                                       team_a_score=7, team_b_score=3, winning_team_id=None)
+        self.game = make_model_mock(Game, id=1, external_game_id="401772915", is_completed=False,
+                                    team_a_score=7, team_b_score=3)
+        self.game.over_under_props = [self.ou_prop]
+        self.game.winner_loser_props = [self.wl_prop]
+        self.game.anytime_td_props = []
+
+    def collect(self, game_data):
+        """Collect a poll's changes and record its fingerprint as if they were committed."""
+        changes = defaultdict(dict)
+        fingerprints = {}
+        changed = PollingService._collect_game_changes(
+            self.game, ESPNGameSnapshot("401772915", game_data), changes, fingerprints)
+        PollingService._fingerprints.update(fingerprints)
+        return changed, changes
+
+    def test_stored_values_that_match_are_not_written(self):
+        """Test that Decimal and float values that are equal don't produce prop writes."""
+        changed, changes = self.collect(make_game_data())
+
+        self.assertTrue(changed)  # first poll has no fingerprint yet
+        self.assertEqual(set(changes.keys()), {Game})
+
+    def test_unchanged_fingerprint_skips_props(self):
+        """Test that a repeat poll with the same live values only reschedules the game."""
+        self.collect(make_game_data())
+        self.ou_prop.current_value = Decimal("0")  # would be written if props were compared
+
+        changed, changes = self.collect(make_game_data())
+
+        self.assertFalse(changed)
+        self.assertEqual(set(changes.keys()), {Game})
+        self.assertIn("next_poll_at", changes[Game][1][1])
+
+    def test_only_changed_props_are_written(self):
+        """Test that a stat change writes that prop and leaves the scores alone."""
+        self.collect(make_game_data())
+
+        changed, changes = self.collect(make_game_data(rushing_yards="52"))
+
+        self.assertTrue(changed)
+        self.assertEqual(set(changes.keys()), {Game, OverUnderProp})
+        self.assertEqual(changes[OverUnderProp][20][1], {"current_value": 52.0})
+
+    def test_fingerprint_not_recorded_until_committed(self):
+        """Test that collecting changes only stages the new fingerprint."""
+        fingerprints = {}
+        PollingService._collect_game_changes(
+            self.game, ESPNGameSnapshot("401772915", make_game_data()), defaultdict(dict), fingerprints)
+
+        self.assertIn(1, fingerprints)
+        self.assertEqual(PollingService._fingerprints, {})
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.db')
+    def test_failed_commit_keeps_values_pending(self, mock_db, mock_set_value):
+        """Test that a poll whose commit fails is compared in full again on the next poll."""
+        mock_db.session.commit.side_effect = Exception("could not serialize access")
+
+        with self.assertRaises(Exception):
+            PollingService.poll_game(self.game, ESPNGameSnapshot("401772915", make_game_data(rushing_yards="52")))
+        self.assertNotIn(1, PollingService._fingerprints)
+
+        mock_db.session.commit.side_effect = None
+        PollingService.poll_game(self.game, ESPNGameSnapshot("401772915", make_game_data(rushing_yards="52")))
+        self.assertIn(1, PollingService._fingerprints)
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.db')
+    def test_forced_apply_compares_every_value(self, mock_db, mock_set_value):
+        """Test that applying a snapshot with force writes values a matching fingerprint would skip."""
+        snapshot = ESPNGameSnapshot("401772915", make_game_data())
+        PollingService.apply_snapshot(self.game, snapshot)
+        self.ou_prop.current_value = Decimal("0")
+
+        self.assertFalse(PollingService.apply_snapshot(self.game, snapshot))
+        self.assertEqual(self.ou_prop.current_value, Decimal("0"))
+
+        self.assertTrue(PollingService.apply_snapshot(self.game, snapshot, force=True))
+        self.assertEqual(self.ou_prop.current_value, 45)
+        self.assertEqual(mock_db.session.commit.call_count, 3)
+
+    @patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+    @patch('app.services.game.pollingService.db')
+    def test_one_update_per_table(self, mock_db, mock_set_value):
+        """Test that changes for many rows are written with one UPDATE per table."""
+        second_prop = make_model_mock(OverUnderProp, id=21, player_name="Derrick Henry", player_id="3043078",
+                                      stat_type="rushing_yards", current_value=None)
+        self.game.over_under_props = [self.ou_prop, second_prop]
+        _, changes = self.collect(make_game_data(bal_score=14, rushing_yards="60"))
+
+        PollingService._write_changes(changes)
+
+        tables = [call.args[0].table.name for call in mock_db.session.execute.call_args_list]
+        self.assertEqual(sorted(tables), ["game", "over_under_prop", "winner_loser_prop"])
+        ou_rows = next(call.args[1] for call in mock_db.session.execute.call_args_list
+                       if call.args[0].table.name == "over_under_prop")
+        self.assertEqual(sorted(row["id"] for row in ou_rows), [20, 21])
+        self.assertEqual(self.game.team_a_score, 14)
+        self.assertEqual(self.wl_prop.team_a_score, 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit tests for the staged polling pipeline.
+
+Tests cover:
+- Events being applied as they are parsed, while slower fetches are still running
+- Completed games being graded on the grading thread, not the polling thread
+- Grading falling back to the polling thread when the grading queue is full
+- Per-stage timings being recorded
+"""
+
+import queue
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from flask import Flask
+from app.models.gameModel import Game
+from app.models.props.overUnderProp import OverUnderProp
+from app.services.game.pollingService import PollingService
+from tests.test_scoreboard_triage import make_scoreboard
+from tests.test_poll_change_detection import make_game_data
+
+
+def make_game(game_id, external_game_id, player_props=False):
+    """Build a game for an ESPN event with a W/L prop and, optionally, a player-stat prop."""
+    game = MagicMock()
+    game.__class__ = Game
+    game.id = game_id
+    game.external_game_id = external_game_id
+    game.is_completed = False
+    game.winner_loser_props = []
+    game.over_under_props = []
+    if player_props:
+        prop = MagicMock(player_name="Derrick Henry", player_id=None, stat_type="rushing_yards", current_value=None)
+        prop.__class__ = OverUnderProp
+        game.over_under_props = [prop]
+    game.anytime_td_props = []
+    return game
+
+
+@patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+@patch('app.services.game.pollingService.db')
+@patch('app.services.game.pollingService.PollingService.get_games_to_poll')
+@patch('app.services.game.pollingService.ESPNClientService.get_scoreboard')
+@patch('app.services.game.pollingService.ESPNClientService.get_game_data')
+class TestPollPipeline(unittest.TestCase):
+    """Test cases for the fetch, parse, apply and grade stages."""
+
+    def setUp(self):
+        """Start each test with empty polling state."""
+        PollingService._fingerprints.clear()
+        PollingService._scoreboard_states.clear()
+        PollingService._stage_stats.clear()
+        self.addCleanup(PollingService._fingerprints.clear)
+        self.addCleanup(PollingService._scoreboard_states.clear)
+
+    def test_scoreboard_events_applied_while_summaries_load(self, mock_game_data, mock_scoreboard,
+                                                            mock_get_games, mock_db, mock_set_value):
+        """Test that a score-only event is applied before a slow summary finishes."""
+        score_game = make_game(1, "1")
+        stat_game = make_game(2, "2", player_props=True)
+        mock_get_games.return_value = [score_game, stat_game]
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_IN_PROGRESS", 300.0, 7),
+                                                        ("2", "STATUS_IN_PROGRESS", 300.0, 14)])
+        score_game_applied = threading.Event()
+        summary_waits = []
+        collect_game_changes = PollingService._collect_game_changes
+
+        def slow_summary(external_game_id):
+            # Only returns early if game 1 is applied while this fetch is in flight
+            summary_waits.append(score_game_applied.wait(2))
+            return make_game_data()
+
+        def watch_score_game(game, snapshot, changes, fingerprints):
+            if game is score_game:
+                score_game_applied.set()
+            return collect_game_changes(game, snapshot, changes, fingerprints)
+
+        mock_game_data.side_effect = slow_summary
+
+        with patch.object(PollingService, '_collect_game_changes', side_effect=watch_score_game):
+            result = PollingService.poll_all_active_games()
+
+        self.assertEqual(summary_waits, [True])
+        self.assertEqual(result["games_polled"], 2)
+        self.assertEqual(score_game.team_a_score, 7)
+        self.assertEqual(stat_game.over_under_props[0].current_value, 45)
+        self.assertEqual(result["espn_fetches"], 2)
+
+    @patch('app.services.game.pollingService.get_game_with_props')
+    @patch('app.services.game.pollingService.GradeGameService')
+    def test_completed_game_graded_off_the_polling_thread(self, mock_grade, mock_get_game, mock_game_data,
+                                                          mock_scoreboard, mock_get_games, mock_db,
+                                                          mock_set_value):
+        """Test that polling returns while the grading thread is still grading."""
+        game = make_game(1, "1")
+        mock_get_games.return_value = [game]
+        mock_get_game.return_value = game
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_FINAL", 0, 24)])
+        release_grading = threading.Event()
+        grading_threads = []
+
+        def slow_grade(game_id):
+            grading_threads.append(threading.current_thread().name)
+            release_grading.wait(5)
+
+        mock_grade.grade_game.side_effect = slow_grade
+
+        with Flask(__name__).app_context():
+            result = PollingService.poll_all_active_games()
+
+        self.assertEqual(result["games_completed"], 1)
+        self.assertFalse(PollingService.wait_for_grading(timeout=0.2))
+        release_grading.set()
+        self.assertTrue(PollingService.wait_for_grading(timeout=5))
+        self.assertEqual(grading_threads, ["grading"])
+        mock_grade.auto_grade_props_from_live_data.assert_called_once_with(game)
+        self.assertIn("grade", PollingService.get_stage_timings())
+
+    @patch('app.services.game.pollingService.get_games_with_props')
+    @patch('app.services.game.pollingService.GradeGameService')
+    @patch('app.services.game.pollingService.PollingService._start_grading_thread')
+    def test_full_grading_queue_grades_inline(self, mock_start_thread, mock_grade, mock_get_games_with_props,
+                                              mock_game_data, mock_scoreboard, mock_get_games, mock_db,
+                                              mock_set_value):
+        """Test that a full grading queue makes the polling thread grade the game itself."""
+        game = make_game(1, "1")
+        mock_get_games_with_props.return_value = [game]
+        full_queue = queue.Queue(maxsize=1)
+        full_queue.put((None, 99))
+
+        with patch.object(PollingService, '_grading_queue', full_queue), Flask(__name__).app_context():
+            PollingService.submit_grading([1])
+
+        mock_get_games_with_props.assert_called_once_with([1])
+        mock_grade.grade_game.assert_called_once_with(1)
+
+    def test_stage_timings_recorded(self, mock_game_data, mock_scoreboard, mock_get_games, mock_db,
+                                    mock_set_value):
+        """Test that each cycle records fetch, parse, apply and write timings."""
+        mock_get_games.return_value = [make_game(1, "1", player_props=True)]
+        mock_scoreboard.return_value = None
+        mock_game_data.return_value = make_game_data()
+
+        result = PollingService.poll_all_active_games()
+
+        timings = PollingService.get_stage_timings()
+        for stage in ("fetch", "parse", "apply", "write"):
+            self.assertEqual(timings[stage]["count"], 1 if stage != "parse" else 2)
+        self.assertEqual(set(result["stage_ms"]), {"fetch", "apply", "write"})
+
+
+if __name__ == '__main__':
+    unittest.main()
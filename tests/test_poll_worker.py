@@ -0,0 +1,96 @@
+"""
+Unit tests for the standalone poll worker.
+
+Tests cover:
+- Database pool settings for the worker process
+- The worker starting the scheduler and shutting it down on a stop signal
+- Scheduler startup no longer running a synchronous poll
+"""
+
+import os
+import signal
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from app.services.game.pollWorkerService import PollWorkerService
+from app.services.game.schedulerService import SchedulerService
+
+
+class TestPollWorkerConfig(unittest.TestCase):
+    """Test cases for the worker's app config."""
+
+    def test_postgres_pool_sized_from_environment(self):
+        """Test that the worker's pool size comes from the environment."""
+        env = {"DATABASE_URL": "postgresql://localhost/pickem", "POLL_WORKER_DB_POOL_SIZE": "6"}
+        with patch.dict(os.environ, env):
+            options = PollWorkerService.get_config_overrides()["SQLALCHEMY_ENGINE_OPTIONS"]
+
+        self.assertEqual(options["pool_size"], 6)
+        self.assertEqual(options["max_overflow"], PollWorkerService.DEFAULT_DB_MAX_OVERFLOW)
+        self.assertTrue(options["pool_pre_ping"])
+
+    def test_sqlite_keeps_default_pool(self):
+        """Test that SQLite development databases get no pool overrides."""
+        with patch.dict(os.environ, {"DATABASE_URL": "sqlite://"}):
+            self.assertEqual(PollWorkerService.get_config_overrides(), {})
+
+
+class TestPollWorkerRun(unittest.TestCase):
+    """Test cases for the worker loop."""
+
+    def setUp(self):
+        """Restore the default signal handlers after each test."""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+    @patch('app.services.game.pollWorkerService.SchedulerService')
+    def test_stop_signal_shuts_scheduler_down(self, mock_scheduler_service):
+        """Test that SIGTERM stops the loop and shuts the scheduler down."""
+        app = MagicMock()
+        mock_scheduler_service.initialize_scheduler.side_effect = \
+            lambda app: PollWorkerService.request_stop(signal.SIGTERM)
+
+        PollWorkerService.run(app)
+
+        mock_scheduler_service.initialize_scheduler.assert_called_once_with(app)
+        mock_scheduler_service.shutdown_scheduler.assert_called_once()
+        self.assertIs(signal.getsignal(signal.SIGTERM), PollWorkerService.request_stop)
+
+    @patch('app.services.game.pollWorkerService.SchedulerService')
+    def test_dead_scheduler_exits_loop(self, mock_scheduler_service):
+        """Test that the worker exits if its scheduler stopped running."""
+        mock_scheduler_service.get_scheduler.return_value = None
+
+        with patch.object(PollWorkerService, 'HEALTH_CHECK_SECONDS', 0):
+            PollWorkerService.run(MagicMock())
+
+        mock_scheduler_service.shutdown_scheduler.assert_called_once()
+
+
+class TestSchedulerStartup(unittest.TestCase):
+    """Test cases for starting the scheduler without blocking."""
+
+    @patch('app.services.game.schedulerService.PollingService.requeue_ungraded_games')
+    @patch('app.services.game.schedulerService.SchedulerService.get_next_wake_time')
+    @patch('app.services.game.schedulerService.PollingService.poll_all_active_games')
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_startup_arms_job_without_polling(self, mock_leader, mock_poll, mock_wake, mock_requeue):
+        """Test that the leader arms the polling job instead of polling during startup."""
+        mock_leader.try_acquire.return_value = True
+        mock_leader.is_leader.return_value = True
+        mock_wake.return_value = datetime.now(timezone.utc) + timedelta(minutes=5)
+        self.addCleanup(SchedulerService.shutdown_scheduler)
+
+        app = MagicMock()
+        app.config = {'LEADER_CHECK_SECONDS': 45}
+
+        SchedulerService.initialize_scheduler(app)
+
+        mock_poll.assert_not_called()
+        self.assertIsNotNone(SchedulerService.scheduler.get_job(SchedulerService.POLL_JOB_ID))
+        leader_job = SchedulerService.scheduler.get_job(SchedulerService.LEADER_JOB_ID)
+        self.assertEqual(leader_job.trigger.interval, timedelta(seconds=45))
+
+
+if __name__ == '__main__':
+    unittest.main()
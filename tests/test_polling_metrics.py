@@ -0,0 +1,175 @@
+"""
+Unit tests for polling metrics.
+
+Tests cover:
+- Histogram bucketing, quantiles and Prometheus text rendering
+- ESPN request latency and response size histograms
+- Polling stage histograms and cycle outcome totals
+- Scheduler run delay, interval, overrun and job event counting
+- The /polling/metrics endpoint
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from flask import Flask
+from app.controllers.liveStatsController import liveStatsController
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.game.pollingMetricsService import PollingMetricsService
+from app.services.game.pollingService import PollingService
+from app.services.game.schedulerService import SchedulerService
+from app.utils.metrics import Histogram, PrometheusWriter
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for Histogram and PrometheusWriter."""
+
+    def test_cumulative_buckets_and_quantile(self):
+        """Test that observations land in the first bucket at or above them."""
+        histogram = Histogram((10, 100))
+        for value in (5, 10, 50, 500):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [(10, 2), (100, 3), (float("inf"), 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.sum, 565)
+        self.assertEqual(histogram.quantile(0.5), 10)
+        self.assertEqual(histogram.quantile(0.99), 100)
+
+    def test_copy_is_independent(self):
+        """Test that a copy doesn't see later observations."""
+        histogram = Histogram((10,))
+        snapshot = histogram.copy()
+        histogram.observe(1)
+
+        self.assertEqual(snapshot.count, 0)
+
+    def test_prometheus_text(self):
+        """Test counter, gauge and scaled histogram rendering."""
+        histogram = Histogram((250, 1000))
+        histogram.observe(300)
+        writer = PrometheusWriter(prefix="test_")
+        writer.counter("requests_total", "Requests.", [({"endpoint": 'sum"mary'}, 3)])
+        writer.gauge("depth", "Depth.", [(None, 2.5)])
+        writer.histogram("duration_seconds", "Latency.", [({"stage": "fetch"}, histogram)], scale=0.001)
+
+        self.assertEqual(writer.render().splitlines(), [
+            "# HELP test_requests_total Requests.",
+            "# TYPE test_requests_total counter",
+            'test_requests_total{endpoint="sum\\"mary"} 3',
+            "# HELP test_depth Depth.",
+            "# TYPE test_depth gauge",
+            "test_depth 2.5",
+            "# HELP test_duration_seconds Latency.",
+            "# TYPE test_duration_seconds histogram",
+            'test_duration_seconds_bucket{stage="fetch",le="0.25"} 0',
+            'test_duration_seconds_bucket{stage="fetch",le="1"} 1',
+            'test_duration_seconds_bucket{stage="fetch",le="+Inf"} 1',
+            'test_duration_seconds_sum{stage="fetch"} 0.3',
+            'test_duration_seconds_count{stage="fetch"} 1',
+        ])
+
+
+class TestPollingMetrics(unittest.TestCase):
+    """Test cases for the metrics the polling path records."""
+
+    def setUp(self):
+        """Start every test with empty counters."""
+        ESPNHttpClient.reset()
+        PollingService.reset_stats()
+        SchedulerService.reset_run_stats()
+        self.addCleanup(ESPNHttpClient.reset)
+        self.addCleanup(PollingService.reset_stats)
+        self.addCleanup(SchedulerService.reset_run_stats)
+
+    @patch.object(ESPNHttpClient, 'get_session')
+    def test_espn_latency_and_response_size(self, mock_get_session):
+        """Test that a full response records its latency and body size."""
+        response = MagicMock(status_code=200, content=b"x" * 5000, headers={})
+        response.json.return_value = {"ok": True}
+        mock_get_session.return_value.get.return_value = response
+
+        ESPNHttpClient.get_json("https://example.test/summary", params={"event": "1"}, endpoint="summary")
+
+        histograms = ESPNHttpClient.get_histograms()["summary"]
+        self.assertEqual(histograms["latency_ms"].count, 1)
+        self.assertEqual(histograms["response_bytes"].count, 1)
+        self.assertEqual(histograms["response_bytes"].sum, 5000)
+
+    def test_stage_histograms_and_outcome_totals(self):
+        """Test that stages feed histograms and cycles add to the totals."""
+        PollingService._record_stage("parse", 12.0)
+        PollingService._record_stage("parse", 30.0)
+        PollingService._record_cycle({"polled": 3, "failed": 1, "completed": 1, "changed": 2}, 4)
+        PollingService._record_cycle({}, 0)
+
+        self.assertEqual(PollingService.get_stage_histograms()["parse"].count, 2)
+        self.assertEqual(PollingService.get_stage_timings()["parse"]["count"], 2)
+        self.assertEqual(PollingService.get_outcome_totals(), {
+            "cycles": 2, "espn_requests": 4, "polled": 3, "failed": 1, "completed": 1, "changed": 2
+        })
+
+    @patch.object(PollingService, 'get_games_to_poll', return_value=[])
+    def test_empty_cycle_is_timed(self, mock_get_games):
+        """Test that a cycle with nothing due still counts as a cycle."""
+        PollingService.poll_all_active_games()
+
+        self.assertEqual(PollingService.get_stage_timings()["cycle"]["count"], 1)
+        self.assertEqual(PollingService.get_outcome_totals()["cycles"], 1)
+
+    def test_run_delay_interval_and_overrun(self):
+        """Test that a run longer than its scheduled sleep counts as an overrun."""
+        now = datetime.now(timezone.utc)
+        SchedulerService._scheduled_run_at = now - timedelta(seconds=2)
+        SchedulerService._scheduled_sleep_seconds = 20
+
+        SchedulerService._record_run_start(now, 100.0)
+        SchedulerService._record_run_end(5000)
+        SchedulerService._record_run_start(now, 125.0)
+        SchedulerService._record_run_end(25000)
+
+        stats = SchedulerService.get_run_stats()
+        self.assertEqual(stats["overruns"], 1)
+        self.assertEqual(stats["last_run_ms"], 25000)
+        self.assertEqual(stats["histograms"]["start_delay_ms"].count, 2)
+        self.assertAlmostEqual(stats["histograms"]["start_delay_ms"].sum, 4000, delta=1)
+        self.assertEqual(stats["histograms"]["interval_ms"].sum, 25000)
+
+    @patch.object(SchedulerService, 'schedule_next_poll')
+    def test_job_events_are_counted(self, mock_schedule):
+        """Test that missed and skipped runs are counted per job."""
+        for code in (EVENT_JOB_EXECUTED, EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MAX_INSTANCES):
+            SchedulerService._on_poll_job_event(MagicMock(code=code, job_id=SchedulerService.POLL_JOB_ID))
+        SchedulerService._on_poll_job_event(MagicMock(code=EVENT_JOB_EXECUTED, job_id=SchedulerService.LEADER_JOB_ID))
+
+        self.assertEqual(SchedulerService.get_run_stats()["job_events"], {
+            SchedulerService.POLL_JOB_ID: {"executed": 1, "missed": 1, "max_instances": 2},
+            SchedulerService.LEADER_JOB_ID: {"executed": 1},
+        })
+        self.assertEqual(mock_schedule.call_count, 4)
+
+    def test_metrics_endpoint(self):
+        """Test that the endpoint serves every family in the Prometheus text format."""
+        ESPNHttpClient._record("summary", 120.0, "ok", 40000)
+        ESPNHttpClient._record("summary", 3000.0, "error")
+        PollingService._record_stage("fetch", 700.0)
+        SchedulerService._on_poll_job_event(MagicMock(code=EVENT_JOB_MISSED, job_id="other"))
+        app = Flask(__name__)
+        app.register_blueprint(liveStatsController)
+
+        response = app.test_client().get('/polling/metrics')
+        body = response.get_data(as_text=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn('pickem_espn_requests_total{endpoint="summary",outcome="error"} 1', body)
+        self.assertIn('pickem_espn_response_size_bytes_sum{endpoint="summary"} 40000', body)
+        self.assertIn('pickem_polling_stage_duration_seconds_bucket{stage="fetch",le="1"} 1', body)
+        self.assertIn('pickem_scheduler_job_events_total{job="other",event="missed"} 1', body)
+        self.assertIn('pickem_polling_run_overruns_total 0', body)
+        self.assertEqual(body, PollingMetricsService.render_prometheus())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -390,5 +390,79 @@ def test_polling_triggers_auto_grading_when_game_final(mock_get_game_data):
     print(f"  - Polling stopped: {not mock_game.is_polling}")
 
 
+
+@patch('app.services.game.pollingService.set_committed_value', side_effect=setattr)
+@patch('app.services.game.pollingService.db')
+@patch('app.services.game.pollingService.PollingService.get_games_to_poll')
+@patch('app.services.espnClientService.ESPNClientService.get_scoreboard', return_value=None)
+@patch('app.services.espnClientService.ESPNClientService.get_game_data')
+def test_polling_fetches_each_espn_event_once(mock_get_game_data, mock_get_scoreboard, mock_get_games,
+                                              mock_db, mock_set_value):
+    """Test that games from different leagues sharing an ESPN event trigger one fetch."""
+    from app.models.gameModel import Game
+    from app.services.game.pollingService import PollingService
+
+    mock_get_game_data.return_value = get_mock_espn_data_in_progress()
+
+    def make_game(game_id, external_game_id):
+        game = MagicMock()
+        game.__class__ = Game
+        game.id = game_id
+        game.external_game_id = external_game_id
+        game.is_completed = False
+        game.winner_loser_props = []
+        game.over_under_props = []
+        game.anytime_td_props = []
+        return game
+
+    # Three leagues track the same NFL game, one league tracks another
+    games = [make_game(1, "401772915"), make_game(2, "401772915"),
+             make_game(3, "401772915"), make_game(4, "401772999")]
+    mock_get_games.return_value = games
+
+    result = PollingService.poll_all_active_games()
+
+    assert mock_get_game_data.call_count == 2, "Should fetch each ESPN event once"
+    assert result["espn_fetches"] == 3, "One scoreboard request plus one summary per event"
+    assert result["games_polled"] == 4
+    assert all(game.team_a_score == 14 and game.team_b_score == 10 for game in games)
+
+    print("✓ Polling fetches each ESPN event once and fans it out to every game")
+
+
+
+@patch('app.services.game.pollingService.PollingService._fetch_settings', return_value=(4, 0.5))
+@patch('app.services.espnClientService.ESPNClientService.get_game_data')
+def test_slow_espn_fetch_does_not_block_cycle(mock_get_game_data, mock_settings):
+    """Test that fetches run concurrently and a hung request is dropped at the cycle deadline."""
+    import threading
+    import time
+    from app.services.game.pollingService import PollingService
+
+    release_slow_fetch = threading.Event()
+
+    def fake_get_game_data(external_game_id):
+        if external_game_id == "slow":
+            release_slow_fetch.wait(5)
+            return get_mock_espn_data_in_progress()
+        time.sleep(0.1)
+        return get_mock_espn_data_in_progress()
+
+    mock_get_game_data.side_effect = fake_get_game_data
+
+    started = time.monotonic()
+    try:
+        snapshots = PollingService.fetch_snapshots(["a", "b", "c", "slow"])
+        elapsed = time.monotonic() - started
+    finally:
+        release_slow_fetch.set()
+
+    assert snapshots["slow"] is None, "Fetch past the deadline should be reported as failed"
+    assert all(snapshots[event_id] is not None for event_id in ("a", "b", "c"))
+    assert elapsed < 1.0, "Cycle should end at the deadline, not wait for the slow request"
+
+    print(f"✓ Concurrent fetch finished in {elapsed:.2f}s with the slow event dropped")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,125 @@
+"""
+Unit tests for the TTL response cache.
+
+Tests cover:
+- Hits within the TTL and reloads after expiry
+- LRU eviction once maxsize is reached
+- Single-flight loading for concurrent misses
+- Failures and None results not being cached
+- ESPNClientService serving repeated requests from the cache
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+from app.services.responseCache import TTLCache, espn_response_cache
+from app.services.espnClientService import ESPNClientService
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def test_hit_within_ttl_and_reload_after_expiry(self):
+        """Test that values are reused until their TTL passes."""
+        cache = TTLCache()
+        loader = Mock(side_effect=[{"v": 1}, {"v": 2}])
+
+        self.assertEqual(cache.get_or_load(("summary", "1"), loader, ttl=0.05), {"v": 1})
+        self.assertEqual(cache.get_or_load(("summary", "1"), loader, ttl=0.05), {"v": 1})
+        time.sleep(0.06)
+        self.assertEqual(cache.get_or_load(("summary", "1"), loader, ttl=0.05), {"v": 2})
+
+        self.assertEqual(loader.call_count, 2)
+        stats = cache.get_stats()["endpoints"]["summary"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache drops the least recently used key when full."""
+        cache = TTLCache(maxsize=2)
+        cache.get_or_load(("roster", "a"), lambda: "A")
+        cache.get_or_load(("roster", "b"), lambda: "B")
+        cache.get_or_load(("roster", "a"), lambda: "unused")  # touch a
+        cache.get_or_load(("roster", "c"), lambda: "C")       # evicts b
+
+        self.assertEqual(cache.get_or_load(("roster", "a"), lambda: "reloaded"), "A")
+        self.assertEqual(cache.get_or_load(("roster", "b"), lambda: "reloaded"), "reloaded")
+        self.assertEqual(cache.get_stats()["endpoints"]["roster"]["evictions"], 2)
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test that N concurrent requests for one key cause one upstream fetch."""
+        cache = TTLCache()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"players": []}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(("roster", "1"), slow_loader)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = cache.get_stats()["endpoints"]["roster"]
+        self.assertEqual(stats["misses"] + stats["coalesced"] + stats["hits"], 8)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_errors_and_none_are_not_cached(self):
+        """Test that failed loads are retried on the next request."""
+        cache = TTLCache()
+        failing = Mock(side_effect=RuntimeError("ESPN down"))
+        with self.assertRaises(RuntimeError):
+            cache.get_or_load(("summary", "1"), failing)
+
+        self.assertIsNone(cache.get_or_load(("summary", "1"), lambda: None))
+        self.assertEqual(cache.get_or_load(("summary", "1"), lambda: {"ok": True}), {"ok": True})
+
+
+class TestESPNClientCaching(unittest.TestCase):
+    """Test cases for caching in ESPNClientService."""
+
+    def setUp(self):
+        """Start with an empty shared cache."""
+        espn_response_cache.clear()
+        self.addCleanup(espn_response_cache.clear)
+
+    @patch('app.services.espnClientService.ESPNHttpClient.get_json')
+    def test_scoreboard_served_from_cache(self, mock_get_json):
+        """Test that repeated scoreboard requests for a date make one ESPN call."""
+        mock_get_json.return_value = {"events": []}
+
+        for _ in range(3):
+            self.assertEqual(ESPNClientService.get_scoreboard("20250115"), {"events": []})
+        ESPNClientService.get_scoreboard("20250116")
+
+        self.assertEqual(mock_get_json.call_count, 2)
+
+    @patch('app.services.espnClientService.ESPNHttpClient.get_json')
+    def test_rosters_cached_per_team(self, mock_get_json):
+        """Test that rosters are fetched once per team across requests."""
+        summary = {"header": {"competitions": [{"competitors": [
+            {"team": {"id": "1"}}, {"team": {"id": "2"}}
+        ]}]}}
+        roster = {"athletes": [{"items": [
+            {"displayName": "Patrick Mahomes", "id": "3139477", "position": {"abbreviation": "QB"}}
+        ]}]}
+        mock_get_json.side_effect = lambda url, params=None, endpoint=None: summary if endpoint == "summary" else roster
+
+        ESPNClientService.get_available_players("401772915")
+        players = ESPNClientService.get_available_players("401772915")
+
+        self.assertEqual(players, [{"name": "Patrick Mahomes", "id": "3139477", "position": "QB"}])
+        endpoints = [call.kwargs["endpoint"] for call in mock_get_json.call_args_list]
+        self.assertEqual(endpoints.count("summary"), 1)
+        self.assertEqual(endpoints.count("roster"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
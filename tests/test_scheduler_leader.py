@@ -0,0 +1,234 @@
+"""
+Unit tests for scheduler leader election.
+
+Tests cover:
+- Taking, keeping and losing the Postgres advisory lock
+- Followers retrying the lock on one long-lived connection
+- Schedule change notifications from other processes
+- Non-Postgres databases always leading
+- The scheduler arming, removing and re-arming the polling job on leadership changes
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services.game.leaderElectionService import LeaderElectionService
+from app.services.game.schedulerService import SchedulerService
+
+
+class TestLeaderElectionService(unittest.TestCase):
+    """Test cases for the advisory lock."""
+
+    def setUp(self):
+        """Start every test as a follower with a mocked lock engine."""
+        self.engine = MagicMock()
+        self.connection = self.engine.connect.return_value.execution_options.return_value
+        LeaderElectionService._engine = self.engine
+        LeaderElectionService._connection = None
+        LeaderElectionService._is_leader = False
+        self.addCleanup(setattr, LeaderElectionService, '_engine', None)
+        self.addCleanup(setattr, LeaderElectionService, '_connection', None)
+        self.addCleanup(setattr, LeaderElectionService, '_is_leader', False)
+
+        db_patch = patch('app.services.game.leaderElectionService.db')
+        self.mock_db = db_patch.start()
+        self.mock_db.engine.dialect.name = "postgresql"
+        self.addCleanup(db_patch.stop)
+
+    def test_acquires_free_lock_and_keeps_connection(self):
+        """Test that a free lock makes this process the leader."""
+        self.connection.execute.return_value.scalar.return_value = True
+
+        self.assertTrue(LeaderElectionService.try_acquire())
+        self.assertTrue(LeaderElectionService.is_leader())
+        self.assertIs(LeaderElectionService._connection, self.connection)
+        self.connection.close.assert_not_called()
+
+    def test_lock_held_elsewhere_keeps_follower_connection(self):
+        """Test that a follower keeps its connection open and retries the lock on it."""
+        self.connection.execute.return_value.scalar.return_value = False
+
+        self.assertFalse(LeaderElectionService.try_acquire())
+        self.assertFalse(LeaderElectionService.is_leader())
+        self.assertIs(LeaderElectionService._connection, self.connection)
+        self.connection.close.assert_not_called()
+
+        self.connection.execute.reset_mock()
+        self.assertFalse(LeaderElectionService.try_acquire())
+        self.engine.connect.assert_called_once()
+        statements = [str(call[0][0]) for call in self.connection.execute.call_args_list]
+        self.assertEqual(len(statements), 1)
+        self.assertIn("pg_try_advisory_lock", statements[0])
+
+    def test_follower_takes_over_on_existing_connection(self):
+        """Test that a follower whose retry succeeds leads and listens for schedule changes."""
+        self.connection.execute.return_value.scalar.return_value = False
+        LeaderElectionService.try_acquire()
+        self.connection.execute.return_value.scalar.return_value = True
+
+        self.assertTrue(LeaderElectionService.try_acquire())
+        self.engine.connect.assert_called_once()
+        self.assertIn("LISTEN", str(self.connection.execute.call_args[0][0]))
+
+    def test_follower_reconnects_after_connection_error(self):
+        """Test that a follower drops a broken connection and opens a new one next time."""
+        self.connection.execute.return_value.scalar.return_value = False
+        LeaderElectionService.try_acquire()
+        self.connection.execute.side_effect = Exception("server closed the connection")
+
+        self.assertFalse(LeaderElectionService.try_acquire())
+        self.assertIsNone(LeaderElectionService._connection)
+        self.connection.close.assert_called_once()
+
+    def test_pop_schedule_changed_reads_notifications(self):
+        """Test that the leader sees, and clears, notifications from other processes."""
+        self.connection.execute.return_value.scalar.return_value = True
+        LeaderElectionService.try_acquire()
+        raw_connection = self.connection.connection.driver_connection
+        raw_connection.notifies = [MagicMock()]
+
+        self.assertTrue(LeaderElectionService.pop_schedule_changed())
+        self.assertFalse(LeaderElectionService.pop_schedule_changed())
+        raw_connection.poll.assert_called()
+
+    def test_follower_ignores_schedule_notifications(self):
+        """Test that only the leader reads schedule change notifications."""
+        self.assertFalse(LeaderElectionService.pop_schedule_changed())
+
+    def test_notify_schedule_changed_sends_notification(self):
+        """Test that other processes signal a schedule change with pg_notify."""
+        LeaderElectionService.notify_schedule_changed()
+
+        connection = self.mock_db.engine.connect.return_value.__enter__.return_value
+        self.assertIn("pg_notify", str(connection.execute.call_args[0][0]))
+        connection.commit.assert_called_once()
+
+    def test_leader_confirms_without_reacquiring(self):
+        """Test that a leader with a live connection stays leader without a new connection."""
+        self.connection.execute.return_value.scalar.return_value = True
+        LeaderElectionService.try_acquire()
+        self.engine.connect.reset_mock()
+
+        self.assertTrue(LeaderElectionService.try_acquire())
+        self.engine.connect.assert_not_called()
+
+    def test_dead_connection_steps_down_and_retries(self):
+        """Test that a leader whose connection dropped competes for the lock again."""
+        old_connection = MagicMock()
+        old_connection.execute.side_effect = Exception("server closed the connection")
+        LeaderElectionService._connection = old_connection
+        LeaderElectionService._is_leader = True
+        self.connection.execute.return_value.scalar.return_value = False
+
+        self.assertFalse(LeaderElectionService.try_acquire())
+        self.assertFalse(LeaderElectionService.is_leader())
+        old_connection.close.assert_called_once()
+
+    def test_non_postgres_always_leads(self):
+        """Test that SQLite development databases run the scheduler without a lock."""
+        self.mock_db.engine.dialect.name = "sqlite"
+
+        self.assertTrue(LeaderElectionService.try_acquire())
+        self.engine.connect.assert_not_called()
+
+    def test_release_unlocks_and_steps_down(self):
+        """Test that releasing unlocks and closes the lock connection."""
+        self.connection.execute.return_value.scalar.return_value = True
+        LeaderElectionService.try_acquire()
+
+        LeaderElectionService.release()
+
+        self.assertFalse(LeaderElectionService.is_leader())
+        self.assertIn("pg_advisory_unlock", str(self.connection.execute.call_args[0][0]))
+        self.connection.close.assert_called_once()
+
+
+class TestSchedulerLeadership(unittest.TestCase):
+    """Test cases for the scheduler's leader election job."""
+
+    def setUp(self):
+        """Attach a mock scheduler and app."""
+        self.scheduler = MagicMock()
+        patches = [
+            patch.object(SchedulerService, 'scheduler', self.scheduler),
+            patch.object(SchedulerService, 'app', MagicMock()),
+            patch('app.services.game.schedulerService.SchedulerService.schedule_next_poll'),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.mock_schedule = SchedulerService.schedule_next_poll
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_new_leader_arms_polling_job(self, mock_leader):
+        """Test that taking over the lock arms the polling job."""
+        mock_leader.is_leader.return_value = False
+        mock_leader.try_acquire.return_value = True
+
+        SchedulerService._check_leadership()
+
+        self.mock_schedule.assert_called_once()
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_lost_leader_removes_polling_job(self, mock_leader):
+        """Test that a leader that lost the lock stops polling."""
+        mock_leader.is_leader.return_value = True
+        mock_leader.try_acquire.return_value = False
+
+        SchedulerService._check_leadership()
+
+        self.scheduler.remove_job.assert_called_once_with(SchedulerService.POLL_JOB_ID)
+        self.mock_schedule.assert_not_called()
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_follower_does_nothing(self, mock_leader):
+        """Test that a follower that can't get the lock leaves the scheduler alone."""
+        mock_leader.is_leader.return_value = False
+        mock_leader.try_acquire.return_value = False
+
+        SchedulerService._check_leadership()
+
+        self.scheduler.remove_job.assert_not_called()
+        self.mock_schedule.assert_not_called()
+
+    @patch('app.services.game.schedulerService.SchedulerService.get_next_wake_time')
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_leader_rearms_only_on_schedule_change(self, mock_leader, mock_wake):
+        """Test that the leader re-arms for another worker's change only when notified of it."""
+        mock_leader.is_leader.return_value = True
+        mock_leader.try_acquire.return_value = True
+        self.scheduler.get_job.return_value = MagicMock()
+
+        mock_leader.pop_schedule_changed.return_value = False
+        SchedulerService._check_leadership()
+        self.mock_schedule.assert_not_called()
+        mock_wake.assert_not_called()
+
+        mock_leader.pop_schedule_changed.return_value = True
+        SchedulerService._check_leadership()
+        self.mock_schedule.assert_called_once()
+
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_leader_rearms_missing_job(self, mock_leader):
+        """Test that a leader without a pending polling job arms one."""
+        mock_leader.is_leader.return_value = True
+        mock_leader.try_acquire.return_value = True
+        mock_leader.pop_schedule_changed.return_value = False
+        self.scheduler.get_job.return_value = None
+
+        SchedulerService._check_leadership()
+
+        self.mock_schedule.assert_called_once()
+
+    @patch('app.services.game.schedulerService.PollingService.poll_all_active_games')
+    @patch('app.services.game.schedulerService.LeaderElectionService')
+    def test_follower_poll_job_does_not_poll(self, mock_leader, mock_poll):
+        """Test that a polling job left over after losing the lock is a no-op."""
+        mock_leader.is_leader.return_value = False
+
+        SchedulerService._run_poll_job()
+
+        mock_poll.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for scoreboard-first polling.
+
+Tests cover:
+- Building score-only snapshots from a scoreboard payload
+- Winner/loser-only games needing no summary requests
+- Props naming a player only by athlete id still needing a summary
+- Summaries fetched only when a stat game's scoreboard state changes
+- Events missing from the scoreboard falling back to a summary
+- Final games with stat props never completing on scoreboard data alone
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+
+
+def make_scoreboard(events):
+    """Build a scoreboard payload from (event_id, status, clock, bal_score) tuples."""
+    return {"events": [{
+        "id": event_id,
+        "competitions": [{
+            "competitors": [
+                {"team": {"abbreviation": "BAL", "displayName": "Baltimore Ravens"}, "score": str(bal_score)},
+                {"team": {"abbreviation": "KC", "displayName": "Kansas City Chiefs"}, "score": "3"}
+            ],
+            "status": {"clock": clock, "period": 2, "type": {"name": status}}
+        }]
+    } for event_id, status, clock, bal_score in events]}
+
+
+def make_game(player_props=False):
+    """Build a game with a winner/loser prop and, optionally, a player-stat prop."""
+    game = MagicMock()
+    game.winner_loser_props = [MagicMock()]
+    game.over_under_props = [MagicMock(player_name="Derrick Henry", stat_type="rushing_yards")] if player_props else []
+    game.anytime_td_props = []
+    return game
+
+
+class TestScoreboardSnapshots(unittest.TestCase):
+    """Test cases for parsing scoreboard events."""
+
+    def test_scoreboard_events_become_score_only_snapshots(self):
+        """Test that each event gets scores and status but no player stats."""
+        board = ESPNGameSnapshot.from_scoreboard(make_scoreboard([("1", "STATUS_FINAL", 0, 24)]))
+
+        snapshot = board["1"]
+        self.assertEqual(snapshot.scores, {"BAL": 24, "KC": 3})
+        self.assertTrue(snapshot.is_completed)
+        self.assertEqual(snapshot.winning_team_id, "BAL")
+        self.assertEqual(snapshot.team_names["KC"], "Kansas City Chiefs")
+        self.assertEqual(snapshot.get_player_stat(None, "total_points"), 27)
+        self.assertIsNone(snapshot.get_player_stat("Derrick Henry", "rushing_yards"))
+
+
+class TestScoreboardTriage(unittest.TestCase):
+    """Test cases for choosing which events need a summary."""
+
+    def setUp(self):
+        PollingService._scoreboard_states.clear()
+        self.addCleanup(PollingService._scoreboard_states.clear)
+
+    @patch('app.services.game.pollingService.PollingService.fetch_snapshots')
+    @patch('app.services.game.pollingService.ESPNClientService.get_scoreboard')
+    def test_winner_loser_games_need_no_summary(self, mock_scoreboard, mock_fetch):
+        """Test that games with only score-based props are served from the scoreboard."""
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_IN_PROGRESS", 300.0, 7)])
+        mock_fetch.return_value = {}
+
+        snapshots, requests_made = PollingService.fetch_cycle_snapshots({"1": [make_game(), make_game()]})
+
+        mock_fetch.assert_called_once_with([])
+        self.assertEqual(requests_made, 1)
+        self.assertEqual(snapshots["1"].scores["BAL"], 7)
+
+    def test_id_only_player_prop_needs_box_score(self):
+        """Test that a prop with an athlete id but no player name still needs the summary's box score."""
+        game = make_game()
+        game.over_under_props = [MagicMock(player_name=None, player_id="3043078", stat_type="rushing_yards")]
+        self.assertTrue(PollingService.needs_box_score([game]))
+
+        game.over_under_props = [MagicMock(player_name=None, player_id=None, stat_type="total_points")]
+        self.assertFalse(PollingService.needs_box_score([game]))
+
+    @patch('app.services.game.pollingService.PollingService.fetch_snapshots')
+    @patch('app.services.game.pollingService.ESPNClientService.get_scoreboard')
+    def test_stat_game_summary_only_when_state_changes(self, mock_scoreboard, mock_fetch):
+        """Test that a stat game's summary is skipped while its scoreboard state is unchanged."""
+        games_by_event = {"1": [make_game(player_props=True)]}
+        summary = MagicMock(is_completed=False)
+        mock_fetch.side_effect = lambda ids: {event_id: summary for event_id in ids}
+
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_IN_PROGRESS", 300.0, 7)])
+        snapshots, _ = PollingService.fetch_cycle_snapshots(games_by_event)
+        self.assertIs(snapshots["1"], summary)
+
+        # Same clock and score (e.g. a timeout): scoreboard snapshot, no summary
+        snapshots, requests_made = PollingService.fetch_cycle_snapshots(games_by_event)
+        self.assertFalse(snapshots["1"].has_box_score)
+        self.assertEqual(requests_made, 1)
+
+        # Clock moved: stats may have changed
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_IN_PROGRESS", 270.0, 7)])
+        snapshots, requests_made = PollingService.fetch_cycle_snapshots(games_by_event)
+        self.assertIs(snapshots["1"], summary)
+        self.assertEqual(requests_made, 2)
+
+    @patch('app.services.game.pollingService.PollingService.fetch_snapshots')
+    @patch('app.services.game.pollingService.ESPNClientService.get_scoreboard')
+    def test_missing_event_falls_back_to_summary(self, mock_scoreboard, mock_fetch):
+        """Test that events not on the scoreboard (or no scoreboard at all) use a summary."""
+        mock_scoreboard.return_value = None
+        summary = MagicMock(is_completed=False)
+        mock_fetch.return_value = {"1": summary}
+
+        snapshots, requests_made = PollingService.fetch_cycle_snapshots({"1": [make_game()]})
+
+        mock_fetch.assert_called_once_with(["1"])
+        self.assertIs(snapshots["1"], summary)
+        self.assertEqual(requests_made, 2)
+
+    @patch('app.services.game.pollingService.PollingService.fetch_snapshots')
+    @patch('app.services.game.pollingService.ESPNClientService.get_scoreboard')
+    def test_final_stat_game_waits_for_summary(self, mock_scoreboard, mock_fetch):
+        """Test that a final game with stat props isn't completed if its summary fails."""
+        mock_scoreboard.return_value = make_scoreboard([("1", "STATUS_FINAL", 0, 24)])
+        mock_fetch.return_value = {"1": None}
+
+        snapshots, _ = PollingService.fetch_cycle_snapshots({"1": [make_game(player_props=True)]})
+
+        self.assertIsNone(snapshots["1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
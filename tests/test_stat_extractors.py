@@ -0,0 +1,225 @@
+"""
+Unit tests for the stat extractor registry.
+
+Tests cover:
+- Base, derived (scrimmage_yards, touchdowns) and game (total_points) stat types
+- Defensive and fumble return touchdowns, without counting a pick-six twice
+- ESPNGameSnapshot.get_stats() evaluating a game's stats in one pass
+- Polling updating Anytime TD options from the touchdowns stat
+- One touchdown tally per snapshot shared by every Anytime TD option
+"""
+
+import unittest
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
+from app.models.gameModel import Game
+from app.models.props.anytimeTdOption import AnytimeTdOption
+from app.models.props.overUnderProp import OverUnderProp
+from app.services.boxScoreIndex import BoxScoreIndex
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.game.pollingService import PollingService
+from app.services.statExtractors import STAT_EXTRACTORS, StatExtractor, get_extractor
+
+
+def make_game_data():
+    """Build a summary payload where scorers find the end zone in different ways."""
+    def group(name, keys, athletes):
+        return {"name": name, "keys": keys, "athletes": [
+            {"athlete": {"id": athlete_id, "displayName": display_name}, "stats": stats}
+            for athlete_id, display_name, stats in athletes
+        ]}
+
+    return {
+        "header": {"competitions": [{
+            "competitors": [
+                {"team": {"abbreviation": "BAL", "displayName": "Baltimore Ravens"}, "score": "27"},
+                {"team": {"abbreviation": "KC", "displayName": "Kansas City Chiefs"}, "score": "20"}
+            ],
+            "status": {"period": 4, "clock": 0.0, "type": {"name": "STATUS_IN_PROGRESS"}}
+        }]},
+        "boxscore": {"players": [{
+            "team": {"abbreviation": "BAL"},
+            "statistics": [
+                group("passing", ["passingYards", "passingTouchdowns"], [("1", "Lamar Jackson", ["250", "2"])]),
+                group("rushing", ["rushingYards", "rushingTouchdowns"], [("1", "Lamar Jackson", ["61", "1"]),
+                                                                         ("2", "Derrick Henry", ["102", "1"])]),
+                group("receiving", ["receptions", "receivingYards", "receivingTouchdowns"],
+                      [("2", "Derrick Henry", ["2", "15", "1"]), ("3", "Zay Flowers", ["6", "84", "0"])]),
+                group("kickReturns", ["kickReturns", "kickReturnYards", "kickReturnTouchdowns"],
+                      [("3", "Zay Flowers", ["1", "98", "1"])]),
+                group("interceptions", ["interceptions", "interceptionYards", "interceptionTouchdowns"],
+                      [("4", "Kyle Hamilton", ["1", "40", "1"])]),
+            ]
+        }]}
+    }
+
+
+class TestStatExtractors(unittest.TestCase):
+    """Test cases for evaluating registry entries."""
+
+    def setUp(self):
+        self.snapshot = ESPNGameSnapshot("401", make_game_data())
+
+    def test_touchdowns_count_every_way_a_player_scores(self):
+        """Test that touchdowns sum rushing, receiving and return TDs but not passing TDs."""
+        self.assertEqual(self.snapshot.get_player_stat("Lamar Jackson", "touchdowns"), 1.0)
+        self.assertEqual(self.snapshot.get_player_stat("Derrick Henry", "touchdowns"), 2.0)
+        self.assertEqual(self.snapshot.get_player_stat("Zay Flowers", "touchdowns"), 1.0)
+        self.assertEqual(self.snapshot.get_player_stat("Kyle Hamilton", "touchdowns"), 1.0)
+
+    def add_defense(self, defensive=(), fumbles=(), interceptions=()):
+        """Add defensive, fumbles and extra interceptions box score rows and re-parse the snapshot."""
+        data = make_game_data()
+        statistics = data["boxscore"]["players"][0]["statistics"]
+        next(group for group in statistics if group["name"] == "interceptions")["athletes"].extend(
+            {"athlete": {"id": athlete_id, "displayName": name}, "stats": stats}
+            for athlete_id, name, stats in interceptions)
+        statistics.append({"name": "defensive", "keys": ["totalTackles", "sacks", "defensiveTouchdowns"],
+                           "athletes": [{"athlete": {"id": athlete_id, "displayName": name}, "stats": stats}
+                                        for athlete_id, name, stats in defensive]})
+        statistics.append({"name": "fumbles", "keys": ["fumblesLost", "fumblesRecovered", "fumblesTouchdowns"],
+                           "athletes": [{"athlete": {"id": athlete_id, "displayName": name}, "stats": stats}
+                                        for athlete_id, name, stats in fumbles]})
+        return ESPNGameSnapshot("401", data)
+
+    def test_pick_six_counted_once(self):
+        """Test that an interception return TD also in the defensive TD column counts once."""
+        snapshot = self.add_defense(defensive=[("4", "Kyle Hamilton", ["5", "0", "1"])])
+
+        self.assertEqual(snapshot.get_player_stat("Kyle Hamilton", "touchdowns"), 1.0)
+        self.assertEqual(snapshot.get_player_stat("Kyle Hamilton", "defensive_tds"), 1.0)
+
+    def test_fumble_return_touchdowns(self):
+        """Test fumble return TDs from the fumbles column, and from the defensive column alone."""
+        snapshot = self.add_defense(defensive=[("5", "Roquan Smith", ["9", "1", "1"])],
+                                    fumbles=[("7", "Odafe Oweh", ["0", "1", "1"])])
+
+        self.assertEqual(snapshot.get_player_stat("Odafe Oweh", "touchdowns"), 1.0)
+        self.assertEqual(snapshot.get_player_stat("Odafe Oweh", "fumble_return_tds"), 1.0)
+        self.assertEqual(snapshot.get_player_stat("Roquan Smith", "touchdowns"), 1.0)
+
+    def test_other_defensive_touchdowns(self):
+        """Test that a defender's pick-six plus another defensive TD counts both."""
+        snapshot = self.add_defense(defensive=[("6", "Marlon Humphrey", ["3", "0", "2"])],
+                                    interceptions=[("6", "Marlon Humphrey", ["1", "35", "1"])])
+
+        self.assertEqual(snapshot.get_player_stat("Marlon Humphrey", "touchdowns"), 2.0)
+        self.assertEqual(snapshot.box_score.tally("touchdowns")["marlon humphrey"], 2.0)
+
+    def test_derived_and_game_stats(self):
+        """Test scrimmage_yards and total_points."""
+        self.assertEqual(self.snapshot.get_player_stat("Derrick Henry", "scrimmage_yards"), 117.0)
+        self.assertEqual(self.snapshot.get_player_stat(None, "total_points"), 47)
+
+    def test_scopes(self):
+        """Test that only game stats can be answered without a box score."""
+        self.assertFalse(get_extractor("total_points").needs_box_score)
+        self.assertTrue(get_extractor("touchdowns").needs_box_score)
+        self.assertIsNone(get_extractor("field_goals"))
+        self.assertTrue(all(extractor.scope in (StatExtractor.PLAYER, StatExtractor.GAME)
+                            for extractor in STAT_EXTRACTORS.values()))
+
+    def test_index_rejects_game_stats(self):
+        """Test that the box score index only answers player stats."""
+        self.assertIsNone(BoxScoreIndex(make_game_data()).get_player_stat("Lamar Jackson", "total_points"))
+
+    def test_get_stats_looks_up_each_player_once(self):
+        """Test that many stats for one player share a single athlete lookup."""
+        requests = [("Derrick Henry", stat_type)
+                    for stat_type in ("rushing_yards", "receiving_yards", "scrimmage_yards", "touchdowns")]
+        requests += [(None, "total_points"), ("Derrick Henry", "total_points"),
+                     ("Derrick Henry", "field_goals"), ("Nobody", "rushing_yards")]
+
+        with patch.object(BoxScoreIndex, "find_athlete", autospec=True,
+                          side_effect=BoxScoreIndex.find_athlete) as mock_find:
+            values = self.snapshot.get_stats(requests)
+
+        self.assertEqual([call.args[1] for call in mock_find.call_args_list], ["Derrick Henry", "Nobody"])
+        self.assertEqual(values, {
+            ("Derrick Henry", "rushing_yards"): 102.0,
+            ("Derrick Henry", "receiving_yards"): 15.0,
+            ("Derrick Henry", "scrimmage_yards"): 117.0,
+            ("Derrick Henry", "touchdowns"): 2.0,
+            (None, "total_points"): 47,
+            ("Derrick Henry", "total_points"): 47,
+        })
+
+    def test_score_only_snapshot_answers_game_stats(self):
+        """Test that scoreboard snapshots answer total_points and nothing that needs a box score."""
+        board = ESPNGameSnapshot("401", {"header": make_game_data()["header"]}, has_box_score=False)
+
+        self.assertEqual(board.get_stats([(None, "total_points"), ("Derrick Henry", "touchdowns")]),
+                         {(None, "total_points"): 47})
+
+
+class TestPollingTouchdowns(unittest.TestCase):
+    """Test cases for polling Anytime TD options."""
+
+    def setUp(self):
+        PollingService._fingerprints.clear()
+        self.addCleanup(PollingService._fingerprints.clear)
+
+    def make_mock(self, model, **attrs):
+        obj = MagicMock(**attrs)
+        obj.__class__ = model
+        return obj
+
+    def test_anytime_td_options_are_updated(self):
+        """Test that current_tds is written from the touchdowns stat."""
+        henry = self.make_mock(AnytimeTdOption, id=5, player_name="Derrick Henry", current_tds=1)
+        flowers = self.make_mock(AnytimeTdOption, id=6, player_name="Zay Flowers", current_tds=1)
+        nobody = self.make_mock(AnytimeTdOption, id=7, player_name="Nobody", current_tds=0)
+        total = self.make_mock(OverUnderProp, id=8, player_name=None, player_id=None,
+                               stat_type="total_points", current_value=40)
+        game = self.make_mock(Game, id=1, external_game_id="401", is_completed=False, team_a_score=0, team_b_score=0)
+        game.over_under_props = [total]
+        game.winner_loser_props = []
+        game.anytime_td_props = [MagicMock(options=[henry, flowers, nobody])]
+
+        changes = defaultdict(dict)
+        PollingService._collect_game_changes(game, ESPNGameSnapshot("401", make_game_data()), changes, {})
+
+        self.assertEqual({row_id: values for row_id, (_, values) in changes[AnytimeTdOption].items()},
+                         {5: {"current_tds": 2}})
+        self.assertEqual(changes[OverUnderProp][8][1], {"current_value": 47})
+
+    def test_touchdown_tally_built_once_per_snapshot(self):
+        """Test that every option of every game sharing an event reads one tally, staged for one write."""
+        snapshot = ESPNGameSnapshot("401", make_game_data())
+        changes = defaultdict(dict)
+        option_id = 100
+        for game_id in (1, 2):
+            props = []
+            for _ in range(2):
+                options = []
+                for name in ("Derrick Henry", "Zay Flowers", "Kyle Hamilton", "Lamar Jackson"):
+                    option_id += 1
+                    options.append(self.make_mock(AnytimeTdOption, id=option_id, player_name=name, current_tds=0))
+                props.append(MagicMock(options=options))
+            game = self.make_mock(Game, id=game_id, external_game_id="401", is_completed=False,
+                                  team_a_score=0, team_b_score=0)
+            game.over_under_props = []
+            game.winner_loser_props = []
+            game.anytime_td_props = props
+
+            with patch.object(BoxScoreIndex, "tally", autospec=True, side_effect=BoxScoreIndex.tally) as mock_tally:
+                PollingService._collect_game_changes(game, snapshot, changes, {})
+            self.assertEqual(mock_tally.call_count, 1 if game_id == 1 else 0)
+
+        self.assertEqual(len(changes[AnytimeTdOption]), 16)
+        self.assertEqual(sorted(values["current_tds"] for _, values in changes[AnytimeTdOption].values()),
+                         [1] * 12 + [2] * 4)
+
+    def test_touchdown_tally(self):
+        """Test the per-player tally and lookups that miss."""
+        snapshot = ESPNGameSnapshot("401", make_game_data())
+
+        self.assertEqual(snapshot.box_score.tally("touchdowns"), {
+            "lamar jackson": 1.0, "derrick henry": 2.0, "zay flowers": 1.0, "kyle hamilton": 1.0})
+        self.assertEqual(snapshot.get_touchdowns("DERRICK HENRY"), 2)
+        self.assertIsNone(snapshot.get_touchdowns("Nobody"))
+        self.assertEqual(snapshot.box_score.tally("total_points"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Tests for binding Winner/Loser props to ESPN team ids.
+
+Tests cover:
+- Matching commissioner-entered team names to an event's teams
+- Polling reading scores by bound id, and binding leftover props from the snapshot
+- Binding at prop creation and the backfill of existing props, on SQLite
+- Binding at prop creation giving up at a short deadline when ESPN fails
+"""
+
+import time
+import unittest
+from collections import defaultdict
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+import requests
+from app import db
+from app.models.gameModel import Game
+from app.models.leagueModel import League
+from app.models.props.winnerLoserProp import WinnerLoserProp
+from app.services.espnClientService import ESPNClientService
+from app.services.espnGameSnapshot import ESPNGameSnapshot
+from app.services.espnHttpClient import ESPNHttpClient
+from app.services.game.gameService import GameService
+from app.services.game.pollingService import PollingService
+from app.services.game.teamBindingService import TeamBindingService
+from app.services.responseCache import espn_response_cache
+from tests.sqlite_app import SQLiteAppTestCase
+
+
+TEAMS = {"BAL": "Baltimore Ravens", "KC": "Kansas City Chiefs"}
+
+
+def make_game_data():
+    """Build a minimal in-progress ESPN summary header: BAL 21, KC 14."""
+    return {"header": {"competitions": [{
+        "competitors": [
+            {"team": {"abbreviation": "KC", "displayName": "Kansas City Chiefs"}, "score": "14"},
+            {"team": {"abbreviation": "BAL", "displayName": "Baltimore Ravens"}, "score": "21"}
+        ],
+        "status": {"period": 3, "clock": 300.0, "type": {"name": "STATUS_IN_PROGRESS"}}
+    }]}}
+
+
+class TestMatchTeamIds(unittest.TestCase):
+    """Test cases for TeamBindingService.match_team_ids."""
+
+    def test_full_names_abbreviations_and_nicknames(self):
+        """Test the three ways a commissioner names a team."""
+        self.assertEqual(TeamBindingService.match_team_ids(TEAMS, "Baltimore Ravens", "Kansas City Chiefs"),
+                         ("BAL", "KC"))
+        self.assertEqual(TeamBindingService.match_team_ids(TEAMS, "kc", "BAL"), ("KC", "BAL"))
+        self.assertEqual(TeamBindingService.match_team_ids(TEAMS, "Ravens", " chiefs "), ("BAL", "KC"))
+
+    def test_unresolved_or_ambiguous_names_bind_nothing(self):
+        """Test that a partial, ambiguous or duplicate match leaves both ids unset."""
+        new_york = {"NYG": "New York Giants", "NYJ": "New York Jets"}
+        self.assertEqual(TeamBindingService.match_team_ids(new_york, "New York", "Jets"), (None, None))
+        self.assertEqual(TeamBindingService.match_team_ids(TEAMS, "Ravens", "Bills"), (None, None))
+        self.assertEqual(TeamBindingService.match_team_ids(TEAMS, "Ravens", "Baltimore"), (None, None))
+        self.assertEqual(TeamBindingService.match_team_ids({}, "Ravens", "Chiefs"), (None, None))
+
+
+class TestPollingTeamIds(unittest.TestCase):
+    """Test cases for polling Winner/Loser props by ESPN team id."""
+
+    def setUp(self):
+        PollingService._fingerprints.clear()
+        self.addCleanup(PollingService._fingerprints.clear)
+        self.game = MagicMock(id=1, external_game_id="401", is_completed=False, team_a_score=None, team_b_score=None)
+        self.game.__class__ = Game
+        self.game.over_under_props = []
+        self.game.anytime_td_props = []
+
+    def make_prop(self, **attrs):
+        return WinnerLoserProp(id=10, team_a_score=None, team_b_score=None, winning_team_id=None, **attrs)
+
+    def test_scores_read_by_bound_id(self):
+        """Test that bound props get their scores by id, whatever order ESPN lists teams in."""
+        self.game.winner_loser_props = [self.make_prop(team_a_id="BAL", team_b_id="KC",
+                                                       team_a_name="Whoever", team_b_name="Someone")]
+
+        scores = PollingService._match_game_scores(self.game, ESPNGameSnapshot("401", make_game_data()))
+
+        self.assertEqual(scores, (21, 14))
+
+    def test_unbound_prop_is_bound_from_snapshot(self):
+        """Test that polling binds a leftover prop once from the snapshot and writes the ids in its batch."""
+        prop = self.make_prop(team_a_name="Ravens", team_b_name="Chiefs")
+        self.game.winner_loser_props = [prop]
+        changes = defaultdict(dict)
+
+        with patch('app.services.espnClientService.ESPNClientService.get_event_teams') as mock_teams:
+            PollingService._collect_game_changes(self.game, ESPNGameSnapshot("401", make_game_data()), changes, {})
+            mock_teams.assert_not_called()
+
+        self.assertEqual((prop.team_a_id, prop.team_b_id), ("BAL", "KC"))
+        staged = changes[WinnerLoserProp][10][1]
+        self.assertEqual((staged["team_a_id"], staged["team_b_id"]), ("BAL", "KC"))
+        self.assertEqual((staged["team_a_score"], staged["team_b_score"]), (21, 14))
+
+    def test_unmatched_names_keep_stored_scores(self):
+        """Test that props whose names match neither team don't get scores by position."""
+        self.game.team_a_score, self.game.team_b_score = 3, 0
+        self.game.winner_loser_props = [self.make_prop(team_a_name="Bills", team_b_name="Jets")]
+
+        scores = PollingService._match_game_scores(self.game, ESPNGameSnapshot("401", make_game_data()))
+
+        self.assertEqual(scores, (3, 0))
+
+
+class TestBindingOnSqlite(SQLiteAppTestCase):
+    """Test cases for binding at creation, on game updates and by backfill."""
+
+    def setUp(self):
+        super().setUp()
+
+        league = League(league_name="Sunday", join_code="abc")
+        db.session.add(league)
+        db.session.flush()
+        self.league_id = league.id
+
+    def add_game(self, external_game_id):
+        game = Game(league_id=self.league_id, game_name="BAL vs KC", start_time=datetime(2026, 1, 11),
+                    prop_limit=2, graded=0, external_game_id=external_game_id)
+        db.session.add(game)
+        db.session.commit()
+        return game
+
+    @patch('app.services.espnClientService.ESPNClientService.get_event_teams', return_value=TEAMS)
+    def test_props_bound_at_creation(self, mock_teams):
+        """Test that both prop creation paths store the ESPN ids."""
+        game = self.add_game("401")
+
+        GameService.createWinnerLoserQuestion({"question": "Who wins?", "favoriteTeam": "Ravens",
+                                               "underdogTeam": "Chiefs", "favoritePoints": 1,
+                                               "underdogPoints": 2}, game.id)
+        result = GameService.add_winner_loser_prop({"game_id": game.id, "question": "Who wins?",
+                                                    "favorite_team": "Kansas City Chiefs",
+                                                    "underdog_team": "Baltimore Ravens"})
+
+        ids = sorted((prop.team_a_id, prop.team_b_id) for prop in WinnerLoserProp.query.all())
+        self.assertEqual(ids, [("BAL", "KC"), ("KC", "BAL")])
+        self.assertIn("prop_id", result)
+        mock_teams.assert_called_with("401")
+
+    @patch('app.services.espnClientService.ESPNClientService.get_event_teams', return_value={})
+    def test_creation_survives_espn_outage(self, mock_teams):
+        """Test that a prop is still created, unbound, when ESPN has no teams for the event."""
+        game = self.add_game("401")
+
+        GameService.createWinnerLoserQuestion({"question": "Who wins?", "favoriteTeam": "Ravens",
+                                               "underdogTeam": "Chiefs"}, game.id)
+
+        prop = WinnerLoserProp.query.one()
+        self.assertIsNone(prop.team_a_id)
+
+    def test_creation_bounded_when_espn_times_out(self):
+        """Test that a timed-out ESPN lookup runs under the binding deadline and leaves the prop unbound."""
+        game = self.add_game("401")
+        deadlines = []
+
+        def time_out(external_game_id):
+            deadlines.append(ESPNHttpClient.get_deadline())
+            raise requests.Timeout("ESPN timed out")
+
+        with patch('app.services.espnClientService.ESPNClientService.get_event_teams', side_effect=time_out):
+            started = time.monotonic()
+            result = GameService.add_winner_loser_prop({"game_id": game.id, "question": "Who wins?",
+                                                        "favorite_team": "Ravens", "underdog_team": "Chiefs"})
+            finished = time.monotonic()
+
+        self.assertIn("prop_id", result)
+        self.assertIsNone(WinnerLoserProp.query.one().team_a_id)
+        self.assertLessEqual(deadlines[0], finished + TeamBindingService.BIND_DEADLINE_SECONDS)
+        self.assertGreaterEqual(deadlines[0], started + TeamBindingService.BIND_DEADLINE_SECONDS)
+        self.assertIsNone(ESPNHttpClient.get_deadline())
+
+    def test_backfill_looks_up_each_event_once(self):
+        """Test that the backfill binds props across leagues with one lookup per event."""
+        for external_game_id in ("401", "401", "402", None):
+            game = self.add_game(external_game_id)
+            db.session.add(WinnerLoserProp(game_id=game.id, question="Who wins?",
+                                           team_a_name="Ravens", team_b_name="Chiefs"))
+        db.session.commit()
+        teams = {"401": TEAMS, "402": {"BUF": "Buffalo Bills", "PHI": "Philadelphia Eagles"}}
+
+        with patch('app.services.espnClientService.ESPNClientService.get_event_teams',
+                   side_effect=teams.get) as mock_teams:
+            result = TeamBindingService.backfill_team_ids()
+
+        self.assertEqual(result, {"events": 2, "bound": 2, "unresolved": 1})
+        self.assertEqual(sorted(call.args[0] for call in mock_teams.call_args_list), ["401", "402"])
+        self.assertEqual(WinnerLoserProp.query.filter(WinnerLoserProp.team_a_id == "BAL").count(), 2)
+
+    def test_changing_event_rebinds(self):
+        """Test that pointing a game at another ESPN event replaces the bound ids."""
+        game = self.add_game("401")
+        db.session.add(WinnerLoserProp(game_id=game.id, question="Who wins?", team_a_id="BAL", team_b_id="KC",
+                                       team_a_name="Bills", team_b_name="Eagles"))
+        db.session.commit()
+
+        with patch('app.services.espnClientService.ESPNClientService.get_event_teams',
+                   return_value={"BUF": "Buffalo Bills", "PHI": "Philadelphia Eagles"}), \
+                patch('app.services.game.gameService.SchedulerService'):
+            GameService.update_game({"game_id": game.id, "external_game_id": "402"})
+
+        prop = WinnerLoserProp.query.one()
+        self.assertEqual((prop.team_a_id, prop.team_b_id), ("BUF", "PHI"))
+
+
+class TestEventTeamsCache(unittest.TestCase):
+    """Test cases for ESPNClientService.get_event_teams."""
+
+    def setUp(self):
+        espn_response_cache.clear()
+        self.addCleanup(espn_response_cache.clear)
+
+    @patch('app.services.espnClientService.ESPNClientService.get_game_data')
+    def test_teams_cached_but_failures_retried(self, mock_get_game_data):
+        """Test that a found team list is cached and an empty one is not."""
+        mock_get_game_data.side_effect = [None, make_game_data()]
+
+        self.assertEqual(ESPNClientService.get_event_teams("401"), {})
+        self.assertEqual(ESPNClientService.get_event_teams("401"), TEAMS)
+        self.assertEqual(ESPNClientService.get_event_teams("401"), TEAMS)
+        self.assertEqual(mock_get_game_data.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,17 @@
+# worker.py runs live-stats polling and grading without the web app. Run with 'python3 worker.py'
+# or 'flask --app worker poll-worker'.
+
+from app import create_app
+from app.services.game.pollWorkerService import PollWorkerService
+
+app = create_app(PollWorkerService.get_config_overrides())
+
+
+@app.cli.command("poll-worker")
+def poll_worker():
+    """Run the live-stats polling scheduler until SIGTERM/SIGINT."""
+    PollWorkerService.run(app)
+
+
+if __name__ == "__main__":
+    PollWorkerService.run(app)